@@ -12,6 +12,17 @@ conversion:
     - DirectoryConversionSuite: Tests bulk directory conversion operations
     - ValidationSuite: Tests input validation and error detection
 
+import_time:
+    - ImportTimeSuite: Tracks cumulative import time of the package, the CLI
+      entry point and the converter (``python -m benchmarks.import_time``
+      checks them against their budgets)
+
+api_ingestion:
+    - APIFetchSuite: fetch_all time, request count and peak memory per vendor
+    - APIConcurrencySuite: Jira/Xray fetch time across max_concurrency levels
+    - APIRateLimitSuite: fetch cost under injected 429 and 503 responses
+    All run against the local MockVendorServer (``mock_vendor_server``)
+
 Running Benchmarks
 ------------------
 Run all benchmarks:
@@ -43,15 +54,20 @@ Notes
 - All benchmarks should complete within their defined timeout (60-180s)
 """
 
+from .api_ingestion import APIConcurrencySuite, APIFetchSuite, APIRateLimitSuite
 from .conversion import (
     DirectoryConversionSuite,
     ValidationSuite,
     ZephyrConversionSuite,
 )
+from .import_time import ImportTimeSuite
 
 __all__ = [
-    # Conversion benchmarks
+    "APIConcurrencySuite",
+    "APIFetchSuite",
+    "APIRateLimitSuite",
     "DirectoryConversionSuite",
+    "ImportTimeSuite",
     "ValidationSuite",
     "ZephyrConversionSuite",
 ]
@@ -0,0 +1,198 @@
+"""
+Benchmarks for the API ingestion path against a local mock vendor server.
+
+Each benchmark drains ``fetch_all`` of a real ``importobot.integrations``
+client pointed at :class:`~benchmarks.mock_vendor_server.MockVendorServer`,
+so changes to concurrency, connection pooling or rate limiting can be
+measured without network access or vendor credentials.
+
+The clients' own call budget (100 calls per minute) is lifted for the
+benchmarks; otherwise every suite would measure the limiter's sleep. Zephyr
+discovery state is disabled, so every run is a cold start and nothing is
+written to the working directory.
+
+Print a report directly:
+    $ python -m benchmarks.api_ingestion
+"""
+
+import sys
+import time
+from collections.abc import Callable
+from typing import Any, ClassVar
+
+from benchmarks.mock_vendor_server import MockVendorConfig, MockVendorServer
+from importobot.integrations.clients import get_api_client
+from importobot.integrations.clients.discovery_state import DiscoveryStateStore
+from importobot.medallion.interfaces.enums import SupportedFormat
+from importobot.utils.rate_limiter import RateLimiter
+
+ITEM_COUNT = 2000
+VENDORS = ["jira_xray", "zephyr", "testrail", "testlink"]
+
+
+def build_client(
+    server: MockVendorServer, vendor: str, *, max_concurrency: int | None = None
+) -> Any:
+    """Create the ``vendor`` client configured against ``server``."""
+    client: Any = get_api_client(
+        SupportedFormat(vendor),
+        api_url=server.url(vendor),
+        tokens=["benchmark-token"],
+        user="benchmark-user",
+        project_name=server.config.project_key,
+        project_id=None,
+        max_concurrency=max_concurrency,
+        verify_ssl=True,
+    )
+    client._rate_limiter = RateLimiter(max_calls=1_000_000, time_window=1.0)
+    if hasattr(client, "_discovery_state"):
+        client._discovery_state = DiscoveryStateStore(ttl_seconds=0)
+    return client
+
+
+def drain(client: Any) -> int:
+    """Consume every page of ``client.fetch_all`` and return the page count."""
+    return sum(1 for _ in client.fetch_all(lambda **_: None))
+
+
+class APIFetchSuite:
+    """Throughput, request count and peak memory of ``fetch_all`` per vendor."""
+
+    params: ClassVar[tuple[list[str]]] = (VENDORS,)
+    param_names: ClassVar[list[str]] = ["vendor"]
+    timeout: float = 300.0
+    server: MockVendorServer
+
+    def setup(self, vendor: str) -> None:
+        """Start a mock server holding ``ITEM_COUNT`` items."""
+        self.server = MockVendorServer(MockVendorConfig(items=ITEM_COUNT))
+        self.server.start()
+
+    def teardown(self, vendor: str) -> None:
+        """Stop the mock server."""
+        self.server.stop()
+
+    def time_fetch_all(self, vendor: str) -> None:
+        """Time to fetch every item."""
+        drain(build_client(self.server, vendor))
+
+    def track_requests(self, vendor: str) -> int:
+        """HTTP requests needed to fetch every item."""
+        drain(build_client(self.server, vendor))
+        return self.server.stats.requests
+
+    track_requests.unit = "requests"  # type: ignore[attr-defined]
+
+    def peakmem_fetch_all(self, vendor: str) -> None:
+        """Peak process memory while fetching every item."""
+        drain(build_client(self.server, vendor))
+
+
+class APIConcurrencySuite:
+    """Jira/Xray fetch time with per-request latency across concurrency levels."""
+
+    params: ClassVar[tuple[list[int]]] = ([1, 4, 8],)
+    param_names: ClassVar[list[str]] = ["max_concurrency"]
+    timeout: float = 300.0
+    server: MockVendorServer
+
+    def setup(self, max_concurrency: int) -> None:
+        """Start a mock server that delays every response by 20 ms."""
+        self.server = MockVendorServer(
+            MockVendorConfig(items=ITEM_COUNT, latency_seconds=0.02)
+        )
+        self.server.start()
+
+    def teardown(self, max_concurrency: int) -> None:
+        """Stop the mock server."""
+        self.server.stop()
+
+    def time_fetch_all(self, max_concurrency: int) -> None:
+        """Time to fetch every issue."""
+        drain(build_client(self.server, "jira_xray", max_concurrency=max_concurrency))
+
+    def track_connections(self, max_concurrency: int) -> int:
+        """TCP connections opened to fetch every issue."""
+        drain(build_client(self.server, "jira_xray", max_concurrency=max_concurrency))
+        return self.server.stats.connections
+
+    track_connections.unit = "connections"  # type: ignore[attr-defined]
+
+
+class APIRateLimitSuite:
+    """Fetch cost when the server rate-limits or fails a share of requests."""
+
+    params: ClassVar[tuple[list[str]]] = (["rate_limited", "failing"],)
+    param_names: ClassVar[list[str]] = ["fault"]
+    timeout: float = 300.0
+    server: MockVendorServer
+
+    def setup(self, fault: str) -> None:
+        """Answer every 5th request with 429 or every 7th with 503."""
+        config = MockVendorConfig(items=ITEM_COUNT)
+        if fault == "rate_limited":
+            config.rate_limit_every = 5
+        else:
+            config.fail_every = 7
+        self.server = MockVendorServer(config)
+        self.server.start()
+
+    def teardown(self, fault: str) -> None:
+        """Stop the mock server."""
+        self.server.stop()
+
+    def time_fetch_all(self, fault: str) -> None:
+        """Time to fetch every issue despite the injected faults."""
+        drain(build_client(self.server, "jira_xray"))
+
+    def track_requests(self, fault: str) -> int:
+        """HTTP requests, retries included, to fetch every issue."""
+        drain(build_client(self.server, "jira_xray"))
+        return self.server.stats.requests
+
+    track_requests.unit = "requests"  # type: ignore[attr-defined]
+
+
+def measure(
+    config: MockVendorConfig, fetch: Callable[[MockVendorServer], int]
+) -> tuple[float, int, int]:
+    """Return seconds, requests and connections for one fetch against ``config``."""
+    with MockVendorServer(config) as server:
+        start = time.perf_counter()
+        fetch(server)
+        elapsed = time.perf_counter() - start
+        return elapsed, server.stats.requests, server.stats.connections
+
+
+def fetch_with(
+    vendor: str, max_concurrency: int | None = None
+) -> Callable[[MockVendorServer], int]:
+    """Return a fetch of every ``vendor`` item for :func:`measure`."""
+
+    def fetch(server: MockVendorServer) -> int:
+        return drain(build_client(server, vendor, max_concurrency=max_concurrency))
+
+    return fetch
+
+
+def main() -> int:
+    """Print fetch time and request counts per vendor and concurrency level."""
+    for vendor in VENDORS:
+        seconds, requests, _ = measure(
+            MockVendorConfig(items=ITEM_COUNT), fetch_with(vendor)
+        )
+        print(f"{vendor:>10}: {seconds:6.3f}s, {requests} requests")
+    for workers in APIConcurrencySuite.params[0]:
+        seconds, requests, connections = measure(
+            MockVendorConfig(items=ITEM_COUNT, latency_seconds=0.02),
+            fetch_with("jira_xray", workers),
+        )
+        print(
+            f"jira_xray x{workers}: {seconds:6.3f}s, {requests} requests, "
+            f"{connections} connections (20 ms latency)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
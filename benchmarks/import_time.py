@@ -0,0 +1,123 @@
+"""
+Import-time benchmarks and startup budget for importobot.
+
+Every CLI invocation pays the interpreter's import cost before doing any
+work, so ``import importobot`` and the CLI entry point must stay cheap. These
+benchmarks run ``python -X importtime`` in a fresh interpreter and report the
+cumulative import time of each entry point. They also check that heavy
+dependencies (Robot Framework, bleach, requests, NumPy) are not loaded until
+a feature needs them.
+
+Run the budget check directly (non-zero exit on regression):
+    $ python -m benchmarks.import_time
+"""
+
+import subprocess
+import sys
+from typing import ClassVar
+
+# Entry point -> cumulative import budget in milliseconds. The budgets leave
+# generous headroom over typical timings so only real regressions, such as a
+# module-level import of the conversion engine, break them.
+IMPORT_BUDGETS_MS: dict[str, float] = {
+    "importobot": 150.0,
+    "importobot.__main__": 250.0,
+    "importobot.core.converter": 600.0,
+}
+
+# Entry point -> modules that must not be loaded by importing it.
+DEFERRED_MODULES: dict[str, tuple[str, ...]] = {
+    "importobot": (
+        "bleach",
+        "importobot.core.engine",
+        "numpy",
+        "requests",
+        "robot",
+    ),
+    "importobot.__main__": (
+        "bleach",
+        "importobot.core.engine",
+        "numpy",
+        "requests",
+        "robot",
+    ),
+    "importobot.core.converter": ("bleach", "numpy", "requests", "robot"),
+}
+
+
+def parse_importtime(output: str) -> dict[str, int]:
+    """Map each imported module to its cumulative import time in microseconds."""
+    timings: dict[str, int] = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # Header row
+        timings[fields[2].strip()] = int(fields[1])
+    return timings
+
+
+def measure_imports(module: str) -> dict[str, int]:
+    """Import ``module`` in a fresh interpreter and return its import timings."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def import_time_ms(module: str) -> float:
+    """Return the cumulative time to import ``module`` in milliseconds."""
+    return measure_imports(module)[module] / 1000.0
+
+
+def check_import_budgets(
+    budgets: dict[str, float] | None = None,
+    deferred: dict[str, tuple[str, ...]] | None = None,
+) -> list[str]:
+    """Return a description of every budget or deferred-import violation."""
+    budgets = IMPORT_BUDGETS_MS if budgets is None else budgets
+    deferred = DEFERRED_MODULES if deferred is None else deferred
+    violations: list[str] = []
+    for module in sorted(set(budgets) | set(deferred)):
+        timings = measure_imports(module)
+        elapsed_ms = timings[module] / 1000.0
+        budget_ms = budgets.get(module)
+        if budget_ms is not None and elapsed_ms > budget_ms:
+            violations.append(
+                f"import {module} took {elapsed_ms:.1f} ms (budget {budget_ms:.1f} ms)"
+            )
+        eager = sorted(name for name in deferred.get(module, ()) if name in timings)
+        if eager:
+            violations.append(f"import {module} eagerly loaded {', '.join(eager)}")
+    return violations
+
+
+class ImportTimeSuite:
+    """Benchmark suite tracking the import cost of importobot entry points."""
+
+    timeout: float = 60.0
+    unit: str = "ms"
+    params: ClassVar[list[str]] = list(IMPORT_BUDGETS_MS)
+    param_names: ClassVar[list[str]] = ["module"]
+
+    def track_import_time(self, module: str) -> float:
+        """Cumulative import time of an entry point in a fresh interpreter."""
+        return import_time_ms(module)
+
+
+def main() -> int:
+    """Check the import budgets and print a report."""
+    violations = check_import_budgets()
+    for violation in violations:
+        print(f"FAIL: {violation}")
+    if not violations:
+        print("Import-time budgets met.")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
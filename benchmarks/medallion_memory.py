@@ -0,0 +1,140 @@
+"""
+Memory benchmarks for records retained by the medallion layers.
+
+The Bronze layer keeps every ingested record in memory together with its
+``LayerMetadata``, ``LineageInfo`` and a cached ``BronzeRecord`` (which in turn
+holds ``RecordMetadata``, ``FormatDetectionResult`` and ``DataLineage``). At
+large record counts the per-object overhead of these models dominates the
+payloads, so these benchmarks track the bytes retained per record with
+``tracemalloc``.
+
+Print a report directly:
+    $ python -m benchmarks.medallion_memory
+"""
+
+import gc
+import sys
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from importobot.medallion.bronze_layer import BronzeLayer
+from importobot.medallion.interfaces.data_models import (
+    DataLineage,
+    FormatDetectionResult,
+    LayerMetadata,
+    LineageInfo,
+)
+from importobot.medallion.interfaces.enums import ProcessingStatus, SupportedFormat
+from importobot.medallion.interfaces.records import BronzeRecord, RecordMetadata
+
+RECORD_COUNT = 2000
+
+
+def retained_bytes_per_item(build: Callable[[int], Any], count: int) -> float:
+    """Return the bytes still allocated per item after building ``count`` items."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        items = [build(index) for index in range(count)]
+        gc.collect()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del items
+    return (after - before) / count
+
+
+def build_record_models(index: int) -> tuple[Any, ...]:
+    """Build the model objects the Bronze layer keeps for one record."""
+    timestamp = datetime(2025, 1, 1, 12, 0)
+    source = f"exports/batch_{index % 10}.json"
+    record_id = f"bronze_{index:08d}"
+    metadata = LayerMetadata(
+        source_path=Path(source),
+        layer_name="bronze",
+        ingestion_timestamp=timestamp,
+        processing_timestamp=timestamp,
+        data_hash=f"{index:064x}",
+        format_type=SupportedFormat.ZEPHYR,
+    )
+    lineage_info = LineageInfo(
+        data_id=record_id,
+        source_layer="input",
+        target_layer="bronze",
+        transformation_type="raw_ingestion",
+        transformation_timestamp=timestamp,
+    )
+    record = BronzeRecord(
+        data={},
+        metadata=RecordMetadata(
+            record_id=record_id,
+            ingestion_timestamp=timestamp,
+            processing_status=ProcessingStatus.COMPLETED,
+            source_system=str(Path(source)),
+            source_checksum=metadata.data_hash,
+        ),
+        format_detection=FormatDetectionResult(
+            detected_format=SupportedFormat.ZEPHYR,
+            confidence_score=0.8,
+            evidence_details={"source": "bronze_layer", "method": "in_memory"},
+            detection_timestamp=timestamp,
+        ),
+        lineage=DataLineage(
+            source_id=record_id,
+            source_type="bronze",
+            source_location=str(Path(source)),
+            created_timestamp=timestamp,
+        ),
+    )
+    return metadata, lineage_info, record
+
+
+def _ingest_into(layer: BronzeLayer, index: int) -> None:
+    """Ingest a small Zephyr-style record numbered ``index``."""
+    layer.ingest(
+        {"testCase": {"name": f"Test {index}", "steps": [{"action": "Run"}]}},
+        LayerMetadata(
+            source_path=Path(f"exports/batch_{index % 10}.json"),
+            layer_name="bronze",
+            ingestion_timestamp=datetime(2025, 1, 1, 12, 0),
+        ),
+    )
+
+
+def bronze_layer_bytes_per_record(count: int) -> float:
+    """Return the bytes a Bronze layer retains per ingested record."""
+    _ingest_into(BronzeLayer(), -1)  # Warm module-level caches first
+    layer = BronzeLayer(max_in_memory_records=count)
+    return retained_bytes_per_item(lambda index: _ingest_into(layer, index), count)
+
+
+class MedallionMemorySuite:
+    """Benchmark suite tracking per-record memory of medallion models."""
+
+    timeout: float = 300.0
+    unit: str = "bytes"
+
+    def track_model_bytes_per_record(self) -> float:
+        """Bytes retained by the metadata, lineage and record models."""
+        return retained_bytes_per_item(build_record_models, RECORD_COUNT)
+
+    def track_bronze_layer_bytes_per_record(self) -> float:
+        """Bytes retained by a Bronze layer per ingested record."""
+        return bronze_layer_bytes_per_record(RECORD_COUNT)
+
+
+def main() -> int:
+    """Print the per-record memory report."""
+    models = retained_bytes_per_item(build_record_models, RECORD_COUNT)
+    layer = bronze_layer_bytes_per_record(RECORD_COUNT)
+    print(f"Record models: {models:,.0f} bytes per record")
+    print(f"Bronze layer:  {layer:,.0f} bytes per ingested record")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,377 @@
+"""
+Local stand-in for the vendor APIs used by ``importobot.integrations.clients``.
+
+``MockVendorServer`` serves a generated project of test cases over HTTP on
+localhost, emulating the pagination each client relies on:
+
+- Jira/Xray: ``startAt``/``maxResults`` search returning ``total``
+- Zephyr: ``/rest/{tests,atm}/1.0/testcase/search`` with key and detail
+  queries (``key IN (...)``) for the two-stage fetch
+- TestRail: ``offset``/``limit`` pages linked through ``_links.next``
+- TestLink: JSON POST bridge paged through an opaque ``next`` cursor
+
+Every request can be delayed (latency injection), and every Nth request can
+be answered with 429 plus ``Retry-After`` (rate limiting) or 503 (failure
+injection). The server keeps HTTP/1.1 connections alive and counts requests,
+status codes and connections, so concurrency, pooling and rate-limiter
+changes can be measured offline.
+
+Run it standalone for manual experiments:
+    $ python -m benchmarks.mock_vendor_server --items 5000 --latency 0.02
+"""
+
+import argparse
+import json
+import re
+import socket
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlencode, urlparse
+
+VENDOR_PATHS = {
+    "jira_xray": "/jira/rest/api/2/search",
+    "zephyr": "/zephyr",
+    "testrail": "/testrail/api/v2/get_cases",
+    "testlink": "/testlink/lib/api/xmlrpc/v1/xmlrpc.php",
+}
+
+_ZEPHYR_KEYS = re.compile(r'"([^"]+)"')
+
+
+@dataclass
+class MockVendorConfig:
+    """Behaviour of a :class:`MockVendorServer`."""
+
+    items: int = 1000
+    max_page_size: int = 100
+    latency_seconds: float = 0.0
+    rate_limit_every: int = 0
+    retry_after_seconds: float = 0.0
+    fail_every: int = 0
+    project_key: str = "PRJ"
+
+
+@dataclass
+class MockVendorStats:
+    """Counters collected while the server runs."""
+
+    requests: int = 0
+    connections: int = 0
+    statuses: Counter[int] = field(default_factory=Counter)
+    by_vendor: Counter[str] = field(default_factory=Counter)
+
+
+def _page_bounds(params: dict[str, str], config: MockVendorConfig) -> range:
+    """Return the item range requested by ``startAt``/``offset`` and a size."""
+    start = int(params.get("startAt") or params.get("offset") or 0)
+    size = int(params.get("maxResults") or params.get("limit") or 50)
+    size = max(1, min(size, config.max_page_size))
+    return range(min(start, config.items), min(start + size, config.items))
+
+
+def jira_issue(index: int, project: str) -> dict[str, Any]:
+    """Return the generated Jira/Xray issue number ``index``."""
+    return {
+        "id": str(10000 + index),
+        "key": f"{project}-{index + 1}",
+        "fields": {
+            "summary": f"Verify feature {index + 1}",
+            "description": f"Step 1: open page {index}\nExpected: page loads",
+            "issuetype": {"name": "Test"},
+        },
+    }
+
+
+def zephyr_case(index: int, project: str) -> dict[str, Any]:
+    """Return the generated Zephyr test case number ``index``."""
+    return {
+        "key": f"{project}-T{index + 1}",
+        "name": f"Verify feature {index + 1}",
+        "status": "Approved",
+        "testScript": {
+            "type": "STEP_BY_STEP",
+            "steps": [
+                {
+                    "description": f"Open page {index}",
+                    "expectedResult": "Page loads",
+                }
+            ],
+        },
+    }
+
+
+def testrail_case(index: int) -> dict[str, Any]:
+    """Return the generated TestRail case number ``index``."""
+    return {
+        "id": index + 1,
+        "title": f"Verify feature {index + 1}",
+        "custom_steps_separated": [
+            {"content": f"Open page {index}", "expected": "Page loads"}
+        ],
+    }
+
+
+def testlink_suite(index: int) -> dict[str, Any]:
+    """Return the generated TestLink test suite number ``index``."""
+    return {
+        "id": index + 1,
+        "name": f"Suite {index + 1}",
+        "testcases": [{"name": f"Verify feature {index + 1}", "steps": []}],
+    }
+
+
+class _VendorRequestHandler(BaseHTTPRequestHandler):
+    """Dispatch one connection's requests to the emulated vendors."""
+
+    protocol_version = "HTTP/1.1"
+    server: "_VendorHTTPServer"
+
+    def setup(self) -> None:
+        """Count the connection before serving its requests."""
+        super().setup()
+        # Headers and body are separate writes; avoid Nagle/delayed-ACK stalls
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.lock:
+            self.server.stats.connections += 1
+
+    def do_GET(self) -> None:
+        """Serve Jira, Zephyr and TestRail searches."""
+        parsed = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        if parsed.path == VENDOR_PATHS["jira_xray"]:
+            self._respond("jira_xray", lambda: self._jira_page(params))
+        elif parsed.path.endswith("/testcase/search"):
+            self._respond("zephyr", lambda: self._zephyr_page(params))
+        elif parsed.path == VENDOR_PATHS["testrail"]:
+            self._respond("testrail", lambda: self._testrail_page(params))
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"error": "unknown endpoint"})
+
+    def do_POST(self) -> None:
+        """Serve the TestLink JSON bridge."""
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if urlparse(self.path).path == VENDOR_PATHS["testlink"]:
+            self._respond("testlink", lambda: self._testlink_page(body))
+        else:
+            self._send(HTTPStatus.NOT_FOUND, {"error": "unknown endpoint"})
+
+    # pylint: disable=redefined-builtin,unused-argument
+    def log_message(self, format: str, *args: Any) -> None:
+        """Suppress per-request logging."""
+        return
+
+    def _respond(self, vendor: str, build: Any) -> None:
+        """Apply latency and injected faults, then send ``build()``."""
+        config = self.server.config
+        with self.server.lock:
+            self.server.stats.requests += 1
+            self.server.stats.by_vendor[vendor] += 1
+            number = self.server.stats.requests
+        if config.latency_seconds:
+            time.sleep(config.latency_seconds)
+        if config.rate_limit_every and number % config.rate_limit_every == 0:
+            self._send(
+                HTTPStatus.TOO_MANY_REQUESTS,
+                {"error": "rate limited"},
+                {"Retry-After": f"{config.retry_after_seconds:g}"},
+            )
+        elif config.fail_every and number % config.fail_every == 0:
+            self._send(HTTPStatus.SERVICE_UNAVAILABLE, {"error": "injected failure"})
+        else:
+            self._send(HTTPStatus.OK, build())
+
+    def _send(
+        self,
+        status: HTTPStatus,
+        payload: Any,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Write a JSON response that keeps the connection reusable."""
+        body = json.dumps(payload).encode("utf-8")
+        with self.server.lock:
+            self.server.stats.statuses[int(status)] += 1
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _jira_page(self, params: dict[str, str]) -> dict[str, Any]:
+        config = self.server.config
+        page = _page_bounds(params, config)
+        return {
+            "startAt": page.start,
+            "maxResults": len(page),
+            "total": config.items,
+            "issues": [jira_issue(i, config.project_key) for i in page],
+        }
+
+    def _zephyr_page(self, params: dict[str, str]) -> dict[str, Any]:
+        config = self.server.config
+        query = params.get("query", "")
+        if query.startswith("key IN"):
+            prefix = f"{config.project_key}-T"
+            indexes = [
+                int(key[len(prefix) :]) - 1
+                for key in _ZEPHYR_KEYS.findall(query)
+                if key.startswith(prefix)
+            ]
+            results = [zephyr_case(i, config.project_key) for i in indexes]
+            return {"results": results, "total": len(results)}
+        page = _page_bounds(params, config)
+        if params.get("fields") == "key":
+            results = [{"key": f"{config.project_key}-T{i + 1}"} for i in page]
+        else:
+            results = [zephyr_case(i, config.project_key) for i in page]
+        return {
+            "startAt": page.start,
+            "maxResults": len(page),
+            "total": config.items,
+            "results": results,
+        }
+
+    def _testrail_page(self, params: dict[str, str]) -> dict[str, Any]:
+        config = self.server.config
+        params.setdefault("limit", "250")
+        page = _page_bounds(params, config)
+        next_link = None
+        if page.stop < config.items:
+            query = urlencode({"offset": page.stop, "limit": len(page)})
+            next_link = f"{VENDOR_PATHS['testrail']}?{query}"
+        return {
+            "offset": page.start,
+            "limit": len(page),
+            "size": len(page),
+            "_links": {"next": next_link, "prev": None},
+            "cases": [testrail_case(i) for i in page],
+        }
+
+    def _testlink_page(self, body: dict[str, Any]) -> dict[str, Any]:
+        config = self.server.config
+        start = int(str(body.get("next") or "suite:0").rsplit(":", 1)[-1])
+        page = _page_bounds({"offset": str(start), "limit": "100"}, config)
+        return {
+            "data": [testlink_suite(i) for i in page],
+            "total": config.items,
+            "next": f"suite:{page.stop}" if page.stop < config.items else None,
+        }
+
+
+class _VendorHTTPServer(ThreadingHTTPServer):
+    """Threading HTTP server carrying the mock configuration and counters."""
+
+    daemon_threads = True
+
+    def __init__(self, config: MockVendorConfig) -> None:
+        super().__init__(("127.0.0.1", 0), _VendorRequestHandler)
+        self.config = config
+        self.stats = MockVendorStats()
+        self.lock = threading.Lock()
+
+
+class MockVendorServer:
+    """Serve the emulated vendor APIs from a background thread.
+
+    Example:
+        with MockVendorServer(MockVendorConfig(items=500)) as server:
+            client = JiraXrayClient(api_url=server.url("jira_xray"), ...)
+    """
+
+    def __init__(self, config: MockVendorConfig | None = None) -> None:
+        """Create a server with ``config``; call :meth:`start` to serve."""
+        self.config = config or MockVendorConfig()
+        self._server: _VendorHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> "MockVendorServer":
+        """Start serving."""
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Stop serving."""
+        self.stop()
+
+    @property
+    def base_url(self) -> str:
+        """Return the server's root URL."""
+        if self._server is None:
+            raise RuntimeError("MockVendorServer is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @property
+    def stats(self) -> MockVendorStats:
+        """Return the live request counters."""
+        if self._server is None:
+            raise RuntimeError("MockVendorServer is not running")
+        return self._server.stats
+
+    def url(self, vendor: str) -> str:
+        """Return the API URL a client for ``vendor`` should be configured with."""
+        return f"{self.base_url}{VENDOR_PATHS[vendor]}"
+
+    def start(self) -> None:
+        """Bind an ephemeral localhost port and serve in a daemon thread."""
+        if self._server is not None:
+            return
+        self._server = _VendorHTTPServer(self.config)
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="mock-vendor-server",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Shut the server down and release its port."""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._server = None
+        self._thread = None
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Serve the mock vendor APIs until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--max-page-size", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--rate-limit-every", type=int, default=0)
+    parser.add_argument("--retry-after", type=float, default=0.0)
+    parser.add_argument("--fail-every", type=int, default=0)
+    args = parser.parse_args(argv)
+    config = MockVendorConfig(
+        items=args.items,
+        max_page_size=args.max_page_size,
+        latency_seconds=args.latency,
+        rate_limit_every=args.rate_limit_every,
+        retry_after_seconds=args.retry_after,
+        fail_every=args.fail_every,
+    )
+    with MockVendorServer(config) as server:
+        for vendor in VENDOR_PATHS:
+            print(f"{vendor:>10}: {server.url(vendor)}")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -38,7 +38,15 @@ def main() -> int:
 
     try:
         # Generate the test suite using the consolidated utility
-        counts = generate_test_suite(args.output_dir, args.count, distribution, weights)
+        counts = generate_test_suite(
+            args.output_dir,
+            args.count,
+            distribution,
+            weights,
+            seed=args.seed,
+            workers=args.workers,
+            output_format=args.format,
+        )
         _print_results(args, counts)
         return 0
     except Exception as e:
@@ -62,6 +70,26 @@ def _parse_arguments() -> argparse.Namespace:
         default=800,
         help="Total number of tests to generate (default: 800)",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        help="Seed for a reproducible suite (same seed, same suite)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes generating tests (default: 1)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["files", "jsonl", "bundles"],
+        default="files",
+        help=(
+            "Output layout: one file per test, a single JSON Lines file, "
+            "or one bundle file per shard (default: files)"
+        ),
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -152,7 +180,7 @@ def _print_results(args: argparse.Namespace, counts: dict[str, int]) -> None:
     total_generated = sum(counts.values())
     print(f"Successfully generated {total_generated} test cases")
 
-    if args.verbose:
+    if args.verbose and args.format == "files":
         print("Output structure:")
         for category, count in counts.items():
             print(f"  {args.output_dir}/{category}/: {count} .json files")
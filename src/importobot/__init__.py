@@ -12,36 +12,64 @@ Public API:
 
 Internal:
     - _check_dependencies
+
+``api`` and ``JsonToRobotConverter`` are imported on first access, so
+``import importobot`` and CLI startup do not load the conversion engine.
 """
 
 from __future__ import annotations
 
+import importlib
+import importlib.util
 from typing import TYPE_CHECKING, Any
 
-# Core public functionality - import without exposing modules
-# API toolkit (following pandas.api pattern)
-from importobot import api as _api
+# Configuration and exceptions are light and validated on import; everything
+# that pulls in the conversion engine is loaded on first attribute access.
 from importobot import config as _config
 from importobot import exceptions as _exceptions
-from importobot.core.converter import JsonToRobotConverter
 
+if TYPE_CHECKING:
+    from importobot import api
+    from importobot.core.converter import JsonToRobotConverter
+
+# Public attribute -> (module, attribute in that module or None for the module)
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str | None]] = {
+    "JsonToRobotConverter": ("importobot.core.converter", "JsonToRobotConverter"),
+    "api": ("importobot.api", None),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import heavy public attributes on first access (PEP 562)."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    module = importlib.import_module(module_name)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
 
-# Dependency validation following pandas pattern
-def _check_dependencies() -> None:
-    """Validate essential runtime dependencies during package import."""
-    missing_deps = []
 
-    # Check json (standard library)
-    try:
-        __import__("json")
-    except ImportError:
-        missing_deps.append("json (standard library)")
+def __dir__() -> list[str]:
+    """Include lazily loaded attributes in ``dir(importobot)``."""
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
 
-    # Check robotframework
-    try:
-        __import__("robot")
-    except ImportError:
-        missing_deps.append("robotframework")
+
+# Dependency validation following pandas pattern
+def _check_dependencies() -> None:
+    """Validate essential runtime dependencies during package import.
+
+    Dependencies are located with ``find_spec`` rather than imported, so the
+    check does not pay Robot Framework's import cost.
+    """
+    missing_deps = [
+        package
+        for module_name, package in (
+            ("json", "json (standard library)"),
+            ("robot", "robotframework"),
+        )
+        if importlib.util.find_spec(module_name) is None
+    ]
 
     if missing_deps:
         raise ImportError(
@@ -53,30 +81,27 @@ def _check_dependencies() -> None:
 _check_dependencies()
 _config.validate_global_limits()
 
-# TYPE_CHECKING block removed - no future type exports currently needed
-
 # Expose through clean interface
 config = _config
 exceptions = _exceptions
-api = _api
 
 
 def convert(payload: dict[str, Any] | str) -> str:
     """Convert a JSON payload (dictionary or string) to Robot Framework text."""
-    converter = JsonToRobotConverter()
-    return converter.convert(payload)
+    converter = __getattr__("JsonToRobotConverter")()
+    return converter.convert(payload)  # type: ignore[no-any-return]
 
 
 def convert_file(input_file: str, output_file: str) -> dict[str, Any]:
     """Convert a JSON file to Robot Framework output."""
-    converter = JsonToRobotConverter()
-    return converter.convert_file(input_file, output_file)
+    converter = __getattr__("JsonToRobotConverter")()
+    return converter.convert_file(input_file, output_file)  # type: ignore[no-any-return]
 
 
 def convert_directory(input_dir: str, output_dir: str) -> dict[str, Any]:
     """Convert all JSON files within a directory to Robot Framework output."""
-    converter = JsonToRobotConverter()
-    return converter.convert_directory(input_dir, output_dir)
+    converter = __getattr__("JsonToRobotConverter")()
+    return converter.convert_directory(input_dir, output_dir)  # type: ignore[no-any-return]
 
 
 __all__ = [
@@ -92,5 +117,5 @@ __all__ = [
 __version__ = "0.1.4"
 
 # Clean up namespace - remove internal imports from dir()
-del _config, _exceptions, _api
+del _config, _exceptions
 del TYPE_CHECKING
@@ -4,24 +4,59 @@ Entry point for importobot CLI. Handles argument parsing and dispatches
 to appropriate conversion functions.
 """
 
+import importlib
 import json
 import sys
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from importobot import exceptions
-from importobot.cli.handlers import (
-    handle_api_ingest,
-    handle_directory_conversion,
-    handle_files_conversion,
-    handle_positional_args,
-)
 from importobot.cli.parser import create_parser
-from importobot.core.schema_parser import register_schema_file
-from importobot.core.templates import configure_template_sources
+from importobot.cli.profiling import ProfilingSession
+from importobot.telemetry import export_telemetry_metrics
 from importobot.utils.logging import get_logger, log_exception
 
+if TYPE_CHECKING:
+    from importobot.cli.handlers import (
+        handle_api_ingest,
+        handle_api_stream,
+        handle_directory_conversion,
+        handle_files_conversion,
+        handle_positional_args,
+    )
+    from importobot.core.schema_parser import register_schema_file
+    from importobot.core.templates import configure_template_sources
+
 logger = get_logger("importobot-cli")
 
+# Command implementations import the conversion engine, templates and schema
+# parser, so they are loaded only once a command runs; ``--help`` and
+# argument errors exit before paying for them.
+_COMMAND_MODULES = {
+    "handle_api_ingest": "importobot.cli.handlers",
+    "handle_api_stream": "importobot.cli.handlers",
+    "handle_directory_conversion": "importobot.cli.handlers",
+    "handle_files_conversion": "importobot.cli.handlers",
+    "handle_positional_args": "importobot.cli.handlers",
+    "register_schema_file": "importobot.core.schema_parser",
+    "configure_template_sources": "importobot.core.templates",
+}
+
+
+def _load_commands() -> None:
+    """Bind the command implementations into this module, keeping patched names."""
+    namespace = globals()
+    for name, module_name in _COMMAND_MODULES.items():
+        if name not in namespace:
+            namespace[name] = getattr(importlib.import_module(module_name), name)
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve command names on first access (PEP 562)."""
+    if name not in _COMMAND_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _load_commands()
+    return globals()[name]
+
 
 def _check_conversion_flags(args: Any) -> bool:
     """Check if any conversion-related flags are present."""
@@ -40,6 +75,12 @@ def _handle_api_ingest_logic(
     args: Any, _parser: Any, had_conversion_flags: bool
 ) -> bool:
     """Handle API ingest logic if needed."""
+    if getattr(args, "stream", False):
+        if not getattr(args, "output", None):
+            _parser.error("--stream requires --output DIRECTORY for the .robot files")
+        handle_api_stream(args)
+        return True  # Exit flag
+
     saved_payload_path = handle_api_ingest(args)
 
     if not getattr(args, "input", None):
@@ -111,7 +152,18 @@ def main() -> None:
     parser = create_parser()
     args = parser.parse_args()
 
+    profile_mode = getattr(args, "profile", None)
+    if profile_mode:
+        with ProfilingSession(profile_mode, getattr(args, "profile_output", None)):
+            _run(args, parser)
+    else:
+        _run(args, parser)
+
+
+def _run(args: Any, parser: Any) -> None:
+    """Run the requested CLI action with shared error handling."""
     try:
+        _load_commands()
         had_conversion_flags = _check_conversion_flags(args)
 
         template_sources = getattr(args, "robot_templates", None)
@@ -133,6 +185,8 @@ def main() -> None:
 
     except Exception as e:
         _handle_error(e)
+    finally:
+        export_telemetry_metrics()
 
 
 if __name__ == "__main__":
@@ -6,22 +6,33 @@ import argparse
 import datetime as dt
 import enum
 import glob
+import importlib
 import json
 import os
 import re
 import sys
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 from importobot import exceptions
-from importobot.config import resolve_api_ingest_config
+from importobot.config import (
+    API_PIPELINE_WORKERS,
+    API_SYNC_OVERLAP_SECONDS,
+    resolve_api_ingest_config,
+)
 from importobot.core.converter import (
     convert_directory,
     convert_file,
     convert_multiple_files,
     get_conversion_suggestions,
 )
-from importobot.integrations.clients import get_api_client
+from importobot.integrations.incremental import (
+    SyncStateStore,
+    merge_snapshot,
+    payload_items,
+    sync_key,
+)
 from importobot.utils.file_operations import (
     display_suggestion_changes,
     process_single_file_with_suggestions,
@@ -179,13 +190,22 @@ def print_suggestions(filtered_suggestions: list[str]) -> None:
     print(SUGGESTIONS_SECTION_FOOTER)
 
 
-def display_suggestions(json_file_path: str, no_suggestions: bool = False) -> None:
-    """Display conversion suggestions for a JSON file if not disabled."""
+def display_suggestions(
+    json_file_path: str,
+    no_suggestions: bool = False,
+    json_data: object | None = None,
+) -> None:
+    """Display conversion suggestions for a JSON file if not disabled.
+
+    Pass ``json_data`` when the document has already been parsed (for example
+    by the conversion that just ran) to skip re-reading the file.
+    """
     if no_suggestions:
         return
 
     try:
-        json_data = load_json_file(json_file_path)
+        if json_data is None:
+            json_data = load_json_file(json_file_path)
 
         all_suggestions = collect_suggestions(json_data)
         filtered_suggestions = filter_suggestions(all_suggestions)
@@ -199,9 +219,9 @@ def display_suggestions(json_file_path: str, no_suggestions: bool = False) -> No
 
 def convert_single_file(args: argparse.Namespace) -> None:
     """Convert a single file."""
-    convert_file(args.input, args.output_file)
+    json_data = convert_file(args.input, args.output_file)
     print(SUCCESS_FILE_MSG.format(src=args.input, dest=args.output_file))
-    display_suggestions(args.input, args.no_suggestions)
+    display_suggestions(args.input, args.no_suggestions, json_data=json_data)
 
 
 def convert_directory_handler(args: argparse.Namespace) -> None:
@@ -213,9 +233,9 @@ def convert_directory_handler(args: argparse.Namespace) -> None:
 def convert_wildcard_files(args: argparse.Namespace, detected_files: list[str]) -> None:
     """Convert files matching wildcard pattern."""
     if len(detected_files) == 1:
-        convert_file(detected_files[0], args.output_file)
+        json_data = convert_file(detected_files[0], args.output_file)
         print(SUCCESS_FILE_MSG.format(src=detected_files[0], dest=args.output_file))
-        display_suggestions(detected_files[0], args.no_suggestions)
+        display_suggestions(detected_files[0], args.no_suggestions, json_data=json_data)
     else:
         convert_multiple_files(detected_files, args.output_file)
         print(
@@ -245,9 +265,9 @@ def handle_bulk_conversion_with_suggestions(
         convert_directory(args.input, args.output_file)
         print(SUCCESS_DIRECTORY_MSG.format(src=args.input, dest=args.output_file))
     elif len(detected_files) == 1:
-        convert_file(detected_files[0], args.output_file)
+        json_data = convert_file(detected_files[0], args.output_file)
         print(SUCCESS_FILE_MSG.format(src=detected_files[0], dest=args.output_file))
-        display_suggestions(detected_files[0], args.no_suggestions)
+        display_suggestions(detected_files[0], args.no_suggestions, json_data=json_data)
     else:
         convert_multiple_files(detected_files, args.output_file)
         print(
@@ -281,8 +301,8 @@ def _warn_if_insecure(config: Any) -> None:
     logger.warning(warning_message)
 
 
-def _collect_payloads(client: Any) -> tuple[list[dict[str, Any]], dict[str, int]]:
-    totals: dict[str, int] = {"progress_events": 0, "items": 0}
+def _progress_callback(totals: dict[str, int]) -> Callable[..., None]:
+    """Return a progress callback accumulating page and item counts."""
 
     def progress_cb(**info: Any) -> None:
         totals["progress_events"] += 1
@@ -306,6 +326,12 @@ def _collect_payloads(client: Any) -> tuple[list[dict[str, Any]], dict[str, int]
                 totals["items"],
             )
 
+    return progress_cb
+
+
+def _collect_payloads(client: Any) -> tuple[list[dict[str, Any]], dict[str, int]]:
+    totals: dict[str, int] = {"progress_events": 0, "items": 0}
+    progress_cb = _progress_callback(totals)
     payloads: list[dict[str, Any]] = list(client.fetch_all(progress_cb))
     return payloads, totals
 
@@ -340,7 +366,23 @@ def _write_metadata(metadata_path: Path, metadata: dict[str, Any]) -> None:
         json.dump(metadata, meta_handle, indent=2)
 
 
-def _create_api_client(config: Any) -> Any:
+def get_api_client(fetch_format: Any, **options: Any) -> Any:
+    """Create an API client, importing the HTTP integrations on first use.
+
+    The clients pull in ``requests``; conversions that never fetch from an
+    API should not pay for that import.
+    """
+    clients = importlib.import_module("importobot.integrations.clients")
+    return clients.get_api_client(fetch_format, **options)
+
+
+def fetch_and_convert(client: Any, output_dir: Path, **options: Any) -> Any:
+    """Run the pipelined fetch and conversion, importing it on first use."""
+    pipeline = importlib.import_module("importobot.integrations.pipeline")
+    return pipeline.fetch_and_convert(client, output_dir, **options)
+
+
+def _create_api_client(config: Any, *, updated_since: dt.datetime | None = None) -> Any:
     return get_api_client(
         config.fetch_format,
         api_url=config.api_url,
@@ -350,33 +392,100 @@ def _create_api_client(config: Any) -> Any:
         project_id=config.project_id,
         max_concurrency=config.max_concurrency,
         verify_ssl=not config.insecure,
+        updated_since=updated_since,
     )
 
 
+def _load_previous_sync(
+    sync_state: SyncStateStore, source_key: str
+) -> tuple[dt.datetime, list[Any]] | None:
+    """Return the high-water mark and payload pages of the last sync."""
+    recorded = sync_state.load(source_key)
+    if recorded is None:
+        logger.info("No previous sync recorded for %s; fetching everything", source_key)
+        return None
+    high_water_mark, snapshot_path = recorded
+    try:
+        snapshot = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as error:
+        logger.warning(
+            "Previous snapshot %s is unavailable (%s); fetching everything",
+            snapshot_path,
+            error,
+        )
+        return None
+    pages = snapshot if isinstance(snapshot, list) else [snapshot]
+    try:
+        for page in pages:
+            payload_items(page)
+    except exceptions.ParseError as error:
+        logger.warning(
+            "Previous snapshot %s is unreadable (%s); fetching everything",
+            snapshot_path,
+            error,
+        )
+        return None
+    return high_water_mark, pages
+
+
 def handle_api_ingest(args: argparse.Namespace) -> str:
     """Fetch suites from a remote API and persist them to disk."""
     config = resolve_api_ingest_config(args)
     _warn_if_insecure(config)
-    client = _create_api_client(config)
 
     config.output_dir.mkdir(parents=True, exist_ok=True)
     payload_path = _build_payload_filename(config)
     metadata_path = payload_path.with_suffix(".meta.json")
 
+    sync_state = SyncStateStore.for_directory(config.output_dir)
+    source_key = sync_key(
+        config.fetch_format.value,
+        config.api_url,
+        config.project_name or config.project_id,
+    )
+    previous = (
+        _load_previous_sync(sync_state, source_key) if config.incremental else None
+    )
+    updated_since = previous[0] if previous else None
+    client = _create_api_client(config, updated_since=updated_since)
+    if previous is not None and not getattr(client, "supports_updated_since", True):
+        logger.info(
+            "%s has no update filter; replacing the previous snapshot",
+            config.fetch_format.value,
+        )
+        previous = None
+
+    sync_started = dt.datetime.now(dt.timezone.utc)
     payloads, totals = _collect_payloads(client)
 
     page_count = len(payloads)
 
-    if not payloads:
+    if not payloads and previous is None:
         logger.warning(
             "No data returned from %s for %s",
             config.api_url,
             config.fetch_format.value,
         )
 
-    _write_payload(payload_path, payloads)
     metadata = _build_metadata(config, page_count=page_count, totals=totals)
+    if previous is not None:
+        merged = merge_snapshot(previous[1], payloads)
+        payloads = [merged]
+        metadata["incremental"] = {
+            "updated_since": previous[0].isoformat(),
+            "changed_items": totals["items"],
+            "snapshot_items": merged["total"],
+        }
+
+    _write_payload(payload_path, payloads)
     _write_metadata(metadata_path, metadata)
+    if config.incremental:
+        sync_state.save(
+            source_key,
+            sync_started=sync_started,
+            snapshot=payload_path,
+            overlap_seconds=API_SYNC_OVERLAP_SECONDS,
+        )
 
     args.input = str(payload_path)
     args.input_dir = str(config.output_dir)
@@ -393,6 +502,57 @@ def handle_api_ingest(args: argparse.Namespace) -> str:
     return str(payload_path)
 
 
+def handle_api_stream(args: argparse.Namespace) -> str:
+    """Fetch suites from a remote API and convert each page as it arrives.
+
+    Pages go straight from the client to the converter through a bounded
+    queue and are written as ``.robot`` files into ``args.output``. The raw
+    payload and its metadata are written only with ``--archive-payload``.
+    """
+    config = resolve_api_ingest_config(args)
+    if config.incremental:
+        raise exceptions.ConfigurationError(
+            "--incremental merges into a saved payload and cannot be combined "
+            "with --stream"
+        )
+    _warn_if_insecure(config)
+    client = _create_api_client(config)
+
+    payload_path = _build_payload_filename(config)
+    archive_path = payload_path if getattr(args, "archive_payload", False) else None
+    output_dir = Path(args.output).expanduser()
+    totals: dict[str, int] = {"progress_events": 0, "items": 0}
+
+    result = fetch_and_convert(
+        client,
+        output_dir,
+        basename=payload_path.stem,
+        progress_cb=_progress_callback(totals),
+        workers=getattr(args, "convert_workers", None) or API_PIPELINE_WORKERS,
+        archive_path=archive_path,
+    )
+
+    if archive_path is not None:
+        metadata = _build_metadata(config, page_count=result.pages, totals=totals)
+        _write_metadata(archive_path.with_suffix(".meta.json"), metadata)
+    if not result.robot_files:
+        logger.warning(
+            "No test items returned from %s for %s",
+            config.api_url,
+            config.fetch_format.value,
+        )
+
+    print(SUCCESS_COUNT_MSG.format(count=len(result.robot_files), dest=output_dir))
+    logger.info(
+        "Converted %s pages (%s items) from %s; skipped %s empty pages",
+        result.pages,
+        result.items,
+        config.api_url,
+        result.skipped_pages,
+    )
+    return str(output_dir)
+
+
 def handle_positional_args(
     args: argparse.Namespace, parser: argparse.ArgumentParser
 ) -> None:
@@ -437,9 +597,9 @@ def handle_files_conversion(
         display_suggestions(input_file, args.no_suggestions)
     elif len(args.files) == 1:
         # Single file conversion - output should be a file
-        convert_file(args.files[0], args.output)
+        json_data = convert_file(args.files[0], args.output)
         print(SUCCESS_FILE_MSG.format(src=args.files[0], dest=args.output))
-        display_suggestions(args.files[0], args.no_suggestions)
+        display_suggestions(args.files[0], args.no_suggestions, json_data=json_data)
     else:
         # Multiple files conversion - output should be a directory
         convert_multiple_files(args.files, args.output)
@@ -472,6 +632,7 @@ __all__ = [
     "display_suggestions",
     "filter_suggestions",
     "handle_api_ingest",
+    "handle_api_stream",
     "handle_bulk_conversion_with_suggestions",
     "handle_directory_conversion",
     "handle_files_conversion",
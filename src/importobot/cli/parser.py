@@ -7,6 +7,7 @@ from collections.abc import Sequence
 from typing import cast
 
 from importobot.cli.constants import FETCHABLE_FORMATS, format_choices
+from importobot.cli.profiling import PROFILE_MODES
 
 
 class FetchFormatAction(argparse.Action):
@@ -175,6 +176,34 @@ def create_parser() -> argparse.ArgumentParser:
         type=int,
         help="Maximum number of concurrent API requests (experimental)",
     )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Fetch only items updated since the previous sync of the same "
+            "source and merge them into its last payload file"
+        ),
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Convert fetched pages as they arrive, writing one .robot file per "
+            "page into the --output directory instead of saving the payload first"
+        ),
+    )
+    parser.add_argument(
+        "--archive-payload",
+        dest="archive_payload",
+        action="store_true",
+        help="With --stream, also save the raw payload and its metadata",
+    )
+    parser.add_argument(
+        "--convert-workers",
+        dest="convert_workers",
+        type=int,
+        help="With --stream, number of conversion processes (default: 1)",
+    )
     parser.add_argument(
         "--insecure",
         action="store_true",
@@ -208,4 +237,23 @@ def create_parser() -> argparse.ArgumentParser:
         ),
     )
 
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="cpu",
+        choices=PROFILE_MODES,
+        metavar="MODE",
+        help=(
+            "Profile the run and write a JSON hot-path report "
+            "(cpu: cProfile and regex timings, mem: tracemalloc peaks per stage). "
+            "Use --profile=MODE when followed by positional arguments."
+        ),
+    )
+    parser.add_argument(
+        "--profile-output",
+        dest="profile_output",
+        metavar="PATH",
+        help="Profile report path (defaults to importobot-profile-MODE.json)",
+    )
+
     return parser
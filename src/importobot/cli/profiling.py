@@ -0,0 +1,417 @@
+"""Profiling support behind the ``--profile`` CLI flag.
+
+The profiler wraps a whole CLI invocation and writes a JSON report that is
+stable enough to diff between releases. Time and memory are attributed to the
+same pipeline stages that telemetry spans record (``json.load``,
+``format.detect``, ``keywords.<generator>``, ...), so a report answers "which
+stage was slow" before "which function was slow".
+"""
+
+from __future__ import annotations
+
+import cProfile
+import json
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from importobot import __version__
+from importobot.services.performance_cache import get_performance_cache
+from importobot.telemetry import (
+    TelemetryClient,
+    get_telemetry_client,
+    set_telemetry_client,
+)
+from importobot.utils.logging import get_logger
+from importobot.utils.regex_cache import (
+    disable_pattern_timing,
+    enable_pattern_timing,
+    get_pattern_timings,
+    reset_pattern_timings,
+)
+from importobot.utils.regex_cache import get_cache_info as get_regex_cache_info
+from importobot.utils.string_cache import get_cache_info as get_string_cache_info
+
+logger = get_logger("importobot-cli")
+
+PROFILE_MODES: tuple[str, ...] = ("cpu", "mem")
+PROFILE_REPORT_SCHEMA_VERSION = 1
+DEFAULT_PROFILE_TOP_N = 25
+
+_PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+
+def default_profile_output(mode: str) -> Path:
+    """Return the default report path for ``mode`` in the working directory."""
+    return Path(f"importobot-profile-{mode}.json")
+
+
+class _StageMemoryTracker:
+    """Attribute tracemalloc peaks to nested stages.
+
+    ``tracemalloc`` exposes a single process-wide peak, so each stage resets it
+    on entry and hands the observed peak back to its parent on exit.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stack: list[list[int]] = []
+        self.peaks: dict[str, int] = {}
+        self.overall_peak = 0
+
+    def push(self) -> None:
+        with self._lock:
+            current, peak_so_far = tracemalloc.get_traced_memory()
+            self.overall_peak = max(self.overall_peak, peak_so_far)
+            if self._stack:
+                parent = self._stack[-1]
+                parent[1] = max(parent[1], peak_so_far)
+            tracemalloc.reset_peak()
+            self._stack.append([current, current])
+
+    def pop(self, stage: str) -> None:
+        with self._lock:
+            if not self._stack:
+                return
+            baseline, child_peak = self._stack.pop()
+            _, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, child_peak)
+            self.overall_peak = max(self.overall_peak, peak)
+            self.peaks[stage] = max(self.peaks.get(stage, 0), peak - baseline)
+            if self._stack:
+                parent = self._stack[-1]
+                parent[1] = max(parent[1], peak)
+
+
+class _MemorySpan:
+    """Timing span that also records the stage's peak traced memory."""
+
+    __slots__ = ("_inner", "_stage", "_tracker")
+
+    def __init__(
+        self,
+        inner: AbstractContextManager[None],
+        tracker: _StageMemoryTracker,
+        stage: str,
+    ) -> None:
+        self._inner = inner
+        self._tracker = tracker
+        self._stage = stage
+
+    def __enter__(self) -> None:
+        self._tracker.push()
+        self._inner.__enter__()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._inner.__exit__(exc_type, exc, traceback)
+        self._tracker.pop(self._stage)
+
+
+class _ProfilingTelemetryClient(TelemetryClient):
+    """Telemetry client installed for the duration of a profiling session."""
+
+    def __init__(self, memory_tracker: _StageMemoryTracker | None) -> None:
+        # Thresholds that can never be reached keep cache metrics from being
+        # logged while the profiler owns the global client.
+        super().__init__(
+            min_emit_interval=float("inf"),
+            min_sample_delta=sys.maxsize,
+        )
+        self._memory_tracker = memory_tracker
+
+    def span(self, stage: str) -> AbstractContextManager[None]:
+        """Return a span that also tracks memory when profiling ``mem``."""
+        inner = super().span(stage)
+        if self._memory_tracker is None:
+            return inner
+        return _MemorySpan(inner, self._memory_tracker, stage)
+
+
+def _component_for(filename: str) -> str:
+    """Map a source file to an importobot module path, or ``external``."""
+    if filename.startswith(("<", "~")):
+        return "builtin"
+    try:
+        relative = Path(filename).resolve().relative_to(_PACKAGE_ROOT)
+    except ValueError:
+        return "external"
+    return ".".join(("importobot", *relative.with_suffix("").parts))
+
+
+def _summarize_cache(hits: int, misses: int, **extra: Any) -> dict[str, Any]:
+    total = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": hits / total if total else 0.0,
+        **extra,
+    }
+
+
+def _regex_cache_stats() -> dict[str, Any]:
+    info = get_regex_cache_info()
+    return _summarize_cache(
+        int(info["hits"] or 0), int(info["misses"] or 0), size=info["currsize"]
+    )
+
+
+def _string_cache_stats() -> dict[str, Any]:
+    info = get_string_cache_info()["cache"]
+    return _summarize_cache(
+        int(info["hits"]), int(info["misses"]), size=info["currsize"]
+    )
+
+
+def _performance_cache_stats() -> dict[str, Any]:
+    stats = get_performance_cache().get_stats()
+    return _summarize_cache(
+        int(stats["cache_hits"]), int(stats["cache_misses"]), size=stats["cache_size"]
+    )
+
+
+CACHE_STATS_PROVIDERS: dict[str, Callable[[], dict[str, Any]]] = {
+    "regex_cache": _regex_cache_stats,
+    "string_cache": _string_cache_stats,
+    "performance_cache": _performance_cache_stats,
+}
+
+
+class ProfilingSession:
+    """Profile a block of CLI work and write a machine-readable report.
+
+    ``cpu`` mode runs ``cProfile`` (reporting functions by cumulative and by
+    self time) and times regex patterns served by
+    :mod:`importobot.utils.regex_cache`; ``mem`` mode runs ``tracemalloc`` and
+    records peak memory per stage. Both modes report stage timings and cache
+    hit rates.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        output_path: str | Path | None = None,
+        *,
+        top_n: int = DEFAULT_PROFILE_TOP_N,
+        argv: list[str] | None = None,
+    ) -> None:
+        """Initialize the session without starting any profiler."""
+        if mode not in PROFILE_MODES:
+            raise ValueError(
+                f"Unsupported profile mode {mode!r}; expected one of {PROFILE_MODES}"
+            )
+        self.mode = mode
+        self.output_path = Path(output_path or default_profile_output(mode))
+        self.top_n = top_n
+        self.argv = list(sys.argv[1:] if argv is None else argv)
+        self.report: dict[str, Any] | None = None
+        self._profiler: cProfile.Profile | None = None
+        self._memory_tracker: _StageMemoryTracker | None = None
+        self._client: _ProfilingTelemetryClient | None = None
+        self._previous_client: TelemetryClient | None = None
+        self._started_tracemalloc = False
+        self._start = 0.0
+        self._elapsed = 0.0
+
+    def __enter__(self) -> ProfilingSession:
+        """Install the profiling telemetry client and start the profiler."""
+        self._previous_client = get_telemetry_client()
+        if self.mode == "mem":
+            self._memory_tracker = _StageMemoryTracker()
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            tracemalloc.reset_peak()
+        self._client = _ProfilingTelemetryClient(self._memory_tracker)
+        set_telemetry_client(self._client)
+
+        reset_pattern_timings()
+        if self.mode == "cpu":
+            enable_pattern_timing()
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Stop profiling, restore telemetry and write the report."""
+        self._elapsed = time.perf_counter() - self._start
+        if self._profiler is not None:
+            self._profiler.disable()
+        disable_pattern_timing()
+        peak_memory = 0
+        allocations: list[dict[str, Any]] = []
+        if self._memory_tracker is not None:
+            peak_memory = max(
+                tracemalloc.get_traced_memory()[1], self._memory_tracker.overall_peak
+            )
+            allocations = self._top_allocations()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        set_telemetry_client(self._previous_client)
+
+        self.report = self.build_report(
+            peak_memory=peak_memory,
+            allocations=allocations,
+            exit_status=self._exit_status(exc_type, exc),
+        )
+        try:
+            self.write_report(self.report)
+        except OSError as error:
+            logger.error(
+                "Could not write profile report %s: %s", self.output_path, error
+            )
+            return
+        print(
+            f"Profile report ({self.mode}) written to {self.output_path}",
+            file=sys.stderr,
+        )
+
+    @staticmethod
+    def _exit_status(
+        exc_type: type[BaseException] | None, exc: BaseException | None
+    ) -> str:
+        if exc_type is None:
+            return "ok"
+        if isinstance(exc, SystemExit) and exc.code in (0, None):
+            return "ok"
+        return "error"
+
+    def build_report(
+        self,
+        *,
+        peak_memory: int = 0,
+        allocations: list[dict[str, Any]] | None = None,
+        exit_status: str = "ok",
+    ) -> dict[str, Any]:
+        """Assemble the report dictionary from the collected data."""
+        report: dict[str, Any] = {
+            "schema_version": PROFILE_REPORT_SCHEMA_VERSION,
+            "importobot_version": __version__,
+            "python_version": sys.version.split()[0],
+            "mode": self.mode,
+            "argv": self.argv,
+            "exit_status": exit_status,
+            "wall_time_seconds": self._elapsed,
+            "stages": self._stage_report(),
+            "counters": self._counters(),
+            "caches": self._cache_report(),
+        }
+        if self.mode == "cpu":
+            functions = self._function_rows()
+            report["top_functions"] = sorted(
+                functions, key=lambda row: row["cumulative_seconds"], reverse=True
+            )[: self.top_n]
+            report["hot_functions"] = sorted(
+                functions, key=lambda row: row["total_seconds"], reverse=True
+            )[: self.top_n]
+            report["regex_patterns"] = get_pattern_timings()[: self.top_n]
+        else:
+            report["memory"] = {
+                "peak_bytes": peak_memory,
+                "top_allocations": allocations or [],
+            }
+        return report
+
+    def write_report(self, report: dict[str, Any]) -> None:
+        """Write ``report`` as sorted, indented JSON for stable diffs."""
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.output_path, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2, sort_keys=True, default=str)
+            handle.write("\n")
+
+    def _snapshot(self) -> dict[str, Any]:
+        if self._client is None:
+            return {"timings": {}, "counters": {}}
+        return self._client.metrics_snapshot()
+
+    def _stage_report(self) -> dict[str, dict[str, Any]]:
+        timings = self._snapshot().get("timings", {})
+        peaks = self._memory_tracker.peaks if self._memory_tracker else {}
+        stages: dict[str, dict[str, Any]] = {}
+        for stage, data in timings.items():
+            entry = {
+                "count": data["count"],
+                "total_seconds": data["sum"],
+                "mean_seconds": data["mean"],
+                "max_seconds": data["max"],
+            }
+            if self.mode == "mem":
+                entry["peak_memory_bytes"] = peaks.get(stage, 0)
+            stages[stage] = entry
+        return stages
+
+    def _counters(self) -> dict[str, Any]:
+        counters = self._snapshot().get("counters", {})
+        return dict(counters) if isinstance(counters, dict) else {}
+
+    @staticmethod
+    def _cache_report() -> dict[str, dict[str, Any]]:
+        return {name: provider() for name, provider in CACHE_STATS_PROVIDERS.items()}
+
+    def _function_rows(self) -> list[dict[str, Any]]:
+        if self._profiler is None:
+            return []
+        stats = pstats.Stats(self._profiler)
+        raw_stats: dict[Any, Any] = stats.stats  # type: ignore[attr-defined]
+        rows = []
+        for (filename, lineno, name), (
+            primitive_calls,
+            calls,
+            total_time,
+            cumulative_time,
+            _callers,
+        ) in raw_stats.items():
+            rows.append(
+                {
+                    "function": f"{name} ({Path(filename).name}:{lineno})",
+                    "component": _component_for(filename),
+                    "calls": calls,
+                    "primitive_calls": primitive_calls,
+                    "total_seconds": total_time,
+                    "cumulative_seconds": cumulative_time,
+                }
+            )
+        return rows
+
+    def _top_allocations(self) -> list[dict[str, Any]]:
+        snapshot = tracemalloc.take_snapshot()
+        statistics = snapshot.statistics("lineno")[: self.top_n]
+        allocations = []
+        for stat in statistics:
+            frame = stat.traceback[0]
+            allocations.append(
+                {
+                    "location": f"{Path(frame.filename).name}:{frame.lineno}",
+                    "component": _component_for(frame.filename),
+                    "size_bytes": stat.size,
+                    "count": stat.count,
+                }
+            )
+        return allocations
+
+
+__all__ = [
+    "CACHE_STATS_PROVIDERS",
+    "DEFAULT_PROFILE_TOP_N",
+    "PROFILE_MODES",
+    "PROFILE_REPORT_SCHEMA_VERSION",
+    "ProfilingSession",
+    "default_profile_output",
+]
@@ -162,6 +162,9 @@ FILE_CONTENT_CACHE_TTL_SECONDS = _int_from_env(
 FILE_CONTENT_CACHE_MAX_ENTRIES = _int_from_env(
     "IMPORTOBOT_FILE_CACHE_MAX_ENTRIES", 2048, minimum=1
 )
+STEP_KEYWORD_CACHE_MAX_SIZE = _int_from_env(
+    "IMPORTOBOT_STEP_KEYWORD_CACHE_MAX_SIZE", 4096, minimum=0
+)
 PERFORMANCE_CACHE_MAX_SIZE = _int_from_env(
     "IMPORTOBOT_PERFORMANCE_CACHE_MAX_SIZE", 1000, minimum=1
 )
@@ -190,6 +193,28 @@ BRONZE_LAYER_IN_MEMORY_TTL_SECONDS = _int_from_env(
     "IMPORTOBOT_BRONZE_IN_MEMORY_TTL_SECONDS", 0, minimum=0
 )
 
+# How long a discovered Zephyr API configuration is reused before probing
+# again. Scheduled syncs against one tenant skip discovery within this window;
+# 0 disables the discovery state file.
+ZEPHYR_DISCOVERY_TTL_SECONDS = _int_from_env(
+    "IMPORTOBOT_ZEPHYR_DISCOVERY_TTL_SECONDS", 6 * 60 * 60, minimum=0
+)
+
+
+# Incremental API syncs request items updated since the previous sync started,
+# moved back by this many seconds to absorb client/server clock skew.
+API_SYNC_OVERLAP_SECONDS = _int_from_env(
+    "IMPORTOBOT_API_SYNC_OVERLAP_SECONDS", 5 * 60, minimum=0
+)
+
+
+# Pipelined fetch and conversion (--stream): fetched pages waiting for a
+# converter, and the conversion processes (1 converts on the calling thread).
+API_PIPELINE_QUEUE_PAGES = _int_from_env(
+    "IMPORTOBOT_API_PIPELINE_QUEUE_PAGES", 4, minimum=1
+)
+API_PIPELINE_WORKERS = _int_from_env("IMPORTOBOT_API_PIPELINE_WORKERS", 1, minimum=1)
+
 
 @dataclass(slots=True)
 class APIIngestConfig:
@@ -204,6 +229,7 @@ class APIIngestConfig:
     output_dir: Path
     max_concurrency: int | None
     insecure: bool
+    incremental: bool = False
 
 
 def _split_tokens(raw_tokens: str | None) -> list[str]:
@@ -242,6 +268,12 @@ def _resolve_max_concurrency(cli_value: int | None) -> int | None:
     return value if value > 0 else None
 
 
+def _resolve_incremental_flag(args: Any, prefix: str) -> bool:
+    """Resolve the incremental sync flag from CLI arguments or environment variables."""
+    cli_incremental = bool(getattr(args, "incremental", False))
+    return cli_incremental or _flag_from_env(f"{prefix}_INCREMENTAL", False)
+
+
 def _resolve_insecure_flag(args: Any, prefix: str) -> bool:
     """Resolve the TLS verification flag from CLI arguments or environment variables."""
     cli_insecure = bool(getattr(args, "insecure", False))
@@ -466,6 +498,7 @@ def resolve_api_ingest_config(args: Any) -> APIIngestConfig:
         output_dir=output_dir,
         max_concurrency=max_concurrency,
         insecure=insecure,
+        incremental=_resolve_incremental_flag(args, prefix),
     )
 
 
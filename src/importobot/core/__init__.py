@@ -4,15 +4,19 @@ This module's contents are implementation details and should not be accessed
 directly. Public API functionality is exposed through `importobot.api`.
 """
 
-from typing import NoReturn
+from types import ModuleType
+
+from importobot.utils.lazy_loader import import_internal_submodule
 
 # No public exports - these are implementation details
 # Access public functionality through importobot.api
 __all__: list[str] = []
 
 
-def __getattr__(name: str) -> NoReturn:
+def __getattr__(name: str) -> ModuleType:
     """Prevents accidental access to internal core modules."""
-    raise ModuleNotFoundError(
-        "importobot.core is internal. Use importobot.api.* or documented helpers."
+    return import_internal_submodule(
+        __name__,
+        name,
+        "importobot.core is internal. Use importobot.api.* or documented helpers.",
     )
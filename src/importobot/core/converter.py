@@ -6,6 +6,7 @@ with steps, expected results, and metadata.
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -13,6 +14,7 @@ from importobot import exceptions
 from importobot.core.engine import GenericConversionEngine
 from importobot.core.suggestions import GenericSuggestionEngine
 from importobot.services.performance_cache import cached_string_lower
+from importobot.telemetry import telemetry_span
 from importobot.utils.json_utils import load_json_file
 from importobot.utils.logging import get_logger
 from importobot.utils.validation import (
@@ -106,10 +108,15 @@ class JsonToRobotConverter:
         return {"success": True, "input_dir": input_dir, "output_dir": output_dir}
 
 
+@lru_cache(maxsize=1)
+def _shared_suggestion_engine() -> GenericSuggestionEngine:
+    """Return a suggestion engine reused across calls; analyzers are stateless."""
+    return GenericSuggestionEngine()
+
+
 def get_conversion_suggestions(json_data: dict[str, Any]) -> list[str]:
     """Generate suggestions to improve JSON test data for Robot conversion."""
-    suggestion_engine = GenericSuggestionEngine()
-    return suggestion_engine.get_suggestions(json_data)
+    return _shared_suggestion_engine().get_suggestions(json_data)
 
 
 def apply_conversion_suggestions(
@@ -138,13 +145,20 @@ def save_robot_file(content: str, file_path: str) -> None:
 
     validated_path = validate_safe_path(file_path)
 
-    with open(validated_path, "w", encoding="utf-8") as f:
+    with (
+        telemetry_span("storage.write.robot"),
+        open(validated_path, "w", encoding="utf-8") as f,
+    ):
         f.write(content)
 
 
-def convert_file(input_file: str, output_file: str) -> None:
+def convert_file(input_file: str, output_file: str) -> dict[str, Any]:
     """Convert a single JSON file to Robot Framework format.
 
+    Returns:
+        The parsed JSON document, so callers such as the CLI can generate
+        suggestions without reading and parsing the file a second time.
+
     Raises:
         `ValidationError`: If input parameters are invalid.
         `ConversionError`: If the conversion process fails.
@@ -159,6 +173,7 @@ def convert_file(input_file: str, output_file: str) -> None:
     converter = JsonToRobotConverter()
     robot_content = converter.convert_json_data(json_data)
     save_robot_file(robot_content, output_file)
+    return json_data
 
 
 def convert_multiple_files(input_files: list[str], output_dir: str) -> None:
@@ -8,10 +8,14 @@ from importobot.core.field_definitions import (
     TEST_TAG_FIELDS,
 )
 from importobot.core.interfaces import ConversionEngine
-from importobot.core.keyword_generator import GenericKeywordGenerator
+from importobot.core.keyword_generator import (
+    GenericKeywordGenerator,
+    get_shared_step_memo,
+)
 from importobot.core.parsers import GenericTestFileParser
 from importobot.core.pattern_matcher import LibraryDetector
 from importobot.core.templates.blueprints import render_with_blueprints
+from importobot.telemetry import telemetry_span
 from importobot.utils.logging import get_logger
 from importobot.utils.validation import (
     convert_parameters_to_robot_variables,
@@ -27,7 +31,9 @@ class GenericConversionEngine(ConversionEngine):
     def __init__(self) -> None:
         """Initialize the parser and keyword generator components."""
         self.parser = GenericTestFileParser()
-        self.keyword_generator = GenericKeywordGenerator()
+        self.keyword_generator = GenericKeywordGenerator(
+            step_memo=get_shared_step_memo()
+        )
 
     def convert(
         self,
@@ -38,7 +44,8 @@ class GenericConversionEngine(ConversionEngine):
         Args:
             json_data: The JSON data to convert
         """
-        specialized = render_with_blueprints(json_data)
+        with telemetry_span("blueprint.render"):
+            specialized = render_with_blueprints(json_data)
         if specialized is not None:
             return specialized
 
@@ -0,0 +1,454 @@
+"""Precompiled, memory-mapped index of the Robot Framework keyword catalogs.
+
+The keyword definitions live in two places: the JSON catalogs under
+``data/keywords`` and the in-code tables of
+:class:`~importobot.core.keywords_registry.RobotFrameworkKeywordRegistry`.
+:func:`compile_keyword_catalog` merges both into one compact binary file:
+
+* a fixed header (magic, format version, slot count, source fingerprint),
+* an open-addressing hash table of ``(hash, offset, length)`` slots keyed by
+  the normalized keyword name, and
+* one compact JSON record per normalized name plus a metadata record with
+  the library list and the intent table.
+
+:class:`KeywordCatalog` maps the file read-only, so worker processes share
+the same physical pages, and a lookup decodes only the one record it hits.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from importobot import exceptions
+from importobot.core.keywords_registry import RobotFrameworkKeywordRegistry
+from importobot.utils.defaults import get_library_canonical_name
+from importobot.utils.logging import get_logger
+from importobot.utils.security import extract_security_warnings
+
+logger = get_logger()
+
+CATALOG_MAGIC = b"IOKC"
+CATALOG_FORMAT_VERSION = 1
+KEYWORD_DATA_DIR = Path(__file__).parent.parent / "data" / "keywords"
+DEFAULT_CATALOG_PATH = Path(".importobot/cache/keyword_catalog.bin")
+
+# magic, version, reserved, slot count, record count, metadata offset,
+# metadata length, source fingerprint
+_HEADER = struct.Struct("<4sHHIIQI16s")
+# key hash, record offset, record length (0 marks an empty slot)
+_SLOT = struct.Struct("<QQI")
+
+
+def normalize_keyword_name(name: str) -> str:
+    """Normalize a keyword name the way Robot Framework matches keywords.
+
+    Matching ignores case, spaces and underscores, so ``Open Browser``,
+    ``open_browser`` and ``OPENBROWSER`` all name the same keyword.
+    """
+    return name.lower().replace(" ", "").replace("_", "")
+
+
+def _key_hash(normalized: str) -> int:
+    digest = hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+@dataclass(frozen=True)
+class CatalogEntry:
+    """One keyword of one library as recorded in the catalog."""
+
+    library: str
+    keyword: str
+    args: tuple[str, ...]
+    description: str
+    security_warnings: tuple[str, ...]
+    intents: tuple[str, ...]
+
+    @classmethod
+    def from_record(cls, record: dict[str, Any]) -> CatalogEntry:
+        """Build an entry from its serialized record."""
+        return cls(
+            library=record["library"],
+            keyword=record["keyword"],
+            args=tuple(record["args"]),
+            description=record["description"],
+            security_warnings=tuple(record["security_warnings"]),
+            intents=tuple(record["intents"]),
+        )
+
+    def to_record(self) -> dict[str, Any]:
+        """Serialize the entry for the catalog file."""
+        return {
+            "library": self.library,
+            "keyword": self.keyword,
+            "args": list(self.args),
+            "description": self.description,
+            "security_warnings": list(self.security_warnings),
+            "intents": list(self.intents),
+        }
+
+
+def _json_sources(data_dir: Path) -> list[Path]:
+    return sorted(data_dir.glob("*.json")) if data_dir.exists() else []
+
+
+def source_fingerprint(data_dir: Path = KEYWORD_DATA_DIR) -> bytes:
+    """Fingerprint the catalog sources without parsing the JSON catalogs.
+
+    Covers the format version, the size and mtime of every JSON catalog and
+    the content of the registry tables, so any change triggers a rebuild.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{CATALOG_FORMAT_VERSION}".encode())
+    for path in _json_sources(data_dir):
+        stat = path.stat()
+        digest.update(f"{path.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    registry = RobotFrameworkKeywordRegistry
+    digest.update(
+        json.dumps(
+            [registry.KEYWORD_LIBRARIES, registry.INTENT_TO_LIBRARY_KEYWORDS],
+            sort_keys=True,
+        ).encode("utf-8")
+    )
+    return digest.digest()
+
+
+def _merge_keyword(
+    merged: dict[tuple[str, str], dict[str, Any]],
+    library_names: dict[str, str],
+    library: str,
+    keyword: str,
+    info: dict[str, Any],
+) -> None:
+    canonical = get_library_canonical_name(library)
+    library_name = library_names.setdefault(canonical, library)
+    record = merged.setdefault(
+        (canonical, normalize_keyword_name(keyword)),
+        {
+            "library": library_name,
+            "keyword": keyword,
+            "args": None,
+            "description": None,
+            "security_warnings": [],
+        },
+    )
+    if record["args"] is None and isinstance(info.get("args"), list):
+        record["args"] = [str(arg) for arg in info["args"]]
+    if record["description"] is None and "description" in info:
+        record["description"] = str(info["description"])
+    for warning in extract_security_warnings(info):
+        if warning not in record["security_warnings"]:
+            record["security_warnings"].append(warning)
+
+
+def _json_catalog_keywords(
+    path: Path,
+) -> Iterator[tuple[str, str, dict[str, Any]]]:
+    try:
+        config = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as error:
+        logger.warning("Skipping keyword catalog %s: %s", path, error)
+        return
+    keywords = config.get("keywords") if isinstance(config, dict) else None
+    if not isinstance(keywords, dict):
+        return
+    library = str(config.get("library_name", path.stem))
+    for keyword, info in keywords.items():
+        if isinstance(info, dict):
+            yield library, keyword, info
+
+
+def collect_catalog_entries(data_dir: Path = KEYWORD_DATA_DIR) -> list[CatalogEntry]:
+    """Merge the registry tables and the JSON catalogs into catalog entries.
+
+    Libraries are matched through their canonical alias, so the registry's
+    ``builtin`` and the JSON ``BuiltIn`` describe the same library; the
+    registry's library name is kept because the intent table uses it. Fields
+    missing from the registry are filled from the JSON catalogs and security
+    warnings from both are combined.
+    """
+    merged: dict[tuple[str, str], dict[str, Any]] = {}
+    library_names: dict[str, str] = {}
+    for library, keywords in RobotFrameworkKeywordRegistry.KEYWORD_LIBRARIES.items():
+        for keyword, info in keywords.items():
+            _merge_keyword(merged, library_names, library, keyword, info)
+    for path in _json_sources(data_dir):
+        for library, keyword, info in _json_catalog_keywords(path):
+            _merge_keyword(merged, library_names, library, keyword, info)
+
+    intents: dict[tuple[str, str], list[str]] = {}
+    intent_table = RobotFrameworkKeywordRegistry.INTENT_TO_LIBRARY_KEYWORDS
+    for intent, (library, keyword) in intent_table.items():
+        key = (get_library_canonical_name(library), normalize_keyword_name(keyword))
+        intents.setdefault(key, []).append(intent)
+
+    return [
+        CatalogEntry.from_record(
+            {
+                **record,
+                "args": record["args"] or [],
+                "description": record["description"] or "",
+                "intents": sorted(intents.get(key, [])),
+            }
+        )
+        for key, record in merged.items()
+    ]
+
+
+def build_catalog_bytes(
+    entries: list[CatalogEntry],
+    intents: dict[str, tuple[str, str]],
+    fingerprint: bytes,
+) -> bytes:
+    """Serialize entries and the intent table into the binary catalog format."""
+    grouped: dict[str, list[dict[str, Any]]] = {}
+    for entry in entries:
+        grouped.setdefault(normalize_keyword_name(entry.keyword), []).append(
+            entry.to_record()
+        )
+
+    # Keep the table at most half full so probe sequences stay short.
+    slot_count = 8
+    while slot_count < 2 * len(grouped):
+        slot_count *= 2
+    slots = [(0, 0, 0)] * slot_count
+    records_start = _HEADER.size + slot_count * _SLOT.size
+    blob = bytearray()
+    for normalized, records in sorted(grouped.items()):
+        payload = json.dumps(
+            {"name": normalized, "entries": records},
+            ensure_ascii=False,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        key_hash = _key_hash(normalized)
+        index = key_hash & (slot_count - 1)
+        while slots[index][2]:
+            index = (index + 1) & (slot_count - 1)
+        slots[index] = (key_hash, records_start + len(blob), len(payload))
+        blob += payload
+
+    metadata = json.dumps(
+        {
+            "libraries": sorted({entry.library for entry in entries}),
+            "intents": {name: list(target) for name, target in intents.items()},
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    header = _HEADER.pack(
+        CATALOG_MAGIC,
+        CATALOG_FORMAT_VERSION,
+        0,
+        slot_count,
+        len(grouped),
+        records_start + len(blob),
+        len(metadata),
+        fingerprint,
+    )
+    table = b"".join(_SLOT.pack(*slot) for slot in slots)
+    return header + table + bytes(blob) + metadata
+
+
+def compile_keyword_catalog(
+    output_path: str | Path | None = None,
+    *,
+    data_dir: Path = KEYWORD_DATA_DIR,
+) -> Path:
+    """Compile the keyword catalogs into a binary index and return its path.
+
+    The file is written to a temporary sibling and renamed into place, so
+    processes that already mapped an older catalog keep a consistent view.
+    """
+    path = Path(output_path) if output_path is not None else default_catalog_path()
+    payload = build_catalog_bytes(
+        collect_catalog_entries(data_dir),
+        dict(RobotFrameworkKeywordRegistry.INTENT_TO_LIBRARY_KEYWORDS),
+        source_fingerprint(data_dir),
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(payload)
+    tmp_path.replace(path)
+    return path
+
+
+class KeywordCatalog:
+    """Read-only view over a compiled catalog held in a buffer or mapped file."""
+
+    def __init__(self, buffer: bytes | mmap.mmap) -> None:
+        """Validate the header of a compiled catalog."""
+        if len(buffer) < _HEADER.size:
+            raise exceptions.ValidationError("Keyword catalog is truncated")
+        (
+            magic,
+            version,
+            _reserved,
+            self._slot_count,
+            self._record_count,
+            self._metadata_offset,
+            self._metadata_length,
+            self.fingerprint,
+        ) = _HEADER.unpack_from(buffer, 0)
+        if magic != CATALOG_MAGIC:
+            raise exceptions.ValidationError("Not a keyword catalog file")
+        if version != CATALOG_FORMAT_VERSION:
+            raise exceptions.ValidationError(
+                f"Unsupported keyword catalog version {version}, "
+                f"expected {CATALOG_FORMAT_VERSION}"
+            )
+        if len(buffer) < self._metadata_offset + self._metadata_length:
+            raise exceptions.ValidationError("Keyword catalog is truncated")
+        self._buffer = buffer
+        self._metadata: dict[str, Any] | None = None
+
+    @classmethod
+    def open(cls, path: str | Path) -> KeywordCatalog:
+        """Memory-map a compiled catalog file read-only."""
+        with open(path, "rb") as catalog_file:
+            mapped = mmap.mmap(catalog_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(mapped)
+        except exceptions.ValidationError:
+            mapped.close()
+            raise
+
+    def close(self) -> None:
+        """Release the mapping."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> KeywordCatalog:
+        """Return the catalog for use as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release the mapping on exit."""
+        self.close()
+
+    def __len__(self) -> int:
+        """Return the number of distinct normalized keyword names."""
+        return int(self._record_count)
+
+    def __contains__(self, name: object) -> bool:
+        """Return True if any library defines a keyword with this name."""
+        return isinstance(name, str) and bool(self.lookup(name))
+
+    def lookup(self, name: str) -> tuple[CatalogEntry, ...]:
+        """Return every library's definition of a keyword, by normalized name."""
+        normalized = normalize_keyword_name(name)
+        key_hash = _key_hash(normalized)
+        mask = self._slot_count - 1
+        index = key_hash & mask
+        for _ in range(self._slot_count):
+            slot_hash, offset, length = _SLOT.unpack_from(
+                self._buffer, _HEADER.size + index * _SLOT.size
+            )
+            if not length:
+                return ()
+            if slot_hash == key_hash:
+                record = json.loads(self._buffer[offset : offset + length])
+                if record["name"] == normalized:
+                    return tuple(
+                        CatalogEntry.from_record(entry) for entry in record["entries"]
+                    )
+            index = (index + 1) & mask
+        return ()
+
+    def get(self, library: str, keyword: str) -> CatalogEntry | None:
+        """Return one library's definition of a keyword; library aliases match."""
+        canonical = get_library_canonical_name(library)
+        for entry in self.lookup(keyword):
+            if get_library_canonical_name(entry.library) == canonical:
+                return entry
+        return None
+
+    def intent_keyword(self, intent: str) -> tuple[str, str] | None:
+        """Return the (library, keyword) pair mapped to an intent."""
+        target = self._load_metadata()["intents"].get(intent)
+        return (target[0], target[1]) if target else None
+
+    @property
+    def libraries(self) -> list[str]:
+        """Return the names of all libraries in the catalog."""
+        return list(self._load_metadata()["libraries"])
+
+    def _load_metadata(self) -> dict[str, Any]:
+        if self._metadata is None:
+            start = self._metadata_offset
+            self._metadata = json.loads(
+                self._buffer[start : start + self._metadata_length]
+            )
+        return self._metadata
+
+
+def default_catalog_path() -> Path:
+    """Return the catalog location, overridable via IMPORTOBOT_KEYWORD_CATALOG."""
+    return Path(
+        os.getenv("IMPORTOBOT_KEYWORD_CATALOG", str(DEFAULT_CATALOG_PATH))
+    ).expanduser()
+
+
+def load_keyword_catalog(path: str | Path | None = None) -> KeywordCatalog:
+    """Open the compiled catalog, compiling it first when missing or stale.
+
+    When the catalog cannot be written (for example on a read-only file
+    system) it is built in memory for this process instead.
+    """
+    catalog_path = Path(path) if path is not None else default_catalog_path()
+    fingerprint = source_fingerprint()
+    try:
+        catalog = KeywordCatalog.open(catalog_path)
+    except (OSError, ValueError, exceptions.ValidationError):
+        catalog = None
+    if catalog is not None and catalog.fingerprint == fingerprint:
+        return catalog
+    if catalog is not None:
+        catalog.close()
+
+    try:
+        return KeywordCatalog.open(compile_keyword_catalog(catalog_path))
+    except OSError as error:
+        logger.debug("Building keyword catalog in memory: %s", error)
+        return KeywordCatalog(
+            build_catalog_bytes(
+                collect_catalog_entries(),
+                dict(RobotFrameworkKeywordRegistry.INTENT_TO_LIBRARY_KEYWORDS),
+                fingerprint,
+            )
+        )
+
+
+@lru_cache(maxsize=1)
+def get_keyword_catalog() -> KeywordCatalog:
+    """Return this process's shared keyword catalog."""
+    return load_keyword_catalog()
+
+
+__all__ = [
+    "CATALOG_FORMAT_VERSION",
+    "CatalogEntry",
+    "KeywordCatalog",
+    "build_catalog_bytes",
+    "collect_catalog_entries",
+    "compile_keyword_catalog",
+    "default_catalog_path",
+    "get_keyword_catalog",
+    "load_keyword_catalog",
+    "normalize_keyword_name",
+    "source_fingerprint",
+]
@@ -1,9 +1,12 @@
 """Implementation of keyword generation components."""
 
 import re
-from collections.abc import Callable
-from typing import Any
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from typing import Any, ClassVar
 
+from importobot.config import STEP_KEYWORD_CACHE_MAX_SIZE
 from importobot.core.context_analyzer import ContextAnalyzer
 from importobot.core.keywords.base_generator import BaseKeywordGenerator
 from importobot.core.keywords.generators.api_keywords import APIKeywordGenerator
@@ -25,6 +28,7 @@ from importobot.core.pattern_matcher import (
     LibraryDetector,
     RobotFrameworkLibrary,
 )
+from importobot.telemetry import telemetry_span
 from importobot.utils.field_extraction import extract_field
 from importobot.utils.pattern_extraction import extract_pattern
 from importobot.utils.ssh_patterns import (
@@ -35,12 +39,373 @@ from importobot.utils.step_processing import (
     extract_step_information,
 )
 
+_WEB_INTENTS = frozenset(
+    {
+        IntentType.BROWSER_OPEN,
+        IntentType.BROWSER_NAVIGATE,
+        IntentType.INPUT_USERNAME,
+        IntentType.INPUT_PASSWORD,
+        IntentType.CLICK_ACTION,
+        IntentType.VERIFY_CONTENT,
+        IntentType.ELEMENT_VERIFICATION,
+        IntentType.CONTENT_VERIFICATION,
+    }
+)
+
+
+def _intent_generator_label(intent: IntentType) -> str:
+    """Name the specialized generator that handles ``intent`` for telemetry."""
+    if intent in {IntentType.COMMAND_EXECUTION, IntentType.FILE_STAT}:
+        return "operating_system"
+    if intent in _WEB_INTENTS:
+        return "web"
+    for prefix, label in (
+        ("SSH_", "ssh"),
+        ("FILE_", "file"),
+        ("DATABASE_", "database"),
+        ("API_", "api"),
+    ):
+        if intent.name.startswith(prefix):
+            return label
+    return "builtin"
+
+
+# Telemetry stage name per intent, resolved once instead of per step
+_INTENT_TIMING_STAGES = {
+    intent: f"keywords.{_intent_generator_label(intent)}" for intent in IntentType
+}
+
+
+# (generator, description, test data, expected result, library context)
+IntentHandler = Callable[["GenericKeywordGenerator", str, str, str, set[Any]], str]
+
+# Phrasings where several keywords could apply, with the keywords to suggest.
+# ``None`` marks the library-aware verification keyword, which depends on the
+# library context and is resolved per generator.
+_AMBIGUITY_RULES: tuple[tuple[re.Pattern[str], tuple[str | None, ...]], ...] = (
+    # Cases where both logging and verification could apply
+    (
+        re.compile(r"\b(?:log|record).*(?:and|then|&).*(?:verify|check|assert)"),
+        ("Log    ${message}", None),
+    ),
+    (
+        re.compile(r"\bverify.*(?:and|then|&).*(?:log|record)"),
+        (None, "Log    ${message}"),
+    ),
+    # Cases where conversion and validation could apply
+    (
+        re.compile(
+            r"\b(?:convert|transform).*(?:and|then|&).*(?:validate|verify|check)"
+        ),
+        (
+            "Convert To Integer    ${value}",
+            "Should Be Equal    ${actual}    ${expected}",
+        ),
+    ),
+    (
+        re.compile(r"\bvalidate.*(?:and|then|&).*(?:convert|transform)"),
+        (
+            "Should Be Equal    ${actual}    ${expected}",
+            "Convert To Integer    ${value}",
+        ),
+    ),
+    # Cases where length operations could be either get or assert
+    (
+        re.compile(r"\b(?:check|verify|get).*length"),
+        (
+            "Get Length    ${container}",
+            "Length Should Be    ${container}    ${expected_length}",
+        ),
+    ),
+    # Cases involving counts that could be get or assert operations
+    (
+        re.compile(r"\b(?:count|get.*count).*(?:items|elements)"),
+        (
+            "Get Count    ${container}    ${item}",
+            "Should Contain X Times    ${container}    ${item}    ${count}",
+        ),
+    ),
+)
+
+
+# (description, test data, expected result, library context)
+StepKey = tuple[str, str, str, frozenset[Any]]
+
+
+class StepKeywordMemo:
+    """Thread-safe LRU memo of the keyword lines generated for a step.
+
+    Entries are keyed on the extracted (description, test data, expected
+    result) triple plus the active library context, so a step repeated
+    across a suite costs one dictionary lookup after its first occurrence.
+    A ``max_size`` of zero disables memoization.
+    """
+
+    def __init__(self, max_size: int = STEP_KEYWORD_CACHE_MAX_SIZE) -> None:
+        """Create an empty memo holding at most ``max_size`` steps."""
+        self.max_size = max_size
+        self._entries: OrderedDict[StepKey, tuple[str, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __len__(self) -> int:
+        """Return the number of memoized steps."""
+        return len(self._entries)
+
+    def get(self, key: StepKey) -> tuple[str, ...] | None:
+        """Return the memoized lines for ``key`` and mark them recently used."""
+        with self._lock:
+            lines = self._entries.get(key)
+            if lines is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return lines
+
+    def put(self, key: StepKey, lines: Sequence[str]) -> None:
+        """Memoize ``lines`` for ``key``, evicting the least recently used steps."""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = tuple(lines)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop all memoized steps and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Return hit/miss statistics for the memo."""
+        total_requests = self._hits + self._misses
+        return {
+            "cache_hits": self._hits,
+            "cache_misses": self._misses,
+            "hit_rate": self._hits / total_requests if total_requests else 0.0,
+            "cache_size": len(self._entries),
+            "max_size": self.max_size,
+            "evictions": self._evictions,
+        }
+
+
+_SHARED_STEP_MEMO = StepKeywordMemo()
+
+
+def get_shared_step_memo() -> StepKeywordMemo:
+    """Return the process-wide step memo shared by conversion engines."""
+    return _SHARED_STEP_MEMO
+
 
 class GenericKeywordGenerator(BaseKeywordGenerator):
     """Generic keyword generator for Robot Framework conversion."""
 
-    def __init__(self) -> None:
-        """Initialize the generator with specialized generators."""
+    web_generator: WebKeywordGenerator
+    database_generator: DatabaseKeywordGenerator
+    api_generator: APIKeywordGenerator
+    file_generator: FileKeywordGenerator
+    ssh_generator: SSHKeywordGenerator
+    operating_system_generator: OperatingSystemKeywordGenerator
+    builtin_generator: BuiltInKeywordGenerator
+
+    # Intent -> handler(generator, description, test_data, expected, context).
+    # Built once for the class; handlers resolve the specialized generators on
+    # the instance at call time.
+    _INTENT_HANDLERS: ClassVar[dict[IntentType, IntentHandler]] = {
+        # Web operations
+        IntentType.BROWSER_OPEN: lambda g, d, t, e, c: (
+            g.web_generator.generate_browser_keyword(t)
+        ),
+        IntentType.BROWSER_NAVIGATE: lambda g, d, t, e, c: (
+            g.web_generator.generate_navigation_keyword(t)
+        ),
+        IntentType.INPUT_USERNAME: lambda g, d, t, e, c: (
+            g.web_generator.generate_input_keyword(
+                "email" if g._has_email_indicator(d, t) else "username", t
+            )
+        ),
+        IntentType.INPUT_PASSWORD: lambda g, d, t, e, c: (
+            g.web_generator.generate_password_keyword(t)
+        ),
+        IntentType.CLICK_ACTION: lambda g, d, t, e, c: (
+            g.web_generator.generate_click_keyword(d, t)
+        ),
+        IntentType.VERIFY_CONTENT: lambda g, d, t, e, c: (
+            g.web_generator.generate_library_aware_page_verification_keyword(t, e, c)
+        ),
+        # Database operations
+        IntentType.DATABASE_CONNECT: lambda g, d, t, e, c: (
+            g.database_generator.generate_connect_keyword(t)
+        ),
+        IntentType.DATABASE_EXECUTE: lambda g, d, t, e, c: (
+            g.database_generator.generate_query_keyword(t)
+        ),
+        IntentType.DATABASE_DISCONNECT: lambda g, d, t, e, c: (
+            "Disconnect From Database"
+        ),
+        IntentType.DATABASE_MODIFY: lambda g, d, t, e, c: (
+            g.database_generator.generate_modify_keyword(t)
+        ),
+        IntentType.DATABASE_ROW_COUNT: lambda g, d, t, e, c: (
+            g.database_generator.generate_row_count_keyword(t)
+        ),
+        # API operations
+        IntentType.API_REQUEST: lambda g, d, t, e, c: (
+            g.api_generator.generate_request_keyword(t)
+        ),
+        IntentType.API_SESSION: lambda g, d, t, e, c: (
+            g.api_generator.generate_session_keyword(t)
+        ),
+        IntentType.API_RESPONSE: lambda g, d, t, e, c: (
+            g.api_generator.generate_response_keyword(t)
+        ),
+        # File operations (check for SSH context first)
+        IntentType.FILE_EXISTS: lambda g, d, t, e, c: (
+            g._handle_file_verification(d, t)
+        ),
+        IntentType.FILE_REMOVE: lambda g, d, t, e, c: g._handle_file_removal(d, t),
+        IntentType.FILE_VERIFICATION: lambda g, d, t, e, c: (
+            g._handle_file_verification(d, t)
+        ),
+        IntentType.FILE_REMOVAL: lambda g, d, t, e, c: g._handle_file_removal(d, t),
+        IntentType.FILE_TRANSFER: lambda g, d, t, e, c: (
+            g._handle_file_transfer(d, t)
+        ),
+        IntentType.FILE_CREATION: lambda g, d, t, e, c: (
+            g._handle_file_creation(d, t)
+        ),
+        IntentType.FILE_STAT: lambda g, d, t, e, c: (
+            g.operating_system_generator.generate_command_keyword(t)
+        ),
+        # SSH operations
+        IntentType.SSH_CONNECT: lambda g, d, t, e, c: (
+            g.ssh_generator.generate_connect_keyword(t)
+        ),
+        IntentType.SSH_LOGIN: lambda g, d, t, e, c: (
+            g._handle_ssh_authentication(d, t)
+        ),
+        IntentType.SSH_CONFIGURATION: lambda g, d, t, e, c: (
+            g._handle_ssh_configuration(d, t)
+        ),
+        IntentType.SSH_DISCONNECT: lambda g, d, t, e, c: (
+            g._handle_ssh_disconnect(d, t)
+        ),
+        IntentType.SSH_EXECUTE: lambda g, d, t, e, c: (
+            g._handle_ssh_command_execution(d, t)
+        ),
+        IntentType.SSH_FILE_UPLOAD: lambda g, d, t, e, c: (
+            g.ssh_generator.generate_file_transfer_keyword(t, "upload")
+        ),
+        IntentType.SSH_FILE_DOWNLOAD: lambda g, d, t, e, c: (
+            g.ssh_generator.generate_file_transfer_keyword(t, "download")
+        ),
+        IntentType.SSH_READ_UNTIL: lambda g, d, t, e, c: (
+            g.ssh_generator.generate_interactive_shell_keyword(t, "read_until")
+        ),
+        IntentType.SSH_WRITE: lambda g, d, t, e, c: (
+            g.ssh_generator.generate_interactive_shell_keyword(t, "write")
+        ),
+        IntentType.SSH_DIRECTORY_CREATE: lambda g, d, t, e, c: (
+            g.ssh_generator.generate_directory_operations_keyword(t, "create")
+        ),
+        IntentType.SSH_DIRECTORY_LIST: lambda g, d, t, e, c: (
+            g.ssh_generator.generate_directory_operations_keyword(t, "list")
+        ),
+        IntentType.SSH_SWITCH_CONNECTION: lambda g, d, t, e, c: (
+            "Switch Connection    ${connection_alias}"
+        ),
+        IntentType.SSH_ENABLE_LOGGING: lambda g, d, t, e, c: (
+            g._handle_ssh_enable_logging(t)
+        ),
+        # Command execution
+        IntentType.COMMAND_EXECUTION: lambda g, d, t, e, c: (
+            g.operating_system_generator.generate_command_keyword(t)
+        ),
+        # Verification operations
+        IntentType.ASSERTION_CONTAINS: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_assert_contains_keyword(t, e)
+        ),
+        IntentType.ELEMENT_VERIFICATION: lambda g, d, t, e, c: (
+            g.web_generator.generate_library_aware_page_verification_keyword(t, e, c)
+        ),
+        IntentType.CONTENT_VERIFICATION: lambda g, d, t, e, c: (
+            g.web_generator.generate_library_aware_page_verification_keyword(t, e, c)
+        ),
+        # BuiltIn keywords
+        IntentType.CONVERT_TO_INTEGER: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_convert_to_integer_keyword(t)
+        ),
+        IntentType.CONVERT_TO_STRING: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_convert_to_string_keyword(t)
+        ),
+        IntentType.CONVERT_TO_BOOLEAN: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_convert_to_boolean_keyword(t)
+        ),
+        IntentType.CONVERT_TO_NUMBER: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_convert_to_number_keyword(t)
+        ),
+        IntentType.LOG_MESSAGE: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_log_keyword(t)
+        ),
+        IntentType.SET_VARIABLE: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_set_variable_keyword(t)
+        ),
+        IntentType.GET_VARIABLE: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_get_variable_keyword(t)
+        ),
+        IntentType.CREATE_LIST: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_create_list_keyword(t)
+        ),
+        IntentType.CREATE_DICTIONARY: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_create_dictionary_keyword(t)
+        ),
+        IntentType.GET_LENGTH: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_get_length_keyword(t)
+        ),
+        IntentType.LENGTH_SHOULD_BE: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_length_should_be_keyword(t, e)
+        ),
+        IntentType.SHOULD_START_WITH: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_should_start_with_keyword(t, e)
+        ),
+        IntentType.SHOULD_END_WITH: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_should_end_with_keyword(t, e)
+        ),
+        IntentType.SHOULD_MATCH: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_should_match_keyword(t, e)
+        ),
+        IntentType.EVALUATE_EXPRESSION: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_evaluate_keyword(t)
+        ),
+        IntentType.RUN_KEYWORD_IF: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_run_keyword_if_keyword(t)
+        ),
+        IntentType.REPEAT_KEYWORD: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_repeat_keyword_keyword(t)
+        ),
+        IntentType.FAIL_TEST: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_fail_keyword(t)
+        ),
+        IntentType.GET_COUNT: lambda g, d, t, e, c: (
+            g.builtin_generator.generate_get_count_keyword(t, e)
+        ),
+    }
+
+    def __init__(self, step_memo: StepKeywordMemo | None = None) -> None:
+        """Initialize the generator with specialized generators.
+
+        Args:
+            step_memo: Memo of generated step lines to share with other
+                generators; a private memo is created when omitted.
+        """
         super().__init__()  # Initialize the base class
         self.web_generator = WebKeywordGenerator()
         self.database_generator = DatabaseKeywordGenerator()
@@ -55,10 +420,16 @@ class GenericKeywordGenerator(BaseKeywordGenerator):
 
         # Store library context for verification methods
         self.library_context: set[Any] = set()
+        # Ambiguity rules resolved for the library context they were built for
+        self._ambiguity_rules: tuple[tuple[re.Pattern[str], tuple[str, ...]], ...]
+        self._ambiguity_rules = ()
+        self._ambiguity_context: frozenset[Any] | None = None
+        self.step_memo = step_memo if step_memo is not None else StepKeywordMemo()
 
     def set_library_context(self, libraries: set[Any]) -> None:
         """Set the library context for library-aware verification methods."""
         self.library_context = libraries
+        self._ambiguity_context = None
 
     def _get_library_aware_verification(self, content: str) -> str:
         """Get library-aware verification keyword for ambiguous patterns.
@@ -84,9 +455,21 @@ class GenericKeywordGenerator(BaseKeywordGenerator):
 
     def generate_step_keywords(self, step: dict[str, Any]) -> list[str]:
         """Generate Robot Framework keywords for a step."""
-        lines = []
-
         description, test_data, expected = extract_step_information(step)
+        key = (description, test_data, expected, frozenset(self.library_context))
+        cached = self.step_memo.get(key)
+        if cached is not None:
+            return list(cached)
+
+        lines = self._generate_step_lines(description, test_data, expected)
+        self.step_memo.put(key, lines)
+        return lines
+
+    def _generate_step_lines(
+        self, description: str, test_data: str, expected: str
+    ) -> list[str]:
+        """Generate the comment and keyword lines for an extracted step."""
+        lines = []
 
         # Add traceability comments in the correct order
         indent = "    "
@@ -112,9 +495,12 @@ class GenericKeywordGenerator(BaseKeywordGenerator):
             description, parsed_data
         ):
             # Generate multiple Robot Framework commands from structured testData
-            keyword_lines = self.multi_command_parser.generate_multiple_robot_keywords(
-                description, parsed_data, expected
-            )
+            with telemetry_span("keywords.multi_command"):
+                keyword_lines = (
+                    self.multi_command_parser.generate_multiple_robot_keywords(
+                        description, parsed_data, expected
+                    )
+                )
             lines.extend([f"    {line}" for line in keyword_lines])
         else:
             # Check for composite credential input intent (when no structured data)
@@ -138,7 +524,8 @@ class GenericKeywordGenerator(BaseKeywordGenerator):
         self, steps: list[dict[str, Any]], json_data: dict[str, Any] | None = None
     ) -> set[Any]:
         """Detect required Robot Framework libraries from step content."""
-        return LibraryDetector.detect_libraries_from_steps(steps, json_data)
+        with telemetry_span("keywords.detect_libraries"):
+            return LibraryDetector.detect_libraries_from_steps(steps, json_data)
 
     def _get_parser(self) -> GenericTestFileParser:
         """Get parser instance."""
@@ -162,228 +549,13 @@ class GenericKeywordGenerator(BaseKeywordGenerator):
         if ambiguous_keywords:
             return self._format_suggestions(ambiguous_keywords)
 
-        # Delegate to specialized generators (using IntentType enums)
-        web = self.web_generator
-        database = self.database_generator
-        api_generator = self.api_generator
-        ssh_generator = self.ssh_generator
-        os_generator = self.operating_system_generator
-        builtin = self.builtin_generator
-        web_gen = self.web_generator
-        library_aware = web_gen.generate_library_aware_page_verification_keyword
-
-        intent_handlers: dict[Any, Callable[[], str]] = {
-            # Web operations
-            IntentType.BROWSER_OPEN: (lambda: web.generate_browser_keyword(test_data)),
-            IntentType.BROWSER_NAVIGATE: (
-                lambda: web.generate_navigation_keyword(test_data)
-            ),
-            IntentType.INPUT_USERNAME: (
-                lambda: web.generate_input_keyword(
-                    (
-                        "email"
-                        if self._has_email_indicator(description, test_data)
-                        else "username"
-                    ),
-                    test_data,
-                )
-            ),
-            IntentType.INPUT_PASSWORD: (
-                lambda: web.generate_password_keyword(test_data)
-            ),
-            IntentType.CLICK_ACTION: (
-                lambda: web.generate_click_keyword(description, test_data)
-            ),
-            IntentType.VERIFY_CONTENT: (
-                lambda: (
-                    self.web_generator.generate_library_aware_page_verification_keyword(
-                        test_data, expected, self.library_context
-                    )
+        # Dispatch to the specialized generator registered for the intent
+        handler = self._INTENT_HANDLERS.get(intent) if intent is not None else None
+        if intent is not None and handler is not None:
+            with telemetry_span(_INTENT_TIMING_STAGES[intent]):
+                return handler(
+                    self, description, test_data, expected, self.library_context
                 )
-            ),
-            # Database operations
-            IntentType.DATABASE_CONNECT: (
-                lambda: database.generate_connect_keyword(test_data)
-            ),
-            IntentType.DATABASE_EXECUTE: (
-                lambda: database.generate_query_keyword(test_data)
-            ),
-            IntentType.DATABASE_DISCONNECT: lambda: "Disconnect From Database",
-            IntentType.DATABASE_MODIFY: (
-                lambda: database.generate_modify_keyword(test_data)
-            ),
-            IntentType.DATABASE_ROW_COUNT: (
-                lambda: database.generate_row_count_keyword(test_data)
-            ),
-            # API operations
-            IntentType.API_REQUEST: (
-                lambda: api_generator.generate_request_keyword(test_data)
-            ),
-            IntentType.API_SESSION: (
-                lambda: api_generator.generate_session_keyword(test_data)
-            ),
-            IntentType.API_RESPONSE: (
-                lambda: api_generator.generate_response_keyword(test_data)
-            ),
-            # File operations (check for SSH context first)
-            IntentType.FILE_EXISTS: lambda: self._handle_file_verification(
-                description, test_data
-            ),
-            IntentType.FILE_REMOVE: lambda: self._handle_file_removal(
-                description, test_data
-            ),
-            IntentType.FILE_VERIFICATION: lambda: self._handle_file_verification(
-                description, test_data
-            ),
-            IntentType.FILE_REMOVAL: lambda: self._handle_file_removal(
-                description, test_data
-            ),
-            IntentType.FILE_TRANSFER: lambda: self._handle_file_transfer(
-                description, test_data
-            ),
-            IntentType.FILE_CREATION: lambda: self._handle_file_creation(
-                description, test_data
-            ),
-            IntentType.FILE_STAT: (
-                lambda: os_generator.generate_command_keyword(test_data)
-            ),
-            # SSH operations
-            IntentType.SSH_CONNECT: (
-                lambda: ssh_generator.generate_connect_keyword(test_data)
-            ),
-            IntentType.SSH_LOGIN: lambda: self._handle_ssh_authentication(
-                description, test_data
-            ),
-            IntentType.SSH_CONFIGURATION: lambda: self._handle_ssh_configuration(
-                description, test_data
-            ),
-            IntentType.SSH_DISCONNECT: lambda: self._handle_ssh_disconnect(
-                description, test_data
-            ),
-            IntentType.SSH_EXECUTE: lambda: self._handle_ssh_command_execution(
-                description, test_data
-            ),
-            IntentType.SSH_FILE_UPLOAD: (
-                lambda: ssh_generator.generate_file_transfer_keyword(
-                    test_data, "upload"
-                )
-            ),
-            IntentType.SSH_FILE_DOWNLOAD: (
-                lambda: ssh_generator.generate_file_transfer_keyword(
-                    test_data, "download"
-                )
-            ),
-            IntentType.SSH_READ_UNTIL: (
-                lambda: ssh_generator.generate_interactive_shell_keyword(
-                    test_data, "read_until"
-                )
-            ),
-            IntentType.SSH_WRITE: (
-                lambda: ssh_generator.generate_interactive_shell_keyword(
-                    test_data, "write"
-                )
-            ),
-            IntentType.SSH_DIRECTORY_CREATE: (
-                lambda: ssh_generator.generate_directory_operations_keyword(
-                    test_data, "create"
-                )
-            ),
-            IntentType.SSH_DIRECTORY_LIST: (
-                lambda: ssh_generator.generate_directory_operations_keyword(
-                    test_data, "list"
-                )
-            ),
-            IntentType.SSH_SWITCH_CONNECTION: lambda: (
-                "Switch Connection    ${connection_alias}"
-            ),
-            IntentType.SSH_ENABLE_LOGGING: lambda: (
-                self._handle_ssh_enable_logging(test_data)
-            ),
-            # Command execution
-            IntentType.COMMAND_EXECUTION: (
-                lambda: os_generator.generate_command_keyword(test_data)
-            ),
-            # Verification operations
-            IntentType.ASSERTION_CONTAINS: (
-                lambda: builtin.generate_assert_contains_keyword(test_data, expected)
-            ),
-            IntentType.ELEMENT_VERIFICATION: (
-                lambda: library_aware(test_data, expected, self.library_context)
-            ),
-            IntentType.CONTENT_VERIFICATION: (
-                lambda: library_aware(test_data, expected, self.library_context)
-            ),
-            # BuiltIn keywords
-            IntentType.CONVERT_TO_INTEGER: lambda: (
-                self.builtin_generator.generate_convert_to_integer_keyword(test_data)
-            ),
-            IntentType.CONVERT_TO_STRING: lambda: (
-                self.builtin_generator.generate_convert_to_string_keyword(test_data)
-            ),
-            IntentType.CONVERT_TO_BOOLEAN: lambda: (
-                self.builtin_generator.generate_convert_to_boolean_keyword(test_data)
-            ),
-            IntentType.CONVERT_TO_NUMBER: lambda: (
-                self.builtin_generator.generate_convert_to_number_keyword(test_data)
-            ),
-            IntentType.LOG_MESSAGE: lambda: (
-                self.builtin_generator.generate_log_keyword(test_data)
-            ),
-            IntentType.SET_VARIABLE: lambda: (
-                self.builtin_generator.generate_set_variable_keyword(test_data)
-            ),
-            IntentType.GET_VARIABLE: lambda: (
-                self.builtin_generator.generate_get_variable_keyword(test_data)
-            ),
-            IntentType.CREATE_LIST: lambda: (
-                self.builtin_generator.generate_create_list_keyword(test_data)
-            ),
-            IntentType.CREATE_DICTIONARY: lambda: (
-                self.builtin_generator.generate_create_dictionary_keyword(test_data)
-            ),
-            IntentType.GET_LENGTH: lambda: (
-                self.builtin_generator.generate_get_length_keyword(test_data)
-            ),
-            IntentType.LENGTH_SHOULD_BE: lambda: (
-                self.builtin_generator.generate_length_should_be_keyword(
-                    test_data, expected
-                )
-            ),
-            IntentType.SHOULD_START_WITH: lambda: (
-                self.builtin_generator.generate_should_start_with_keyword(
-                    test_data, expected
-                )
-            ),
-            IntentType.SHOULD_END_WITH: lambda: (
-                self.builtin_generator.generate_should_end_with_keyword(
-                    test_data, expected
-                )
-            ),
-            IntentType.SHOULD_MATCH: lambda: (
-                self.builtin_generator.generate_should_match_keyword(
-                    test_data, expected
-                )
-            ),
-            IntentType.EVALUATE_EXPRESSION: lambda: (
-                self.builtin_generator.generate_evaluate_keyword(test_data)
-            ),
-            IntentType.RUN_KEYWORD_IF: lambda: (
-                self.builtin_generator.generate_run_keyword_if_keyword(test_data)
-            ),
-            IntentType.REPEAT_KEYWORD: lambda: (
-                self.builtin_generator.generate_repeat_keyword_keyword(test_data)
-            ),
-            IntentType.FAIL_TEST: lambda: (
-                self.builtin_generator.generate_fail_keyword(test_data)
-            ),
-            IntentType.GET_COUNT: lambda: (
-                self.builtin_generator.generate_get_count_keyword(test_data, expected)
-            ),
-        }
-
-        # Execute handler if intent is recognized
-        if intent in intent_handlers:
-            return intent_handlers[intent]()
 
         # Check if this is SSH context but unrecognized operation
         if self._is_ssh_context(description, test_data):
@@ -611,54 +783,40 @@ class GenericKeywordGenerator(BaseKeywordGenerator):
         # expected parameter is kept for interface consistency
         # but not used in this implementation
         _ = expected  # Mark as intentionally unused
-        ambiguous_suggestions = []
         combined = f"{description} {test_data}".lower()
 
-        # Define ambiguous patterns and their potential keywords
-        ambiguous_patterns = {
-            # Cases where both logging and verification could apply
-            r"\b(?:log|record).*(?:and|then|&).*(?:verify|check|assert)": [
-                "Log    ${message}",
-                self._get_library_aware_verification("${container}    ${item}"),
-            ],
-            r"\bverify.*(?:and|then|&).*(?:log|record)": [
-                self._get_library_aware_verification("${container}    ${item}"),
-                "Log    ${message}",
-            ],
-            # Cases where conversion and validation could apply
-            r"\b(?:convert|transform).*(?:and|then|&).*(?:validate|verify|check)": [
-                "Convert To Integer    ${value}",
-                "Should Be Equal    ${actual}    ${expected}",
-            ],
-            r"\bvalidate.*(?:and|then|&).*(?:convert|transform)": [
-                "Should Be Equal    ${actual}    ${expected}",
-                "Convert To Integer    ${value}",
-            ],
-            # Cases where length operations could be either get or assert
-            r"\b(?:check|verify|get).*length": [
-                "Get Length    ${container}",
-                "Length Should Be    ${container}    ${expected_length}",
-            ],
-            # Cases involving counts that could be get or assert operations
-            r"\b(?:count|get.*count).*(?:items|elements)": [
-                "Get Count    ${container}    ${item}",
-                "Should Contain X Times    ${container}    ${item}    ${count}",
-            ],
-        }
+        # Collect suggestions, removing duplicates while preserving order
+        suggestions: dict[str, None] = {}
+        for pattern, rule_suggestions in self._resolve_ambiguity_rules():
+            if pattern.search(combined):
+                suggestions.update(dict.fromkeys(rule_suggestions))
+        return list(suggestions)
 
-        for pattern, suggestions in ambiguous_patterns.items():
-            if re.search(pattern, combined):
-                ambiguous_suggestions.extend(suggestions)
+    def _resolve_ambiguity_rules(
+        self,
+    ) -> tuple[tuple[re.Pattern[str], tuple[str, ...]], ...]:
+        """Return the ambiguity rules for the current library context.
 
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_suggestions = []
-        for suggestion in ambiguous_suggestions:
-            if suggestion not in seen:
-                seen.add(suggestion)
-                unique_suggestions.append(suggestion)
-
-        return unique_suggestions
+        The library-aware verification keyword is resolved once per context
+        and reused until the library context changes.
+        """
+        context = frozenset(self.library_context)
+        if context != self._ambiguity_context:
+            verification = self._get_library_aware_verification(
+                "${container}    ${item}"
+            )
+            self._ambiguity_rules = tuple(
+                (
+                    pattern,
+                    tuple(
+                        verification if suggestion is None else suggestion
+                        for suggestion in suggestions
+                    ),
+                )
+                for pattern, suggestions in _AMBIGUITY_RULES
+            )
+            self._ambiguity_context = context
+        return self._ambiguity_rules
 
     def _format_suggestions(self, suggestions: list[str]) -> str:
         """Format multiple keyword suggestions with comments."""
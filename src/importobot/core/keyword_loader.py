@@ -18,6 +18,7 @@ class KeywordLibraryLoader:
         """Initialize the loader with the keywords data directory."""
         self.data_dir = Path(__file__).parent.parent / "data" / "keywords"
         self._cache: dict[str, dict[str, Any]] = {}
+        self._filename_map: dict[str, str] | None = None
         self.logger = logger
 
     def load_library(self, library_name: str) -> dict[str, Any]:
@@ -26,13 +27,7 @@ class KeywordLibraryLoader:
             cached_result = self._cache[library_name]
             return cached_result if isinstance(cached_result, dict) else {}
 
-        # Use configurable library mapping
-        filename_map = {}
-        for canonical_name, aliases in LIBRARY_MAPPING.library_aliases.items():
-            json_filename = f"{canonical_name}.json"
-            for alias in aliases:
-                filename_map[alias] = json_filename
-
+        filename_map = self._library_filename_map()
         filename = filename_map.get(library_name)
         if not filename:
             available_libraries = ", ".join(filename_map.keys())
@@ -83,6 +78,16 @@ class KeywordLibraryLoader:
             )
             return {}
 
+    def _library_filename_map(self) -> dict[str, str]:
+        """Map every library alias to its JSON configuration file name."""
+        if self._filename_map is None:
+            self._filename_map = {
+                alias: f"{canonical_name}.json"
+                for canonical_name, aliases in LIBRARY_MAPPING.library_aliases.items()
+                for alias in aliases
+            }
+        return self._filename_map
+
     def load_all_libraries(self) -> dict[str, dict[str, Any]]:
         """Load all available keyword library configurations."""
         libraries: dict[str, dict[str, Any]] = {}
@@ -158,6 +163,7 @@ class KeywordLibraryLoader:
     def refresh_cache(self) -> None:
         """Clear the cache to force a reload of configurations."""
         self._cache.clear()
+        self._filename_map = None
         self.logger.info("Keyword library cache cleared")
 
     def validate_configurations(self) -> dict[str, list[str]]:
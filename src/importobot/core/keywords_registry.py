@@ -4,11 +4,21 @@ This module centralizes keyword definitions, library patterns, and intent recogn
 for Robot Framework conversion operations.
 """
 
+import importlib
 import re
-from typing import Any, ClassVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 from importobot.core.pattern_matcher import IntentType, PatternMatcher
-from importobot.utils.security import SSH_SECURITY_GUIDELINES, extract_security_warnings
+from importobot.utils.security import SSH_SECURITY_GUIDELINES
+
+if TYPE_CHECKING:
+    from importobot.core.keyword_catalog import KeywordCatalog
+
+
+def _keyword_catalog() -> "KeywordCatalog":
+    """Return the shared compiled catalog; imported lazily as it reads this module."""
+    catalog = importlib.import_module("importobot.core.keyword_catalog")
+    return cast("KeywordCatalog", catalog.get_keyword_catalog())
 
 
 class RobotFrameworkKeywordRegistry:
@@ -606,10 +616,14 @@ class RobotFrameworkKeywordRegistry:
 
     @classmethod
     def get_keyword_info(cls, library: str, keyword: str) -> dict[str, Any]:
-        """Retrieve information about a specific keyword."""
-        if library in cls.KEYWORD_LIBRARIES:
-            return cast(dict[str, Any], cls.KEYWORD_LIBRARIES[library].get(keyword, {}))
-        return {}
+        """Retrieve information about a specific keyword.
+
+        Served from the compiled keyword catalog, so library aliases match,
+        keyword names are compared the way Robot Framework compares them and
+        keywords only defined in the JSON keyword libraries are found too.
+        """
+        entry = _keyword_catalog().get(library, keyword)
+        return entry.to_record() if entry is not None else {}
 
     @classmethod
     def get_required_libraries(cls, keywords: list[dict[str, Any]]) -> list[str]:
@@ -623,7 +637,7 @@ class RobotFrameworkKeywordRegistry:
     @classmethod
     def get_intent_keyword(cls, intent: str) -> tuple[str, str]:
         """Retrieve the library and keyword associated with a specific intent."""
-        return cls.INTENT_TO_LIBRARY_KEYWORDS.get(intent, ("builtin", "No Operation"))
+        return _keyword_catalog().intent_keyword(intent) or ("builtin", "No Operation")
 
     @classmethod
     def validate_registry_integrity(cls) -> list[str]:
@@ -726,13 +740,8 @@ class IntentRecognitionEngine:
     @classmethod
     def get_security_warnings_for_keyword(cls, library: str, keyword: str) -> list[str]:
         """Retrieve security warnings for a specific keyword."""
-        warnings = []
-        if library in RobotFrameworkKeywordRegistry.KEYWORD_LIBRARIES:
-            keyword_info = RobotFrameworkKeywordRegistry.KEYWORD_LIBRARIES[library].get(
-                keyword, {}
-            )
-            warnings.extend(extract_security_warnings(keyword_info))
-        return warnings
+        entry = _keyword_catalog().get(library, keyword)
+        return list(entry.security_warnings) if entry is not None else []
 
     @classmethod
     def get_ssh_security_guidelines(cls) -> list[str]:
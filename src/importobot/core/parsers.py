@@ -13,6 +13,7 @@ from importobot.core.field_definitions import (
     is_test_case,
 )
 from importobot.core.interfaces import TestFileParser
+from importobot.telemetry import telemetry_span
 from importobot.utils.logging import get_logger
 
 logger = get_logger()
@@ -30,6 +31,11 @@ class GenericTestFileParser(TestFileParser):
 
     def find_tests(self, data: dict[str, Any]) -> list[dict[str, Any]]:
         """Identify test structures within JSON data regardless of format."""
+        with telemetry_span("parser.find_tests"):
+            return self._find_tests(data)
+
+    def _find_tests(self, data: dict[str, Any]) -> list[dict[str, Any]]:
+        """Apply the test discovery strategies to ``data``."""
         if not isinstance(data, dict):
             return []
 
@@ -61,6 +67,11 @@ class GenericTestFileParser(TestFileParser):
 
     def find_steps(self, test_data: dict[str, Any]) -> list[dict[str, Any]]:
         """Identify step structures within the provided test data."""
+        with telemetry_span("parser.find_steps"):
+            return self._find_steps(test_data)
+
+    def _find_steps(self, test_data: dict[str, Any]) -> list[dict[str, Any]]:
+        """Recursively collect step dictionaries from ``test_data``."""
         steps = []
         step_field_names = self._get_step_field_names()
         script_field_names = {name.lower() for name in TEST_SCRIPT_FIELDS.fields}
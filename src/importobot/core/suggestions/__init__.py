@@ -1,5 +1,6 @@
 """Suggestion engine components."""
 
+from .patching import SuggestionPatch
 from .suggestion_engine import GenericSuggestionEngine
 
-__all__ = ["GenericSuggestionEngine"]
+__all__ = ["GenericSuggestionEngine", "SuggestionPatch"]
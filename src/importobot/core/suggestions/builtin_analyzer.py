@@ -4,22 +4,21 @@ import re
 from typing import Any
 
 from importobot.core.constants import STEPS_FIELD_NAME
-from importobot.core.field_definitions import (
-    STEP_ACTION_FIELDS,
-    STEP_DATA_FIELDS,
-    STEP_EXPECTED_FIELDS,
-    TEST_SCRIPT_FIELDS,
-    get_field_value,
-)
+from importobot.core.field_definitions import TEST_SCRIPT_FIELDS
 from importobot.utils.string_cache import data_to_lower_cached
 
+from .step_features import StepFeatures, extract_step_features
+
 
 class BuiltInKeywordAnalyzer:
     """Analyzer for Robot Framework BuiltIn keyword mapping ambiguities."""
 
     def __init__(self) -> None:
         """Initialize the analyzer with keyword patterns and ambiguity rules."""
-        self._ambiguous_patterns = self._build_ambiguous_patterns()
+        self._ambiguous_patterns = {
+            category: [re.compile(pattern) for pattern in patterns]
+            for category, patterns in self._build_ambiguous_patterns().items()
+        }
         self._builtin_keywords = self._build_builtin_keywords_map()
 
     def check_builtin_keyword_ambiguities(
@@ -28,73 +27,60 @@ class BuiltInKeywordAnalyzer:
         steps: list[dict[str, Any]],
         test_case_index: int,
         suggestions: list[str],
+        features: list[StepFeatures] | None = None,
     ) -> None:
         """Check for BuiltIn keyword mapping ambiguities in test steps."""
-        for i, step in enumerate(steps):
-            # Handle different field name formats (camelCase vs snake_case)
-            step_description = data_to_lower_cached(
-                get_field_value(step, STEP_ACTION_FIELDS)
-            )
-            test_data = get_field_value(step, STEP_DATA_FIELDS)
-            expected = get_field_value(step, STEP_EXPECTED_FIELDS)
+        if features is None:
+            features = extract_step_features(steps)
+
+        for feature in features:
+            step_index = feature.index + 1
 
             # Check for missing parameter issues first
             self._check_missing_parameters(
-                description=step_description,
-                test_data=test_data,
-                expected=expected,
+                description=feature.description_lower,
+                test_data=feature.test_data,
+                expected=feature.expected,
                 test_case_index=test_case_index,
-                step_index=i + 1,
+                step_index=step_index,
                 suggestions=suggestions,
             )
 
             # Check for specific ambiguity patterns
             self._check_log_vs_assertion_ambiguity(
-                description=step_description,
-                test_data=test_data,
-                expected=expected,
+                combined=feature.combined_lower,
                 test_case_index=test_case_index,
-                step_index=i + 1,
+                step_index=step_index,
                 suggestions=suggestions,
             )
             self._check_conversion_ambiguity(
-                description=step_description,
-                test_data=test_data,
-                expected=expected,
+                combined=feature.combined_lower,
                 test_case_index=test_case_index,
-                step_index=i + 1,
+                step_index=step_index,
                 suggestions=suggestions,
             )
             self._check_length_operation_ambiguity(
-                description=step_description,
-                test_data=test_data,
-                expected=expected,
+                combined=feature.combined_lower,
                 test_case_index=test_case_index,
-                step_index=i + 1,
+                step_index=step_index,
                 suggestions=suggestions,
             )
             self._check_string_operation_ambiguity(
-                description=step_description,
-                test_data=test_data,
-                expected=expected,
+                combined=feature.combined_lower,
                 test_case_index=test_case_index,
-                step_index=i + 1,
+                step_index=step_index,
                 suggestions=suggestions,
             )
             self._check_conditional_keyword_ambiguity(
-                description=step_description,
-                test_data=test_data,
-                expected=expected,
+                combined=feature.combined_lower,
                 test_case_index=test_case_index,
-                step_index=i + 1,
+                step_index=step_index,
                 suggestions=suggestions,
             )
             self._check_variable_operation_ambiguity(
-                description=step_description,
-                test_data=test_data,
-                expected=expected,
+                combined=feature.combined_lower,
                 test_case_index=test_case_index,
-                step_index=i + 1,
+                step_index=step_index,
                 suggestions=suggestions,
             )
 
@@ -259,21 +245,14 @@ class BuiltInKeywordAnalyzer:
     def _check_log_vs_assertion_ambiguity(
         self,
         *,
-        description: str,
-        test_data: str,
-        expected: str,
+        combined: str,
         test_case_index: int,
         step_index: int,
         suggestions: list[str],
     ) -> None:
         """Check for ambiguity between logging and assertion operations."""
-        # expected parameter is kept for interface consistency but
-        # not used in this implementation
-        _ = expected  # Mark as intentionally unused
-        combined = data_to_lower_cached(f"{description} {test_data} {expected}")
-
         for pattern in self._ambiguous_patterns["log_vs_assertion"]:
-            if re.search(pattern, combined):
+            if pattern.search(combined):
                 suggestions.append(
                     f"Test case {test_case_index}, "
                     f"step "
@@ -291,21 +270,14 @@ class BuiltInKeywordAnalyzer:
     def _check_conversion_ambiguity(
         self,
         *,
-        description: str,
-        test_data: str,
-        expected: str,
+        combined: str,
         test_case_index: int,
         step_index: int,
         suggestions: list[str],
     ) -> None:
         """Check for ambiguity in conversion operations."""
-        # expected parameter is kept for interface consistency but
-        # not used in this implementation
-        _ = expected  # Mark as intentionally unused
-        combined = data_to_lower_cached(f"{description} {test_data} {expected}")
-
         for pattern in self._ambiguous_patterns["conversion_vs_assertion"]:
-            if re.search(pattern, combined):
+            if pattern.search(combined):
                 suggestions.append(
                     f"Test case {test_case_index}, step {step_index}: "
                     f"Conversion operation mixed with verification. "
@@ -319,21 +291,14 @@ class BuiltInKeywordAnalyzer:
     def _check_length_operation_ambiguity(
         self,
         *,
-        description: str,
-        test_data: str,
-        expected: str,
+        combined: str,
         test_case_index: int,
         step_index: int,
         suggestions: list[str],
     ) -> None:
         """Check for ambiguity in length operations."""
-        # test_case_index and step_index parameters are kept for interface
-        # consistency but not used in this implementation
-        _ = test_case_index, step_index  # Mark as intentionally unused
-        combined = data_to_lower_cached(f"{description} {test_data} {expected}")
-
         for pattern in self._ambiguous_patterns["length_operations"]:
-            if re.search(pattern, combined):
+            if pattern.search(combined):
                 suggestions.append(
                     f"Test case {test_case_index}, step {step_index}: "
                     f"Length operation could map to 'Get Length' (returns length) "
@@ -346,21 +311,14 @@ class BuiltInKeywordAnalyzer:
     def _check_string_operation_ambiguity(
         self,
         *,
-        description: str,
-        test_data: str,
-        expected: str,
+        combined: str,
         test_case_index: int,
         step_index: int,
         suggestions: list[str],
     ) -> None:
         """Check for ambiguity in string operations."""
-        # test_case_index and step_index parameters are kept for interface
-        # consistency but not used in this implementation
-        _ = test_case_index, step_index  # Mark as intentionally unused
-        combined = data_to_lower_cached(f"{description} {test_data} {expected}")
-
         for pattern in self._ambiguous_patterns["string_operations"]:
-            if re.search(pattern, combined):
+            if pattern.search(combined):
                 string_keywords = [
                     "Should Start With",
                     "Should End With",
@@ -383,21 +341,14 @@ class BuiltInKeywordAnalyzer:
     def _check_conditional_keyword_ambiguity(
         self,
         *,
-        description: str,
-        test_data: str,
-        expected: str,
+        combined: str,
         test_case_index: int,
         step_index: int,
         suggestions: list[str],
     ) -> None:
         """Check for ambiguity in conditional keyword operations."""
-        # test_case_index and step_index parameters are kept for interface
-        # consistency but not used in this implementation
-        _ = test_case_index, step_index  # Mark as intentionally unused
-        combined = data_to_lower_cached(f"{description} {test_data} {expected}")
-
         for pattern in self._ambiguous_patterns["conditional_operations"]:
-            if re.search(pattern, combined):
+            if pattern.search(combined):
                 suggestions.append(
                     f"Test case {test_case_index}, step {step_index}: "
                     f"Conditional keyword execution detected. Structure as: "
@@ -410,18 +361,14 @@ class BuiltInKeywordAnalyzer:
     def _check_variable_operation_ambiguity(
         self,
         *,
-        description: str,
-        test_data: str,
-        expected: str,
+        combined: str,
         test_case_index: int,
         step_index: int,
         suggestions: list[str],
     ) -> None:
         """Check for ambiguity in variable operations."""
-        combined = data_to_lower_cached(f"{description} {test_data} {expected}")
-
         for pattern in self._ambiguous_patterns["variable_operations"]:
-            if re.search(pattern, combined):
+            if pattern.search(combined):
                 suggestions.append(
                     f"Test case {test_case_index}, step {step_index}: "
                     f"Variable operation mixed with verification. Separate into: "
@@ -5,15 +5,13 @@ import shlex
 from typing import Any
 
 from importobot.core.constants import STEPS_FIELD_NAME
-from importobot.core.field_definitions import (
-    STEP_ACTION_FIELDS,
-    STEP_DATA_FIELDS,
-    TEST_SCRIPT_FIELDS,
-    TEST_STEP_FIELDS,
-    get_field_value,
-)
+from importobot.core.field_definitions import TEST_SCRIPT_FIELDS, TEST_STEP_FIELDS
 from importobot.utils.logging import get_logger
-from importobot.utils.step_processing import collect_command_steps
+
+from .step_features import (
+    StepFeatures,
+    extract_step_features,
+)
 
 logger = get_logger()
 
@@ -21,22 +19,24 @@ logger = get_logger()
 class ComparisonAnalyzer:
     """Analyzes and suggests improvements for result comparisons."""
 
+    _COMPARISON_KEYWORDS = ("hash", "checksum", "digest", "compare", "diff", "verify")
+
     def check_result_comparison_opportunities(
-        self, steps: list[dict[str, Any]], case_num: int, suggestions: list[str]
+        self,
+        steps: list[dict[str, Any]],
+        case_num: int,
+        suggestions: list[str],
+        *,
+        features: list[StepFeatures] | None = None,
     ) -> None:
         """Check for opportunities to add result comparison steps."""
-        command_steps = self._collect_command_steps(steps)
-        comparison_candidates = self._group_comparable_commands(command_steps)
+        if features is None:
+            features = extract_step_features(steps)
+        comparison_candidates = self._group_comparable_commands(features)
 
         if len(comparison_candidates) >= 2 and not self._comparison_step_exists(steps):
             self._suggest_comparison(comparison_candidates, case_num, suggestions)
 
-    def _collect_command_steps(
-        self, steps: list[dict[str, Any]]
-    ) -> list[dict[str, Any]]:
-        """Collect steps that contain command execution."""
-        return collect_command_steps(steps)
-
     def _comparison_step_exists(self, steps: list[dict[str, Any]]) -> bool:
         """Check whether a generated comparison step already exists."""
         for step in steps:
@@ -51,27 +51,25 @@ class ComparisonAnalyzer:
         return False
 
     def _group_comparable_commands(
-        self, command_steps: list[dict[str, Any]]
+        self, features: list[StepFeatures]
     ) -> list[dict[str, Any]]:
         """Group commands that share a comparable command signature."""
         grouped: dict[str, list[dict[str, Any]]] = {}
-        for step in command_steps:
-            if not isinstance(step, dict):
+        for feature in features:
+            if not feature.is_command or not feature.command:
                 continue
-            command_text = get_field_value(step, STEP_DATA_FIELDS)
-            if not command_text:
-                command_text = get_field_value(step, STEP_ACTION_FIELDS)
-
-            if command_text:
-                content = command_text.lower()
-                if not self._is_comparison_candidate(content, step):
-                    continue
-                signature = self._normalize_command_signature(command_text)
-                if not signature:
-                    continue
-                grouped.setdefault(signature, []).append(
-                    {"step": step, "command": command_text, "signature": signature}
-                )
+            if not self._is_comparison_candidate(feature):
+                continue
+            signature = feature.command_signature
+            if not signature:
+                continue
+            grouped.setdefault(signature, []).append(
+                {
+                    "step": feature.step,
+                    "command": feature.command,
+                    "signature": signature,
+                }
+            )
         # Flatten but keep signature info
         comparable = [
             entry
@@ -81,29 +79,14 @@ class ComparisonAnalyzer:
         ]
         return comparable
 
-    def _is_comparison_candidate(self, content: str, step: dict[str, Any]) -> bool:
+    def _is_comparison_candidate(self, feature: StepFeatures) -> bool:
         """Determine if a step looks like a comparison-type command."""
-        keywords = ["hash", "checksum", "digest", "compare", "diff", "verify"]
-        if any(token in content for token in keywords):
-            return True
-        description = get_field_value(step, STEP_ACTION_FIELDS)
-        if description and isinstance(description, str):
-            lowered = description.lower()
-            if any(token in lowered for token in keywords):
-                return True
-        return False
-
-    def _normalize_command_signature(self, command: str) -> str | None:
-        """Produce a normalized signature for a command."""
-        try:
-            tokens = shlex.split(command)
-        except ValueError:
-            tokens = command.split()
-        if not tokens:
-            return None
-        base = tokens[0].lower()
-        flags = sorted(token.lower() for token in tokens[1:] if token.startswith("-"))
-        return "|".join([base, *flags]) if flags else base
+        content = feature.command_lower
+        description = feature.description_lower
+        return any(
+            token in content or token in description
+            for token in self._COMPARISON_KEYWORDS
+        )
 
     def _suggest_comparison(
         self,
@@ -148,9 +131,7 @@ class ComparisonAnalyzer:
         if steps_container is None:
             return
 
-        hash_entries = self._group_comparable_commands(
-            self._collect_command_steps(steps)
-        )
+        hash_entries = self._group_comparable_commands(extract_step_features(steps))
         indexed_commands = self._index_comparable_commands(
             steps_container, hash_entries
         )
@@ -12,6 +12,8 @@ from importobot.core.constants import (
 from importobot.core.field_definitions import PARAMETERS_FIELDS, TEST_SCRIPT_FIELDS
 from importobot.utils.logging import get_logger
 
+from .step_features import StepFeatures, extract_step_features, find_placeholders
+
 logger = get_logger()
 
 
@@ -24,16 +26,22 @@ class ParameterAnalyzer:
         steps: list[dict[str, Any]],
         case_num: int,
         suggestions: list[str],
+        *,
+        features: list[StepFeatures] | None = None,
     ) -> None:
         """Check parameter placeholders and suggest Robot Framework variable mapping."""
         # Extract defined parameters
         defined_parameters = self._extract_defined_parameters(test_case)
 
-        # Collect all text sources that might contain parameters
-        text_sources = self._collect_text_sources(test_case, steps)
+        # Placeholders in the test case itself plus those found by the step pass
         detected_params, incomplete_params = self._analyze_parameter_patterns(
-            text_sources
+            self._collect_text_sources(test_case, [])
         )
+        if features is None:
+            features = extract_step_features(steps)
+        for feature in features:
+            detected_params |= feature.robot_placeholders
+            incomplete_params |= feature.legacy_placeholders
 
         # Additional suggestions for undefined parameters
         undefined_params = self._get_undefined_parameters(
@@ -287,29 +295,16 @@ class ParameterAnalyzer:
         Scan through all text sources to identify parameter patterns and classify
         them as either detected or incomplete parameters.
         """
-        detected_params = set()
-        incomplete_params = set()
-
-        param_patterns = [
-            (r"\$\{([^}]+)\}", "robot"),  # Robot Framework variables
-            (r"\{([^}]+)\}", "simple"),  # Simple braces
-            (r"<([^>]+)>", "angle"),  # Angle brackets
-            (r"\[([^\]]+)\]", "square"),  # Square brackets
-        ]
+        detected_params: set[str] = set()
+        incomplete_params: set[str] = set()
 
         for text in all_text_sources:
             if not isinstance(text, str):
                 continue
 
-            for pattern, pattern_type in param_patterns:
-                matches = re.findall(pattern, text)
-                for match in matches:
-                    clean_param = match.strip()
-                    if clean_param and len(clean_param) > 1:
-                        if pattern_type == "robot":
-                            detected_params.add(clean_param)
-                        else:
-                            incomplete_params.add(clean_param)
+            robot, legacy = find_placeholders(text)
+            detected_params |= robot
+            incomplete_params |= legacy
 
         return detected_params, incomplete_params
 
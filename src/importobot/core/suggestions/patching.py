@@ -0,0 +1,105 @@
+"""Copy-on-write result of applying suggestions to a JSON document."""
+
+import json
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any
+
+from importobot.utils.json_patch import PatchOperation, diff_json, join_pointer
+
+
+@dataclass
+class SuggestionPatch:
+    """Improvements planned against an unmodified original document.
+
+    Only test cases that the analyzers changed are copied (``replacements``,
+    keyed by test case position); every other test case is shared with
+    ``original``. The improved document and the JSON Patch operations are
+    built on first access, and :meth:`write_improved` streams the improved
+    document to disk without building a second full copy in memory.
+    """
+
+    original: Any
+    container_key: str | None
+    single_test_case: bool
+    replacements: dict[int, dict[str, Any]] = field(default_factory=dict)
+    changes: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        """Return True if any test case was modified."""
+        return bool(self.replacements)
+
+    def test_case_pointer(self, index: int) -> str:
+        """Return the JSON Pointer of a test case in the original document."""
+        if self.single_test_case:
+            return ""
+        if self.container_key is None:
+            return join_pointer("", index)
+        return join_pointer(join_pointer("", self.container_key), index)
+
+    @cached_property
+    def operations(self) -> list[PatchOperation]:
+        """JSON Patch (RFC 6902) operations turning the original into the result."""
+        operations: list[PatchOperation] = []
+        for index, improved in sorted(self.replacements.items()):
+            operations.extend(
+                diff_json(
+                    self._original_test_case(index),
+                    improved,
+                    self.test_case_pointer(index),
+                )
+            )
+        return operations
+
+    @cached_property
+    def improved(self) -> Any:
+        """The improved document, sharing unchanged test cases with the original.
+
+        Treat the result as read-only: mutating a shared test case would also
+        change ``original``.
+        """
+        if not self.replacements:
+            return self.original
+        if self.single_test_case:
+            return self.replacements[0]
+        test_cases = list(self._original_test_cases())
+        for index, improved in self.replacements.items():
+            test_cases[index] = improved
+        if self.container_key is None:
+            return test_cases
+        document = dict(self.original)
+        document[self.container_key] = test_cases
+        return document
+
+    def write_improved(self, path: str | Path) -> Path:
+        """Write the improved document as indented JSON and return the path."""
+        output_path = Path(path)
+        with open(output_path, "w", encoding="utf-8") as json_file:
+            json.dump(self.improved, json_file, indent=2, ensure_ascii=False)
+        return output_path
+
+    def write_patch(self, path: str | Path) -> Path:
+        """Write the JSON Patch operations and return the path."""
+        output_path = Path(path)
+        with open(output_path, "w", encoding="utf-8") as patch_file:
+            json.dump(self.operations, patch_file, indent=2, ensure_ascii=False)
+        return output_path
+
+    def _original_test_cases(self) -> list[Any]:
+        """Return the original list holding the test cases."""
+        if self.container_key is None:
+            return self.original  # type: ignore[no-any-return]
+        return self.original[self.container_key]  # type: ignore[no-any-return]
+
+    def _original_test_case(self, index: int) -> Any:
+        """Return the original test case at ``index``."""
+        if self.single_test_case:
+            return self.original
+        if self.container_key is None:
+            return self.original[index]
+        return self.original[self.container_key][index]
+
+
+__all__ = ["SuggestionPatch"]
@@ -13,6 +13,8 @@ from importobot.core.field_definitions import TEST_SCRIPT_FIELDS
 from importobot.utils.logging import get_logger
 from importobot.utils.step_processing import collect_command_steps
 
+from .step_features import StepFeatures, extract_step_features, find_unmatched_braces
+
 logger = get_logger()
 
 
@@ -20,7 +22,12 @@ class StepAnalyzer:
     """Analyzes and suggests improvements for test steps."""
 
     def check_steps(
-        self, steps: list[dict[str, Any]], case_num: int, suggestions: list[str]
+        self,
+        steps: list[dict[str, Any]],
+        case_num: int,
+        suggestions: list[str],
+        *,
+        features: list[StepFeatures] | None = None,
     ) -> None:
         """Check individual steps for required fields and formatting."""
         if not steps:
@@ -29,31 +36,33 @@ class StepAnalyzer:
             )
             return
 
-        for i, step in enumerate(steps):
-            if not isinstance(step, dict):
-                continue
+        if features is None:
+            features = extract_step_features(steps)
 
-            self._check_step_fields(step, case_num, i + 1, suggestions)
-            self._check_brace_matching(step, case_num, i + 1, suggestions)
+        for feature in features:
+            step_num = feature.index + 1
+            self._check_step_fields(feature.step, case_num, step_num, suggestions)
+            self._report_unmatched_braces(
+                feature.unmatched_braces, case_num, step_num, suggestions
+            )
 
     def check_step_ordering(
-        self, steps: list[dict[str, Any]], case_num: int, suggestions: list[str]
+        self,
+        steps: list[dict[str, Any]],
+        case_num: int,
+        suggestions: list[str],
+        *,
+        features: list[StepFeatures] | None = None,
     ) -> None:
         """Check if steps have proper sequential ordering."""
         if len(steps) < 2:
             return
 
+        if features is None:
+            features = extract_step_features(steps)
+
         # Look for step index/number fields
-        indices = []
-        for step in steps:
-            if isinstance(step, dict):
-                for index_field in ["index", "step_number", "order", "sequence"]:
-                    if index_field in step:
-                        try:
-                            index = int(step[index_field])
-                            indices.append(index)
-                        except (ValueError, TypeError):
-                            continue
+        indices = [value for feature in features for value in feature.index_values]
 
         if len(indices) < 2:
             return
@@ -174,23 +183,23 @@ class StepAnalyzer:
         suggestions: list[str],
     ) -> None:
         """Check for unmatched braces in step content."""
-        for field_name, field_value in step.items():
-            if not isinstance(field_value, str):
-                continue
-
-            # Count different types of braces
-            brace_counts = {
-                "curly": field_value.count("{") - field_value.count("}"),
-                "square": field_value.count("[") - field_value.count("]"),
-                "round": field_value.count("(") - field_value.count(")"),
-            }
+        self._report_unmatched_braces(
+            find_unmatched_braces(step), case_num, step_num, suggestions
+        )
 
-            for brace_type, count in brace_counts.items():
-                if count != 0:
-                    suggestions.append(
-                        f"Test case {case_num}, Step {step_num}: "
-                        f"Fix unmatched {brace_type} braces in '{field_name}' field"
-                    )
+    def _report_unmatched_braces(
+        self,
+        unmatched: tuple[tuple[str, str], ...],
+        case_num: int,
+        step_num: int,
+        suggestions: list[str],
+    ) -> None:
+        """Add a suggestion for each field with unmatched braces."""
+        suggestions.extend(
+            f"Test case {case_num}, Step {step_num}: "
+            f"Fix unmatched {brace_type} braces in '{field_name}' field"
+            for field_name, brace_type in unmatched
+        )
 
     def _improve_single_step(self, step: dict[str, Any]) -> bool:
         """Improve a single step and return True if changes were made."""
@@ -0,0 +1,191 @@
+"""One-pass step feature extraction shared by the suggestion analyzers."""
+
+import re
+import shlex
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any
+
+from importobot.core.constants import (
+    EXPECTED_RESULT_FIELD_NAMES,
+    STEP_DESCRIPTION_FIELD_NAMES,
+    TEST_DATA_FIELD_NAMES,
+)
+from importobot.core.field_definitions import (
+    STEP_ACTION_FIELDS,
+    STEP_DATA_FIELDS,
+    STEP_EXPECTED_FIELDS,
+    get_field_value,
+)
+from importobot.utils.step_processing import is_command_step
+from importobot.utils.string_cache import data_to_lower_cached
+
+ROBOT_PLACEHOLDER_PATTERN = re.compile(r"\$\{([^}]+)\}")
+LEGACY_PLACEHOLDER_PATTERNS = (
+    re.compile(r"\{([^}]+)\}"),  # Simple placeholders: {var}
+    re.compile(r"<([^>]+)>"),  # Angle bracket placeholders: <var>
+    re.compile(r"\[([^\]]+)\]"),  # Square bracket placeholders: [var]
+)
+STEP_INDEX_FIELD_NAMES = ("index", "step_number", "order", "sequence")
+PLACEHOLDER_FIELD_NAMES = (
+    TEST_DATA_FIELD_NAMES + STEP_DESCRIPTION_FIELD_NAMES + EXPECTED_RESULT_FIELD_NAMES
+)
+
+_BRACE_PAIRS = (("curly", "{", "}"), ("square", "[", "]"), ("round", "(", ")"))
+
+
+@dataclass(frozen=True)
+class StepFeatures:
+    """Normalized text, commands and placeholders derived from one test step.
+
+    ``index`` is the position of the step in the list it was extracted from, so
+    analyzers report the same step numbers as when they walked the raw list.
+    Derived features are computed on first access and then cached, so each
+    analyzer pays only for what it reads and no feature is computed twice.
+    """
+
+    step: dict[str, Any]
+    index: int
+    description: str
+    test_data: str
+    expected: str
+
+    @cached_property
+    def description_lower(self) -> str:
+        """Return the lowercased action description."""
+        return data_to_lower_cached(self.description)
+
+    @cached_property
+    def combined_lower(self) -> str:
+        """Return description, test data and expected result as lowercase text."""
+        return f"{self.description_lower} {self.test_data} {self.expected}".lower()
+
+    @property
+    def command(self) -> str:
+        """Return the command text: test data, falling back to the description."""
+        return self.test_data or self.description
+
+    @cached_property
+    def command_lower(self) -> str:
+        """Return the lowercased command text."""
+        return self.command.lower()
+
+    @cached_property
+    def is_command(self) -> bool:
+        """Return True if the step's data or description mentions a command."""
+        return is_command_step(self.step)
+
+    @cached_property
+    def command_signature(self) -> str | None:
+        """Return the base command and its sorted flags, or None if empty."""
+        return normalize_command_signature(self.command)
+
+    @cached_property
+    def _placeholders(self) -> tuple[frozenset[str], frozenset[str]]:
+        """Return Robot Framework and legacy placeholders across text fields."""
+        robot_placeholders: set[str] = set()
+        legacy_placeholders: set[str] = set()
+        for field_name in PLACEHOLDER_FIELD_NAMES:
+            value = self.step.get(field_name)
+            if isinstance(value, str):
+                robot, legacy = find_placeholders(value)
+                robot_placeholders |= robot
+                legacy_placeholders |= legacy
+        return frozenset(robot_placeholders), frozenset(legacy_placeholders)
+
+    @property
+    def robot_placeholders(self) -> frozenset[str]:
+        """Return ``${name}`` placeholder names."""
+        return self._placeholders[0]
+
+    @property
+    def legacy_placeholders(self) -> frozenset[str]:
+        """Return ``{name}``, ``<name>`` and ``[name]`` placeholder names."""
+        return self._placeholders[1]
+
+    @cached_property
+    def unmatched_braces(self) -> tuple[tuple[str, str], ...]:
+        """Return (field name, brace type) pairs with unmatched braces."""
+        return find_unmatched_braces(self.step)
+
+    @cached_property
+    def index_values(self) -> tuple[int, ...]:
+        """Return the integer ordering values declared on the step."""
+        values = []
+        for field_name in STEP_INDEX_FIELD_NAMES:
+            if field_name in self.step:
+                try:
+                    values.append(int(self.step[field_name]))
+                except (ValueError, TypeError):
+                    continue
+        return tuple(values)
+
+
+def normalize_command_signature(command: str) -> str | None:
+    """Produce a normalized signature for a command."""
+    try:
+        tokens = shlex.split(command)
+    except ValueError:
+        tokens = command.split()
+    if not tokens:
+        return None
+    base = tokens[0].lower()
+    flags = sorted(token.lower() for token in tokens[1:] if token.startswith("-"))
+    return "|".join([base, *flags]) if flags else base
+
+
+def find_placeholders(text: str) -> tuple[set[str], set[str]]:
+    """Return Robot Framework and legacy placeholder names found in text."""
+    robot = {
+        clean
+        for match in ROBOT_PLACEHOLDER_PATTERN.findall(text)
+        if len(clean := match.strip()) > 1
+    }
+    legacy = {
+        clean
+        for pattern in LEGACY_PLACEHOLDER_PATTERNS
+        for match in pattern.findall(text)
+        if len(clean := match.strip()) > 1
+    }
+    return robot, legacy
+
+
+def find_unmatched_braces(step: dict[str, Any]) -> tuple[tuple[str, str], ...]:
+    """Return (field name, brace type) pairs for string fields with unmatched braces."""
+    return tuple(
+        (field_name, brace_type)
+        for field_name, value in step.items()
+        if isinstance(value, str)
+        for brace_type, opening, closing in _BRACE_PAIRS
+        if value.count(opening) != value.count(closing)
+    )
+
+
+def extract_features(step: dict[str, Any], index: int) -> StepFeatures:
+    """Extract the shared step fields; derived features follow lazily."""
+    return StepFeatures(
+        step=step,
+        index=index,
+        description=get_field_value(step, STEP_ACTION_FIELDS),
+        test_data=get_field_value(step, STEP_DATA_FIELDS),
+        expected=get_field_value(step, STEP_EXPECTED_FIELDS),
+    )
+
+
+def extract_step_features(steps: list[dict[str, Any]]) -> list[StepFeatures]:
+    """Extract features for every dictionary step in a single pass."""
+    return [
+        extract_features(step, index)
+        for index, step in enumerate(steps)
+        if isinstance(step, dict)
+    ]
+
+
+__all__ = [
+    "StepFeatures",
+    "extract_features",
+    "extract_step_features",
+    "find_placeholders",
+    "find_unmatched_braces",
+    "normalize_command_signature",
+]
@@ -1,19 +1,21 @@
 """Main suggestion engine that orchestrates all suggestion components."""
 
-import copy
 from typing import Any
 
 from importobot import exceptions
 from importobot.core.constants import TEST_CONTAINER_FIELD_NAMES
 from importobot.core.interfaces import SuggestionEngine
 from importobot.core.parsers import GenericTestFileParser
+from importobot.utils.json_patch import copy_containers
 from importobot.utils.logging import get_logger
 from importobot.utils.validation import FieldValidator
 
 from .builtin_analyzer import BuiltInKeywordAnalyzer
 from .comparison_analyzer import ComparisonAnalyzer
 from .parameter_analyzer import ParameterAnalyzer
+from .patching import SuggestionPatch
 from .step_analyzer import StepAnalyzer
+from .step_features import extract_step_features
 
 logger = get_logger()
 
@@ -28,6 +30,7 @@ class GenericSuggestionEngine(SuggestionEngine):
         self.parameter_analyzer = ParameterAnalyzer()
         self.comparison_analyzer = ComparisonAnalyzer()
         self.builtin_analyzer = BuiltInKeywordAnalyzer()
+        self._parser = GenericTestFileParser()
 
     def get_suggestions(self, json_data: dict[str, Any] | list[Any] | Any) -> list[str]:
         """Generate suggestions for improving JSON test data for Robot conversion."""
@@ -37,7 +40,6 @@ class GenericSuggestionEngine(SuggestionEngine):
                 return [test_cases]  # Error message
 
             suggestions: list[str] = []
-            parser = GenericTestFileParser()
 
             for i, test_case in enumerate(test_cases):
                 if not isinstance(test_case, dict):
@@ -46,17 +48,27 @@ class GenericSuggestionEngine(SuggestionEngine):
                 self.field_validator.check_test_case_fields(
                     test_case, i + 1, suggestions
                 )
-                steps = parser.find_steps(test_case)
-                self.step_analyzer.check_steps(steps, i + 1, suggestions)
+                steps = self._parser.find_steps(test_case)
+                # Extract step text, commands and placeholders once for all
+                # analyzers instead of letting each re-scan the raw steps.
+                features = extract_step_features(steps)
+                self.step_analyzer.check_steps(
+                    steps, i + 1, suggestions, features=features
+                )
                 self.parameter_analyzer.check_parameter_mapping(
-                    test_case, steps, i + 1, suggestions
+                    test_case, steps, i + 1, suggestions, features=features
+                )
+                self.step_analyzer.check_step_ordering(
+                    steps, i + 1, suggestions, features=features
                 )
-                self.step_analyzer.check_step_ordering(steps, i + 1, suggestions)
                 self.comparison_analyzer.check_result_comparison_opportunities(
-                    steps, i + 1, suggestions
+                    steps, i + 1, suggestions, features=features
                 )
                 self.builtin_analyzer.check_builtin_keyword_ambiguities(
-                    steps=steps, test_case_index=i + 1, suggestions=suggestions
+                    steps=steps,
+                    test_case_index=i + 1,
+                    suggestions=suggestions,
+                    features=features,
                 )
 
             return (
@@ -87,43 +99,48 @@ class GenericSuggestionEngine(SuggestionEngine):
     def apply_suggestions(
         self, json_data: dict[str, Any] | list[Any] | Any
     ) -> tuple[Any, list[dict[str, Any]]]:
-        """Apply automatic improvements to test data."""
-        try:
-            # Create a deep copy to avoid modifying the original
-            improved_data = copy.deepcopy(json_data)
-            changes_made: list[dict[str, Any]] = []
+        """Apply automatic improvements to test data.
+
+        The input is never modified. Unchanged test cases are shared between
+        the input and the returned document; see :meth:`plan_suggestions`.
+        """
+        patch = self.plan_suggestions(json_data)
+        return patch.improved, patch.changes
+
+    def plan_suggestions(
+        self, json_data: dict[str, Any] | list[Any] | Any
+    ) -> SuggestionPatch:
+        """Plan automatic improvements without copying the whole document.
 
-            test_cases = self._extract_test_cases_for_improvement(improved_data)
+        Each test case is improved on a container-only copy that is kept only
+        if the analyzers actually changed it, so documents needing few or no
+        changes cost little extra memory.
+        """
+        try:
+            container_key, single_test_case, test_cases = (
+                self._locate_test_cases_for_improvement(json_data)
+            )
             if isinstance(test_cases, str):
                 raise exceptions.ImportobotError(test_cases)
 
+            patch = SuggestionPatch(
+                original=json_data,
+                container_key=container_key,
+                single_test_case=single_test_case,
+            )
+            if not isinstance(test_cases, list):
+                return patch
+
             for i, test_case in enumerate(test_cases):
                 if not isinstance(test_case, dict):
                     continue
 
-                # Apply field improvements
-                self.field_validator.add_default_name(test_case, i, changes_made)
-                self.field_validator.add_default_description(test_case, i, changes_made)
-
-                # Apply step improvements
-                self.step_analyzer.improve_steps(test_case, i, changes_made)
+                candidate = copy_containers(test_case)
+                self._improve_test_case(candidate, i, patch.changes)
+                if candidate != test_case:
+                    patch.replacements[i] = candidate
 
-                # Apply parameter improvements
-                self.parameter_analyzer.improve_parameters(test_case, i, changes_made)
-
-                # Add comparison steps if beneficial
-                parser = GenericTestFileParser()
-                steps = parser.find_steps(test_case)
-                self.comparison_analyzer.add_comparison_steps(
-                    test_case, steps, i, changes_made
-                )
-
-                # Apply BuiltIn keyword improvements
-                self.builtin_analyzer.suggest_builtin_keyword_improvements(
-                    test_case, i, changes_made
-                )
-
-            return improved_data, changes_made
+            return patch
 
         except Exception as e:
             logger.error("Error applying suggestions: %s", e)
@@ -131,6 +148,34 @@ class GenericSuggestionEngine(SuggestionEngine):
                 f"Failed to apply suggestions: {e!s}"
             ) from e
 
+    def _improve_test_case(
+        self,
+        test_case: dict[str, Any],
+        index: int,
+        changes_made: list[dict[str, Any]],
+    ) -> None:
+        """Run every analyzer's in-place improvements on one test case."""
+        # Apply field improvements
+        self.field_validator.add_default_name(test_case, index, changes_made)
+        self.field_validator.add_default_description(test_case, index, changes_made)
+
+        # Apply step improvements
+        self.step_analyzer.improve_steps(test_case, index, changes_made)
+
+        # Apply parameter improvements
+        self.parameter_analyzer.improve_parameters(test_case, index, changes_made)
+
+        # Add comparison steps if beneficial
+        steps = self._parser.find_steps(test_case)
+        self.comparison_analyzer.add_comparison_steps(
+            test_case, steps, index, changes_made
+        )
+
+        # Apply BuiltIn keyword improvements
+        self.builtin_analyzer.suggest_builtin_keyword_improvements(
+            test_case, index, changes_made
+        )
+
     def _extract_test_cases(self, json_data: Any) -> Any:
         """Extract test cases from JSON data for analysis."""
         if isinstance(json_data, list):
@@ -150,17 +195,28 @@ class GenericSuggestionEngine(SuggestionEngine):
 
     def _extract_test_cases_for_improvement(self, data: Any) -> Any:
         """Extract test cases from data for improvement."""
+        return self._locate_test_cases_for_improvement(data)[2]
+
+    def _locate_test_cases_for_improvement(
+        self, data: Any
+    ) -> tuple[str | None, bool, Any]:
+        """Find test cases and where they live in the document.
+
+        Returns:
+            Tuple of (container key or None, whether ``data`` is itself a single
+            test case, the test cases or an error message).
+        """
         if isinstance(data, list):
-            return data
+            return None, False, data
         if isinstance(data, dict):
             for key, value in data.items():
                 if (
                     isinstance(value, list)
                     and key.lower() in TEST_CONTAINER_FIELD_NAMES
                 ):
-                    return value
+                    return key, False, value
             for key, value in data.items():
                 if key.lower() in TEST_CONTAINER_FIELD_NAMES:
-                    return value
-            return [data]  # Single test case
-        return "Invalid JSON structure: expected object or array"
+                    return key, False, value
+            return None, True, [data]  # Single test case
+        return None, False, "Invalid JSON structure: expected object or array"
@@ -34,8 +34,6 @@ Example usage:
 from __future__ import annotations
 
 import ast
-import hashlib
-import json
 import os
 import re
 from collections.abc import Sequence
@@ -43,6 +41,12 @@ from pathlib import Path
 from typing import Any
 
 from importobot.config import MAX_TEMPLATE_FILE_SIZE_BYTES
+from importobot.core.templates.blueprints.snapshot import (
+    SNAPSHOT_FILENAME,
+    KnowledgeBaseSnapshot,
+    deserialize_analysis,
+    serialize_analysis,
+)
 from importobot.core.templates.blueprints.storage import (
     KEYWORD_LIBRARY,
     KNOWLEDGE_BASE,
@@ -74,8 +78,6 @@ ALLOWED_TEMPLATE_SUFFIXES = (
     TEMPLATE_EXTENSIONS | RESOURCE_EXTENSIONS | PYTHON_EXTENSIONS
 )
 
-TEMPLATE_CACHE_VERSION = 1
-
 
 def _is_path_within_root(candidate: Path, root: Path) -> bool:
     try:
@@ -129,7 +131,10 @@ def configure_template_sources(entries: Sequence[str]) -> None:
     """Register blueprint templates from user-provided files or directories.
 
     This routine clears and rebuilds the in-memory registry, so callers should
-    invoke it as part of initial setup rather than on hot paths.
+    invoke it as part of initial setup rather than on hot paths. The learned
+    state is rebuilt from the knowledge-base snapshot: sources whose
+    ``(path, mtime, size)`` still match are replayed from it without being
+    read, and only new or changed sources are analysed again.
     Only files under the current working directory are ingested to prevent
     accidental traversal of sensitive paths (e.g., via ``~`` expansion).
     """
@@ -141,8 +146,21 @@ def configure_template_sources(entries: Sequence[str]) -> None:
     SUITE_SETTINGS_REGISTRY.clear()
     TEMPLATE_STATE["base_dir"] = None
     TEMPLATE_STATE["enabled"] = False
-    ingested_files = 0
+    snapshot = _open_template_snapshot()
+    try:
+        ingested_files = _ingest_template_entries(entries, safe_root, snapshot)
+    finally:
+        if snapshot is not None:
+            snapshot.save()
+    TEMPLATE_STATE["enabled"] = ingested_files > 0
+
 
+def _ingest_template_entries(
+    entries: Sequence[str],
+    safe_root: Path,
+    snapshot: KnowledgeBaseSnapshot | None,
+) -> int:
+    ingested_files = 0
     for raw_entry in entries:
         prepared = _prepare_template_entry(raw_entry, safe_root)
         if prepared is None:
@@ -157,44 +175,59 @@ def configure_template_sources(entries: Sequence[str]) -> None:
 
         try:
             ingested_files, limit_hit = _process_template_candidate(
-                candidate, key_override, ingested_files
+                candidate, key_override, ingested_files, snapshot=snapshot
             )
             if limit_hit:
-                TEMPLATE_STATE["enabled"] = ingested_files > 0
-                return
+                return ingested_files
         except TemplateIngestionError as err:
             logger.warning("Skipping template source %s: %s", candidate, err)
-    TEMPLATE_STATE["enabled"] = ingested_files > 0
+    return ingested_files
 
 
 def _process_template_candidate(
-    candidate: Path, key_override: str | None, ingested_files: int
+    candidate: Path,
+    key_override: str | None,
+    ingested_files: int,
+    *,
+    snapshot: KnowledgeBaseSnapshot | None = None,
 ) -> tuple[int, bool]:
     if candidate.is_dir():
-        return _ingest_directory_sources(candidate, key_override, ingested_files)
-    return _ingest_single_source(candidate, key_override, ingested_files)
+        return _ingest_directory_sources(
+            candidate, key_override, ingested_files, snapshot=snapshot
+        )
+    return _ingest_single_source(
+        candidate, key_override, ingested_files, snapshot=snapshot
+    )
 
 
 def _ingest_directory_sources(
-    directory: Path, key_override: str | None, ingested_files: int
+    directory: Path,
+    key_override: str | None,
+    ingested_files: int,
+    *,
+    snapshot: KnowledgeBaseSnapshot | None = None,
 ) -> tuple[int, bool]:
     for child in sorted(directory.iterdir()):
         if child.is_symlink() or not child.is_file():
             continue
         if _has_reached_template_limit(ingested_files):
             return ingested_files, True
-        _ingest_source_file(child, key_override, base_dir=directory)
+        _ingest_source_file(child, key_override, base_dir=directory, snapshot=snapshot)
         ingested_files += 1
         _log_ingestion_progress(ingested_files)
     return ingested_files, False
 
 
 def _ingest_single_source(
-    path: Path, key_override: str | None, ingested_files: int
+    path: Path,
+    key_override: str | None,
+    ingested_files: int,
+    *,
+    snapshot: KnowledgeBaseSnapshot | None = None,
 ) -> tuple[int, bool]:
     if _has_reached_template_limit(ingested_files):
         return ingested_files, True
-    _ingest_source_file(path, key_override, base_dir=path.parent)
+    _ingest_source_file(path, key_override, base_dir=path.parent, snapshot=snapshot)
     updated = ingested_files + 1
     _log_ingestion_progress(updated)
     return updated, False
@@ -278,7 +311,11 @@ def get_suite_settings() -> SuiteSettings | None:
 
 
 def _ingest_source_file(
-    path: Path, key_override: str | None, *, base_dir: Path | None
+    path: Path,
+    key_override: str | None,
+    *,
+    base_dir: Path | None,
+    snapshot: KnowledgeBaseSnapshot | None = None,
 ) -> None:
     """Ingest a template file and register it in the template system.
 
@@ -286,6 +323,7 @@ def _ingest_source_file(
         path: Path to the template file
         key_override: Optional key override for the template
         base_dir: Base directory for relative path calculations
+        snapshot: Knowledge-base snapshot to replay from and record into
 
     Raises:
         TemplateIngestionError: If the file cannot be ingested
@@ -295,39 +333,50 @@ def _ingest_source_file(
         raise TemplateIngestionError(f"Unsupported template type for {path}")
     if path.is_symlink():
         raise TemplateIngestionError(f"Refusing to follow template symlink {path}")
-    _ensure_textual_file(path)
 
-    suffix = path.suffix.lower()
     try:
-        file_size = path.stat().st_size
+        stat = path.stat()
     except OSError as exc:
         raise TemplateIngestionError(f"Failed to stat template {path}: {exc}") from exc
-    if file_size > MAX_TEMPLATE_FILE_SIZE_BYTES:
+    if stat.st_size > MAX_TEMPLATE_FILE_SIZE_BYTES:
         raise TemplateIngestionError(
             f"Template {path} exceeds size limit ({MAX_TEMPLATE_FILE_SIZE_BYTES} bytes)"
         )
 
-    if suffix in TEMPLATE_EXTENSIONS:
-        _register_template(path, key_override)
-        return
-    if suffix in RESOURCE_EXTENSIONS:
-        _register_resource(path, base_dir=base_dir)
-        return
-    if suffix in PYTHON_EXTENSIONS:
-        _register_python(path)
+    kind = _source_kind(suffix)
+    cached = snapshot.lookup(path, stat, kind) if snapshot is not None else None
+    if cached is None:
+        # Snapshot entries were recorded from files that passed this check.
+        _ensure_textual_file(path)
 
+    if kind == "template":
+        payload = _register_template(path, key_override, cached)
+    elif kind == "resource":
+        payload = _register_resource(path, base_dir=base_dir, cached=cached)
+    else:
+        payload = _register_python(path, cached)
+    if cached is None and snapshot is not None:
+        snapshot.record(path, stat, kind, **payload)
 
-def _register_template(path: Path, key_override: str | None) -> None:
-    try:
-        stat = path.stat()
-    except OSError as exc:
-        raise TemplateIngestionError(f"Failed to stat template {path}: {exc}") from exc
 
-    cache_payload = _load_template_cache(path, stat)
-    if cache_payload is not None:
-        content = cache_payload["content"]
-        analysis = _deserialize_analysis(cache_payload["analysis"])
-        _apply_template_analysis(analysis, base_dir=path.parent)
+def _source_kind(suffix: str) -> str:
+    if suffix in TEMPLATE_EXTENSIONS:
+        return "template"
+    if suffix in RESOURCE_EXTENSIONS:
+        return "resource"
+    return "python"
+
+
+def _register_template(
+    path: Path, key_override: str | None, cached: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    if cached is not None:
+        # The snapshot is a writable file, so replayed content is validated again.
+        template_obj = SandboxedTemplate(str(cached.get("content", "")))
+        _apply_template_analysis(
+            deserialize_analysis(cached.get("analysis") or {}), base_dir=path.parent
+        )
+        payload = cached
     else:
         try:
             raw_content = path.read_text(encoding="utf-8")
@@ -342,15 +391,24 @@ def _register_template(path: Path, key_override: str | None) -> None:
             analysis = _learn_from_template(content, base_dir=path.parent)
         except ValueError as exc:
             raise TemplateIngestionError(f"Malformed template {path}: {exc}") from exc
-        _store_template_cache(path, stat, content, analysis)
+        template_obj = SandboxedTemplate(content)
+        payload = {"content": content, "analysis": serialize_analysis(analysis)}
 
-    template_obj = SandboxedTemplate(content)
     for key in _derive_template_keys(key_override or path.stem):
         if key and TEMPLATE_REGISTRY.get(key) is None:
             TEMPLATE_REGISTRY.register(key, template_obj)
+    return payload
 
 
-def _register_resource(path: Path, *, base_dir: Path | None) -> None:
+def _register_resource(
+    path: Path, *, base_dir: Path | None, cached: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    if cached is not None:
+        _apply_template_analysis(
+            deserialize_analysis(cached.get("analysis") or {}), base_dir=base_dir
+        )
+        _register_resource_path(path, base_dir=base_dir)
+        return cached
     try:
         raw_content = path.read_text(encoding="utf-8")
     except OSError as exc:
@@ -358,28 +416,37 @@ def _register_resource(path: Path, *, base_dir: Path | None) -> None:
     content = _sanitize_template_payload(raw_content)
     try:
         _validate_template_content(content)
-        _learn_from_template(content, base_dir=base_dir)
+        analysis = _learn_from_template(content, base_dir=base_dir)
         _register_resource_path(path, base_dir=base_dir)
     except Exception as exc:  # pragma: no cover - defensive guard
         raise TemplateIngestionError(
             f"Resource contains invalid content {path}: {exc}"
         ) from exc
+    return {"analysis": serialize_analysis(analysis)}
 
 
-def _register_python(path: Path) -> None:
-    try:
-        raw_content = path.read_text(encoding="utf-8")
-    except OSError as exc:
-        raise TemplateIngestionError(
-            f"Failed to read python template {path}: {exc}"
-        ) from exc
-    content = _sanitize_template_payload(raw_content)
-    try:
-        _learn_from_python(content)
-    except Exception as exc:  # pragma: no cover - defensive guard
-        raise TemplateIngestionError(
-            f"Python helper {path} has invalid content: {exc}"
-        ) from exc
+def _register_python(
+    path: Path, cached: dict[str, Any] | None = None
+) -> dict[str, Any]:
+    if cached is not None:
+        keywords = [str(name) for name in cached.get("keywords") or []]
+    else:
+        try:
+            raw_content = path.read_text(encoding="utf-8")
+        except OSError as exc:
+            raise TemplateIngestionError(
+                f"Failed to read python template {path}: {exc}"
+            ) from exc
+        content = _sanitize_template_payload(raw_content)
+        try:
+            keywords = _python_keywords(content)
+        except Exception as exc:  # pragma: no cover - defensive guard
+            raise TemplateIngestionError(
+                f"Python helper {path} has invalid content: {exc}"
+            ) from exc
+    for name in keywords:
+        KEYWORD_LIBRARY.add(name)
+    return cached if cached is not None else {"keywords": keywords}
 
 
 def _sanitize_template_payload(content: str) -> str:
@@ -744,20 +811,23 @@ def _pattern_from_block(block: list[str]) -> StepPattern | None:
     )
 
 
-def _learn_from_python(content: str) -> None:
+def _python_keywords(content: str) -> list[str]:
     try:
         module = ast.parse(content)
     except SyntaxError:
-        return
+        return []
 
+    names: list[str] = []
     for node in ast.walk(module):
         if isinstance(node, ast.FunctionDef):
-            name = node.name.replace("_", " ")
-            KEYWORD_LIBRARY.add(name)
+            names.append(node.name.replace("_", " "))
         elif isinstance(node, ast.Assign):
-            for target in node.targets:
-                if isinstance(target, ast.Name) and target.id.isupper():
-                    KEYWORD_LIBRARY.add(target.id.lower())
+            names.extend(
+                target.id.lower()
+                for target in node.targets
+                if isinstance(target, ast.Name) and target.id.isupper()
+            )
+    return names
 
 
 def _extract_keywords_from_lines(lines: list[str], keywords: set[str]) -> None:
@@ -830,133 +900,15 @@ def _template_cache_enabled() -> bool:
 
 def _template_cache_dir() -> Path:
     default_root = Path(".importobot/cache/blueprints")
-    root = Path(
+    return Path(
         os.getenv("IMPORTOBOT_BLUEPRINT_CACHE_DIR", str(default_root))
     ).expanduser()
-    root.mkdir(parents=True, exist_ok=True)
-    return root
-
-
-def _template_cache_key(path: Path) -> str:
-    return hashlib.blake2s(str(path).encode("utf-8"), digest_size=16).hexdigest()
-
-
-def _load_template_cache(path: Path, stat: os.stat_result) -> dict[str, Any] | None:
-    if not _template_cache_enabled():
-        return None
-    cache_file = _template_cache_dir() / f"{_template_cache_key(path)}.json"
-    try:
-        raw = cache_file.read_text(encoding="utf-8")
-    except FileNotFoundError:
-        return None
-    except OSError as exc:  # pragma: no cover - filesystem edge cases
-        logger.debug("Failed reading template cache for %s: %s", path, exc)
-        return None
-    try:
-        payload = json.loads(raw)
-    except json.JSONDecodeError:
-        logger.debug("Invalid template cache payload for %s", path)
-        return None
-    if payload.get("version") != TEMPLATE_CACHE_VERSION:
-        return None
-    if (
-        payload.get("mtime_ns") != stat.st_mtime_ns
-        or payload.get("size") != stat.st_size
-    ):
-        return None
-    analysis = payload.get("analysis")
-    if not isinstance(analysis, dict):
-        return None
-    content = payload.get("content")
-    if not isinstance(content, str):
-        return None
-    return {"content": content, "analysis": analysis}
 
 
-def _store_template_cache(
-    path: Path, stat: os.stat_result, content: str, analysis: TemplateAnalysis
-) -> None:
+def _open_template_snapshot() -> KnowledgeBaseSnapshot | None:
     if not _template_cache_enabled():
-        return
-    cache_dir = _template_cache_dir()
-    cache_file = cache_dir / f"{_template_cache_key(path)}.json"
-    payload = {
-        "version": TEMPLATE_CACHE_VERSION,
-        "mtime_ns": stat.st_mtime_ns,
-        "size": stat.st_size,
-        "content": content,
-        "analysis": _serialize_analysis(analysis),
-    }
-    try:
-        tmp = cache_file.with_suffix(".json.tmp")
-        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
-        tmp.replace(cache_file)
-    except OSError as exc:  # pragma: no cover - best effort cache
-        logger.debug("Failed writing template cache for %s: %s", path, exc)
-
-
-def _serialize_analysis(analysis: TemplateAnalysis) -> dict[str, Any]:
-    return {
-        "patterns": [_serialize_step_pattern(pattern) for pattern in analysis.patterns],
-        "keywords": sorted(analysis.keywords),
-        "resource_imports": analysis.resource_imports,
-    }
-
-
-def _deserialize_analysis(data: dict[str, Any]) -> TemplateAnalysis:
-    pattern_items = data.get("patterns", [])
-    patterns: list[StepPattern] = []
-    if isinstance(pattern_items, list):
-        for item in pattern_items:
-            pattern = _deserialize_step_pattern(item)
-            if pattern is not None:
-                patterns.append(pattern)
-    keywords_raw = data.get("keywords", [])
-    keywords = set(keywords_raw) if isinstance(keywords_raw, list) else set()
-    resources_raw = data.get("resource_imports", [])
-    if isinstance(resources_raw, list):
-        resource_imports = list(dict.fromkeys(resources_raw))
-    else:
-        resource_imports = []
-    return TemplateAnalysis(
-        patterns=patterns, keywords=keywords, resource_imports=resource_imports
-    )
-
-
-def _serialize_step_pattern(pattern: StepPattern) -> dict[str, Any]:
-    """Convert StepPattern into JSON-serialisable payload."""
-    return {
-        "library": pattern.library,
-        "keyword": pattern.keyword,
-        "connection": pattern.connection,
-        "command_token": pattern.command_token,
-        "lines": list(pattern.lines),
-    }
-
-
-def _deserialize_step_pattern(payload: Any) -> StepPattern | None:
-    """Reconstruct StepPattern from cached payload, skipping invalid entries."""
-    if not isinstance(payload, dict):
-        return None
-    required = ("library", "keyword", "command_token", "lines")
-    if not all(key in payload for key in required):
-        return None
-    lines = payload.get("lines", [])
-    if not isinstance(lines, list):
-        return None
-    connection = payload.get("connection")
-    if connection is not None and not isinstance(connection, str):
-        connection = str(connection)
-    try:
-        return StepPattern(
-            library=str(payload["library"]),
-            keyword=str(payload["keyword"]),
-            connection=connection,
-            command_token=str(payload["command_token"]),
-            lines=[str(line) for line in lines],
-        )
-    except (TypeError, ValueError):
         return None
+    return KnowledgeBaseSnapshot.load(_template_cache_dir() / SNAPSHOT_FILENAME)
 
 
 def _log_ingestion_progress(count: int) -> None:
@@ -0,0 +1,225 @@
+"""Packed knowledge-base snapshot for incremental template ingestion.
+
+Learning from a template corpus means reading, sanitising, validating and
+analysing every file. The snapshot stores the outcome of that work for all
+ingested sources in a single file, together with a manifest of each source's
+``(path, mtime, size)``. Reconfiguring the template sources then loads the
+snapshot with one read, replays the stored analyses into the registries and
+only re-analyses the sources whose manifest entry no longer matches.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from importobot.core.templates.blueprints.storage import (
+    StepPattern,
+    SuiteSettings,
+    TemplateAnalysis,
+)
+from importobot.utils.logging import get_logger
+
+logger = get_logger()
+
+SNAPSHOT_VERSION = 2
+SNAPSHOT_FILENAME = "knowledge_base.json"
+
+_SUITE_SETTING_FIELDS = ("suite_setup", "suite_teardown", "test_setup", "test_teardown")
+
+
+class KnowledgeBaseSnapshot:
+    """Manifest-keyed store of analysed template sources.
+
+    Entries are keyed by source path and are only returned while the source's
+    mtime and size still match the recorded manifest. The saved snapshot keeps
+    exactly the sources seen since it was loaded, so files removed from the
+    configuration drop out on the next save.
+    """
+
+    def __init__(
+        self, path: Path | None = None, entries: dict[str, Any] | None = None
+    ) -> None:
+        """Create a snapshot backed by ``path`` with previously saved entries."""
+        self.path = path
+        self._entries: dict[str, dict[str, Any]] = dict(entries or {})
+        self._seen: set[str] = set()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, path: Path) -> KnowledgeBaseSnapshot:
+        """Read the snapshot at ``path``; missing or invalid files start empty."""
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return cls(path)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.debug("Ignoring unreadable template snapshot %s: %s", path, exc)
+            return cls(path)
+        if not isinstance(payload, dict) or payload.get("version") != SNAPSHOT_VERSION:
+            return cls(path)
+        entries = payload.get("entries")
+        if not isinstance(entries, dict):
+            return cls(path)
+        valid = {
+            key: entry for key, entry in entries.items() if isinstance(entry, dict)
+        }
+        return cls(path, valid)
+
+    def __len__(self) -> int:
+        """Return the number of stored source entries."""
+        return len(self._entries)
+
+    def lookup(
+        self, source: Path, stat: os.stat_result, kind: str
+    ) -> dict[str, Any] | None:
+        """Return the stored entry for ``source`` if its manifest still matches."""
+        key = str(source)
+        self._seen.add(key)
+        entry = self._entries.get(key)
+        if (
+            entry is not None
+            and entry.get("kind") == kind
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and entry.get("size") == stat.st_size
+        ):
+            self.hits += 1
+            return entry
+        self.misses += 1
+        return None
+
+    def record(
+        self, source: Path, stat: os.stat_result, kind: str, **payload: Any
+    ) -> None:
+        """Store the analysis of ``source`` under its current manifest."""
+        key = str(source)
+        self._seen.add(key)
+        self._entries[key] = {
+            "kind": kind,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            **payload,
+        }
+        self._dirty = True
+
+    def save(self) -> bool:
+        """Write the snapshot if anything changed; return whether it was written."""
+        stale = set(self._entries) - self._seen
+        if self.path is None or not (self._dirty or stale):
+            return False
+        for key in stale:
+            del self._entries[key]
+        payload = {"version": SNAPSHOT_VERSION, "entries": self._entries}
+        tmp = self.path.with_suffix(".json.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(
+                json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+                encoding="utf-8",
+            )
+            tmp.replace(self.path)
+        except OSError as exc:  # pragma: no cover - best effort cache
+            logger.debug("Failed writing template snapshot %s: %s", self.path, exc)
+            return False
+        self._dirty = False
+        return True
+
+
+def serialize_analysis(analysis: TemplateAnalysis) -> dict[str, Any]:
+    """Convert a template analysis into a JSON-serialisable payload."""
+    settings = analysis.suite_settings
+    return {
+        "patterns": [_serialize_step_pattern(pattern) for pattern in analysis.patterns],
+        "keywords": sorted(analysis.keywords),
+        "resource_imports": analysis.resource_imports,
+        "suite_settings": (
+            {name: getattr(settings, name) for name in _SUITE_SETTING_FIELDS}
+            if settings is not None and settings.has_setup_keywords()
+            else None
+        ),
+    }
+
+
+def deserialize_analysis(data: dict[str, Any]) -> TemplateAnalysis:
+    """Rebuild a template analysis from its payload, skipping invalid parts."""
+    pattern_items = data.get("patterns", [])
+    patterns: list[StepPattern] = []
+    if isinstance(pattern_items, list):
+        for item in pattern_items:
+            pattern = _deserialize_step_pattern(item)
+            if pattern is not None:
+                patterns.append(pattern)
+    keywords_raw = data.get("keywords", [])
+    keywords = set(keywords_raw) if isinstance(keywords_raw, list) else set()
+    resources_raw = data.get("resource_imports", [])
+    if isinstance(resources_raw, list):
+        resource_imports = list(dict.fromkeys(resources_raw))
+    else:
+        resource_imports = []
+    return TemplateAnalysis(
+        patterns=patterns,
+        keywords=keywords,
+        resource_imports=resource_imports,
+        suite_settings=_deserialize_suite_settings(data.get("suite_settings")),
+    )
+
+
+def _serialize_step_pattern(pattern: StepPattern) -> list[Any]:
+    """Pack a StepPattern into a positional ``[library, keyword, ...]`` array."""
+    return [
+        pattern.library,
+        pattern.keyword,
+        pattern.connection,
+        pattern.command_token,
+        list(pattern.lines),
+    ]
+
+
+def _deserialize_step_pattern(payload: Any) -> StepPattern | None:
+    """Unpack a StepPattern from its packed array, skipping invalid entries."""
+    if not isinstance(payload, list) or len(payload) != 5:
+        return None
+    library, keyword, connection, command_token, lines = payload
+    if not (
+        isinstance(library, str)
+        and isinstance(keyword, str)
+        and isinstance(command_token, str)
+        and isinstance(lines, list)
+        and (connection is None or isinstance(connection, str))
+    ):
+        return None
+    if not all(isinstance(line, str) for line in lines):
+        return None
+    return StepPattern(
+        library=library,
+        keyword=keyword,
+        connection=connection,
+        command_token=command_token,
+        lines=lines,
+    )
+
+
+def _deserialize_suite_settings(payload: Any) -> SuiteSettings | None:
+    """Reconstruct SuiteSettings, keeping only well-formed line lists."""
+    if not isinstance(payload, dict):
+        return None
+    values: dict[str, list[str] | None] = {}
+    for name in _SUITE_SETTING_FIELDS:
+        lines = payload.get(name)
+        values[name] = (
+            [str(line) for line in lines] if isinstance(lines, list) else None
+        )
+    return SuiteSettings(**values)
+
+
+__all__ = [
+    "SNAPSHOT_FILENAME",
+    "SNAPSHOT_VERSION",
+    "KnowledgeBaseSnapshot",
+    "deserialize_analysis",
+    "serialize_analysis",
+]
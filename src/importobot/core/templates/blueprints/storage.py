@@ -188,20 +188,48 @@ class TemplateRegistry:
 
 
 class KnowledgeBase:
-    """Aggregates patterns learned from templates."""
+    """Aggregates patterns learned from templates.
+
+    Patterns are grouped by ``(library, keyword)`` and additionally indexed by
+    group and command token, by command token alone and by library. The
+    indexes are maintained in :meth:`add_pattern` so lookups never scan the
+    learned patterns, while still returning the pattern a scan in
+    registration order would find first.
+    """
 
     def __init__(self) -> None:
         """Create empty pattern storage keyed by (library, keyword) tuples."""
         self._patterns: dict[tuple[str, str], list[StepPattern]] = {}
+        self._group_ranks: dict[tuple[str, str], int] = {}
+        self._by_group_token: dict[tuple[str, str, str], StepPattern] = {}
+        # command token -> (rank of the earliest group using it, its first pattern)
+        self._by_token: dict[str, tuple[int, StepPattern]] = {}
+        self._by_library: dict[str, list[StepPattern]] = {}
+        self._hits = 0
+        self._misses = 0
 
     def clear(self) -> None:
-        """Clear all learned pattern groups."""
+        """Clear all learned pattern groups, indexes and lookup statistics."""
         self._patterns.clear()
+        self._group_ranks.clear()
+        self._by_group_token.clear()
+        self._by_token.clear()
+        self._by_library.clear()
+        self._hits = 0
+        self._misses = 0
 
     def add_pattern(self, pattern: StepPattern) -> None:
         """Store a learned pattern indexed by (library, keyword)."""
         key = (pattern.library, pattern.keyword)
+        rank = self._group_ranks.setdefault(key, len(self._group_ranks))
         self._patterns.setdefault(key, []).append(pattern)
+        self._by_library.setdefault(pattern.library, []).append(pattern)
+
+        token = pattern.command_token
+        self._by_group_token.setdefault((*key, token), pattern)
+        indexed = self._by_token.get(token)
+        if indexed is None or rank < indexed[0]:
+            self._by_token[token] = (rank, pattern)
 
     def find_pattern(
         self,
@@ -219,27 +247,44 @@ class KnowledgeBase:
         Returns:
             Matching StepPattern or None
         """
+        lowered = command_token.lower() if command_token else None
+        pattern: StepPattern | None = None
+
         # Primary: exact library+keyword match
         if library and keyword:
-            key = (library, keyword)
-            patterns = self._patterns.get(key, [])
-            if command_token:
-                lowered = command_token.lower()
-                for pattern in patterns:
-                    if pattern.command_token == lowered:
-                        return pattern
-            elif patterns:
-                return patterns[0]
-
-        # Secondary: search all patterns for command token match
-        if command_token:
-            lowered = command_token.lower()
-            for patterns_list in self._patterns.values():
-                for pattern in patterns_list:
-                    if pattern.command_token == lowered:
-                        return pattern
-
-        return None
+            if lowered:
+                pattern = self._by_group_token.get((library, keyword, lowered))
+            else:
+                patterns = self._patterns.get((library, keyword))
+                pattern = patterns[0] if patterns else None
+
+        # Secondary: first group, in registration order, using the command token
+        if pattern is None and lowered:
+            indexed = self._by_token.get(lowered)
+            pattern = indexed[1] if indexed is not None else None
+
+        if pattern is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return pattern
+
+    def patterns_for_library(self, library: str) -> list[StepPattern]:
+        """Return the patterns learned for ``library`` in registration order."""
+        return list(self._by_library.get(library, ()))
+
+    def get_stats(self) -> dict[str, int | float]:
+        """Return lookup hit/miss statistics and index sizes."""
+        total_lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total_lookups if total_lookups else 0.0,
+            "patterns": sum(len(group) for group in self._patterns.values()),
+            "groups": len(self._patterns),
+            "command_tokens": len(self._by_token),
+            "libraries": len(self._by_library),
+        }
 
 
 class KeywordLibrary:
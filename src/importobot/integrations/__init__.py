@@ -1,5 +1,13 @@
 """Integration adapters for external systems."""
 
-from . import clients
+from importlib import import_module
+from types import ModuleType
 
-__all__ = ["clients"]
+__all__ = ["clients", "incremental", "pipeline"]
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import submodules on first access; the API clients pull in ``requests``."""
+    if name in __all__:
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
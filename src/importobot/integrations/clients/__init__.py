@@ -47,6 +47,8 @@ All clients offer the following features:
 
 from __future__ import annotations
 
+from datetime import datetime
+
 from importobot.integrations.clients.base import APISource, BaseAPIClient
 from importobot.integrations.clients.jira_xray import JiraXrayClient
 from importobot.integrations.clients.testlink import TestLinkClient
@@ -65,6 +67,7 @@ def get_api_client(
     project_id: int | None,
     max_concurrency: int | None,
     verify_ssl: bool,
+    updated_since: datetime | None = None,
 ) -> APISource:
     """Create a platform-specific API client from format and configuration."""
     mapping = {
@@ -84,6 +87,7 @@ def get_api_client(
         project_id=project_id,
         max_concurrency=max_concurrency,
         verify_ssl=verify_ssl,
+        updated_since=updated_since,
     )
     return client
 
@@ -8,9 +8,13 @@ from __future__ import annotations
 
 import time
 import warnings
-from collections.abc import Callable, Iterator
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
 from http import HTTPStatus
 from importlib import metadata
+from itertools import islice
 from typing import Any, ClassVar, NamedTuple, Protocol, runtime_checkable
 
 import requests
@@ -22,6 +26,8 @@ logger = get_logger()
 
 BACKOFF_BASE = 2.0
 MAX_RETRY_DELAY_SECONDS = 30.0
+# Pages requested ahead of the consumer per worker; bounds the reorder buffer
+PREFETCH_PAGES_PER_WORKER = 2
 
 
 ProgressCallback = Callable[..., None]
@@ -73,6 +79,9 @@ class BaseAPIClient:
         - Handlers can suppress exceptions by returning `True`.
     """
 
+    # Whether fetch_all honours ``updated_since``; incremental syncs of
+    # clients without a filter replace the snapshot instead of merging
+    supports_updated_since = True
     _max_retries = 3
     _circuit_breaker_threshold = 5  # Open circuit after 5 consecutive failures
     _circuit_breaker_timeout = 60.0  # Half-open state after 60 seconds
@@ -87,14 +96,20 @@ class BaseAPIClient:
         project_id: int | None,
         max_concurrency: int | None,
         verify_ssl: bool,
+        updated_since: datetime | None = None,
     ) -> None:
-        """Initialize the BaseAPIClient with API connection parameters."""
+        """Initialize the BaseAPIClient with API connection parameters.
+
+        ``updated_since`` restricts fetches to items updated at or after that
+        timezone-aware instant, where the platform supports such a filter.
+        """
         self.api_url = api_url
         self.tokens = tokens
         self.user = user
         self.project_name = project_name
         self.project_id = project_id
         self.max_concurrency = max_concurrency
+        self.updated_since = updated_since
         self._verify_ssl = verify_ssl
         self._session = requests.Session()
         self._session.verify = verify_ssl
@@ -259,6 +274,39 @@ class BaseAPIClient:
             return str(self.project_id)
         return None
 
+    def _prefetch_workers(self) -> int:
+        """Return how many page requests may be in flight at once."""
+        return max(self.max_concurrency or 1, 1)
+
+    def _fetch_pages_in_order(
+        self,
+        fetch_page: Callable[[Any], dict[str, Any]],
+        page_refs: Iterable[Any],
+    ) -> Generator[dict[str, Any], None, None]:
+        """Fetch ``page_refs`` concurrently and yield the payloads in order.
+
+        At most ``PREFETCH_PAGES_PER_WORKER`` pages per worker are requested
+        ahead of the consumer, so a slow early page holds back only a bounded
+        number of completed ones. Closing the iterator cancels pending pages.
+        """
+        workers = self._prefetch_workers()
+        refs = iter(page_refs)
+        pending: deque[Future[dict[str, Any]]] = deque()
+        executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="importobot-prefetch"
+        )
+        try:
+            window = islice(refs, workers * PREFETCH_PAGES_PER_WORKER)
+            pending.extend(executor.submit(fetch_page, ref) for ref in window)
+            while pending:
+                payload = pending.popleft().result()
+                pending.extend(
+                    executor.submit(fetch_page, ref) for ref in islice(refs, 1)
+                )
+                yield payload
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def _request(
         self,
         method: str,
@@ -413,6 +461,7 @@ class BaseAPIClient:
 __all__ = [
     "BACKOFF_BASE",
     "MAX_RETRY_DELAY_SECONDS",
+    "PREFETCH_PAGES_PER_WORKER",
     "APISource",
     "BaseAPIClient",
     "ProgressCallback",
@@ -0,0 +1,145 @@
+"""Local state file remembering API configurations discovered by clients.
+
+Zephyr discovery probes several endpoint patterns, authentication strategies
+and page sizes before fetching any data. ``DiscoveryStateStore`` keeps the
+outcome in a small JSON file keyed by a digest of the API URL, the project and
+a fingerprint of the credentials, so the next run against the same tenant can
+try the known configuration first. Credentials themselves are never written;
+entries older than the TTL are ignored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from importobot.config import ZEPHYR_DISCOVERY_TTL_SECONDS
+from importobot.utils.logging import get_logger
+from importobot.utils.state_file import VersionedStateFile
+
+logger = get_logger()
+
+DEFAULT_STATE_PATH = Path(".importobot/cache/zephyr_discovery.json")
+STATE_FORMAT_VERSION = 1
+
+
+def default_state_path() -> Path:
+    """Return the state file location, overridable via the environment."""
+    return Path(
+        os.getenv("IMPORTOBOT_ZEPHYR_DISCOVERY_STATE", str(DEFAULT_STATE_PATH))
+    ).expanduser()
+
+
+def discovery_key(
+    api_url: str,
+    project: str | int | None,
+    tokens: list[str],
+    user: str | None = None,
+) -> str:
+    """Return the state key for one tenant, project and set of credentials.
+
+    The credentials enter only through a one-way fingerprint, so rotating a
+    token starts a fresh discovery without the old token ever being stored.
+    """
+    fingerprint = hashlib.blake2b(digest_size=16)
+    for secret in (user or "", *tokens):
+        fingerprint.update(secret.encode("utf-8"))
+        fingerprint.update(b"\0")
+    identity = json.dumps(
+        [api_url.rstrip("/"), "" if project is None else str(project)],
+        separators=(",", ":"),
+    )
+    digest = hashlib.blake2b(identity.encode("utf-8"), digest_size=16)
+    digest.update(fingerprint.digest())
+    return digest.hexdigest()
+
+
+class DiscoveryStateStore:
+    """JSON file of discovered configurations, each valid for ``ttl_seconds``."""
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        ttl_seconds: int = ZEPHYR_DISCOVERY_TTL_SECONDS,
+    ) -> None:
+        """Use ``path`` (or the default location) with the given TTL."""
+        self._state = VersionedStateFile(
+            path if path is not None else default_state_path(),
+            version=STATE_FORMAT_VERSION,
+            field="entries",
+        )
+        self.ttl_seconds = ttl_seconds
+
+    @property
+    def path(self) -> Path:
+        """Return the location of the state file."""
+        return self._state.path
+
+    @property
+    def enabled(self) -> bool:
+        """Return True when entries are read and written."""
+        return self.ttl_seconds > 0
+
+    def load(self, key: str) -> dict[str, Any] | None:
+        """Return the unexpired entry stored under ``key``."""
+        if not self.enabled:
+            return None
+        entry = self._read().get(key)
+        if not isinstance(entry, dict):
+            return None
+        stored_at = entry.get("stored_at")
+        if not isinstance(stored_at, int | float):
+            return None
+        if time.time() - stored_at > self.ttl_seconds:
+            return None
+        return entry
+
+    def save(self, key: str, entry: dict[str, Any]) -> None:
+        """Store ``entry`` under ``key``, dropping expired entries."""
+        if not self.enabled:
+            return
+        entries = self._live_entries()
+        entries[key] = {**entry, "stored_at": time.time()}
+        self._write(entries)
+
+    def discard(self, key: str) -> None:
+        """Forget the entry stored under ``key``."""
+        if not self.enabled:
+            return
+        entries = self._live_entries()
+        if entries.pop(key, None) is not None:
+            self._write(entries)
+
+    def _live_entries(self) -> dict[str, Any]:
+        """Return the stored entries that have not expired."""
+        now = time.time()
+        return {
+            key: entry
+            for key, entry in self._read().items()
+            if isinstance(entry, dict)
+            and isinstance(entry.get("stored_at"), int | float)
+            and now - entry["stored_at"] <= self.ttl_seconds
+        }
+
+    def _read(self) -> dict[str, Any]:
+        """Load the stored entries."""
+        return self._state.read()
+
+    def _write(self, entries: dict[str, Any]) -> None:
+        """Write the entries; the state is only a cache, so failures are logged."""
+        try:
+            self._state.write(entries)
+        except OSError as error:
+            logger.debug("Could not write discovery state %s: %s", self.path, error)
+
+
+__all__ = [
+    "DiscoveryStateStore",
+    "default_state_path",
+    "discovery_key",
+]
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import math
 from collections.abc import Iterator
+from datetime import datetime, timezone
+from functools import partial
 from typing import Any
 
 from importobot.integrations.clients.base import BaseAPIClient, ProgressCallback
@@ -15,22 +18,50 @@ class JiraXrayClient(BaseAPIClient):
     _page_size = 200
 
     def fetch_all(self, progress_cb: ProgressCallback) -> Iterator[dict[str, Any]]:
-        """Retrieve all issues from the Jira/Xray API, handling pagination."""
-        start_at = 0
-        total: int | None = None
-        while True:
-            params: dict[str, Any] = {
-                "startAt": start_at,
-                "maxResults": self._page_size,
-            }
-            project_ref = self._project_value()
-            if project_ref is not None:
-                params["jql"] = f"project={project_ref}"
-
-            response = self._request(
-                "GET", self.api_url, params=params, headers=self._auth_headers()
+        """Retrieve all issues from the Jira/Xray API, handling pagination.
+
+        The first response carries ``total``; with ``max_concurrency`` above
+        one the remaining pages are then requested concurrently and yielded
+        in page order. The JQL, including its relative update window, is
+        built once so every page runs the same query.
+        """
+        jql = self._jql()
+        payload = self._fetch_page(0, jql=jql)
+        issues = payload.get("issues", [])
+        total = payload.get("total")
+        progress_cb(items=len(issues), total=total, page=1)
+        yield payload
+
+        start_at = payload.get("startAt", 0) + len(issues)
+        if not issues or (total is not None and start_at >= total):
+            return
+        if self._prefetch_workers() > 1 and isinstance(total, int):
+            # Step by the page size the server actually honoured
+            offsets = range(start_at, total, len(issues))
+            pages = self._fetch_pages_in_order(
+                partial(self._fetch_page, jql=jql), offsets
             )
-            payload = response.json()
+            for page, payload in enumerate(pages, start=2):
+                progress_cb(
+                    items=len(payload.get("issues", [])),
+                    total=payload.get("total", total),
+                    page=page,
+                )
+                yield payload
+            return
+        yield from self._fetch_sequentially(start_at, total, progress_cb, jql=jql)
+
+    def _fetch_sequentially(
+        self,
+        start_at: int,
+        total: int | None,
+        progress_cb: ProgressCallback,
+        *,
+        jql: str,
+    ) -> Iterator[dict[str, Any]]:
+        """Request the pages from ``start_at`` one after another."""
+        while True:
+            payload = self._fetch_page(start_at, jql=jql)
             issues = payload.get("issues", [])
             total = payload.get("total", total)
             progress_cb(
@@ -46,5 +77,36 @@ class JiraXrayClient(BaseAPIClient):
             if not issues:
                 break
 
+    def _fetch_page(self, start_at: int, *, jql: str) -> dict[str, Any]:
+        """Request the page of issues beginning at ``start_at``."""
+        params: dict[str, Any] = {
+            "startAt": start_at,
+            "maxResults": self._page_size,
+        }
+        if jql:
+            params["jql"] = jql
+
+        response = self._request(
+            "GET", self.api_url, params=params, headers=self._auth_headers()
+        )
+        payload: dict[str, Any] = response.json()
+        return payload
+
+    def _jql(self) -> str:
+        """Build the JQL restricting the search to the project and updated_since.
+
+        The update filter uses a relative duration: absolute JQL dates are
+        read in the Jira user's timezone, which the client does not know.
+        """
+        clauses: list[str] = []
+        project_ref = self._project_value()
+        if project_ref is not None:
+            clauses.append(f"project={project_ref}")
+        if self.updated_since is not None:
+            elapsed = datetime.now(timezone.utc) - self.updated_since
+            minutes = max(math.ceil(elapsed.total_seconds() / 60), 1)
+            clauses.append(f'updated >= "-{minutes}m"')
+        return " AND ".join(clauses)
+
 
 __all__ = ["JiraXrayClient"]
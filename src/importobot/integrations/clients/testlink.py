@@ -12,9 +12,16 @@ class TestLinkClient(BaseAPIClient):
     """Client for interacting with the TestLink XML-RPC JSON bridge endpoint."""
 
     __test__ = False
+    supports_updated_since = False
 
     def fetch_all(self, progress_cb: ProgressCallback) -> Iterator[dict[str, Any]]:
-        """Retrieve all test suites from the TestLink API, handling pagination."""
+        """Retrieve all test suites from the TestLink API, handling pagination.
+
+        Pages are chained through the opaque ``next`` cursor, so unlike Jira
+        they cannot be requested ahead of time and are fetched one by one.
+        The bridge has no update filter, so ``updated_since`` is ignored and
+        incremental syncs re-fetch every suite.
+        """
         next_cursor: str | None = None
         page = 1
         while True:
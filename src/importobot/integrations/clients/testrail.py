@@ -40,6 +40,8 @@ class TestRailClient(BaseAPIClient):
         page = 1
         while True:
             params = {"offset": offset}
+            if self.updated_since is not None:
+                params["updated_after"] = int(self.updated_since.timestamp())
             response = self._request(
                 "GET", self.api_url, params=params, headers=self._auth_headers()
             )
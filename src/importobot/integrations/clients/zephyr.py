@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import base64
 from collections.abc import Iterator
+from datetime import timezone
 from enum import Enum
 from http import HTTPStatus
 from typing import Any, ClassVar
@@ -14,6 +15,10 @@ from importobot.integrations.clients.base import (
     ProgressCallback,
     _KeyBatch,
 )
+from importobot.integrations.clients.discovery_state import (
+    DiscoveryStateStore,
+    discovery_key,
+)
 from importobot.utils.logging import get_logger
 
 logger = get_logger()
@@ -24,7 +29,9 @@ class ZephyrClient(BaseAPIClient):
     Manage interactions with the Zephyr API to retrieve test cases.
 
     This client will automatically discover and adapt to different Zephyr API patterns,
-    authentication methods, and pagination strategies.
+    authentication methods, and pagination strategies. The discovered
+    configuration is remembered in a :class:`DiscoveryStateStore` and tried
+    first on the next run against the same tenant, project and credentials.
     """
 
     __test__ = False
@@ -98,7 +105,11 @@ class ZephyrClient(BaseAPIClient):
     def __init__(self, **kwargs: Any) -> None:
         """Initialize ZephyrClient with API connection parameters."""
         verify_ssl = kwargs.pop("verify_ssl", True)
+        discovery_state: DiscoveryStateStore | None = kwargs.pop(
+            "discovery_state", None
+        )
         super().__init__(verify_ssl=verify_ssl, **kwargs)
+        self._discovery_state = discovery_state or DiscoveryStateStore()
         self._discovered_pattern: dict[str, Any] | None = None
         self._working_auth_strategy: dict[str, Any] | None = None
         self._effective_page_size: int = self.DEFAULT_PAGE_SIZES[0]
@@ -270,12 +281,17 @@ class ZephyrClient(BaseAPIClient):
     def _discover_working_configuration(self) -> bool:
         """Discover working API pattern and authentication strategy.
 
-        Try different combinations iteratively until a successful one is found.
+        A configuration remembered from an earlier run is verified with one
+        probe first; otherwise try different combinations iteratively until a
+        successful one is found.
         """
         if self._discovered_pattern and self._working_auth_strategy:
             return True
 
         project_ref = self._project_value()
+        state_key = discovery_key(self.api_url, project_ref, self.tokens, self.user)
+        if self._restore_configuration(state_key, project_ref):
+            return True
 
         for pattern in self._candidate_patterns(project_ref):
             discovery = self._try_pattern(pattern, project_ref)
@@ -284,6 +300,14 @@ class ZephyrClient(BaseAPIClient):
                 self._discovered_pattern = pattern
                 self._working_auth_strategy = auth_strategy
                 self._detect_optimal_page_size(pattern, auth_strategy, project_ref)
+                self._discovery_state.save(
+                    state_key,
+                    {
+                        "pattern": pattern["name"],
+                        "auth": auth_strategy["type"].value,
+                        "page_size": self._effective_page_size,
+                    },
+                )
 
                 logger.info(
                     (
@@ -299,6 +323,48 @@ class ZephyrClient(BaseAPIClient):
         logger.error("Failed to discover working Zephyr API configuration")
         return False
 
+    def _restore_configuration(
+        self, state_key: str, project_ref: str | int | None
+    ) -> bool:
+        """Reuse the remembered configuration if a single probe confirms it."""
+        entry = self._discovery_state.load(state_key)
+        if entry is None:
+            return False
+        pattern = next(
+            (p for p in self.API_PATTERNS if p["name"] == entry.get("pattern")), None
+        )
+        auth_strategy = next(
+            (a for a in self.AUTH_STRATEGIES if a["type"].value == entry.get("auth")),
+            None,
+        )
+        page_size = entry.get("page_size")
+        if (
+            pattern is None
+            or auth_strategy is None
+            or page_size not in self.DEFAULT_PAGE_SIZES
+            or (pattern["requires_keys_stage"] and not project_ref)
+            or not self._test_api_connection(
+                pattern,
+                auth_strategy,
+                project_ref,
+                fields="key" if pattern["supports_field_selection"] else None,
+            )
+        ):
+            logger.debug("Remembered Zephyr configuration is stale; rediscovering")
+            self._discovery_state.discard(state_key)
+            return False
+
+        self._discovered_pattern = pattern
+        self._working_auth_strategy = auth_strategy
+        self._effective_page_size = page_size
+        logger.info(
+            "Reusing Zephyr configuration: API pattern=%s, Auth=%s, Page size=%d",
+            pattern["name"],
+            str(auth_strategy["type"]),
+            page_size,
+        )
+        return True
+
     def _candidate_patterns(
         self, project_ref: str | int | None
     ) -> Iterator[dict[str, Any]]:
@@ -558,10 +624,13 @@ class ZephyrClient(BaseAPIClient):
                 params["fields"] = "key,name,status,testScript,customFields"
 
             project_ref = self._project_value()
-            if project_ref:
-                params["query"] = f'testCase.projectKey IN ("{project_ref}")'
-                if self._pattern_uses_project_param(self._discovered_pattern):
-                    params.setdefault("projectKey", str(project_ref))
+            query = self._search_query(project_ref)
+            if query:
+                params["query"] = query
+            if project_ref and self._pattern_uses_project_param(
+                self._discovered_pattern
+            ):
+                params.setdefault("projectKey", str(project_ref))
 
             headers = self._build_auth_headers(self._working_auth_strategy)
             search_url = self._build_pattern_url(
@@ -597,6 +666,16 @@ class ZephyrClient(BaseAPIClient):
                 logger.error("Failed to fetch page %d: %s", page, e)
                 break
 
+    def _search_query(self, project_ref: str | int | None) -> str:
+        """Build the test case query for the project and ``updated_since``."""
+        clauses: list[str] = []
+        if project_ref:
+            clauses.append(f'testCase.projectKey IN ("{project_ref}")')
+        if self.updated_since is not None:
+            since = self.updated_since.astimezone(timezone.utc)
+            clauses.append(f'testCase.updatedOn >= "{since:%Y-%m-%dT%H:%M:%SZ}"')
+        return " AND ".join(clauses)
+
     def _fetch_all_keys(self, progress_cb: ProgressCallback) -> Iterator[_KeyBatch]:
         """Yield key batches for two-stage approach without buffering all keys."""
         if not self._discovered_pattern:
@@ -606,7 +685,7 @@ class ZephyrClient(BaseAPIClient):
 
         while True:
             params = {
-                "query": f'testCase.projectKey IN ("{self._project_value()}")',
+                "query": self._search_query(self._project_value()),
                 "maxResults": self._effective_page_size,
                 "fields": "key",
                 "startAt": offset,
@@ -0,0 +1,226 @@
+"""Pipelined API ingestion: convert fetched pages while later pages download.
+
+The default ``--fetch-format`` flow writes the whole payload to disk and then
+reads it back for conversion, so network I/O and conversion run one after
+the other and the full dataset is held in memory. ``fetch_and_convert`` runs
+the client's ``fetch_all`` on a producer thread that feeds a bounded queue.
+The calling thread takes pages off the queue and converts them, inline or in
+a process pool, writing one ``.robot`` file per page as it arrives. At most
+``queue_pages`` fetched pages plus two per conversion worker are held at a
+time. The raw payload can still be archived, streamed page by page to a JSON
+list.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import IO, Any
+
+from importobot.config import API_PIPELINE_QUEUE_PAGES
+from importobot.core.converter import JsonToRobotConverter, save_robot_file
+from importobot.integrations.clients.base import APISource, ProgressCallback
+from importobot.integrations.incremental import payload_items
+from importobot.utils.logging import get_logger
+
+logger = get_logger()
+
+_END_OF_PAGES = object()
+_PUT_TIMEOUT_SECONDS = 0.1
+
+
+@dataclass(slots=True)
+class PipelineResult:
+    """Outcome of one pipelined fetch and conversion."""
+
+    pages: int = 0
+    items: int = 0
+    skipped_pages: int = 0
+    robot_files: list[Path] = field(default_factory=list)
+    archive_path: Path | None = None
+
+
+@lru_cache(maxsize=1)
+def _page_converter() -> JsonToRobotConverter:
+    """Return the converter reused for every page in this process."""
+    return JsonToRobotConverter()
+
+
+def convert_page(page: dict[str, Any], output_path: str) -> str:
+    """Convert one payload page and write it to ``output_path``."""
+    save_robot_file(_page_converter().convert_json_data(page), output_path)
+    return output_path
+
+
+class _PayloadArchive:
+    """Stream payload pages into a JSON list without holding them in memory."""
+
+    def __init__(self, handle: IO[str]) -> None:
+        self._handle = handle
+        self._pages = 0
+        handle.write("[")
+
+    def write(self, page: Any) -> None:
+        """Append one page."""
+        self._handle.write(",\n" if self._pages else "\n")
+        json.dump(page, self._handle, indent=2)
+        self._pages += 1
+
+    def close(self) -> None:
+        """Terminate the list."""
+        self._handle.write("\n]\n")
+
+
+def _produce(
+    client: APISource,
+    progress_cb: ProgressCallback,
+    pages: queue.Queue[Any],
+    stop: threading.Event,
+) -> None:
+    """Put every fetched page on ``pages``, then an end marker or the error."""
+    outcome: object = _END_OF_PAGES
+    fetched: Any = None
+    try:
+        fetched = client.fetch_all(progress_cb)
+        for page in fetched:
+            if not _put(pages, page, stop):
+                return
+    except Exception as error:
+        outcome = error
+    finally:
+        close = getattr(fetched, "close", None)
+        if close is not None:
+            close()
+    _put(pages, outcome, stop)
+
+
+def _put(pages: queue.Queue[Any], item: Any, stop: threading.Event) -> bool:
+    """Block until ``item`` is queued; return False if the consumer stopped."""
+    while not stop.is_set():
+        try:
+            pages.put(item, timeout=_PUT_TIMEOUT_SECONDS)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _consume(pages: queue.Queue[Any]) -> Iterator[dict[str, Any]]:
+    """Yield queued pages until the end marker, re-raising producer errors."""
+    while True:
+        page = pages.get()
+        if page is _END_OF_PAGES:
+            return
+        if isinstance(page, Exception):
+            raise page
+        yield page
+
+
+def fetch_and_convert(
+    client: APISource,
+    output_dir: Path,
+    *,
+    basename: str,
+    progress_cb: ProgressCallback,
+    workers: int = 1,
+    queue_pages: int = API_PIPELINE_QUEUE_PAGES,
+    archive_path: Path | None = None,
+) -> PipelineResult:
+    """Fetch pages from ``client`` and convert each into ``output_dir``.
+
+    Page ``n`` is written to ``{basename}-page-{n:04d}.robot``. Pages without
+    test items are archived but not converted; a page holding data in a
+    shape :func:`~importobot.integrations.incremental.payload_items` cannot
+    read raises ``ParseError`` rather than being skipped. The first fetch,
+    parse or conversion error stops the pipeline and is raised.
+    """
+    if workers < 1 or queue_pages < 1:
+        raise ValueError("workers and queue_pages must be at least 1")
+    output_dir.mkdir(parents=True, exist_ok=True)
+    result = PipelineResult(archive_path=archive_path)
+    pages: queue.Queue[Any] = queue.Queue(maxsize=queue_pages)
+    stop = threading.Event()
+    producer = threading.Thread(
+        target=_produce,
+        args=(client, progress_cb, pages, stop),
+        name="importobot-fetch",
+        daemon=True,
+    )
+    producer.start()
+    try:
+        with ExitStack() as stack:
+            archive = None
+            if archive_path is not None:
+                archive_path.parent.mkdir(parents=True, exist_ok=True)
+                handle = stack.enter_context(open(archive_path, "w", encoding="utf-8"))
+                archive = _PayloadArchive(handle)
+            tasks = _conversion_tasks(
+                _consume(pages), output_dir, basename, result, archive
+            )
+            result.robot_files.extend(_convert_pages(tasks, workers))
+            if archive is not None:
+                archive.close()
+    finally:
+        stop.set()
+        producer.join()
+    return result
+
+
+def _convert_pages(
+    tasks: Iterator[tuple[dict[str, Any], str]], workers: int
+) -> Iterator[Path]:
+    """Convert ``tasks`` inline or in a process pool, yielding written files."""
+    if workers == 1:
+        for page, output_path in tasks:
+            yield Path(convert_page(page, output_path))
+        return
+
+    pending: deque[Future[str]] = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            for page, output_path in tasks:
+                pending.append(executor.submit(convert_page, page, output_path))
+                if len(pending) >= 2 * workers:
+                    yield Path(pending.popleft().result())
+            while pending:
+                yield Path(pending.popleft().result())
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _conversion_tasks(
+    pages: Iterator[dict[str, Any]],
+    output_dir: Path,
+    basename: str,
+    result: PipelineResult,
+    archive: _PayloadArchive | None,
+) -> Iterator[tuple[dict[str, Any], str]]:
+    """Archive and count each page, yielding the items of each to convert.
+
+    Vendor envelopes differ (``issues``, ``results``, ``cases``...), so the
+    items are handed to the converter as a ``testCases`` list.
+    """
+    for page in pages:
+        result.pages += 1
+        if archive is not None:
+            archive.write(page)
+        _, items = payload_items(page)
+        if not items:
+            result.skipped_pages += 1
+            logger.debug("Page %d holds no test items; not converting", result.pages)
+            continue
+        result.items += len(items)
+        output_path = output_dir / f"{basename}-page-{result.pages:04d}.robot"
+        yield {"testCases": items}, str(output_path)
+
+
+__all__ = ["PipelineResult", "convert_page", "fetch_and_convert"]
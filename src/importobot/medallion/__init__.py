@@ -5,13 +5,17 @@ own ingestion pipelines. They are intentionally **not** part of the public API
 surface and may change without notice.
 """
 
-from typing import NoReturn
+from types import ModuleType
+
+from importobot.utils.lazy_loader import import_internal_submodule
 
 __all__: list[str] = []
 
 
-def __getattr__(name: str) -> NoReturn:
+def __getattr__(name: str) -> ModuleType:
     """Guard against accidental use of medallion layers from the public API."""
-    raise ModuleNotFoundError(
-        "importobot.medallion is internal and not covered by the stability guarantee."
+    return import_internal_submodule(
+        __name__,
+        name,
+        "importobot.medallion is internal and not covered by the stability guarantee.",
     )
@@ -9,6 +9,7 @@ from importlib import import_module
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+from importobot.medallion.canonical_payload import CanonicalPayload
 from importobot.medallion.interfaces.base_interfaces import DataLayer
 from importobot.medallion.interfaces.data_models import (
     DataQualityMetrics,
@@ -78,6 +79,10 @@ class BaseMedallionLayer(DataLayer):
 
         return json.dumps(data, sort_keys=True, default=_default)
 
+    def _canonical_payload(self, data: Any) -> CanonicalPayload:
+        """Serialize ``data`` once for hashing, format detection and storage."""
+        return CanonicalPayload(data, self._serialize_data(data))
+
     def _generate_data_id(
         self,
         data: Any,
@@ -101,13 +106,19 @@ class BaseMedallionLayer(DataLayer):
         # Use Blake2b for faster data integrity hashing
         return hashlib.blake2b(content_str.encode()).hexdigest()
 
-    def _detect_format_type(self, data: dict[str, Any]) -> SupportedFormat:
-        """Detect the test format type from data structure."""
+    def _detect_format_type(
+        self, data: dict[str, Any], payload: CanonicalPayload | None = None
+    ) -> SupportedFormat:
+        """Detect the test format type from data structure.
+
+        ``payload`` is the canonical serialization of ``data``; when given, the
+        detector reuses it instead of serializing ``data`` again.
+        """
         if not isinstance(data, dict):
             return SupportedFormat.UNKNOWN
 
         detector = self._get_format_detector()
-        return detector.detect_format(data)
+        return detector.detect_format(payload if payload is not None else data)
 
     def _get_format_detector(self) -> FormatDetector:
         if self._format_detector is None:
@@ -7,9 +7,34 @@ The Bronze layer is the first layer in the Medallion architecture, responsible f
 - Immutable storage with versioning
 """
 
-from importobot.medallion.bronze.format_detector import FormatDetector
-from importobot.medallion.bronze.raw_data_processor import RawDataProcessor
-from importobot.medallion.bronze.validation import BronzeValidator
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from importobot.medallion.bronze.format_detector import FormatDetector
+    from importobot.medallion.bronze.raw_data_processor import RawDataProcessor
+    from importobot.medallion.bronze.validation import BronzeValidator
+
+# Submodules such as ``evidence_accumulator`` are imported by the keyword
+# pattern matcher; resolving these exports lazily keeps that import from
+# pulling in the whole ingestion stack.
+_LAZY_ATTRIBUTES = {
+    "BronzeValidator": "importobot.medallion.bronze.validation",
+    "FormatDetector": "importobot.medallion.bronze.format_detector",
+    "RawDataProcessor": "importobot.medallion.bronze.raw_data_processor",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import the layer's public classes on first access (PEP 562)."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "BronzeValidator",
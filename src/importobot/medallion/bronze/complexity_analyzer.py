@@ -4,6 +4,14 @@ from __future__ import annotations
 
 from typing import Any
 
+from .structure_profile import (
+    STOP_DEPTH,
+    STOP_KEYS,
+    STOP_SIZE,
+    StructureProfile,
+    profile_structure,
+)
+
 
 class ComplexityAnalyzer:
     """Analyzes data complexity to optimize detection algorithms."""
@@ -11,74 +19,71 @@ class ComplexityAnalyzer:
     # Complexity thresholds and limits
     MAX_DATA_SIZE_CHARS = 50000  # Maximum data size in characters
     MAX_NESTING_DEPTH = 25  # Maximum nesting depth for data structures
-    MAX_KEY_COUNT = 2000  # Maximum estimated key count
+    MAX_KEY_COUNT = 2000  # Maximum dict key count
     MIN_UNIQUENESS_RATIO = 0.1  # Minimum uniqueness ratio for large data
     LARGE_DATA_THRESHOLD = 10000  # Threshold for considering data "large"
-    SAMPLE_SIZE_FOR_DEPTH_CHECK = 5000  # Characters to sample for depth analysis
     MAX_RECURSION_DEPTH = 10  # Maximum recursion depth for text counting
     DEFAULT_MAX_NESTING_DEPTH = 100  # Default max depth for nesting calculation
 
     @classmethod
-    def assess_data_complexity(cls, data: dict[str, Any]) -> dict[str, Any]:
+    def profile_data(cls, data: Any) -> StructureProfile:
+        """Walk ``data`` until it exceeds one of the complexity limits."""
+        return profile_structure(
+            data,
+            max_size=cls.MAX_DATA_SIZE_CHARS,
+            max_depth=cls.MAX_NESTING_DEPTH,
+            max_keys=cls.MAX_KEY_COUNT,
+        )
+
+    @classmethod
+    def assess_data_complexity(
+        cls, data: dict[str, Any], profile: StructureProfile | None = None
+    ) -> dict[str, Any]:
         """Assess data complexity and provide detailed reasoning.
 
-        This method evaluates data complexity for algorithm selection.
+        This method evaluates data complexity for algorithm selection. The
+        payload is walked structurally and the walk stops at the first limit
+        it exceeds, so large payloads are never rendered as a whole. Callers
+        that already profiled ``data`` with :meth:`profile_data` may pass the
+        profile to avoid a second walk.
         """
         try:
-            # Quick heuristics to identify complex data with detailed reasons
-            data_str = str(data)
-            data_size = len(data_str)
+            if profile is None:
+                profile = cls.profile_data(data)
 
-            if data_size > cls.MAX_DATA_SIZE_CHARS:  # Very large data
+            if profile.stopped_by == STOP_SIZE:  # Very large data
                 return {
                     "too_complex": True,
                     "reason": (
-                        f"Data size ({data_size:,} chars) exceeds limit "
-                        f"({cls.MAX_DATA_SIZE_CHARS:,} chars)"
+                        f"Data size (>{cls.MAX_DATA_SIZE_CHARS:,} chars) exceeds "
+                        f"limit ({cls.MAX_DATA_SIZE_CHARS:,} chars)"
                     ),
                     "recommendation": "Consider breaking data into smaller chunks",
                 }
 
-            # Count nesting levels quickly (limit check to prevent hangs)
-            max_depth = 0
-            current_depth = 0
-            # Only check first N chars to prevent hangs
-            for char in data_str[: cls.SAMPLE_SIZE_FOR_DEPTH_CHECK]:
-                if char in "{[":
-                    current_depth += 1
-                    max_depth = max(max_depth, current_depth)
-                elif char in "}]":
-                    current_depth -= 1
-                if max_depth > cls.MAX_NESTING_DEPTH:  # Very deep nesting
-                    return {
-                        "too_complex": True,
-                        "reason": (
-                            f"Nesting depth ({max_depth}) exceeds limit "
-                            f"({cls.MAX_NESTING_DEPTH} levels)"
-                        ),
-                        "recommendation": (
-                            "Flatten data structure for better performance"
-                        ),
-                    }
-
-            # Count total keys (approximate)
-            key_count = data_str.count('"') // 2  # Rough estimate
-            if key_count > cls.MAX_KEY_COUNT:  # Too many keys
+            if profile.stopped_by == STOP_DEPTH:  # Very deep nesting
+                return {
+                    "too_complex": True,
+                    "reason": (
+                        f"Nesting depth ({profile.nesting_depth}) exceeds limit "
+                        f"({cls.MAX_NESTING_DEPTH} levels)"
+                    ),
+                    "recommendation": "Flatten data structure for better performance",
+                }
+
+            if profile.stopped_by == STOP_KEYS:  # Too many keys
                 return {
                     "too_complex": True,
                     "reason": (
-                        f"Estimated key count (~{key_count}) exceeds limit "
+                        f"Key count (>{cls.MAX_KEY_COUNT:,}) exceeds limit "
                         f"({cls.MAX_KEY_COUNT:,} keys)"
                     ),
                     "recommendation": "Reduce data complexity or use batch processing",
                 }
 
-            # Check for potential circular references or repetitive patterns
-            unique_content_ratio = len(set(data_str.split())) / max(
-                1, len(data_str.split())
-            )
             # Check for very repetitive data patterns
-            is_large = len(data_str) > cls.LARGE_DATA_THRESHOLD
+            unique_content_ratio = profile.uniqueness_ratio
+            is_large = profile.size > cls.LARGE_DATA_THRESHOLD
             is_repetitive = unique_content_ratio < cls.MIN_UNIQUENESS_RATIO
             if is_large and is_repetitive:
                 return {
@@ -96,9 +101,9 @@ class ComplexityAnalyzer:
                 "too_complex": False,
                 "reason": "Data complexity within acceptable limits",
                 "stats": {
-                    "size": data_size,
-                    "max_depth": max_depth,
-                    "estimated_keys": key_count,
+                    "size": profile.size,
+                    "max_depth": profile.nesting_depth,
+                    "estimated_keys": profile.key_count,
                     "uniqueness_ratio": unique_content_ratio,
                 },
             }
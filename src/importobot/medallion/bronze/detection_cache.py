@@ -21,6 +21,7 @@ from importobot.config import (
     DETECTION_CACHE_TTL_SECONDS as CONFIG_TTL_SECONDS,
 )
 from importobot.config import MAX_CACHE_CONTENT_SIZE_BYTES
+from importobot.medallion.canonical_payload import CanonicalPayload
 from importobot.medallion.interfaces.enums import SupportedFormat
 from importobot.telemetry import TelemetryClient, get_telemetry_client
 from importobot.utils.logging import get_logger
@@ -130,9 +131,7 @@ class DetectionCache:
             )
             return data_str  # Don't cache, return directly
 
-        # Generate secondary hash for collision detection
-        secondary_hash = self._get_secondary_hash(data_str)
-        cache_key = f"{content_hash}_{secondary_hash[:8]}"  # Combined key
+        cache_key = self._cache_key(data, content_hash, data_str)
 
         if cache_key in self._data_string_cache:
             if self._is_expired(self._data_string_expiry.get(cache_key)):
@@ -183,9 +182,14 @@ class DetectionCache:
     def _get_content_hash_and_string(self, data: Any) -> tuple[str, str]:
         """Generate collision-resistant content hash and normalized string.
 
+        Canonical payloads already carry both, so they are not serialized again.
+
         Returns:
             Tuple of (content_hash, data_string) for caching and verification
         """
+        if isinstance(data, CanonicalPayload):
+            return data.digest, data.lowered
+
         # Convert to JSON string for consistent formatting
         try:
             normalized_str = json.dumps(
@@ -203,6 +207,15 @@ class DetectionCache:
 
         return content_hash, normalized_str
 
+    def _cache_key(self, data: Any, content_hash: str, data_str: str) -> str:
+        """Combine the content hash with a secondary hash into a cache key."""
+        if isinstance(data, CanonicalPayload):
+            # The full-length payload digest needs no secondary hash; keep the
+            # key distinct from keys derived from the lowercased rendering.
+            return f"{content_hash}_payload"
+        secondary_hash = self._get_secondary_hash(data_str)
+        return f"{content_hash}_{secondary_hash[:8]}"
+
     def _get_secondary_hash(self, data_str: str) -> str:
         """Generate secondary hash for collision detection optimization."""
         # Use different algorithm for secondary hash to minimize correlation
@@ -272,8 +285,7 @@ class DetectionCache:
                 )
                 return  # Don't cache
 
-            secondary_hash = self._get_secondary_hash(data_str)
-            cache_key = f"{content_hash}_{secondary_hash[:8]}"
+            cache_key = self._cache_key(data, content_hash, data_str)
 
             # Cache with optimized key (no data duplication)
             self._detection_result_cache[cache_key] = result
@@ -305,8 +317,7 @@ class DetectionCache:
                 )
                 return None  # Don't lookup
 
-            secondary_hash = self._get_secondary_hash(data_str)
-            cache_key = f"{content_hash}_{secondary_hash[:8]}"
+            cache_key = self._cache_key(data, content_hash, data_str)
 
             if cache_key in self._detection_result_cache:
                 if self._is_expired(self._detection_result_expiry.get(cache_key)):
@@ -4,13 +4,16 @@ from __future__ import annotations
 
 import threading
 import time
+from collections.abc import Iterable
 from typing import Any
 
 from importobot.config import (
     FORMAT_DETECTION_CIRCUIT_RESET_SECONDS,
     FORMAT_DETECTION_FAILURE_THRESHOLD,
 )
+from importobot.medallion.canonical_payload import CanonicalPayload
 from importobot.medallion.interfaces.enums import SupportedFormat
+from importobot.telemetry import telemetry_span
 from importobot.utils.logging import get_logger
 
 from .complexity_analyzer import ComplexityAnalyzer
@@ -19,8 +22,11 @@ from .detection_metrics import PerformanceMonitor
 from .evidence_accumulator import EvidenceAccumulator
 from .evidence_collector import EvidenceCollector
 from .format_registry import FormatRegistry
-from .hierarchical_classifier import HierarchicalClassifier
-from .scoring_algorithms import ScoringAlgorithms, ScoringConstants
+from .hierarchical_classifier import (
+    HierarchicalClassificationResult,
+    HierarchicalClassifier,
+)
+from .scoring_algorithms import FormatScoreIndex, ScoringConstants
 from .shared_config import PRIORITY_MULTIPLIERS
 
 logger = get_logger()
@@ -46,20 +52,133 @@ class FormatDetector:
         self._consecutive_failures = 0
         self._circuit_open_until = 0.0
         self._stage1_warning_emitted = False
+        self._score_index: FormatScoreIndex[SupportedFormat] | None = None
 
         logger.debug(
             "Initialized modular FormatDetector with %d formats",
             len(self.format_registry.get_all_formats()),
         )
 
-    def detect_format(self, data: dict[str, Any]) -> SupportedFormat:
-        """Detect the format type of the provided test data."""
+    def detect_format(self, data: dict[str, Any] | CanonicalPayload) -> SupportedFormat:
+        """Detect the format type of the provided test data.
+
+        ``data`` may be a ``CanonicalPayload``; its serialization then keys the
+        detection cache and feeds indicator scoring without rendering the data
+        again.
+        """
+        with telemetry_span("format.detect"):
+            return self._detect_format(_payload_data(data), data)
+
+    def detect_formats(
+        self, payloads: Iterable[Any], *, engine: str = "auto"
+    ) -> list[SupportedFormat]:
+        """Detect the format of many payloads in one pass.
+
+        Each payload goes through the same cache, complexity gate and fast path
+        as :meth:`detect_format`; the payloads that need the full hierarchical
+        classification are then scored together. ``engine`` selects how the
+        Bayesian likelihoods are computed: ``"python"`` matches
+        :meth:`detect_format` exactly, ``"numpy"`` vectorises the scoring and
+        ``"auto"`` uses NumPy for large batches when it is installed.
+        Items may be ``CanonicalPayload`` objects, as for :meth:`detect_format`.
+        Per-payload performance records are not emitted for batches.
+        """
+        with telemetry_span("format.detect_batch"):
+            return self._detect_formats(list(payloads), engine)
+
+    def _detect_formats(
+        self, payloads: list[Any], engine: str
+    ) -> list[SupportedFormat]:
+        """Run the batch detection pipeline for ``payloads``."""
+        start_time = time.perf_counter()
+        if self._is_circuit_open():
+            logger.error("Format detection circuit breaker is open; returning UNKNOWN.")
+            return [SupportedFormat.UNKNOWN] * len(payloads)
+
+        results: list[SupportedFormat] = []
+        pending: list[int] = []
+        for source in payloads:
+            try:
+                result = self._detect_without_classifier(source)
+            except Exception:  # pragma: no cover - defensive circuit breaker guard
+                logger.exception("Format detection pipeline failed unexpectedly.")
+                self._note_detection_failure()
+                result = SupportedFormat.UNKNOWN
+            if result is None:
+                pending.append(len(results))
+                result = SupportedFormat.UNKNOWN
+            results.append(result)
+
+        if not pending or self._classify_pending(payloads, pending, results, engine):
+            self._reset_circuit_after_success()
+        self.detection_cache.enforce_min_detection_time(start_time, payloads)
+        return results
+
+    def _classify_pending(
+        self,
+        payloads: list[Any],
+        pending: list[int],
+        results: list[SupportedFormat],
+        engine: str,
+    ) -> bool:
+        """Classify the ``pending`` payloads together and store their formats.
+
+        Returns False when classification failed and the payloads stay UNKNOWN.
+        """
+        try:
+            classified = self.hierarchical_classifier.classify_batch(
+                [_payload_data(payloads[index]) for index in pending], engine=engine
+            )
+        except (ImportError, ValueError):
+            raise
+        except Exception:  # pragma: no cover - defensive circuit breaker guard
+            logger.exception("Format detection pipeline failed unexpectedly.")
+            self._note_detection_failure()
+            return False
+        for index, classification in zip(pending, classified, strict=True):
+            results[index] = self._select_format(classification)
+            self.detection_cache.cache_detection_result(payloads[index], results[index])
+        return True
+
+    def _detect_without_classifier(self, source: Any) -> SupportedFormat | None:
+        """Resolve ``source`` without the classifier, or return None if needed.
+
+        Covers the cache, invalid payloads, the complexity gate and the strong
+        indicator fast path, in the order :meth:`_detect_format` applies them.
+        """
+        data = _payload_data(source)
+        cached_result = self.detection_cache.get_cached_detection_result(source)
+        if cached_result is not None:
+            return cached_result
+        if not isinstance(data, dict) or not data:
+            if not isinstance(data, dict):
+                logger.warning("Data is not a dictionary, cannot detect format")
+            return SupportedFormat.UNKNOWN
+
+        complexity_info = ComplexityAnalyzer.assess_data_complexity(data)
+        if complexity_info["too_complex"]:
+            result = self._quick_format_detection(data, source)
+        else:
+            result = self._fast_path_if_strong_indicators(data)
+            if result == SupportedFormat.UNKNOWN:
+                return None
+        self.detection_cache.cache_detection_result(source, result)
+        return result
+
+    def _detect_format(self, data: dict[str, Any], source: Any) -> SupportedFormat:
+        """Run cached, fast-path and full detection for ``data``.
+
+        ``source`` is what the detection cache is keyed by: ``data`` itself or
+        its canonical payload.
+        """
         start_time = time.perf_counter()
         result = SupportedFormat.UNKNOWN
-        data_size_estimate = len(str(data)) if data else 0
+        # One bounded walk feeds both the size estimate and the complexity gate
+        profile = ComplexityAnalyzer.profile_data(data) if data else None
+        data_size_estimate = profile.size if profile is not None else 0
 
         with PerformanceMonitor(data_size_estimate) as monitor:
-            cached_result = self.detection_cache.get_cached_detection_result(data)
+            cached_result = self.detection_cache.get_cached_detection_result(source)
             if cached_result is not None:
                 self._reset_circuit_after_success()
                 self.detection_cache.enforce_min_detection_time(start_time, data)
@@ -88,7 +207,9 @@ class FormatDetector:
                 return result
 
             try:
-                complexity_info = ComplexityAnalyzer.assess_data_complexity(data)
+                complexity_info = ComplexityAnalyzer.assess_data_complexity(
+                    data, profile=profile
+                )
                 if complexity_info["too_complex"]:
                     logger.warning(
                         "Data complexity exceeds algorithm limits: %s. "
@@ -96,8 +217,8 @@ class FormatDetector:
                         complexity_info["reason"],
                         complexity_info["recommendation"],
                     )
-                    result = self._quick_format_detection(data)
-                    self.detection_cache.cache_detection_result(data, result)
+                    result = self._quick_format_detection(data, source)
+                    self.detection_cache.cache_detection_result(source, result)
                     self.detection_cache.enforce_min_detection_time(start_time, data)
                     monitor.record_detection(
                         result,
@@ -115,7 +236,7 @@ class FormatDetector:
                     result = self._full_format_detection(data)
                     fast_path_used = False
 
-                self.detection_cache.cache_detection_result(data, result)
+                self.detection_cache.cache_detection_result(source, result)
                 self.detection_cache.enforce_min_detection_time(start_time, data)
 
                 monitor.record_detection(
@@ -133,7 +254,9 @@ class FormatDetector:
                 monitor.record_detection(SupportedFormat.UNKNOWN, 0.0)
                 return SupportedFormat.UNKNOWN
 
-    def _quick_format_detection(self, data: dict[str, Any]) -> SupportedFormat:
+    def _quick_format_detection(
+        self, data: dict[str, Any], source: Any = None
+    ) -> SupportedFormat:
         """Quickly compare format candidates using Bayesian relative scoring."""
         # First, check for strong format indicators (same as fast path)
         strong_indicators = {
@@ -152,15 +275,16 @@ class FormatDetector:
                 return format_type
 
         # Fall back to pattern-based scoring
-        data_str = self.detection_cache.get_data_string_efficient(data)
-        format_patterns = self.evidence_collector.get_all_patterns()
+        data_str = self.detection_cache.get_data_string_efficient(
+            data if source is None else source
+        )
+        scores = self._get_score_index().score_all(data_str, data)
 
         best_score = float("-inf")
         second_best_score = float("-inf")
         best_format = SupportedFormat.UNKNOWN
 
-        for format_type, patterns in format_patterns.items():
-            score = ScoringAlgorithms.calculate_format_score(data_str, patterns, data)
+        for format_type, score in scores.items():
             weighted_score = score * PRIORITY_MULTIPLIERS.get(format_type, 1.0)
 
             if weighted_score > best_score:
@@ -180,6 +304,15 @@ class FormatDetector:
             return best_format
         return SupportedFormat.UNKNOWN
 
+    def _get_score_index(self) -> FormatScoreIndex[SupportedFormat]:
+        """Return the indicator index, rebuilding it when patterns are refreshed."""
+        format_patterns = self.evidence_collector.get_all_patterns()
+        index = self._score_index
+        if index is None or index.format_patterns is not format_patterns:
+            index = FormatScoreIndex(format_patterns)
+            self._score_index = index
+        return index
+
     def _fast_path_if_strong_indicators(self, data: dict[str, Any]) -> SupportedFormat:
         """Check for strong format indicators for fast detection."""
         strong_indicators = {
@@ -202,8 +335,12 @@ class FormatDetector:
     def _full_format_detection(self, data: dict[str, Any]) -> SupportedFormat:
         """Full format detection algorithm using hierarchical classifier."""
         # Use hierarchical classifier for proper two-stage detection
-        result = self.hierarchical_classifier.classify(data)
+        return self._select_format(self.hierarchical_classifier.classify(data))
 
+    def _select_format(
+        self, result: HierarchicalClassificationResult
+    ) -> SupportedFormat:
+        """Map a hierarchical classification to the detected format."""
         # If Stage 1 failed (not test data), return UNKNOWN
         if not result.is_test_data:
             return SupportedFormat.UNKNOWN
@@ -349,4 +486,9 @@ class FormatDetector:
         }
 
 
+def _payload_data(source: Any) -> Any:
+    """Return the parsed data behind ``source``, unwrapping canonical payloads."""
+    return source.data if isinstance(source, CanonicalPayload) else source
+
+
 __all__ = ["FormatDetector", "FormatRegistry"]
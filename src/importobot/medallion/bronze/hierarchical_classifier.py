@@ -19,16 +19,19 @@ while maintaining discriminative power for distinguishing between actual test fo
 from __future__ import annotations
 
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass
-from typing import Any, ClassVar
+from typing import Any, ClassVar, NamedTuple
 
 from importobot.utils.logging import get_logger
 
 from ..interfaces.enums import EvidenceSource
 from .evidence_accumulator import EvidenceAccumulator, EvidenceItem
 from .evidence_collector import EvidenceCollector
+from .evidence_metrics import EvidenceMetrics
 from .format_models import EvidenceWeight
 from .format_registry import FormatRegistry
+from .structure_profile import profile_structure
 
 logger = get_logger()
 
@@ -61,6 +64,15 @@ class HierarchicalClassificationResult:
         return max(self.format_posteriors.values())
 
 
+class _Stage1Outcome(NamedTuple):
+    """Stage 1 verdict plus the Stage 2 fast-path format, if any."""
+
+    is_test_data: bool
+    test_confidence: float
+    test_evidence: dict[str, Any]
+    fast_format: str | None = None
+
+
 class HierarchicalClassifier:
     """Two-stage hierarchical Bayesian classifier for format detection.
 
@@ -84,6 +96,10 @@ class HierarchicalClassifier:
     MIN_DISCRIMINATIVE_RATIO = 2.0  # P(correct|E) / P(wrong|E) >= 2.0 for confidence
     FAST_PATH_UNIQUE_INDICATORS = 2  # Number of UNIQUE indicators for Stage 2 fast pass
 
+    # Structural quality: bounds for the depth walk over large payloads
+    DEPTH_SAMPLE_ITEMS = 32  # List items sampled per list when measuring depth
+    DEPTH_MAX_NODES = 5000  # Values visited before the depth walk stops
+
     # Format-specific unique field combinations (for Stage 2 fast path)
     FORMAT_UNIQUE_COMBINATIONS: ClassVar[dict[str, list[set[str]]]] = {
         "ZEPHYR": [{"testCase", "execution", "cycle"}],
@@ -150,76 +166,139 @@ class HierarchicalClassifier:
         Returns:
             HierarchicalClassificationResult with both stage results
         """
+        stage1 = self._run_stage1(data)
+        if not stage1.is_test_data:
+            return self._stage1_failed_result(stage1)
+        format_likelihoods, format_posteriors = self._stage2_discriminate_formats(data)
+        return self._stage2_result(stage1, format_likelihoods, format_posteriors)
+
+    def classify_batch(
+        self, payloads: Sequence[dict[str, Any]], *, engine: str = "auto"
+    ) -> list[HierarchicalClassificationResult]:
+        """Classify many payloads, scoring all Stage 2 likelihoods in one batch.
+
+        Evidence is collected per payload exactly as in :meth:`classify`; the
+        likelihoods of every (payload, format) pair are then computed by
+        ``IndependentBayesianScorer.calculate_likelihood_batch`` with the given
+        ``engine`` (``"auto"``, ``"numpy"`` or ``"python"``).
+        """
+        results: list[HierarchicalClassificationResult | None] = []
+        pending: list[tuple[int, _Stage1Outcome, dict[str, EvidenceMetrics | None]]]
+        pending = []
+        for data in payloads:
+            stage1 = self._run_stage1(data)
+            if stage1.is_test_data:
+                pending.append((len(results), stage1, self._stage2_metrics(data)))
+                results.append(None)
+            else:
+                results.append(self._stage1_failed_result(stage1))
+
+        scored = [
+            metrics
+            for _, _, format_metrics in pending
+            for metrics in format_metrics.values()
+            if metrics is not None
+        ]
+        bayesian_scorer = self.evidence_accumulator.bayesian_scorer
+        likelihoods = iter(
+            bayesian_scorer.calculate_likelihood_batch(scored, engine=engine)
+        )
+        for index, stage1, format_metrics in pending:
+            format_likelihoods = {
+                format_name: 0.0 if metrics is None else next(likelihoods)
+                for format_name, metrics in format_metrics.items()
+            }
+            format_posteriors = (
+                self.evidence_accumulator.calculate_multi_class_confidence(
+                    format_likelihoods
+                )
+            )
+            results[index] = self._stage2_result(
+                stage1, format_likelihoods, format_posteriors
+            )
+        return [result for result in results if result is not None]
+
+    def _run_stage1(self, data: dict[str, Any]) -> _Stage1Outcome:
+        """Run Stage 1 and, when it passes, the Stage 2 fast-path check."""
         # Stage 1 Fast Path: Check for strong test data indicators
         all_keys = self._extract_all_keys(data)
         all_key_tokens = self._collect_key_tokens(all_keys)
-        # Only process string keys - non-string keys indicate invalid test data
-        all_keys_lower = {k.lower() for k in all_keys if isinstance(k, str)}
 
-        fast_pass_stage1 = self._check_stage1_fast_path(all_key_tokens)
-        if fast_pass_stage1:
+        if self._check_stage1_fast_path(all_key_tokens):
             logger.debug("Stage 1 FAST PATH: Strong test data indicators detected")
-            test_confidence = 1.0
-            test_evidence = {"fast_path": True, "strong_indicators": True}
             is_test_data = True
+            test_confidence = 1.0
+            test_evidence: dict[str, Any] = {
+                "fast_path": True,
+                "strong_indicators": True,
+            }
         else:
             # Stage 1: Full test data validation
             is_test_data, test_confidence, test_evidence = (
                 self._stage1_validate_test_data(data)
             )
-
         if not is_test_data:
-            if not self._stage1_notice_emitted:
-                logger.info(
-                    "Stage 1 FAILED: Input does not appear to be test data "
-                    "(confidence=%.3f < %s)",
-                    test_confidence,
-                    self.MIN_TEST_DATA_CONFIDENCE,
-                )
-                # TODO(post-conversion-log): consolidate repeated classifier noise into
-                # the dedicated log stream being planned for ingestion summaries.
-                self._stage1_notice_emitted = True
-            else:
-                logger.debug(
-                    "Stage 1 failed (confidence=%.3f); suppressing duplicate notice",
-                    test_confidence,
-                )
-            return HierarchicalClassificationResult(
-                is_test_data=False,
-                test_data_confidence=test_confidence,
-                test_data_evidence=test_evidence,
-                format_posteriors={},
-                format_likelihoods={},
-            )
+            return _Stage1Outcome(False, test_confidence, test_evidence)
 
         logger.debug(
             "Stage 1 PASSED: Validated as test data (confidence=%.3f)", test_confidence
         )
-
         # Stage 2 Fast Path: Check for unique format-specific combinations
-        fast_format = self._check_stage2_fast_path(all_keys_lower)
-        if fast_format:
+        # Only process string keys - non-string keys indicate invalid test data
+        all_keys_lower = {k.lower() for k in all_keys if isinstance(k, str)}
+        return _Stage1Outcome(
+            True,
+            test_confidence,
+            test_evidence,
+            self._check_stage2_fast_path(all_keys_lower),
+        )
+
+    def _stage1_failed_result(
+        self, stage1: _Stage1Outcome
+    ) -> HierarchicalClassificationResult:
+        """Log the Stage 1 rejection once and build the not-test-data result."""
+        if not self._stage1_notice_emitted:
+            logger.info(
+                "Stage 1 FAILED: Input does not appear to be test data "
+                "(confidence=%.3f < %s)",
+                stage1.test_confidence,
+                self.MIN_TEST_DATA_CONFIDENCE,
+            )
+            # TODO(post-conversion-log): consolidate repeated classifier noise into
+            # the dedicated log stream being planned for ingestion summaries.
+            self._stage1_notice_emitted = True
+        else:
             logger.debug(
-                "Stage 2 FAST PATH: Unique %s indicators detected", fast_format
+                "Stage 1 failed (confidence=%.3f); suppressing duplicate notice",
+                stage1.test_confidence,
             )
-            # Calculate likelihoods for all formats for transparency
-            format_likelihoods, format_posteriors = self._stage2_discriminate_formats(
-                data
+        return HierarchicalClassificationResult(
+            is_test_data=False,
+            test_data_confidence=stage1.test_confidence,
+            test_data_evidence=stage1.test_evidence,
+            format_posteriors={},
+            format_likelihoods={},
+        )
+
+    def _stage2_result(
+        self,
+        stage1: _Stage1Outcome,
+        format_likelihoods: dict[str, float],
+        format_posteriors: dict[str, float],
+    ) -> HierarchicalClassificationResult:
+        """Apply the Stage 2 fast-path boost and build the final result."""
+        if stage1.fast_format:
+            logger.debug(
+                "Stage 2 FAST PATH: Unique %s indicators detected", stage1.fast_format
             )
             # Boost confidence for fast-path detected format to reflect high certainty
             format_posteriors = self._boost_fast_path_confidence(
-                format_posteriors, fast_format
-            )
-        else:
-            # Stage 2: Full format-specific discrimination
-            format_likelihoods, format_posteriors = self._stage2_discriminate_formats(
-                data
+                format_posteriors, stage1.fast_format
             )
-
         return HierarchicalClassificationResult(
             is_test_data=True,
-            test_data_confidence=test_confidence,
-            test_data_evidence=test_evidence,
+            test_data_confidence=stage1.test_confidence,
+            test_data_evidence=stage1.test_evidence,
             format_posteriors=format_posteriors,
             format_likelihoods=format_likelihoods,
         )
@@ -353,9 +432,32 @@ class HierarchicalClassifier:
         Returns:
             Tuple of (format_likelihoods, format_posteriors)
         """
-        format_likelihoods: dict[str, float] = {}
+        bayesian_scorer = self.evidence_accumulator.bayesian_scorer
+        # Calculate likelihood P(E|H_i) with the Independent Bayesian Scorer
+        format_likelihoods = {
+            format_name: 0.0
+            if metrics is None
+            else bayesian_scorer.calculate_likelihood(metrics)
+            for format_name, metrics in self._stage2_metrics(data).items()
+        }
+
+        # Apply proper multi-class Bayesian normalization
+        format_posteriors = self.evidence_accumulator.calculate_multi_class_confidence(
+            format_likelihoods
+        )
+
+        return format_likelihoods, format_posteriors
+
+    def _stage2_metrics(
+        self, data: dict[str, Any]
+    ) -> dict[str, EvidenceMetrics | None]:
+        """Collect the evidence metrics of every registered format.
+
+        Formats without any recorded evidence map to None and score a
+        likelihood of zero.
+        """
+        format_metrics: dict[str, EvidenceMetrics | None] = {}
 
-        # Collect evidence and calculate likelihoods for all formats
         for format_type in self.format_registry.get_all_formats():
             evidence_items, total_weight = self.evidence_collector.collect_evidence(
                 data, format_type
@@ -374,24 +476,14 @@ class HierarchicalClassifier:
                 format_name, total_weight
             )
 
-            # Calculate likelihood P(E|H_i)
-            if format_name in self.evidence_accumulator.evidence_profiles:
-                profile = self.evidence_accumulator.evidence_profiles[format_name]
-                metrics = self.evidence_accumulator._profile_to_metrics(profile)
-                bayesian_scorer = self.evidence_accumulator.bayesian_scorer
-
-                # Use calculate_likelihood for Independent Bayesian Scorer
-                likelihood = bayesian_scorer.calculate_likelihood(metrics)
-                format_likelihoods[format_name] = likelihood
-            else:
-                format_likelihoods[format_name] = 0.0
-
-        # Apply proper multi-class Bayesian normalization
-        format_posteriors = self.evidence_accumulator.calculate_multi_class_confidence(
-            format_likelihoods
-        )
+            profile = self.evidence_accumulator.evidence_profiles.get(format_name)
+            format_metrics[format_name] = (
+                None
+                if profile is None
+                else self.evidence_accumulator._profile_to_metrics(profile)
+            )
 
-        return format_likelihoods, format_posteriors
+        return format_metrics
 
     def _extract_all_keys(self, data: Any, keys: set[str] | None = None) -> set[str]:
         """Recursively extract all keys from nested dict structure."""
@@ -493,21 +585,18 @@ class HierarchicalClassifier:
         return 0.6 * depth_score + 0.4 * breadth_score
 
     def _calculate_depth(self, data: Any, current_depth: int = 0) -> int:
-        """Calculate maximum depth of nested structure."""
-        if not isinstance(data, dict | list):
-            return current_depth
+        """Calculate maximum depth of nested structure.
 
-        if isinstance(data, dict):
-            if not data:
-                return current_depth
-            return max(
-                self._calculate_depth(value, current_depth + 1)
-                for value in data.values()
-            )
-        # list case
-        if not data:
-            return current_depth
-        return max(self._calculate_depth(item, current_depth + 1) for item in data)
+        Long lists are sampled and the walk is bounded, so very large payloads
+        yield a lower bound, which the depth score treats the same way.
+        """
+        profile = profile_structure(
+            data,
+            max_nodes=self.DEPTH_MAX_NODES,
+            sample_items=self.DEPTH_SAMPLE_ITEMS,
+            count_tokens=False,
+        )
+        return current_depth + profile.path_depth
 
     def _check_stage1_fast_path(self, key_tokens: set[str]) -> bool:
         """Check if Stage 1 can fast-pass based on strong test data indicators.
@@ -0,0 +1,152 @@
+"""Secondary indexes over the Bronze layer's in-memory records.
+
+``BronzeLayer.get_bronze_records`` used to answer every filter by scanning
+the whole in-memory store and evaluating each record. ``BronzeRecordIndex``
+keeps hash indexes for format type and source path and a sorted index of
+ingestion timestamps, so the common filters resolve to a candidate set
+without touching non-matching records. The layer keeps the index in step with
+its store on ingest and eviction.
+"""
+
+from __future__ import annotations
+
+import bisect
+from dataclasses import dataclass
+from datetime import datetime
+from operator import itemgetter
+from typing import Any
+
+from importobot.medallion.interfaces.enums import SupportedFormat
+
+_timestamp = itemgetter(0)
+
+
+def format_key(format_type: Any) -> str:
+    """Return the case-insensitive lookup key of a format type."""
+    if isinstance(format_type, SupportedFormat):
+        return format_type.value.lower()
+    return str(format_type).lower()
+
+
+@dataclass(frozen=True, slots=True)
+class _IndexEntry:
+    """Indexed attributes of one record, kept to undo its index entries."""
+
+    sequence: int
+    format_key: str
+    source_key: str
+    ingested_at: datetime
+
+
+class BronzeRecordIndex:
+    """Hash and sorted indexes over Bronze record metadata."""
+
+    def __init__(self) -> None:
+        """Create an empty index."""
+        self._entries: dict[str, _IndexEntry] = {}
+        self._by_format: dict[str, set[str]] = {}
+        self._by_source: dict[str, set[str]] = {}
+        self._by_time: list[tuple[datetime, int, str]] = []
+        self._time_sorted = True
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        """Return the number of indexed records."""
+        return len(self._entries)
+
+    def __contains__(self, record_id: object) -> bool:
+        """Return True when ``record_id`` is indexed."""
+        return record_id in self._entries
+
+    def add(
+        self,
+        record_id: str,
+        *,
+        format_type: Any,
+        source_path: Any,
+        ingested_at: datetime,
+    ) -> None:
+        """Index a record, replacing any previous entry for ``record_id``."""
+        self.remove(record_id)
+        self._sequence += 1
+        entry = _IndexEntry(
+            sequence=self._sequence,
+            format_key=format_key(format_type),
+            source_key=str(source_path),
+            ingested_at=ingested_at,
+        )
+        self._entries[record_id] = entry
+        self._by_format.setdefault(entry.format_key, set()).add(record_id)
+        self._by_source.setdefault(entry.source_key, set()).add(record_id)
+        if self._time_sorted:
+            try:
+                bisect.insort(self._by_time, (ingested_at, entry.sequence, record_id))
+            except TypeError:
+                # Naive and aware timestamps cannot be ordered; scan instead
+                self._time_sorted = False
+                self._by_time.clear()
+
+    def remove(self, record_id: str) -> None:
+        """Drop ``record_id`` from every index."""
+        entry = self._entries.pop(record_id, None)
+        if entry is None:
+            return
+        self._discard(self._by_format, entry.format_key, record_id)
+        self._discard(self._by_source, entry.source_key, record_id)
+        if self._time_sorted:
+            key = (entry.ingested_at, entry.sequence, record_id)
+            position = bisect.bisect_left(self._by_time, key)
+            del self._by_time[position]
+        if not self._entries:
+            self._time_sorted = True
+
+    def with_format(self, format_type: Any) -> set[str]:
+        """Return the records whose format matches ``format_type``."""
+        return set(self._by_format.get(format_key(format_type), ()))
+
+    def with_source(self, source_path: Any) -> set[str]:
+        """Return the records ingested from ``source_path``."""
+        return set(self._by_source.get(str(source_path), ()))
+
+    def ingested_between(
+        self, after: datetime | None, before: datetime | None
+    ) -> set[str] | None:
+        """Return the records ingested strictly between ``after`` and ``before``.
+
+        Returns None when the timestamps cannot be ordered against each other
+        or the bounds, leaving the caller to scan.
+        """
+        if not self._time_sorted:
+            return None
+        times = self._by_time
+        try:
+            low = bisect.bisect_right(times, after, key=_timestamp) if after else 0
+            high = (
+                bisect.bisect_left(times, before, key=_timestamp)
+                if before
+                else len(times)
+            )
+        except TypeError:
+            return None
+        return {record_id for _, _, record_id in times[low:high]}
+
+    def in_ingestion_order(self, record_ids: set[str]) -> list[str]:
+        """Return ``record_ids`` in the order their records were indexed."""
+        entries = self._entries
+        return sorted(
+            (record_id for record_id in record_ids if record_id in entries),
+            key=lambda record_id: entries[record_id].sequence,
+        )
+
+    @staticmethod
+    def _discard(index: dict[str, set[str]], key: str, record_id: str) -> None:
+        """Remove ``record_id`` from ``index[key]``, dropping empty buckets."""
+        bucket = index.get(key)
+        if bucket is None:
+            return
+        bucket.discard(record_id)
+        if not bucket:
+            del index[key]
+
+
+__all__ = ["BronzeRecordIndex", "format_key"]
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import re
-from typing import Any
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
 
 from importobot.utils.logging import get_logger
 from importobot.utils.regex_cache import get_compiled_pattern
@@ -115,16 +117,23 @@ class ScoringAlgorithms:
         The penalty multiplier reflects how unlikely it is to see the format
         without its required keys (Bayesian evidence against the hypothesis).
         """
-        score = 0
         required_keys = patterns.get("required_keys", [])
-        total_required = len(required_keys)
+        return ScoringAlgorithms._score_required_presence(
+            [key.lower() in data_str for key in required_keys]
+        )
+
+    @staticmethod
+    def _score_required_presence(present: Sequence[bool]) -> int:
+        """Score required keys from their presence flags, in declaration order."""
+        score = 0
+        total_required = len(present)
 
         if total_required == 0:
             return 0
 
         matches = 0
-        for key in required_keys:
-            if key.lower() in data_str:
+        for found in present:
+            if found:
                 score += ScoringAlgorithms.REQUIRED_KEY_SCORE
                 matches += 1
             else:
@@ -284,4 +293,132 @@ class ScoringAlgorithms:
         return values
 
 
-__all__ = ["ScoringAlgorithms"]
+FormatKey = TypeVar("FormatKey")
+
+
+@dataclass(frozen=True)
+class _FormatPlan:
+    """Presence bits and patterns that score one format."""
+
+    patterns: dict[str, Any]
+    required: tuple[int, ...]
+    optional: tuple[int, ...]
+    structure: tuple[int, ...]
+    field_patterns: tuple[tuple[int, str], ...]
+
+
+class FormatScoreIndex(Generic[FormatKey]):
+    """Indicator index shared by the pattern scores of every format.
+
+    ``ScoringAlgorithms.calculate_format_score`` searches the document once
+    per indicator of each format, so indicators shared between formats are
+    searched repeatedly. The index assigns one bit to every distinct
+    lowercased indicator, searches each of them at most once per document and
+    lets every format score read the resulting presence bitmap. Indicators are
+    searched shortest first: when one is absent, every indicator containing it
+    is known to be absent too and is skipped. Scores are identical to
+    ``calculate_format_score`` for the same patterns.
+    """
+
+    def __init__(self, format_patterns: Mapping[FormatKey, dict[str, Any]]) -> None:
+        """Index the indicators of ``format_patterns``."""
+        self.format_patterns = format_patterns
+        bits: dict[str, int] = {}
+
+        def flags(names: Sequence[str]) -> tuple[int, ...]:
+            return tuple(
+                1 << bits.setdefault(name.lower(), len(bits)) for name in names
+            )
+
+        self._plans: dict[FormatKey, _FormatPlan] = {}
+        for format_key, patterns in format_patterns.items():
+            field_patterns = patterns.get("field_patterns", {})
+            self._plans[format_key] = _FormatPlan(
+                patterns=patterns,
+                required=flags(patterns.get("required_keys", [])),
+                optional=flags(patterns.get("optional_keys", [])),
+                structure=flags(patterns.get("structure_indicators", [])),
+                field_patterns=tuple(
+                    zip(
+                        flags(list(field_patterns)),
+                        field_patterns.values(),
+                        strict=True,
+                    )
+                ),
+            )
+
+        needles = sorted(bits, key=len)
+        self._search_order = tuple(
+            (
+                needle,
+                1 << bits[needle],
+                sum(
+                    1 << bits[other]
+                    for other in needles
+                    if other != needle and needle in other
+                ),
+            )
+            for needle in needles
+        )
+
+    def __len__(self) -> int:
+        """Return the number of distinct indicators in the index."""
+        return len(self._search_order)
+
+    def presence(self, data_str: str) -> int:
+        """Return a bitmap of the indicators that occur in ``data_str``."""
+        present = 0
+        absent = 0
+        for needle, flag, containing in self._search_order:
+            if absent & flag:
+                continue
+            if needle in data_str:
+                present |= flag
+            else:
+                absent |= flag | containing
+        return present
+
+    def score(
+        self,
+        format_key: FormatKey,
+        presence: int,
+        data_str: str,
+        data: dict[str, Any] | None = None,
+    ) -> int:
+        """Score ``format_key`` from a presence bitmap of ``data_str``."""
+        plan = self._plans[format_key]
+        score = 0
+        score += ScoringAlgorithms._score_required_presence(
+            [bool(presence & flag) for flag in plan.required]
+        )
+        for flag in plan.optional:
+            if presence & flag:
+                score += ScoringAlgorithms.OPTIONAL_KEY_SCORE
+        for flag in plan.structure:
+            if presence & flag:
+                score += ScoringAlgorithms.STRUCTURE_INDICATOR_SCORE
+        if data is not None:
+            # Structured matching reads top-level fields, not the document
+            score += ScoringAlgorithms._score_field_patterns(
+                data_str, plan.patterns, data
+            )
+            return score
+        for flag, pattern in plan.field_patterns:
+            if presence & flag:
+                compiled_pattern = _compile_pattern_safe(pattern)
+                if compiled_pattern and compiled_pattern.search(data_str):
+                    score += ScoringAlgorithms.FIELD_PATTERN_SCORE
+        return score
+
+    def score_all(
+        self, data_str: str, data: dict[str, Any] | None = None
+    ) -> dict[FormatKey, int]:
+        """Score every indexed format against ``data_str`` in one pass."""
+        presence = self.presence(data_str)
+        return {
+            format_key: self.score(format_key, presence, data_str, data)
+            for format_key in self._plans
+        }
+
+
+__all__ = ["FormatScoreIndex", "ScoringAlgorithms"]
@@ -0,0 +1,312 @@
+"""Bounded structural profiling of parsed payloads.
+
+Format detection needs a few coarse facts about a payload before choosing an
+algorithm: roughly how large it is, how deeply it nests, how many keys it has
+and how repetitive its content is. Rendering the payload with ``str()`` and
+scanning the text answers those questions but allocates memory proportional
+to the payload. The walker in this module visits the parsed structure
+directly, stops as soon as a configured limit is exceeded, samples long lists
+when asked to, and estimates the number of distinct tokens with a fixed-size
+HyperLogLog sketch, so its memory use does not grow with the payload.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+# Characters added around and between items when a container is rendered,
+# e.g. the ``{}``/``[]`` brackets and the ``", "`` / ``": "`` separators.
+_BRACKET_CHARS = 2
+_SEPARATOR_CHARS = 2
+# Rendering of a container that was already visited (``{...}`` / ``[...]``).
+_CYCLE_CHARS = 5
+
+STOP_SIZE = "size"
+STOP_DEPTH = "depth"
+STOP_KEYS = "keys"
+STOP_NODES = "nodes"
+
+_Limits = tuple[int | None, int | None, int | None]
+_EXHAUSTED = object()
+# 2 ** -rank for every register value a 64-bit hash can produce
+_INVERSE_POWERS = tuple(2.0**-rank for rank in range(65))
+
+
+class HyperLogLog:
+    """Fixed-size sketch estimating the number of distinct tokens."""
+
+    __slots__ = ("_mask", "_precision", "_registers", "_rest_bits")
+
+    def __init__(self, precision: int = 10) -> None:
+        """Create a sketch with ``2 ** precision`` registers."""
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+        self._precision = precision
+        self._rest_bits = 64 - precision
+        self._mask = (1 << self._rest_bits) - 1
+        self._registers = bytearray(1 << precision)
+
+    def add(self, token: str) -> None:
+        """Record ``token`` in the sketch."""
+        self.update((token,))
+
+    def update(self, tokens: Iterable[str]) -> int:
+        """Record every token in ``tokens`` and return how many were added."""
+        registers = self._registers
+        rest_bits = self._rest_bits
+        mask = self._mask
+        count = 0
+        for token in tokens:
+            # hash() of str is salted per process; estimates must be stable
+            digest = hashlib.blake2b(
+                token.encode("utf-8", "surrogatepass"), digest_size=8
+            ).digest()
+            value = int.from_bytes(digest, "little")
+            index = value >> rest_bits
+            rank = rest_bits - (value & mask).bit_length() + 1
+            registers[index] = max(registers[index], rank)
+            count += 1
+        return count
+
+    def estimate(self) -> float:
+        """Return the estimated number of distinct tokens added so far."""
+        registers = self._registers
+        size = len(registers)
+        zeros = registers.count(0)
+        if zeros == size:
+            return 0.0
+        alpha = 0.7213 / (1 + 1.079 / size)
+        raw = alpha * size * size / sum(map(_INVERSE_POWERS.__getitem__, registers))
+        if raw <= 2.5 * size and zeros:
+            # Linear counting is more accurate for small cardinalities
+            return size * math.log(size / zeros)
+        return raw
+
+
+@dataclass(frozen=True)
+class StructureProfile:
+    """Coarse structural statistics gathered by :func:`profile_structure`.
+
+    ``size`` approximates the length of ``str(data)``. ``nesting_depth``
+    counts the containers on the deepest path (``{}`` has depth 1), whereas
+    ``path_depth`` counts the edges from the root to the deepest value, so
+    empty containers add no level. When the walk stopped early, ``stopped_by``
+    names the limit that was exceeded and every figure is a lower bound.
+    """
+
+    size: int
+    nesting_depth: int
+    path_depth: int
+    key_count: int
+    node_count: int
+    token_count: int
+    unique_tokens: float
+    stopped_by: str | None = None
+    sampled: bool = False
+
+    @property
+    def complete(self) -> bool:
+        """Return True when every node of the payload was visited."""
+        return self.stopped_by is None and not self.sampled
+
+    @property
+    def uniqueness_ratio(self) -> float:
+        """Return the estimated share of distinct tokens among all tokens."""
+        if not self.token_count:
+            return 1.0
+        return min(1.0, self.unique_tokens / self.token_count)
+
+
+class _Walk:
+    """Mutable state of a single structural walk."""
+
+    __slots__ = (
+        "active",
+        "key_count",
+        "limits",
+        "nesting_depth",
+        "node_count",
+        "path_depth",
+        "sample_items",
+        "sampled",
+        "size",
+        "sketch",
+        "stack",
+        "token_count",
+    )
+
+    def __init__(self, limits: _Limits, sample_items: int | None) -> None:
+        self.limits = limits
+        self.sample_items = sample_items
+        self.sketch: HyperLogLog | None = None
+        # Open containers as (children, depth of children, id); ``active``
+        # holds their ids so that self-referencing payloads terminate.
+        self.stack: list[tuple[Iterator[Any], int, int]] = []
+        self.active: set[int] = set()
+        self.size = 0
+        self.nesting_depth = 0
+        self.path_depth = 0
+        self.key_count = 0
+        self.node_count = 0
+        self.token_count = 0
+        self.sampled = False
+
+    def exceeded(self) -> str | None:
+        """Return the name of the first limit the walk has exceeded."""
+        max_size, max_depth, max_keys = self.limits
+        if max_size is not None and self.size > max_size:
+            return STOP_SIZE
+        if max_depth is not None and self.nesting_depth > max_depth:
+            return STOP_DEPTH
+        if max_keys is not None and self.key_count > max_keys:
+            return STOP_KEYS
+        return None
+
+    def add_text(self, text: str) -> None:
+        """Account for a string key or value."""
+        self.size += len(text) + 2
+        max_size = self.limits[0]
+        if self.sketch is None or (max_size is not None and self.size > max_size):
+            # Oversized strings end the walk; skip tokenising them
+            return
+        self.token_count += self.sketch.update(text.split())
+
+    def add_key(self, key: Any) -> None:
+        """Account for a dict key and its separators."""
+        self.size += _SEPARATOR_CHARS * 2
+        if isinstance(key, str):
+            self.add_text(key)
+        else:
+            self.add_token(repr(key))
+
+    def add_token(self, rendered: str) -> None:
+        """Account for a rendered non-string scalar."""
+        self.size += len(rendered)
+        if self.sketch is not None:
+            self.sketch.add(rendered)
+            self.token_count += 1
+
+    def add_scalar(self, value: Any, depth: int) -> None:
+        """Account for a non-container value at ``depth``."""
+        self.path_depth = max(self.path_depth, depth)
+        if isinstance(value, str):
+            self.add_text(value)
+        else:
+            self.add_token(repr(value))
+
+    def visit(self, value: Any, depth: int) -> None:
+        """Account for ``value`` and open it if it is a non-empty container."""
+        self.node_count += 1
+        if not isinstance(value, dict | list | tuple):
+            self.add_scalar(value, depth)
+            return
+        if id(value) in self.active:
+            self.size += _CYCLE_CHARS
+            return
+        self.nesting_depth = max(self.nesting_depth, depth + 1)
+        self.size += _BRACKET_CHARS
+        if not value:
+            self.path_depth = max(self.path_depth, depth)
+            return
+        children: Iterator[Any]
+        if isinstance(value, dict):
+            self.key_count += len(value)
+            children = _dict_values(self, value)
+        else:
+            indices = _sample_indices(len(value), self.sample_items)
+            self.sampled = self.sampled or len(indices) < len(value)
+            self.size += _SEPARATOR_CHARS * len(indices)
+            children = (value[index] for index in indices)
+        self.stack.append((children, depth + 1, id(value)))
+        self.active.add(id(value))
+
+    def advance(self) -> tuple[Any, int] | None:
+        """Return the next value to visit and its depth, or None when done."""
+        while self.stack:
+            children, depth, container_id = self.stack[-1]
+            value = next(children, _EXHAUSTED)
+            if value is not _EXHAUSTED:
+                return value, depth
+            self.stack.pop()
+            self.active.discard(container_id)
+        return None
+
+    def profile(self, stopped_by: str | None) -> StructureProfile:
+        """Freeze the gathered statistics."""
+        return StructureProfile(
+            size=self.size,
+            nesting_depth=self.nesting_depth,
+            path_depth=self.path_depth,
+            key_count=self.key_count,
+            node_count=self.node_count,
+            token_count=self.token_count,
+            unique_tokens=self.sketch.estimate() if self.sketch else 0.0,
+            stopped_by=stopped_by,
+            sampled=self.sampled,
+        )
+
+
+def _sample_indices(length: int, sample_items: int | None) -> range | list[int]:
+    """Return the list positions to visit, spread evenly over the list."""
+    if sample_items is None or length <= sample_items:
+        return range(length)
+    step = length / max(sample_items - 1, 1)
+    indices = dict.fromkeys(int(i * step) for i in range(sample_items - 1))
+    indices[length - 1] = None
+    return list(indices)
+
+
+def _dict_values(walk: _Walk, mapping: dict[Any, Any]) -> Iterator[Any]:
+    """Yield the values of ``mapping``, accounting for each key on the way."""
+    for key, value in mapping.items():
+        walk.add_key(key)
+        yield value
+
+
+def profile_structure(
+    data: Any,
+    *,
+    max_size: int | None = None,
+    max_depth: int | None = None,
+    max_keys: int | None = None,
+    max_nodes: int | None = None,
+    sample_items: int | None = None,
+    count_tokens: bool = True,
+) -> StructureProfile:
+    """Walk ``data`` depth-first and return its structural profile.
+
+    The walk keeps one iterator per open container, so its memory grows with
+    the nesting depth rather than with the payload size.
+
+    Args:
+        data: Parsed payload built from dicts, lists, tuples and scalars.
+        max_size: Stop once the estimated rendered size exceeds this.
+        max_depth: Stop once the container nesting exceeds this depth.
+        max_keys: Stop once more than this many dict keys were seen.
+        max_nodes: Stop after visiting this many values.
+        sample_items: Visit at most this many evenly spaced items per list.
+        count_tokens: Estimate token uniqueness from keys and scalar values.
+
+    Returns:
+        The gathered profile; ``stopped_by`` names the exceeded limit, if any.
+    """
+    walk = _Walk((max_size, max_depth, max_keys), sample_items)
+    if count_tokens:
+        walk.sketch = HyperLogLog()
+    pending: tuple[Any, int] | None = (data, 0)
+    while pending is not None:
+        if max_nodes is not None and walk.node_count >= max_nodes:
+            return walk.profile(STOP_NODES)
+        walk.visit(*pending)
+        stopped_by = walk.exceeded()
+        if stopped_by is not None:
+            return walk.profile(stopped_by)
+        pending = walk.advance()
+    return walk.profile(None)
+
+
+__all__ = ["HyperLogLog", "StructureProfile", "profile_structure"]
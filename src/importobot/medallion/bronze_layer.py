@@ -16,6 +16,7 @@ from importobot.config import (
     BRONZE_LAYER_MAX_IN_MEMORY_RECORDS,
 )
 from importobot.medallion.base_layers import BaseMedallionLayer
+from importobot.medallion.bronze.record_index import BronzeRecordIndex, format_key
 from importobot.medallion.interfaces.data_models import (
     DataLineage,
     DataQualityMetrics,
@@ -60,6 +61,10 @@ class BronzeLayer(BaseMedallionLayer):
         "ingestion_timestamp_before": "_filter_ingestion_before",
         "ingestion_timestamp_after": "_filter_ingestion_after",
     }
+    _TIME_FILTERS: ClassVar[tuple[str, str]] = (
+        "ingestion_timestamp_after",
+        "ingestion_timestamp_before",
+    )
 
     def __init__(
         self,
@@ -103,6 +108,7 @@ class BronzeLayer(BaseMedallionLayer):
         self._ingestion_order: deque[str] = deque()
         self._in_memory_timestamps: dict[str, datetime] = {}
         self._record_cache: dict[str, BronzeRecord] = {}
+        self._record_index = BronzeRecordIndex()
 
     def ingest(self, data: Any, metadata: LayerMetadata) -> ProcessingResult:
         """Ingest raw data into the Bronze layer."""
@@ -110,24 +116,22 @@ class BronzeLayer(BaseMedallionLayer):
         self._purge_expired_records(start_time)
 
         try:
-            # Serialize once for downstream hashing to avoid repeated JSON dumps
-            serialized_data = self._serialize_data(data)
+            # Serialize once; hashing, detection and storage share the payload
+            payload = self._canonical_payload(data)
 
             # Generate unique ID for this data
             data_id = self._generate_data_id(
-                data, metadata, serialized_data=serialized_data
+                data, metadata, serialized_data=payload.text
             )
 
             # Update metadata with processing information
-            metadata.data_hash = self._calculate_data_hash(
-                data, serialized_data=serialized_data
-            )
-            metadata.format_type = self._detect_format_type(data)
+            metadata.data_hash = payload.digest
+            metadata.format_type = self._detect_format_type(data, payload)
             metadata.processing_timestamp = start_time
             metadata.layer_name = self.layer_name
 
             # Validate data
-            validation_result = self.validate(data)
+            validation_result = self._validate_lowered(data, payload.lowered)
             if not validation_result.is_valid:
                 logger.warning(
                     "Data validation failed for %s: %s",
@@ -154,6 +158,12 @@ class BronzeLayer(BaseMedallionLayer):
             self._metadata_store[data_id] = metadata
             self._lineage_store[data_id] = lineage
             self._register_in_memory_record(data_id, start_time)
+            self._record_index.add(
+                data_id,
+                format_type=metadata.format_type,
+                source_path=metadata.source_path,
+                ingested_at=metadata.ingestion_timestamp,
+            )
             self._enforce_in_memory_capacity()
             self._cache_bronze_record(data_id)
 
@@ -161,7 +171,11 @@ class BronzeLayer(BaseMedallionLayer):
             if self.storage_backend:
                 try:
                     self.storage_backend.store_data(
-                        self.layer_name, data_id, data, metadata
+                        self.layer_name,
+                        data_id,
+                        data,
+                        metadata,
+                        serialized=payload.encoded,
                     )
                 except Exception as storage_error:
                     logger.warning(
@@ -217,6 +231,11 @@ class BronzeLayer(BaseMedallionLayer):
 
     def validate(self, data: Any) -> ValidationResult:
         """Validate raw data for Bronze layer ingestion."""
+        lowered = data_to_lower_cached(data) if isinstance(data, dict) else ""
+        return self._validate_lowered(data, lowered)
+
+    def _validate_lowered(self, data: Any, lowered: str) -> ValidationResult:
+        """Validate ``data`` given a lowercase rendering of it."""
         issues = []
         error_count = 0
         warning_count = 0
@@ -235,7 +254,7 @@ class BronzeLayer(BaseMedallionLayer):
             # Check for basic test structure indicators
             test_indicators = ["test", "case", "step", "name", "description"]
             has_test_indicator = any(
-                indicator in data_to_lower_cached(data) for indicator in test_indicators
+                indicator in lowered for indicator in test_indicators
             )
             if not has_test_indicator:
                 issues.append("Data does not appear to contain test case information")
@@ -287,6 +306,7 @@ class BronzeLayer(BaseMedallionLayer):
         self._lineage_store.pop(data_id, None)
         self._in_memory_timestamps.pop(data_id, None)
         self._record_cache.pop(data_id, None)
+        self._record_index.remove(data_id)
         if self._ingestion_order and self._ingestion_order[0] == data_id:
             self._ingestion_order.popleft()
         else:
@@ -508,10 +528,18 @@ class BronzeLayer(BaseMedallionLayer):
         """Gather Bronze records from the in-memory store."""
         records: list[BronzeRecord] = []
 
-        if not filter_criteria:
-            source_iter: Iterable[tuple[str, dict[str, Any]]] = islice(
-                self._data_store.items(), 0, effective_limit
+        candidates: list[str] | None = None
+        if filter_criteria:
+            candidates, filter_criteria = self._plan_in_memory_filter(filter_criteria)
+
+        if candidates is not None:
+            source_iter: Iterable[tuple[str, dict[str, Any]]] = (
+                (record_id, self._data_store[record_id])
+                for record_id in candidates
+                if record_id in self._data_store
             )
+        elif not filter_criteria:
+            source_iter = islice(self._data_store.items(), 0, effective_limit)
         else:
             source_iter = self._data_store.items()
 
@@ -542,11 +570,52 @@ class BronzeLayer(BaseMedallionLayer):
 
             records.append(cached_record)
 
-            if filter_criteria and len(records) >= effective_limit:
+            if len(records) >= effective_limit:
                 break
 
         return records
 
+    def _plan_in_memory_filter(
+        self, filter_criteria: dict[str, Any]
+    ) -> tuple[list[str] | None, dict[str, Any]]:
+        """Resolve indexed filters to candidate record IDs.
+
+        Returns:
+            The candidate IDs in ingestion order (None when no filter could use
+            an index) and the criteria still to be evaluated per record.
+        """
+        residual = dict(filter_criteria)
+        matches = [
+            self._indexed_matches(key, residual.pop(key))
+            for key in ("record_id", "format_type", "source_path")
+            if key in residual
+        ]
+
+        time_bounds = [
+            self._parse_datetime(residual.get(key)) for key in self._TIME_FILTERS
+        ]
+        if any(time_bounds):
+            in_range = self._record_index.ingested_between(*time_bounds)
+            if in_range is not None:
+                matches.append(in_range)
+                for key in self._TIME_FILTERS:
+                    residual.pop(key, None)
+
+        if not matches:
+            return None, filter_criteria
+        candidates = min(matches, key=len).intersection(*matches)
+        return self._record_index.in_ingestion_order(candidates), residual
+
+    def _indexed_matches(self, key: str, expected: Any) -> set[str]:
+        """Return the record IDs matching one hash-indexed filter."""
+        if key == "format_type":
+            return self._record_index.with_format(expected)
+        if key == "source_path":
+            return self._record_index.with_source(expected)
+        if isinstance(expected, str) and expected in self._record_index:
+            return {expected}
+        return set()
+
     def _collect_persisted_records(
         self,
         filter_criteria: dict[str, Any] | None,
@@ -864,12 +933,7 @@ class BronzeLayer(BaseMedallionLayer):
         metadata: LayerMetadata,
         **_: Any,
     ) -> bool:
-        format_value = (
-            metadata.format_type.value
-            if isinstance(metadata.format_type, SupportedFormat)
-            else str(metadata.format_type)
-        )
-        return str(expected).lower() == format_value.lower()
+        return format_key(expected) == format_key(metadata.format_type)
 
     def _filter_source_path(
         self,
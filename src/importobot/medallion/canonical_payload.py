@@ -0,0 +1,51 @@
+"""Canonical serialization shared by every stage of a single ingest.
+
+Ingesting a record hashes it, identifies it, detects its format and persists
+it. Each of those steps used to render the document on its own. A
+``CanonicalPayload`` renders it once, as sorted-key JSON, and carries the
+encoded bytes, their blake2b digest and a lazily built lowercase view, so
+every step reuses the same serialization and storage writes the exact bytes
+that were hashed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections.abc import Callable
+from typing import Any
+
+
+class CanonicalPayload:
+    """Parsed data together with its canonical serialization."""
+
+    __slots__ = ("_lowered", "data", "digest", "encoded", "text")
+
+    def __init__(self, data: Any, text: str) -> None:
+        """Wrap ``data`` and its canonical JSON ``text``."""
+        self.data = data
+        self.text = text
+        self.encoded = text.encode("utf-8")
+        self.digest = hashlib.blake2b(self.encoded).hexdigest()
+        self._lowered: str | None = None
+
+    @classmethod
+    def from_data(
+        cls, data: Any, *, default: Callable[[Any], Any] | None = None
+    ) -> CanonicalPayload:
+        """Serialize ``data`` as sorted-key JSON, using ``default`` for others."""
+        return cls(data, json.dumps(data, sort_keys=True, default=default))
+
+    @property
+    def lowered(self) -> str:
+        """Return the lowercase serialization used for indicator matching."""
+        if self._lowered is None:
+            self._lowered = self.text.lower()
+        return self._lowered
+
+    def __len__(self) -> int:
+        """Return the size of the encoded payload in bytes."""
+        return len(self.encoded)
+
+
+__all__ = ["CanonicalPayload"]
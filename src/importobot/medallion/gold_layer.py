@@ -8,7 +8,7 @@ preparation.
 from __future__ import annotations
 
 import warnings
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -27,6 +27,7 @@ from importobot.services.optimization_service import (
     OptimizationOutcome,
     OptimizationService,
 )
+from importobot.utils.lazy_loader import NUMPY
 from importobot.utils.optimization import OptimizerConfig
 from importobot.utils.validation_models import (
     QualitySeverity,
@@ -182,6 +183,9 @@ class GoldLayer(BaseMedallionLayer, PlaceholderMixin):
             initial_parameters=initial_parameters,
             parameter_bounds=parameter_bounds,
             algorithm=optimization_settings.get("algorithm"),
+            batch_objective=self._build_default_batch_objective(
+                data, optimization_settings
+            ),
             metadata={
                 "source": "GoldLayer.ingest",
                 "preview": True,
@@ -196,9 +200,15 @@ class GoldLayer(BaseMedallionLayer, PlaceholderMixin):
             adaptive_learning=True,
         )
 
+        # The engines' stochastic runs differ for the same seed, so NumPy is
+        # opt-in ("numpy" or "auto"); otherwise the service's engine is used,
+        # keeping results independent of whether NumPy is installed.
         outcome = self._optimization_service.execute(
             scenario_name,
             gradient_config=gradient_config,
+            engine=optimization_settings.get("engine"),
+            seed=optimization_settings.get("seed"),
+            starts=optimization_settings.get("starts", 1),
         )
         return outcome
 
@@ -213,6 +223,7 @@ class GoldLayer(BaseMedallionLayer, PlaceholderMixin):
                 "score": optimization_preview.score,
                 "parameters": optimization_preview.parameters,
                 "metadata": optimization_preview.details.get("metadata", {}),
+                "engine": optimization_preview.details.get("engine", "python"),
             }
         return details
 
@@ -222,6 +233,36 @@ class GoldLayer(BaseMedallionLayer, PlaceholderMixin):
         settings: dict[str, Any],
     ) -> Callable[[dict[str, float]], float]:
         """Construct a placeholder objective for upcoming optimization tasks."""
+        penalty = self._build_conversion_penalty(data, settings)
+
+        def objective(parameters: dict[str, float]) -> float:
+            return float(penalty(parameters, max))
+
+        return objective
+
+    def _build_default_batch_objective(
+        self,
+        data: Any,
+        settings: dict[str, Any],
+    ) -> Callable[[Mapping[str, Any]], Any]:
+        """Vectorized twin of the default objective for the NumPy engine."""
+        penalty = self._build_conversion_penalty(data, settings)
+
+        def batch_objective(columns: Mapping[str, Any]) -> Any:
+            return penalty(columns, NUMPY.module.maximum)
+
+        return batch_objective
+
+    def _build_conversion_penalty(
+        self,
+        data: Any,
+        settings: dict[str, Any],
+    ) -> Callable[[Mapping[str, Any], Callable[[Any, Any], Any]], Any]:
+        """Return the penalty formula shared by the scalar and batch objectives.
+
+        Parameters may be floats or NumPy columns; ``maximum`` is ``max`` or
+        ``numpy.maximum`` accordingly, so both paths compute identical values.
+        """
         target_quality = settings.get("target_quality_score", 0.92)
         baseline_quality = settings.get("baseline_quality_score", 0.75)
         baseline_latency = settings.get("baseline_latency_ms", 650.0)
@@ -231,23 +272,25 @@ class GoldLayer(BaseMedallionLayer, PlaceholderMixin):
             self._estimate_suite_complexity(data),
         )
 
-        def objective(parameters: dict[str, float]) -> float:
+        def penalty(
+            parameters: Mapping[str, Any], maximum: Callable[[Any, Any], Any]
+        ) -> Any:
             quality_weight = parameters.get("quality_weight", 1.0)
             latency_weight = parameters.get("latency_weight", 0.5)
 
             projected_quality = baseline_quality * (1.0 + 0.12 * quality_weight)
             quality_penalty = (projected_quality - target_quality) ** 2
 
-            projected_latency = baseline_latency / max(0.2, 1.0 + latency_weight)
+            projected_latency = baseline_latency / maximum(0.2, 1.0 + latency_weight)
             projected_latency += suite_complexity * 2.5
             latency_penalty = (
                 (projected_latency - target_latency) / max(target_latency, 1.0)
             ) ** 2
 
             regularization = 0.01 * (quality_weight**2 + latency_weight**2)
-            return float(quality_penalty + latency_penalty + regularization)
+            return quality_penalty + latency_penalty + regularization
 
-        return objective
+        return penalty
 
     @staticmethod
     def _estimate_suite_complexity(data: Any) -> float:
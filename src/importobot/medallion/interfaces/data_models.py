@@ -1,7 +1,13 @@
-"""Data models for Medallion architecture."""
+"""Data models for Medallion architecture.
+
+Layers keep these models for every in-memory record, so they are slotted and
+intern the short labels (layer names, transformation types, source locations)
+that repeat across records.
+"""
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -10,7 +16,12 @@ from typing import Any
 from .enums import ProcessingStatus, SupportedFormat
 
 
-@dataclass(frozen=True)
+def intern_label(value: Any) -> Any:
+    """Return the interned copy of a plain string; other values pass through."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(frozen=True, slots=True)
 class FormatDetectionResult:
     """Result of format detection analysis for raw data integration."""
 
@@ -27,9 +38,12 @@ class FormatDetectionResult:
                 f"Confidence score must be between 0.0 and 1.0, got "
                 f"{self.confidence_score}"
             )
+        object.__setattr__(
+            self, "detection_version", intern_label(self.detection_version)
+        )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataLineage:
     """Comprehensive data lineage tracking for medallion architecture."""
 
@@ -41,6 +55,11 @@ class DataLineage:
     child_records: list[str] = field(default_factory=list)
     created_timestamp: datetime = field(default_factory=datetime.now)
 
+    def __post_init__(self) -> None:
+        """Intern the source labels shared by records of one source."""
+        object.__setattr__(self, "source_type", intern_label(self.source_type))
+        object.__setattr__(self, "source_location", intern_label(self.source_location))
+
     @property
     def depth(self) -> int:
         """Calculate lineage depth.
@@ -64,7 +83,7 @@ class DataLineage:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class LayerMetadata:
     """Metadata for tracking data lineage and processing information."""
 
@@ -82,8 +101,14 @@ class LayerMetadata:
     session_id: str = ""
     custom_metadata: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        """Intern the labels shared across records."""
+        self.layer_name = intern_label(self.layer_name)
+        self.version = intern_label(self.version)
+        self.user_id = intern_label(self.user_id)
+
 
-@dataclass
+@dataclass(slots=True)
 class DataQualityMetrics:
     """Quality metrics for validation scoring across layers."""
 
@@ -103,7 +128,7 @@ class DataQualityMetrics:
     calculation_duration_ms: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LineageInfo:
     """Data lineage tracking information."""
 
@@ -116,8 +141,14 @@ class LineageInfo:
     child_ids: list[str] = field(default_factory=list)
     transformation_details: dict[str, Any] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        """Intern the layer and transformation labels."""
+        self.source_layer = intern_label(self.source_layer)
+        self.target_layer = intern_label(self.target_layer)
+        self.transformation_type = intern_label(self.transformation_type)
+
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingResult:
     """Result of layer processing operations."""
 
@@ -138,7 +169,7 @@ class ProcessingResult:
     details: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class LayerQuery:
     """Query specification for retrieving data from layers."""
 
@@ -152,7 +183,7 @@ class LayerQuery:
     filters: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class LayerData:
     """Data retrieved from a layer."""
 
@@ -8,11 +8,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
-from .data_models import DataLineage, FormatDetectionResult
+from .data_models import DataLineage, FormatDetectionResult, intern_label
 from .enums import DataQuality, ProcessingStatus
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RecordMetadata:
     """Enhanced metadata for medallion layer records with comprehensive tracking."""
 
@@ -45,6 +45,8 @@ class RecordMetadata:
             raise ValueError(
                 f"Quality score must be between 0.0 and 1.0, got {self.quality_score}"
             )
+        for name in ("version", "schema_version", "source_system"):
+            object.__setattr__(self, name, intern_label(getattr(self, name)))
 
     @property
     def is_valid(self) -> bool:
@@ -62,6 +64,9 @@ class BronzeRecord:
 
     Bronze layer stores raw, unprocessed data with full metadata and lineage
     tracking as defined in Databricks Medallion Architecture patterns.
+
+    Unlike its metadata models the record is not slotted, so that
+    ``BronzeRecordResponse`` can also subclass ``dict``.
     """
 
     data: dict[str, Any]
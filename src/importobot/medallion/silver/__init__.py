@@ -0,0 +1,27 @@
+"""Silver layer components for normalized, queryable test cases.
+
+The Silver layer turns raw Bronze records into one vendor-independent schema:
+- Cross-format normalization of test cases and steps
+- Dictionary-encoded columnar storage for scan-based queries
+- Incremental rebuilds keyed by the Bronze data hash
+"""
+
+from importobot.medallion.silver.columnar_store import (
+    ColumnarTestStore,
+    StepMatch,
+    StringDictionary,
+)
+from importobot.medallion.silver.normalizer import (
+    NormalizedStep,
+    NormalizedTestCase,
+    TestCaseNormalizer,
+)
+
+__all__ = [
+    "ColumnarTestStore",
+    "NormalizedStep",
+    "NormalizedTestCase",
+    "StepMatch",
+    "StringDictionary",
+    "TestCaseNormalizer",
+]
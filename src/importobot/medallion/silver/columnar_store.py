@@ -0,0 +1,304 @@
+"""Dictionary-encoded columnar storage for normalized test cases.
+
+Every string of every column is stored once in a shared
+:class:`StringDictionary`; the columns themselves are ``array('I')`` vectors
+of dictionary codes. A text query therefore tests each *distinct* string once,
+turns the matches into a code mask and scans the code columns, instead of
+re-parsing or re-lowercasing every record. Repeated values such as
+priorities, vendor names or common step phrasing cost four bytes per row.
+
+Test rows are grouped by the source (the Bronze ``data_hash``) they were
+normalized from. Replacing or removing a source tombstones its rows; the
+arrays are compacted once tombstones outnumber live rows.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Any, NamedTuple
+
+from importobot.medallion.silver.normalizer import NormalizedStep, NormalizedTestCase
+from importobot.utils.lazy_loader import NUMPY
+
+TEST_COLUMNS = ("source", "format", "key", "name", "description", "priority")
+STEP_COLUMNS = ("action", "data", "expected")
+NUMPY_SCAN_MIN_ROWS = 4096  # Below this, a Python scan beats array setup
+COMPACT_MIN_DEAD_ROWS = 1024  # Never compact for a handful of tombstones
+
+
+class StringDictionary:
+    """Append-only mapping between strings and dense integer codes."""
+
+    __slots__ = ("_codes", "_lowered", "_values")
+
+    def __init__(self) -> None:
+        """Create a dictionary holding only the empty string (code 0)."""
+        self._codes: dict[str, int] = {"": 0}
+        self._values: list[str] = [""]
+        self._lowered: list[str] = [""]
+
+    def __len__(self) -> int:
+        """Return the number of distinct strings."""
+        return len(self._values)
+
+    def encode(self, value: str) -> int:
+        """Return the code of ``value``, adding it when unseen."""
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self._values)
+            self._codes[value] = code
+            self._values.append(value)
+            self._lowered.append(value.lower())
+        return code
+
+    def decode(self, code: int) -> str:
+        """Return the string stored under ``code``."""
+        return self._values[code]
+
+    def code_of(self, value: str) -> int | None:
+        """Return the code of ``value`` without adding it."""
+        return self._codes.get(value)
+
+    def matching(self, text: str, *, case_sensitive: bool = False) -> bytearray:
+        """Return a mask over codes whose string contains ``text``."""
+        if case_sensitive:
+            values = self._values
+        else:
+            values, text = self._lowered, text.lower()
+        return bytearray(text in value for value in values)
+
+
+class StepMatch(NamedTuple):
+    """A step found by a column scan, with the test case it belongs to."""
+
+    source: str
+    test_key: str
+    test_name: str
+    step: NormalizedStep
+
+
+def _scan(codes: array[int], mask: bytearray) -> list[int]:
+    """Return the positions in ``codes`` whose code is set in ``mask``."""
+    if len(codes) >= NUMPY_SCAN_MIN_ROWS and NUMPY.available:
+        np = NUMPY.module
+        hits = np.frombuffer(mask, dtype=np.bool_)[np.frombuffer(codes, np.uint32)]
+        return [int(row) for row in np.flatnonzero(hits)]
+    return [row for row, code in enumerate(codes) if mask[code]]
+
+
+class ColumnarTestStore:
+    """Normalized test cases and steps kept as dictionary-encoded columns."""
+
+    def __init__(self) -> None:
+        """Create an empty store."""
+        self.strings = StringDictionary()
+        self._sources: dict[str, range] = {}
+        self._reset_columns()
+
+    def _reset_columns(self) -> None:
+        """Start empty row columns; the string dictionary is kept."""
+        self._test_columns: dict[str, array[int]] = {
+            name: array("I") for name in TEST_COLUMNS
+        }
+        self._step_start = array("I")
+        self._step_count = array("I")
+        self._test_live = bytearray()
+        self._step_columns: dict[str, array[int]] = {
+            name: array("I") for name in STEP_COLUMNS
+        }
+        self._step_test = array("I")
+        self._step_index = array("I")
+        self._dead_tests = 0
+
+    def __contains__(self, source: object) -> bool:
+        """Return True when rows from ``source`` are stored."""
+        return source in self._sources
+
+    @property
+    def sources(self) -> list[str]:
+        """Return the stored source identifiers in insertion order."""
+        return list(self._sources)
+
+    @property
+    def test_count(self) -> int:
+        """Return the number of live test cases."""
+        return len(self._test_live) - self._dead_tests
+
+    @property
+    def step_count(self) -> int:
+        """Return the number of steps of live test cases."""
+        return sum(self._step_count[row] for row in self._live_rows())
+
+    def add_source(
+        self, source: str, format_name: str, tests: Iterable[NormalizedTestCase]
+    ) -> int:
+        """Store ``tests`` under ``source``, replacing its previous rows.
+
+        Returns:
+            The number of test cases stored.
+        """
+        self.remove_source(source)
+        encode = self.strings.encode
+        first_row = len(self._test_live)
+        source_code, format_code = encode(source), encode(format_name)
+        columns = self._test_columns
+        for test in tests:
+            row = len(self._test_live)
+            for name, code in (
+                ("source", source_code),
+                ("format", format_code),
+                ("key", encode(test.key)),
+                ("name", encode(test.name)),
+                ("description", encode(test.description)),
+                ("priority", encode(test.priority)),
+            ):
+                columns[name].append(code)
+            self._step_start.append(len(self._step_test))
+            self._step_count.append(len(test.steps))
+            self._test_live.append(1)
+            for step in test.steps:
+                self._step_test.append(row)
+                self._step_index.append(step.index)
+                self._step_columns["action"].append(encode(step.action))
+                self._step_columns["data"].append(encode(step.data))
+                self._step_columns["expected"].append(encode(step.expected))
+        self._sources[source] = range(first_row, len(self._test_live))
+        return len(self._sources[source])
+
+    def remove_source(self, source: str) -> int:
+        """Drop the rows stored under ``source`` and return how many there were."""
+        rows = self._sources.pop(source, None)
+        if rows is None:
+            return 0
+        for row in rows:
+            self._test_live[row] = 0
+        self._dead_tests += len(rows)
+        if self._dead_tests >= max(COMPACT_MIN_DEAD_ROWS, self.test_count):
+            self.compact()
+        return len(rows)
+
+    def test_cases(self, source: str | None = None) -> list[NormalizedTestCase]:
+        """Materialize the live test cases of ``source`` (or of every source)."""
+        if source is None:
+            rows: Sequence[int] = self._live_rows()
+        else:
+            rows = self._sources.get(source, range(0))
+        return [self._test_case(row) for row in rows]
+
+    def find_tests(self, column: str, value: str) -> list[NormalizedTestCase]:
+        """Return the live test cases whose ``column`` equals ``value``."""
+        code = self.strings.code_of(value)
+        if code is None:
+            return []
+        codes = self._test_columns[column]
+        live = self._test_live
+        return [
+            self._test_case(row)
+            for row, row_code in enumerate(codes)
+            if row_code == code and live[row]
+        ]
+
+    def find_steps(
+        self,
+        text: str,
+        *,
+        columns: Sequence[str] = STEP_COLUMNS,
+        case_sensitive: bool = False,
+    ) -> list[StepMatch]:
+        """Return the live steps whose ``columns`` contain ``text``.
+
+        Each distinct string is tested once; the step columns are then scanned
+        as integer codes.
+        """
+        mask = self.strings.matching(text, case_sensitive=case_sensitive)
+        if not any(mask):
+            return []
+        rows: set[int] = set()
+        for column in columns:
+            rows.update(_scan(self._step_columns[column], mask))
+        step_test, live = self._step_test, self._test_live
+        return [self._step_match(row) for row in sorted(rows) if live[step_test[row]]]
+
+    def compact(self) -> None:
+        """Rewrite the columns without the rows of removed sources."""
+        old_tests = self._test_columns
+        old_steps = self._step_columns
+        old_start, old_count = self._step_start, self._step_count
+        old_step_index = self._step_index
+        live_rows = self._live_rows()
+        self._reset_columns()
+        remap: dict[int, int] = {}
+        for new_row, row in enumerate(live_rows):
+            remap[row] = new_row
+            for name, codes in old_tests.items():
+                self._test_columns[name].append(codes[row])
+            start, count = old_start[row], old_count[row]
+            self._step_start.append(len(self._step_test))
+            self._step_count.append(count)
+            self._test_live.append(1)
+            for step_row in range(start, start + count):
+                self._step_test.append(new_row)
+                self._step_index.append(old_step_index[step_row])
+                for name, codes in old_steps.items():
+                    self._step_columns[name].append(codes[step_row])
+        self._sources = {
+            source: range(remap[rows[0]], remap[rows[0]] + len(rows))
+            if rows
+            else range(0)
+            for source, rows in self._sources.items()
+        }
+
+    def stats(self) -> dict[str, Any]:
+        """Return row counts and the memory held by the code columns."""
+        columns = [*self._test_columns.values(), *self._step_columns.values()]
+        return {
+            "sources": len(self._sources),
+            "tests": self.test_count,
+            "steps": self.step_count,
+            "distinct_strings": len(self.strings),
+            "column_bytes": sum(c.itemsize * len(c) for c in columns),
+        }
+
+    def _live_rows(self) -> list[int]:
+        """Return the rows of test cases whose source is still stored."""
+        return [row for row, alive in enumerate(self._test_live) if alive]
+
+    def _test_case(self, row: int) -> NormalizedTestCase:
+        """Decode the test case stored in ``row``."""
+        decode, columns = self.strings.decode, self._test_columns
+        start = self._step_start[row]
+        return NormalizedTestCase(
+            key=decode(columns["key"][row]),
+            name=decode(columns["name"][row]),
+            description=decode(columns["description"][row]),
+            priority=decode(columns["priority"][row]),
+            steps=tuple(
+                self._step(step_row)
+                for step_row in range(start, start + self._step_count[row])
+            ),
+        )
+
+    def _step(self, row: int) -> NormalizedStep:
+        """Decode the step stored in step ``row``."""
+        decode, columns = self.strings.decode, self._step_columns
+        return NormalizedStep(
+            index=self._step_index[row],
+            action=decode(columns["action"][row]),
+            data=decode(columns["data"][row]),
+            expected=decode(columns["expected"][row]),
+        )
+
+    def _step_match(self, row: int) -> StepMatch:
+        """Decode step ``row`` together with its test case identity."""
+        test_row = self._step_test[row]
+        decode, columns = self.strings.decode, self._test_columns
+        return StepMatch(
+            source=decode(columns["source"][test_row]),
+            test_key=decode(columns["key"][test_row]),
+            test_name=decode(columns["name"][test_row]),
+            step=self._step(row),
+        )
+
+
+__all__ = ["ColumnarTestStore", "StepMatch", "StringDictionary"]
@@ -0,0 +1,218 @@
+"""Cross-format normalization of vendor test-case exports.
+
+Zephyr, Xray, TestRail and TestLink export the same concepts, a test case
+with a name and a sequence of steps, under different shapes and field names.
+``TestCaseNormalizer`` maps each shape onto one schema of
+:class:`NormalizedTestCase` and :class:`NormalizedStep` values so that the
+Silver layer can store and query test cases without knowing which vendor
+produced them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+from importobot.core.field_definitions import (
+    STEP_ACTION_FIELDS,
+    STEP_DATA_FIELDS,
+    STEP_EXPECTED_FIELDS,
+    TEST_DESCRIPTION_FIELDS,
+    TEST_NAME_FIELDS,
+    FieldGroup,
+)
+from importobot.core.parsers import GenericTestFileParser
+from importobot.medallion.interfaces.enums import SupportedFormat
+
+# Vendor spellings on top of the shared converter field groups
+ACTION_FIELDS = FieldGroup(
+    fields=(*STEP_ACTION_FIELDS.fields, "stepDescription", "content", "actions"),
+    description="Step action across vendor exports",
+)
+DATA_FIELDS = FieldGroup(
+    fields=STEP_DATA_FIELDS.fields,
+    description="Step input data across vendor exports",
+)
+EXPECTED_FIELDS = FieldGroup(
+    fields=(*STEP_EXPECTED_FIELDS.fields, "expectedresults", "expected_results"),
+    description="Step expected result across vendor exports",
+)
+NAME_FIELDS = FieldGroup(
+    fields=TEST_NAME_FIELDS.fields,
+    description="Test case name across vendor exports",
+)
+DESCRIPTION_FIELDS = FieldGroup(
+    fields=(*TEST_DESCRIPTION_FIELDS.fields, "preconditions", "custom_preconds"),
+    description="Test case description across vendor exports",
+)
+KEY_FIELDS = FieldGroup(
+    fields=("key", "testCaseKey", "external_id", "externalid", "case_id", "id"),
+    description="Vendor identifier of a test case",
+)
+PRIORITY_FIELDS = FieldGroup(
+    fields=("priority", "priority_id", "importance"),
+    description="Test case priority",
+)
+STEP_LIST_FIELDS = ("steps", "custom_steps_separated", "teststeps")
+
+# A test's step container and the mapping its name, key and priority come from
+_Extracted = tuple[dict[str, Any], dict[str, Any]]
+
+
+@dataclass(frozen=True, slots=True)
+class NormalizedStep:
+    """One step of a normalized test case."""
+
+    index: int
+    action: str
+    data: str = ""
+    expected: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class NormalizedTestCase:
+    """Vendor-independent view of a test case."""
+
+    key: str
+    name: str
+    description: str = ""
+    priority: str = ""
+    steps: tuple[NormalizedStep, ...] = ()
+
+
+def _text(value: Any) -> str:
+    """Render a field value as text, unwrapping ``{"name": ...}`` objects."""
+    if value is None:
+        return ""
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, dict):
+        for field in ("name", "value", "text"):
+            if field in value:
+                return _text(value[field])
+        return ""
+    if isinstance(value, list):
+        return ", ".join(filter(None, (_text(item) for item in value)))
+    return str(value)
+
+
+def _first_text(data: dict[str, Any], group: FieldGroup) -> str:
+    """Return the text of the first populated field of ``group``."""
+    _, value = group.find_first(data)
+    return _text(value)
+
+
+def _as_dicts(value: Any) -> list[dict[str, Any]]:
+    """Return ``value`` as a list of dicts, wrapping a single dict."""
+    if isinstance(value, dict):
+        return [value]
+    if isinstance(value, list):
+        return [item for item in value if isinstance(item, dict)]
+    return []
+
+
+class TestCaseNormalizer:
+    """Maps vendor test-case exports onto the normalized schema."""
+
+    __test__ = False
+
+    _EXTRACTORS: ClassVar[dict[SupportedFormat, str]] = {
+        SupportedFormat.ZEPHYR: "_zephyr_tests",
+        SupportedFormat.JIRA_XRAY: "_xray_tests",
+        SupportedFormat.TESTRAIL: "_testrail_tests",
+        SupportedFormat.TESTLINK: "_testlink_tests",
+    }
+
+    def __init__(self) -> None:
+        """Create a normalizer backed by the converter's generic parser."""
+        self._parser = GenericTestFileParser()
+
+    def normalize(
+        self, data: Any, format_type: SupportedFormat = SupportedFormat.UNKNOWN
+    ) -> list[NormalizedTestCase]:
+        """Return the test cases found in ``data`` in the normalized schema.
+
+        Formats without a dedicated extractor fall back to the converter's
+        generic test discovery.
+        """
+        if not isinstance(data, dict):
+            return []
+        extractor: Callable[[dict[str, Any]], Iterator[_Extracted]] = getattr(
+            self, self._EXTRACTORS.get(format_type, "_generic_tests")
+        )
+        tests = list(extractor(data)) or list(self._generic_tests(data))
+        return [self._normalize_test(test, fields) for test, fields in tests]
+
+    def _normalize_test(
+        self, test: dict[str, Any], fields: dict[str, Any]
+    ) -> NormalizedTestCase:
+        """Build a normalized test case from ``test`` and its field view."""
+        steps = tuple(
+            NormalizedStep(
+                index=index,
+                action=_first_text(step, ACTION_FIELDS),
+                data=_first_text(step, DATA_FIELDS),
+                expected=_first_text(step, EXPECTED_FIELDS),
+            )
+            for index, step in enumerate(self._steps(test), start=1)
+        )
+        return NormalizedTestCase(
+            key=_first_text(fields, KEY_FIELDS),
+            name=_first_text(fields, NAME_FIELDS),
+            description=_first_text(fields, DESCRIPTION_FIELDS),
+            priority=_first_text(fields, PRIORITY_FIELDS),
+            steps=steps,
+        )
+
+    def _steps(self, test: dict[str, Any]) -> list[dict[str, Any]]:
+        """Return the step dicts of ``test`` across the vendor layouts."""
+        for field in STEP_LIST_FIELDS:
+            value = test.get(field)
+            # TestLink XML exports nest the list: {"steps": {"step": [...]}}
+            if isinstance(value, dict) and "step" in value:
+                value = value["step"]
+            steps = _as_dicts(value)
+            if steps:
+                return steps
+        return self._parser.find_steps(test)
+
+    def _generic_tests(self, data: dict[str, Any]) -> Iterator[_Extracted]:
+        """Yield tests found by the converter's generic discovery."""
+        for test in self._parser.find_tests(data):
+            yield test, test
+
+    def _zephyr_tests(self, data: dict[str, Any]) -> Iterator[_Extracted]:
+        """Yield Zephyr test cases from single or list exports."""
+        for field in ("testCase", "testCases", "values"):
+            for test in _as_dicts(data.get(field)):
+                yield test, test
+
+    def _xray_tests(self, data: dict[str, Any]) -> Iterator[_Extracted]:
+        """Yield Xray test issues, reading names from the Jira ``fields``."""
+        for issue in _as_dicts(data.get("issues")):
+            fields = issue.get("fields")
+            if isinstance(fields, dict):
+                fields = {**fields, "key": issue.get("key")}
+            else:
+                fields = issue
+            test_info = issue.get("testInfo")
+            yield (test_info if isinstance(test_info, dict) else issue), fields
+
+    def _testrail_tests(self, data: dict[str, Any]) -> Iterator[_Extracted]:
+        """Yield TestRail cases, or run tests when no cases are exported."""
+        tests = _as_dicts(data.get("cases")) or _as_dicts(data.get("tests"))
+        for test in tests:
+            yield test, test
+
+    def _testlink_tests(self, data: dict[str, Any]) -> Iterator[_Extracted]:
+        """Yield TestLink test cases from arbitrarily nested test suites."""
+        pending = _as_dicts(data.get("testsuites")) or [data]
+        while pending:
+            suite = pending.pop(0)
+            for test in _as_dicts(suite.get("testcase")):
+                yield test, test
+            pending.extend(_as_dicts(suite.get("testsuite")))
+
+
+__all__ = ["NormalizedStep", "NormalizedTestCase", "TestCaseNormalizer"]
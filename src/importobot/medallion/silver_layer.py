@@ -1,139 +1,367 @@
 """Silver layer implementation for curated and standardized data.
 
-This module contains the SilverLayer class which will be fully implemented in MR2.
-The Silver layer is responsible for data standardization, enrichment, and quality
-validation.
+The Silver layer normalizes Bronze records from every supported vendor into
+one test-case/step schema and keeps them in a dictionary-encoded columnar
+store. Sources are keyed by their Bronze ``data_hash``: records whose hash is
+already stored are skipped, so rebuilding from Bronze only normalizes new or
+changed content.
 """
 
 from __future__ import annotations
 
-import warnings
+from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from importobot.medallion.base_layers import BaseMedallionLayer
 from importobot.medallion.interfaces.data_models import (
     DataLineage,
     DataQualityMetrics,
+    FormatDetectionResult,
     LayerMetadata,
+    LayerQuery,
     ProcessingResult,
 )
-from importobot.medallion.interfaces.enums import ProcessingStatus
+from importobot.medallion.interfaces.enums import ProcessingStatus, SupportedFormat
 from importobot.medallion.interfaces.records import BronzeRecord, RecordMetadata
-from importobot.medallion.placeholder_base import PlaceholderMixin
+from importobot.medallion.silver.columnar_store import (
+    STEP_COLUMNS,
+    ColumnarTestStore,
+    StepMatch,
+)
+from importobot.medallion.silver.normalizer import (
+    NormalizedTestCase,
+    TestCaseNormalizer,
+)
+from importobot.utils.logging import get_logger
 from importobot.utils.validation_models import (
     QualitySeverity,
     ValidationResult,
+    create_basic_validation_result,
 )
 
+if TYPE_CHECKING:
+    from importobot.medallion.bronze_layer import BronzeLayer
 
-class SilverLayer(BaseMedallionLayer, PlaceholderMixin):
-    """Silver layer for curated and standardized data.
+logger = get_logger()
 
-    The Silver layer implements data standardization, enrichment, and quality
-    validation.
-    This is a placeholder implementation that will be completed in MR2.
 
-    Future implementation will include:
+class SilverLayer(BaseMedallionLayer):
+    """Silver layer for curated and standardized data.
 
-    - TestCaseNormalizer for cross-format standardization
-    - MetadataEnricher for business rule application and traceability
-    - QualityValidator with completeness, consistency, and referential integrity checks
-    - Change tracking between Bronze and Silver transformations
-    - Incremental processing capabilities for changed data only
-    - Rollback mechanisms for data quality issues
+    Test cases are normalized with :class:`TestCaseNormalizer` and stored in a
+    :class:`ColumnarTestStore`, so queries such as "all steps mentioning SSH"
+    run as column scans rather than re-parsing vendor JSON.
     """
 
-    def __init__(self, storage_path: Path | None = None) -> None:
+    def __init__(
+        self,
+        storage_path: Path | None = None,
+        *,
+        normalizer: TestCaseNormalizer | None = None,
+        store: ColumnarTestStore | None = None,
+    ) -> None:
         """Initialize the Silver layer."""
         super().__init__("silver", storage_path)
-        warnings.warn(
-            "SilverLayer is currently a placeholder implementation; "
-            "APIs may change without notice.",
-            UserWarning,
-            stacklevel=2,
-        )
+        self.normalizer = normalizer or TestCaseNormalizer()
+        self.store = store or ColumnarTestStore()
 
     def ingest(self, data: Any, metadata: LayerMetadata) -> ProcessingResult:
-        """Ingest and standardize data into the Silver layer.
+        """Normalize ``data`` into the columnar store.
 
-        This is a placeholder implementation that will be completed in MR2.
-        Future implementation will include data standardization, enrichment,
-        and comprehensive quality validation.
+        The source is keyed by ``metadata.data_hash`` (computed from ``data``
+        when empty); content whose hash is already stored is skipped.
 
         Args:
-            data: Raw data from Bronze layer
+            data: Raw data from the Bronze layer
             metadata: Layer metadata for tracking
 
         Returns:
-            ProcessingResult indicating pending implementation
+            ProcessingResult with the number of normalized test cases
         """
-        # Placeholder implementation - will be completed in MR2
-        # pylint: disable=duplicate-code
         start_time = datetime.now()
+        validation_result = self.validate(data)
+        if not validation_result.is_valid:
+            return self._result(
+                start_time,
+                metadata,
+                ProcessingStatus.FAILED,
+                errors=validation_result.issues,
+            )
 
+        data_hash = metadata.data_hash or self._canonical_payload(data).digest
+        if data_hash in self.store:
+            logger.debug("Silver layer already holds source %s; skipping", data_hash)
+            return self._result(
+                start_time,
+                self._metadata_store.get(data_hash, metadata),
+                ProcessingStatus.SKIPPED,
+            )
+
+        format_type = metadata.format_type
+        if format_type == SupportedFormat.UNKNOWN:
+            format_type = self._detect_format_type(data)
+        test_cases = self.normalizer.normalize(data, format_type)
+        self.store.add_source(data_hash, format_type.value, test_cases)
+
+        metadata.data_hash = data_hash
+        metadata.format_type = format_type
+        metadata.layer_name = self.layer_name
+        metadata.record_count = len(test_cases)
+        metadata.processing_timestamp = start_time
+        self._metadata_store[data_hash] = metadata
+        self._lineage_store[data_hash] = self._create_lineage(
+            data_id=data_hash,
+            source_layer="bronze",
+            target_layer=self.layer_name,
+            transformation_type="normalization",
+        )
+        return self._result(start_time, metadata, ProcessingStatus.COMPLETED)
+
+    def sync_from_bronze(
+        self,
+        bronze_layer: BronzeLayer,
+        *,
+        filter_criteria: dict[str, Any] | None = None,
+        limit: int | None = None,
+    ) -> ProcessingResult:
+        """Normalize the Bronze records not yet present in the Silver layer.
+
+        Records are matched by their Bronze ``data_hash``; unchanged content is
+        skipped without being normalized again.
+        """
+        start_time = datetime.now()
+        counts = dict.fromkeys(ProcessingStatus, 0)
+        errors: list[str] = []
+        for record in bronze_layer.get_bronze_records(filter_criteria, limit):
+            result = self.ingest(record.data, self._metadata_from_bronze(record))
+            counts[result.status] += 1
+            errors.extend(result.errors)
+
+        end_time = datetime.now()
+        processed = sum(counts.values())
         return ProcessingResult(
-            status=ProcessingStatus.PENDING,
-            processed_count=0,
-            success_count=0,
-            error_count=0,
+            status=(
+                ProcessingStatus.FAILED
+                if counts[ProcessingStatus.FAILED]
+                else ProcessingStatus.COMPLETED
+            ),
+            processed_count=processed,
+            success_count=counts[ProcessingStatus.COMPLETED],
+            error_count=counts[ProcessingStatus.FAILED],
             warning_count=0,
-            skipped_count=1,
-            processing_time_ms=0.0,
+            skipped_count=counts[ProcessingStatus.SKIPPED],
+            processing_time_ms=(end_time - start_time).total_seconds() * 1000,
             start_timestamp=start_time,
-            metadata=metadata,
+            end_timestamp=end_time,
+            metadata=LayerMetadata(
+                source_path=Path("bronze"),
+                layer_name=self.layer_name,
+                ingestion_timestamp=start_time,
+                record_count=self.store.test_count,
+            ),
             quality_metrics=DataQualityMetrics(),
-            errors=["Silver layer implementation pending MR2"],
+            errors=errors,
         )
 
-    def validate(self, data: Any) -> ValidationResult:
-        """Validate data for Silver layer processing.
+    def remove_source(self, data_hash: str) -> bool:
+        """Drop the test cases normalized from ``data_hash``."""
+        stored = data_hash in self.store
+        self.store.remove_source(data_hash)
+        self._metadata_store.pop(data_hash, None)
+        self._lineage_store.pop(data_hash, None)
+        return stored
 
-        This is a placeholder implementation that will be completed in MR2.
-        Future implementation will include comprehensive data quality validation
-        with completeness, consistency, and referential integrity checks.
+    def find_steps(
+        self,
+        text: str,
+        *,
+        columns: Sequence[str] = STEP_COLUMNS,
+        case_sensitive: bool = False,
+    ) -> list[StepMatch]:
+        """Return the steps whose ``columns`` contain ``text``."""
+        return self.store.find_steps(
+            text, columns=columns, case_sensitive=case_sensitive
+        )
 
-        Args:
-            data: Data to validate
+    def get_test_cases(self, data_hash: str | None = None) -> list[NormalizedTestCase]:
+        """Return the normalized test cases of one source, or of all sources."""
+        return self.store.test_cases(data_hash)
 
-        Returns:
-            ValidationResult indicating pending implementation
-        """
-        # pylint: disable=duplicate-code
-        return ValidationResult(
-            is_valid=False,
-            severity=QualitySeverity.INFO,
+    def validate(self, data: Any) -> ValidationResult:
+        """Validate data for Silver layer processing."""
+        if not isinstance(data, dict):
+            return create_basic_validation_result(
+                severity=QualitySeverity.CRITICAL,
+                error_count=1,
+                warning_count=0,
+                issues=["Data must be a dictionary structure"],
+            )
+        issues = [] if data else ["Data dictionary is empty"]
+        return create_basic_validation_result(
+            severity=QualitySeverity.MEDIUM,
             error_count=0,
-            warning_count=1,
-            issues=["Silver layer validation pending MR2"],
+            warning_count=len(issues),
+            issues=issues,
         )
 
     def ingest_with_detection(
         self, data: dict[str, Any], source_info: dict[str, Any]
     ) -> BronzeRecord:
-        """Process data with format detection (to be implemented in MR2)."""
-        raise self._not_implemented_error("ingest_with_detection", "MR2")
+        """Normalize ``data`` through :meth:`ingest` and describe the source.
+
+        The returned record carries the detected format, the ingest status
+        and errors, and the Silver lineage of the stored source.
+        """
+        source_path = str(source_info.get("source_path", self.layer_name))
+        result = self.ingest(
+            data,
+            LayerMetadata(
+                source_path=Path(source_path),
+                layer_name=self.layer_name,
+                ingestion_timestamp=datetime.now(),
+                data_hash=self._canonical_payload(data).digest,
+            ),
+        )
+        metadata = result.metadata
+        record_metadata = RecordMetadata(
+            record_id=metadata.data_hash,
+            ingestion_timestamp=metadata.ingestion_timestamp,
+            processing_status=result.status,
+            processing_errors=list(result.errors),
+            source_system=source_path,
+            source_file_size=source_info.get("file_size"),
+            source_checksum=metadata.data_hash,
+            quality_checks={"record_count": metadata.record_count},
+        )
+        lineage = self.get_record_lineage(metadata.data_hash) or DataLineage(
+            source_id=metadata.data_hash,
+            source_type=self.layer_name,
+            source_location=source_path,
+        )
+        return BronzeRecord(
+            data=data,
+            metadata=record_metadata,
+            format_detection=FormatDetectionResult(
+                detected_format=metadata.format_type,
+                confidence_score=(
+                    0.0 if metadata.format_type == SupportedFormat.UNKNOWN else 1.0
+                ),
+                evidence_details={"source": "silver_layer", "method": "normalizer"},
+            ),
+            lineage=lineage,
+        )
 
     def get_record_metadata(self, record_id: str) -> RecordMetadata | None:
-        """Retrieve record metadata (to be implemented in MR2)."""
-        return self._placeholder_record_metadata(record_id)
+        """Retrieve metadata for the source stored under ``record_id``."""
+        metadata = self._metadata_store.get(record_id)
+        if metadata is None:
+            return None
+        return RecordMetadata(
+            record_id=record_id,
+            ingestion_timestamp=metadata.ingestion_timestamp,
+            processing_status=ProcessingStatus.COMPLETED,
+            source_system=str(metadata.source_path),
+            source_checksum=metadata.data_hash or None,
+            quality_checks={"record_count": metadata.record_count},
+        )
 
     def get_record_lineage(self, record_id: str) -> DataLineage | None:
-        """Retrieve record lineage information (to be implemented in MR2)."""
-        return self._placeholder_record_lineage(record_id)
+        """Retrieve lineage for the source stored under ``record_id``."""
+        lineage_info = self._lineage_store.get(record_id)
+        metadata = self._metadata_store.get(record_id)
+        if lineage_info is None or metadata is None:
+            return None
+        return DataLineage(
+            source_id=record_id,
+            source_type=lineage_info.source_layer,
+            source_location=str(metadata.source_path),
+            transformation_history=[
+                {
+                    "transformation_type": lineage_info.transformation_type,
+                    "source_layer": lineage_info.source_layer,
+                    "target_layer": lineage_info.target_layer,
+                    "timestamp": lineage_info.transformation_timestamp,
+                }
+            ],
+            created_timestamp=lineage_info.transformation_timestamp,
+        )
 
     def validate_bronze_data(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Validate bronze data for silver processing (to be implemented in MR2)."""
-        return self._placeholder_validate_bronze_data(data, "Silver", "MR2")
+        """Validate Bronze data for Silver processing."""
+        validation_result = self.validate(data)
+        test_cases = self.normalizer.normalize(data, self._detect_format_type(data))
+        return {
+            "is_valid": validation_result.is_valid and bool(test_cases),
+            "error_count": validation_result.error_count,
+            "warning_count": validation_result.warning_count + (not test_cases),
+            "issues": [
+                *validation_result.issues,
+                *([] if test_cases else ["No test cases found to normalize"]),
+            ],
+            "test_case_count": len(test_cases),
+            "step_count": sum(len(test.steps) for test in test_cases),
+        }
 
     def get_bronze_records(
         self,
         filter_criteria: dict[str, Any] | None = None,
         limit: int | None = None,
     ) -> list[BronzeRecord]:
-        """Retrieve bronze records for silver processing (to be implemented in MR2)."""
-        return self._placeholder_get_bronze_records(filter_criteria, limit)
+        """Return no records; the Silver layer does not retain Bronze records."""
+        return []
+
+    def _filter_records(self, query: LayerQuery) -> tuple[list[Any], list[Any]]:
+        """Materialize each matching source as ``{"data_hash", "test_cases"}``."""
+        records: list[Any] = []
+        metadata_list: list[Any] = []
+        for data_hash, metadata in self._metadata_store.items():
+            record = {
+                "data_hash": data_hash,
+                "format_type": metadata.format_type.value,
+                "test_cases": self.store.test_cases(data_hash),
+            }
+            if self._record_matches_query(data_hash, record, metadata, query):
+                records.append(record)
+                metadata_list.append(metadata)
+        return records, metadata_list
+
+    def _metadata_from_bronze(self, record: BronzeRecord) -> LayerMetadata:
+        """Build Silver metadata carrying a Bronze record's hash and format."""
+        return LayerMetadata(
+            source_path=Path(record.lineage.source_location),
+            layer_name=self.layer_name,
+            ingestion_timestamp=record.metadata.ingestion_timestamp,
+            data_hash=record.metadata.source_checksum or "",
+            format_type=record.format_detection.detected_format,
+            custom_metadata={"bronze_record_id": record.record_id},
+        )
+
+    def _result(
+        self,
+        start_time: datetime,
+        metadata: LayerMetadata,
+        status: ProcessingStatus,
+        *,
+        errors: list[str] | None = None,
+    ) -> ProcessingResult:
+        """Build the ProcessingResult of a single ingest."""
+        end_time = datetime.now()
+        return ProcessingResult(
+            status=status,
+            processed_count=1,
+            success_count=int(status == ProcessingStatus.COMPLETED),
+            error_count=int(status == ProcessingStatus.FAILED),
+            warning_count=0,
+            skipped_count=int(status == ProcessingStatus.SKIPPED),
+            processing_time_ms=(end_time - start_time).total_seconds() * 1000,
+            start_timestamp=start_time,
+            end_timestamp=end_time,
+            metadata=metadata,
+            quality_metrics=DataQualityMetrics(),
+            errors=errors or [],
+        )
 
 
 __all__ = ["SilverLayer"]
@@ -31,6 +31,8 @@ class StorageBackend(ABC):
         data_id: str,
         data: dict[str, Any],
         metadata: LayerMetadata,
+        *,
+        serialized: bytes | None = None,
     ) -> bool:
         """Store data in the specified layer.
 
@@ -39,6 +41,7 @@ class StorageBackend(ABC):
             data_id: Unique identifier for the data
             data: The data to store
             metadata: Associated metadata
+            serialized: Canonical JSON encoding of ``data`` to persist as-is
 
         Returns:
             True if storage was successful, False otherwise
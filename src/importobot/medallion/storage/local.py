@@ -29,6 +29,7 @@ from importobot.medallion.interfaces.data_models import (
 from importobot.medallion.interfaces.enums import SupportedFormat
 from importobot.medallion.storage.base import StorageBackend
 from importobot.medallion.utils.query_filters import matches_query_filters
+from importobot.telemetry import telemetry_span
 from importobot.utils.logging import get_logger
 
 logger = get_logger()
@@ -97,6 +98,8 @@ class LocalStorageBackend(StorageBackend):
         data_id: str,
         data: dict[str, Any],
         metadata: LayerMetadata,
+        *,
+        serialized: bytes | None = None,
     ) -> bool:
         """Store data in the local filesystem.
 
@@ -105,6 +108,8 @@ class LocalStorageBackend(StorageBackend):
             data_id: Unique identifier for the data
             data: The data to store
             metadata: Associated metadata
+            serialized: Canonical JSON encoding of ``data``; written verbatim
+                instead of serializing ``data`` again
 
         Returns:
             True if storage was successful, False otherwise
@@ -115,10 +120,13 @@ class LocalStorageBackend(StorageBackend):
             metadata_file = layer_path / "metadata" / f"{data_id}.json"
 
             lock_manager = self._acquire_write_lock(layer_path, data_id)
-            with lock_manager:
+            with lock_manager, telemetry_span(f"storage.write.{layer_name}"):
                 # Store data
-                with open(data_file, "w", encoding="utf-8") as f:
-                    json.dump(data, f, indent=2, default=str, ensure_ascii=False)
+                if serialized is not None:
+                    data_file.write_bytes(serialized)
+                else:
+                    with open(data_file, "w", encoding="utf-8") as f:
+                        json.dump(data, f, indent=2, default=str, ensure_ascii=False)
 
                 # Store metadata
                 metadata_dict = {
@@ -5,14 +5,18 @@ part of the public API surface. Import stability is only guaranteed through
 `importobot.JsonToRobotConverter` and the modules under `importobot.api`.
 """
 
-from typing import NoReturn
+from types import ModuleType
+
+from importobot.utils.lazy_loader import import_internal_submodule
 
 __all__: list[str] = []
 
 
-def __getattr__(name: str) -> NoReturn:
+def __getattr__(name: str) -> ModuleType:
     """Prevent accidental access to internal service modules via attribute lookup."""
-    raise ModuleNotFoundError(
+    return import_internal_submodule(
+        __name__,
+        name,
         "importobot.services is internal and not part of the public API. "
-        "Import concrete modules directly or use importobot.api.* helpers."
+        "Import concrete modules directly or use importobot.api.* helpers.",
     )
@@ -9,13 +9,17 @@ implementations decoupled from business logic.
 
 from __future__ import annotations
 
+import importlib
+import random
 import time
 from collections import OrderedDict
-from collections.abc import Callable
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from typing import Any, ClassVar
 
 from importobot.config import OPTIMIZATION_CACHE_TTL_SECONDS
+from importobot.utils.lazy_loader import NUMPY
 from importobot.utils.optimization import (
     AnnealingConfig,
     GeneticAlgorithmOptimizer,
@@ -25,6 +29,7 @@ from importobot.utils.optimization import (
 )
 
 AlgorithmName = str
+EngineName = str
 
 
 @dataclass
@@ -37,6 +42,9 @@ class OptimizationScenario:
     algorithm: AlgorithmName = "gradient_descent"
     maximize: bool = False
     metadata: dict[str, Any] = field(default_factory=dict)
+    # Optional vectorized objective: parameter name -> column array in,
+    # one value per row out. Used by the NumPy engine instead of row mapping.
+    batch_objective: Callable[[Mapping[str, Any]], Any] | None = None
 
 
 @dataclass
@@ -56,6 +64,14 @@ class OptimizationService:
     keeps algorithm selection, optimizer configuration, and metadata collection
     centralized so downstream features can request optimization without knowing
     the implementation details of each algorithm.
+
+    Two engines are available. ``"python"`` runs the dict-based optimizers in
+    :mod:`importobot.utils.optimization`; ``"numpy"`` runs the batched,
+    multi-start optimizers in :mod:`importobot.utils.vectorized_optimization`
+    and needs the ``analytics`` extra. ``"auto"`` picks NumPy when it is
+    installed and the run is batched.
+    With one start, NumPy gradient descent matches the Python engine exactly;
+    stochastic algorithms are reproducible per engine for a given ``seed``.
     """
 
     SUPPORTED_ALGORITHMS: ClassVar[set[AlgorithmName]] = {
@@ -64,6 +80,8 @@ class OptimizationService:
         "simulated_annealing",
     }
 
+    SUPPORTED_ENGINES: ClassVar[set[EngineName]] = {"python", "numpy", "auto"}
+
     MAX_REGISTERED_SCENARIOS: ClassVar[int] = 32
     MAX_RESULT_HISTORY: ClassVar[int] = 64
 
@@ -72,9 +90,11 @@ class OptimizationService:
         default_algorithm: AlgorithmName = "gradient_descent",
         *,
         cache_ttl_seconds: int | None = None,
+        engine: EngineName = "python",
     ) -> None:
-        """Initialize optimization service with default algorithm."""
+        """Initialize optimization service with default algorithm and engine."""
         self.default_algorithm = default_algorithm
+        self.engine = self._validate_engine(engine)
         self._scenarios: OrderedDict[str, OptimizationScenario] = OrderedDict()
         self._results: OrderedDict[str, OptimizationOutcome] = OrderedDict()
         resolved_ttl = (
@@ -98,6 +118,7 @@ class OptimizationService:
         algorithm: AlgorithmName | None = None,
         maximize: bool = False,
         metadata: dict[str, Any] | None = None,
+        batch_objective: Callable[[Mapping[str, Any]], Any] | None = None,
     ) -> None:
         """Register an optimization scenario for later execution."""
         self._purge_expired_entries()
@@ -114,6 +135,7 @@ class OptimizationService:
             algorithm=chosen_algorithm,
             maximize=maximize,
             metadata=metadata or {},
+            batch_objective=batch_objective,
         )
 
         if name in self._scenarios:
@@ -140,8 +162,18 @@ class OptimizationService:
         gradient_config: OptimizerConfig | None = None,
         annealing_config: AnnealingConfig | None = None,
         genetic_optimizer: GeneticAlgorithmOptimizer | None = None,
+        engine: EngineName | None = None,
+        seed: int | None = None,
+        starts: int = 1,
+        workers: int = 1,
     ) -> OptimizationOutcome:
-        """Execute a registered optimization scenario and return the outcome."""
+        """Execute a registered optimization scenario and return the outcome.
+
+        ``seed`` makes stochastic algorithms reproducible. On the NumPy engine
+        ``starts`` runs several starting points (or annealing chains) at once,
+        and ``workers`` fans scalar objective calls out to a process pool; the
+        objective must then be picklable. Neither changes results for a seed.
+        """
         self._purge_expired_entries()
         if name not in self._scenarios:
             raise KeyError(f'Unknown optimization scenario "{name}"')
@@ -150,18 +182,31 @@ class OptimizationService:
         self._scenarios.move_to_end(name)
         chosen_algorithm = algorithm or scenario.algorithm
         self._touch_scenario(name)
+        if chosen_algorithm not in self.SUPPORTED_ALGORITHMS:
+            raise ValueError(
+                f'Unsupported algorithm "{chosen_algorithm}". Supported algorithms: '
+                f"{sorted(self.SUPPORTED_ALGORITHMS)}"
+            )
 
-        if chosen_algorithm == "gradient_descent":
-            return self._run_gradient_descent(name, scenario, gradient_config)
-        if chosen_algorithm == "simulated_annealing":
-            return self._run_simulated_annealing(name, scenario, annealing_config)
-        if chosen_algorithm == "genetic_algorithm":
-            return self._run_genetic_algorithm(name, scenario, genetic_optimizer)
+        if self._resolve_engine(engine, chosen_algorithm, starts) == "numpy":
+            run = _VectorizedRun(
+                scenario=scenario,
+                algorithm=chosen_algorithm,
+                gradient_config=gradient_config,
+                annealing_config=annealing_config,
+                genetic_optimizer=genetic_optimizer,
+                seed=seed,
+                starts=starts,
+                workers=workers,
+            )
+            return self._run_vectorized(name, run)
 
-        raise ValueError(
-            f'Unsupported algorithm "{chosen_algorithm}". Supported algorithms: '
-            f"{sorted(self.SUPPORTED_ALGORITHMS)}"
-        )
+        with _seeded_random(seed):
+            if chosen_algorithm == "gradient_descent":
+                return self._run_gradient_descent(name, scenario, gradient_config)
+            if chosen_algorithm == "simulated_annealing":
+                return self._run_simulated_annealing(name, scenario, annealing_config)
+            return self._run_genetic_algorithm(name, scenario, genetic_optimizer)
 
     def last_result(self, name: str) -> OptimizationOutcome | None:
         """Return the last cached result for a scenario, if any."""
@@ -262,6 +307,88 @@ class OptimizationService:
         )
         return self._cache_result(name, outcome)
 
+    def _run_vectorized(self, name: str, run: _VectorizedRun) -> OptimizationOutcome:
+        """Run a scenario on the NumPy engine."""
+        # Imported on demand so NumPy is only loaded when the engine is used.
+        vectorized = importlib.import_module("importobot.utils.vectorized_optimization")
+
+        scenario = run.scenario
+        space = vectorized.ParameterSpace.build(
+            scenario.initial_parameters,
+            scenario.parameter_bounds,
+            self._ensure_parameter_ranges(
+                scenario.initial_parameters, scenario.parameter_bounds
+            ),
+        )
+        with vectorized.BatchEvaluator(
+            space,
+            scenario.objective_function,
+            batch_objective=scenario.batch_objective,
+            workers=run.workers,
+        ) as evaluator:
+            if run.algorithm == "gradient_descent":
+                parameters, score, metadata = vectorized.VectorizedGradientDescent(
+                    run.gradient_config, n_starts=run.starts, seed=run.seed
+                ).optimize(evaluator, scenario.initial_parameters)
+            elif run.algorithm == "simulated_annealing":
+                parameters, score, metadata = (
+                    vectorized.multi_chain_simulated_annealing(
+                        evaluator,
+                        scenario.initial_parameters,
+                        config=run.annealing_config,
+                        chains=run.starts,
+                        seed=run.seed,
+                    )
+                )
+            else:
+                parameters, score, metadata = vectorized.vectorized_genetic_algorithm(
+                    evaluator,
+                    scenario.initial_parameters,
+                    maximize=scenario.maximize,
+                    settings=vectorized.GeneticSettings.from_optimizer(
+                        run.genetic_optimizer
+                    ),
+                    seed=run.seed,
+                )
+
+        outcome = OptimizationOutcome(
+            algorithm=run.algorithm,
+            parameters=parameters,
+            score=score,
+            details={
+                "metadata": metadata,
+                "maximize": scenario.maximize,
+                "engine": "numpy",
+            },
+        )
+        return self._cache_result(name, outcome)
+
+    def _validate_engine(self, engine: EngineName) -> EngineName:
+        """Reject unknown engine names."""
+        if engine not in self.SUPPORTED_ENGINES:
+            raise ValueError(
+                f'Unsupported engine "{engine}". Supported engines: '
+                f"{sorted(self.SUPPORTED_ENGINES)}"
+            )
+        return engine
+
+    def _resolve_engine(
+        self, engine: EngineName | None, algorithm: AlgorithmName, starts: int
+    ) -> EngineName:
+        """Return the concrete engine to run, checking NumPy when required.
+
+        ``"auto"`` only picks NumPy when a step evaluates many points at once
+        (several starts or a genetic population); a single low-dimensional
+        chain runs faster on plain floats than on tiny arrays.
+        """
+        chosen = self._validate_engine(engine or self.engine)
+        if chosen == "auto":
+            batched = starts > 1 or algorithm == "genetic_algorithm"
+            return "numpy" if batched and NUMPY.available else "python"
+        if chosen == "numpy":
+            _ = NUMPY.module  # Raises an informative ImportError when missing.
+        return chosen
+
     # Cache bookkeeping helpers -------------------------------------------------
 
     def _current_time(self) -> float:
@@ -326,6 +453,34 @@ class OptimizationService:
         return parameter_ranges
 
 
+@dataclass
+class _VectorizedRun:
+    """Options for one execution on the NumPy engine."""
+
+    scenario: OptimizationScenario
+    algorithm: AlgorithmName
+    gradient_config: OptimizerConfig | None
+    annealing_config: AnnealingConfig | None
+    genetic_optimizer: GeneticAlgorithmOptimizer | None
+    seed: int | None
+    starts: int
+    workers: int
+
+
+@contextmanager
+def _seeded_random(seed: int | None) -> Iterator[None]:
+    """Seed the global RNG for one run, restoring the caller's state after."""
+    if seed is None:
+        yield
+        return
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(state)
+
+
 __all__ = [
     "OptimizationOutcome",
     "OptimizationScenario",
@@ -24,6 +24,8 @@ from typing import (
 
 from importobot.services.security_types import SecurityLevel
 from importobot.services.validation_service import ValidationService
+from importobot.telemetry import telemetry_span
+from importobot.utils.lazy_loader import LazyModule
 from importobot.utils.logging import get_logger
 from importobot.utils.security import SecurityValidator
 from importobot.utils.validation import (
@@ -34,15 +36,20 @@ from importobot.utils.validation import (
     validate_safe_path,
 )
 
-bleach: Any | None = None
-_BLEACH_AVAILABLE = False
-try:
-    import bleach as _bleach_module  # type: ignore[import-untyped]
+# bleach (and its vendored html5lib) is imported on the first sanitization
+# rather than with this module. Setting ``bleach`` to None forces the
+# lightweight regex-based mode.
+bleach: Any | None = LazyModule("bleach")
 
-    bleach = _bleach_module
-    _BLEACH_AVAILABLE = True
-except ImportError:  # pragma: no cover - lightweight security mode
-    pass
+
+def _resolve_bleach_clean() -> Any | None:
+    """Return ``bleach.clean``, or None when bleach is disabled or missing."""
+    if bleach is None:
+        return None
+    try:
+        return bleach.clean
+    except ImportError:
+        return None
 
 
 class _BleachState:
@@ -352,6 +359,16 @@ class SecurityGateway:
         Raises:
             SecurityError: If input fails security validation
         """
+        with telemetry_span(f"security.sanitize.{input_type}"):
+            return self._sanitize_api_input(data, input_type, context)
+
+    def _sanitize_api_input(
+        self,
+        data: Any,
+        input_type: str,
+        context: Mapping[str, Any] | None,
+    ) -> SanitizationResult:
+        """Run type-specific sanitization followed by universal checks."""
         self._enforce_rate_limit(f"sanitize_{input_type}")
         context_dict: dict[str, Any] = dict(context or {})
         correlation_id = self._extract_correlation_id(context_dict)
@@ -519,8 +536,9 @@ class SecurityGateway:
 
         # Apply HTML sanitization using optimized bleach when available,
         # otherwise use lightweight regex-based sanitization.
-        if _BLEACH_AVAILABLE and bleach is not None:
-            sanitized_string = bleach.clean(
+        bleach_clean = _resolve_bleach_clean()
+        if bleach_clean is not None:
+            sanitized_string = bleach_clean(
                 data,
                 tags=[],
                 attributes={},
@@ -5,12 +5,22 @@ The ValidationService provides:
 - Centralized error handling
 - Domain-specific validation strategies
 - Performance optimization through caching
+
+Cross-validation assigns record ``i`` to fold ``i % k_folds``, so fold
+membership is deterministic and identical for in-memory and streamed data.
+Folds (or, when streaming, chunks of records) can be evaluated in a process
+pool; their results are merged in submission order, so the worker count never
+changes the outcome.
 """
 
 from __future__ import annotations
 
 import math
 import statistics
+from collections import deque
+from collections.abc import Generator, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
 from typing import Any, Protocol
 
 from importobot.services.strategies import (
@@ -20,6 +30,32 @@ from importobot.services.strategies import (
 )
 from importobot.utils.validation_models import ValidationResult, ValidationSeverity
 
+CROSS_VALIDATION_CHUNK_SIZE = 1000  # Records per task when streaming
+MIN_FOLDS_FOR_EARLY_EXIT = 3  # Fold scores needed before trusting an interval
+
+# Per-process copy of the service, installed by the pool initializer
+_WORKER_STATE: dict[str, ValidationService] = {}
+
+
+def _init_cross_validation_worker(service: ValidationService) -> None:
+    """Install the service whose strategies this worker process evaluates."""
+    _WORKER_STATE["service"] = service
+
+
+def _run_in_worker(method: str, args: tuple[Any, ...]) -> Any:
+    """Call ``method`` of the worker's service with ``args``."""
+    return getattr(_WORKER_STATE["service"], method)(*args)
+
+
+def _record_chunks(
+    records: Iterator[Any], chunk_size: int
+) -> Iterator[tuple[int, list[Any]]]:
+    """Yield ``(start_index, chunk)`` pairs read lazily from ``records``."""
+    start = 0
+    while chunk := list(islice(records, chunk_size)):
+        yield start, chunk
+        start += len(chunk)
+
 
 class ValidationStrategy(Protocol):
     """Protocol for domain-specific validation strategies."""
@@ -158,17 +194,30 @@ class ValidationService:
         strategies: list[str],
         k_folds: int = 5,
         context: dict[str, Any] | None = None,
+        *,
+        workers: int = 1,
+        ci_tolerance: float | None = None,
+        streaming: bool = False,
+        chunk_size: int = CROSS_VALIDATION_CHUNK_SIZE,
     ) -> dict[str, Any]:
         """Perform k-fold cross-validation on data using multiple strategies.
 
         Assess the reliability and consistency of validation results across
-        different data subsets and validation strategies.
+        different data subsets and validation strategies. A strategy's fold
+        score is the fraction of the fold's records that pass it.
 
         Args:
             data: Data to validate (must be iterable for cross-validation)
             strategies: List of strategy names to apply
             k_folds: Number of folds for cross-validation (default: 5)
             context: Additional validation context
+            workers: Worker processes evaluating folds; 1 evaluates in-process.
+                Strategies must be picklable when greater than 1.
+            ci_tolerance: Stop once every strategy's 95% confidence interval
+                is at most this wide
+            streaming: Read ``data`` lazily in chunks instead of materializing
+                it; scores are the same as without streaming
+            chunk_size: Records per task in streaming mode
 
         Returns:
             Dictionary containing cross-validation metrics including:
@@ -176,17 +225,37 @@ class ValidationService:
             - strategy_consistency: Consistency scores across folds
             - overall_reliability: Overall validation reliability score
             - confidence_intervals: Statistical confidence intervals
+            - early_stopped: Whether ``ci_tolerance`` ended the run early
 
         Raises:
             ValueError: If data is not iterable or k_folds is invalid
         """
-        # Validate inputs
-        data_list = self._validate_cross_validation_inputs(data, k_folds)
-
-        # Perform k-fold validation
-        fold_results, strategy_scores = self._perform_k_fold_validation(
-            data_list, strategies, k_folds, context
-        )
+        self._check_cross_validation_options(workers, ci_tolerance, chunk_size)
+        if streaming:
+            self._check_cross_validation_data(data, k_folds)
+            fold_results, strategy_scores, total_size, early_stopped = (
+                self._stream_k_fold_validation(
+                    iter(data),
+                    strategies,
+                    k_folds,
+                    context,
+                    workers=workers,
+                    ci_tolerance=ci_tolerance,
+                    chunk_size=chunk_size,
+                )
+            )
+        else:
+            data_list = self._validate_cross_validation_inputs(data, k_folds)
+            fold_results, strategy_scores = self._perform_k_fold_validation(
+                data_list,
+                strategies,
+                k_folds,
+                context,
+                workers=workers,
+                ci_tolerance=ci_tolerance,
+            )
+            total_size = len(data_list)
+            early_stopped = len(fold_results) < k_folds
 
         # Calculate consistency metrics
         strategy_consistency = self._calculate_strategy_consistency(strategy_scores)
@@ -196,90 +265,288 @@ class ValidationService:
 
         return {
             "k_folds": k_folds,
-            "total_data_size": len(data_list),
+            "total_data_size": total_size,
             "fold_results": fold_results,
             "strategy_consistency": strategy_consistency,
             "overall_reliability": overall_reliability,
+            "early_stopped": early_stopped,
             "recommendation": self._get_cross_validation_recommendation(
                 overall_reliability, strategy_consistency
             ),
         }
 
-    def _validate_cross_validation_inputs(self, data: Any, k_folds: int) -> list[Any]:
-        """Validate inputs for cross-validation."""
+    @staticmethod
+    def _check_cross_validation_options(
+        workers: int, ci_tolerance: float | None, chunk_size: int
+    ) -> None:
+        """Validate the execution options of a cross-validation run."""
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        if ci_tolerance is not None and ci_tolerance <= 0:
+            raise ValueError("ci_tolerance must be positive")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+
+    @staticmethod
+    def _check_cross_validation_data(data: Any, k_folds: int) -> None:
+        """Validate that data is iterable and k_folds is in range."""
         if not hasattr(data, "__iter__") or isinstance(data, str | bytes):
             raise ValueError("Data must be iterable for cross-validation")
 
         if k_folds < 2 or k_folds > 10:
             raise ValueError("k_folds must be between 2 and 10")
 
+    def _validate_cross_validation_inputs(self, data: Any, k_folds: int) -> list[Any]:
+        """Validate inputs for cross-validation."""
+        self._check_cross_validation_data(data, k_folds)
         data_list = list(data)
-        if len(data_list) < k_folds:
-            raise ValueError(
-                f"Data size ({len(data_list)}) must be >= k_folds ({k_folds})"
-            )
-
+        self._check_data_size(len(data_list), k_folds)
         return data_list
 
+    @staticmethod
+    def _check_data_size(size: int, k_folds: int) -> None:
+        """Require at least one record per fold."""
+        if size < k_folds:
+            raise ValueError(f"Data size ({size}) must be >= k_folds ({k_folds})")
+
+    @staticmethod
+    def _fold_context(
+        context: dict[str, Any] | None, fold: int, k_folds: int
+    ) -> dict[str, Any]:
+        """Return ``context`` enriched with fold-specific information."""
+        fold_context = (context or {}).copy()
+        fold_context.update(
+            {
+                "fold_number": fold + 1,
+                "total_folds": k_folds,
+                "is_cross_validation": True,
+            }
+        )
+        return fold_context
+
     def _perform_k_fold_validation(
         self,
         data_list: list[Any],
         strategies: list[str],
         k_folds: int,
         context: dict[str, Any] | None,
+        *,
+        workers: int = 1,
+        ci_tolerance: float | None = None,
     ) -> tuple[list[dict[str, Any]], dict[str, list[float]]]:
         """Perform k-fold validation and return results."""
-        fold_size = len(data_list) // k_folds
         fold_results = []
         strategy_scores: dict[str, list[float]] = {
             strategy: [] for strategy in strategies
         }
 
-        for fold in range(k_folds):
-            # Create train/validation split for this fold
-            start_idx = fold * fold_size
-            end_idx = start_idx + fold_size if fold < k_folds - 1 else len(data_list)
-
-            validation_data = data_list[start_idx:end_idx]
-            train_data = data_list[:start_idx] + data_list[end_idx:]
-
-            # Enrich context with fold-specific information
-            fold_context = (context or {}).copy()
-            fold_context.update(
-                {
-                    "fold_number": fold + 1,
-                    "total_folds": k_folds,
-                    "validation_size": len(validation_data),
-                    "train_size": len(train_data),
-                    "is_cross_validation": True,
-                }
-            )
-
-            # Validate using each strategy
-            fold_strategy_results = {}
-            for strategy in strategies:
-                results = self.validate_multiple(
-                    validation_data, [strategy], fold_context
+        def fold_tasks() -> Iterator[tuple[Any, ...]]:
+            for fold in range(k_folds):
+                validation_data = data_list[fold::k_folds]
+                fold_context = self._fold_context(context, fold, k_folds)
+                fold_context.update(
+                    {
+                        "validation_size": len(validation_data),
+                        "train_size": len(data_list) - len(validation_data),
+                    }
                 )
-                valid_ratio = (
-                    sum(1 for r in results if r.is_valid) / len(results)
-                    if results
-                    else 0.0
+                yield strategies, validation_data, fold_context
+
+        scores_by_fold = self._run_ordered("_fold_scores", fold_tasks(), workers)
+        try:
+            for fold, fold_strategy_results in enumerate(scores_by_fold):
+                validation_size = len(range(fold, len(data_list), k_folds))
+                for strategy, score in fold_strategy_results.items():
+                    strategy_scores[strategy].append(score)
+                fold_results.append(
+                    {
+                        "fold": fold + 1,
+                        "validation_size": validation_size,
+                        "train_size": len(data_list) - validation_size,
+                        "strategy_scores": fold_strategy_results,
+                    }
                 )
-                fold_strategy_results[strategy] = valid_ratio
-                strategy_scores[strategy].append(valid_ratio)
-
-            fold_results.append(
-                {
-                    "fold": fold + 1,
-                    "validation_size": len(validation_data),
-                    "train_size": len(train_data),
-                    "strategy_scores": fold_strategy_results,
-                }
-            )
+                if self._intervals_are_tight(strategy_scores, ci_tolerance, k_folds):
+                    break
+        finally:
+            scores_by_fold.close()
 
         return fold_results, strategy_scores
 
+    def _fold_scores(
+        self,
+        strategies: list[str],
+        validation_data: list[Any],
+        fold_context: dict[str, Any],
+    ) -> dict[str, float]:
+        """Score each strategy by the fraction of fold records that pass it.
+
+        Records are validated one at a time, as in streaming mode, so both
+        modes give the same scores for the same data.
+        """
+        fold_strategy_results = {}
+        for strategy in strategies:
+            passed = sum(
+                1
+                for record in validation_data
+                if self.validate(record, strategy, fold_context).is_valid
+            )
+            fold_strategy_results[strategy] = (
+                passed / len(validation_data) if validation_data else 0.0
+            )
+        return fold_strategy_results
+
+    def _stream_k_fold_validation(
+        self,
+        records: Iterator[Any],
+        strategies: list[str],
+        k_folds: int,
+        context: dict[str, Any] | None,
+        *,
+        workers: int,
+        ci_tolerance: float | None,
+        chunk_size: int,
+    ) -> tuple[list[dict[str, Any]], dict[str, list[float]], int, bool]:
+        """Score records one at a time, reading ``records`` chunk by chunk.
+
+        Returns:
+            Fold results, per-strategy fold scores, the number of records read
+            and whether the run stopped early.
+        """
+        fold_sizes = [0] * k_folds
+        valid_counts = [dict.fromkeys(strategies, 0) for _ in range(k_folds)]
+        read = 0
+
+        def tasks() -> Iterator[tuple[Any, ...]]:
+            nonlocal read
+            for start, chunk in _record_chunks(records, chunk_size):
+                read = start + len(chunk)
+                yield strategies, start, chunk, k_folds, context
+
+        early_stopped = False
+        chunk_results = self._run_ordered("_tally_records", tasks(), workers)
+        try:
+            for chunk_sizes, chunk_valid in chunk_results:
+                for fold in range(k_folds):
+                    fold_sizes[fold] += chunk_sizes[fold]
+                    for strategy, count in chunk_valid[fold].items():
+                        valid_counts[fold][strategy] += count
+                strategy_scores = self._streamed_scores(fold_sizes, valid_counts)
+                if self._intervals_are_tight(strategy_scores, ci_tolerance, k_folds):
+                    # Stopping after the last record is not an early stop
+                    early_stopped = read > sum(fold_sizes) or any(
+                        True for _ in islice(records, 1)
+                    )
+                    break
+        finally:
+            chunk_results.close()
+
+        total_size = sum(fold_sizes)
+        self._check_data_size(total_size, k_folds)
+        fold_results = [
+            {
+                "fold": fold + 1,
+                "validation_size": fold_sizes[fold],
+                "train_size": total_size - fold_sizes[fold],
+                "strategy_scores": {
+                    strategy: count / fold_sizes[fold]
+                    for strategy, count in valid_counts[fold].items()
+                },
+            }
+            for fold in range(k_folds)
+        ]
+        return (
+            fold_results,
+            self._streamed_scores(fold_sizes, valid_counts),
+            total_size,
+            early_stopped,
+        )
+
+    def _tally_records(
+        self,
+        strategies: list[str],
+        start: int,
+        records: list[Any],
+        k_folds: int,
+        context: dict[str, Any] | None,
+    ) -> tuple[list[int], list[dict[str, int]]]:
+        """Validate a chunk of records, counting records and passes per fold."""
+        fold_contexts = [
+            {**self._fold_context(context, fold, k_folds), "streaming": True}
+            for fold in range(k_folds)
+        ]
+        sizes = [0] * k_folds
+        valid = [dict.fromkeys(strategies, 0) for _ in range(k_folds)]
+        for index, record in enumerate(records, start=start):
+            fold = index % k_folds
+            sizes[fold] += 1
+            for strategy in strategies:
+                if self.validate(record, strategy, fold_contexts[fold]).is_valid:
+                    valid[fold][strategy] += 1
+        return sizes, valid
+
+    @staticmethod
+    def _streamed_scores(
+        fold_sizes: list[int], valid_counts: list[dict[str, int]]
+    ) -> dict[str, list[float]]:
+        """Return each strategy's pass ratio in every non-empty fold."""
+        scores: dict[str, list[float]] = {}
+        for size, counts in zip(fold_sizes, valid_counts, strict=True):
+            for strategy, count in counts.items():
+                ratios = scores.setdefault(strategy, [])
+                if size:
+                    ratios.append(count / size)
+        return scores
+
+    def _intervals_are_tight(
+        self,
+        strategy_scores: dict[str, list[float]],
+        ci_tolerance: float | None,
+        k_folds: int,
+    ) -> bool:
+        """Return True when every strategy's 95% interval fits the tolerance."""
+        if ci_tolerance is None or not strategy_scores:
+            return False
+        required = min(MIN_FOLDS_FOR_EARLY_EXIT, k_folds)
+        for scores in strategy_scores.values():
+            if len(scores) < required:
+                return False
+            lower, upper = self._calculate_confidence_interval(scores, 0.95)
+            if upper - lower > ci_tolerance:
+                return False
+        return True
+
+    def _run_ordered(
+        self, method: str, tasks: Iterable[tuple[Any, ...]], workers: int
+    ) -> Generator[Any, None, None]:
+        """Yield ``method(*task)`` for each task, in task order.
+
+        With more than one worker the tasks run in a process pool holding a
+        copy of this service. At most two tasks per worker are in flight, so
+        lazily produced tasks are read only as results are consumed; closing
+        the iterator cancels the tasks not yet started.
+        """
+        if workers == 1:
+            for args in tasks:
+                yield getattr(self, method)(*args)
+            return
+
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_cross_validation_worker,
+            initargs=(self,),
+        )
+        pending: deque[Future[Any]] = deque()
+        try:
+            for args in tasks:
+                pending.append(executor.submit(_run_in_worker, method, args))
+                if len(pending) >= 2 * workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
     def _calculate_strategy_consistency(
         self, strategy_scores: dict[str, list[float]]
     ) -> dict[str, Any]:
@@ -4,9 +4,14 @@ from __future__ import annotations
 
 import json
 import os
+import tempfile
 import threading
 import time
+from bisect import bisect_left
 from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from types import TracebackType
 
 from importobot.utils.logging import get_logger
 
@@ -14,6 +19,29 @@ logger = get_logger()
 
 TelemetryPayload = dict[str, object]
 TelemetryExporter = Callable[[str, TelemetryPayload], None]
+MetricsSnapshot = dict[str, object]
+MetricsExporter = Callable[[MetricsSnapshot], None]
+
+# Upper bounds (seconds) for stage timing histograms. The final +Inf bucket is
+# implicit, matching the Prometheus histogram convention.
+DEFAULT_TIMING_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+_NULL_SPAN: AbstractContextManager[None] = nullcontext()
 
 
 def _flag_from_env(var_name: str, default: bool = False) -> bool:
@@ -46,6 +74,182 @@ def _int_from_env(var_name: str, default: int) -> int:
         return default
 
 
+class _Histogram:
+    """Fixed-bucket histogram storing only counts, sum, min and max."""
+
+    __slots__ = ("bounds", "bucket_counts", "count", "maximum", "minimum", "total")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.bucket_counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.bucket_counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def to_dict(self) -> dict[str, object]:
+        cumulative = 0
+        buckets: dict[str, int] = {}
+        labels = [repr(bound) for bound in self.bounds] + ["+Inf"]
+        for label, bucket_count in zip(labels, self.bucket_counts, strict=True):
+            cumulative += bucket_count
+            buckets[label] = cumulative
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "min": self.minimum if self.count else 0.0,
+            "max": self.maximum,
+            "mean": self.total / self.count if self.count else 0.0,
+            "buckets": buckets,
+        }
+
+
+class MetricsAggregator:
+    """Aggregate stage timings and counters in memory.
+
+    Observations only update a handful of integers under a lock, so the
+    aggregator can sit on hot paths; exporters receive a snapshot on demand.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_TIMING_BUCKETS) -> None:
+        """Initialize an empty aggregator with the given histogram buckets."""
+        self._buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._histograms: dict[str, _Histogram] = {}
+        self._counters: dict[str, float] = {}
+
+    def observe(self, stage: str, seconds: float) -> None:
+        """Record a single duration for ``stage``."""
+        with self._lock:
+            histogram = self._histograms.get(stage)
+            if histogram is None:
+                histogram = self._histograms[stage] = _Histogram(self._buckets)
+            histogram.observe(seconds)
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Add ``value`` to the counter ``name``."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Return a JSON-serializable copy of the current aggregates."""
+        with self._lock:
+            timings = {
+                stage: histogram.to_dict()
+                for stage, histogram in sorted(self._histograms.items())
+            }
+            counters = dict(sorted(self._counters.items()))
+        return {"timestamp": time.time(), "timings": timings, "counters": counters}
+
+    def reset(self) -> None:
+        """Drop all recorded timings and counters."""
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+
+class _TimingSpan:
+    """Context manager that records elapsed wall time into an aggregator."""
+
+    __slots__ = ("_aggregator", "_stage", "_start")
+
+    def __init__(self, aggregator: MetricsAggregator, stage: str) -> None:
+        self._aggregator = aggregator
+        self._stage = stage
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._aggregator.observe(self._stage, time.perf_counter() - self._start)
+        if exc_type is not None:
+            self._aggregator.increment(f"{self._stage}.errors")
+
+
+def _write_atomically(path: Path, content: str) -> None:
+    """Replace ``path`` with ``content`` so scrapers never see partial files."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(content)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _prometheus_name(namespace: str, name: str) -> str:
+    """Convert a dotted metric name into a valid Prometheus identifier."""
+    cleaned = "".join(ch if ch.isalnum() else "_" for ch in name)
+    return f"{namespace}_{cleaned}" if namespace else cleaned
+
+
+class PrometheusTextExporter:
+    """Write metric snapshots in the Prometheus text exposition format.
+
+    The output is suitable for the node_exporter textfile collector.
+    """
+
+    def __init__(self, path: str | Path, *, namespace: str = "importobot") -> None:
+        """Initialize the exporter with the target file path."""
+        self.path = Path(path)
+        self.namespace = namespace
+
+    def render(self, snapshot: MetricsSnapshot) -> str:
+        """Render ``snapshot`` as Prometheus exposition text."""
+        lines: list[str] = []
+        timings = snapshot.get("timings", {})
+        if isinstance(timings, dict) and timings:
+            metric = _prometheus_name(self.namespace, "stage_duration_seconds")
+            lines.append(f"# HELP {metric} Time spent in importobot pipeline stages.")
+            lines.append(f"# TYPE {metric} histogram")
+            for stage, data in timings.items():
+                label = f'stage="{stage}"'
+                for bound, cumulative in data["buckets"].items():
+                    lines.append(
+                        f'{metric}_bucket{{{label},le="{bound}"}} {cumulative}'
+                    )
+                lines.append(f"{metric}_sum{{{label}}} {data['sum']!r}")
+                lines.append(f"{metric}_count{{{label}}} {data['count']}")
+        counters = snapshot.get("counters", {})
+        if isinstance(counters, dict):
+            for name, value in counters.items():
+                metric = _prometheus_name(self.namespace, f"{name}_total")
+                lines.append(f"# TYPE {metric} counter")
+                lines.append(f"{metric} {value!r}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def __call__(self, snapshot: MetricsSnapshot) -> None:
+        """Write ``snapshot`` to the configured path."""
+        _write_atomically(self.path, self.render(snapshot))
+
+
+class JsonSnapshotExporter:
+    """Write metric snapshots as a JSON document."""
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the exporter with the target file path."""
+        self.path = Path(path)
+
+    def __call__(self, snapshot: MetricsSnapshot) -> None:
+        """Write ``snapshot`` to the configured path."""
+        _write_atomically(self.path, json.dumps(snapshot, indent=2, sort_keys=True))
+
+
 class TelemetryClient:
     """Provide a simple telemetry client with basic rate limiting."""
 
@@ -61,6 +265,8 @@ class TelemetryClient:
         self._lock = threading.Lock()
         self._last_emit: dict[str, tuple[int, float]] = {}
         self._exporters: list[TelemetryExporter] = [self._default_logger_exporter]
+        self._metrics = MetricsAggregator()
+        self._metrics_exporters: list[MetricsExporter] = []
 
     def register_exporter(self, exporter: TelemetryExporter) -> None:
         """Register an exporter that receives telemetry events."""
@@ -117,6 +323,42 @@ class TelemetryClient:
 
         self._emit("cache_metrics", payload)
 
+    # ---------------------------------------------------------------------
+    # Stage timings and counters
+    def span(self, stage: str) -> AbstractContextManager[None]:
+        """Return a context manager that times the enclosed block as ``stage``."""
+        return _TimingSpan(self._metrics, stage)
+
+    def record_timing(self, stage: str, seconds: float) -> None:
+        """Record an externally measured duration for ``stage``."""
+        self._metrics.observe(stage, seconds)
+
+    def increment_counter(self, name: str, value: float = 1) -> None:
+        """Increment the counter ``name`` by ``value``."""
+        self._metrics.increment(name, value)
+
+    def metrics_snapshot(self) -> MetricsSnapshot:
+        """Return the aggregated stage timings and counters."""
+        return self._metrics.snapshot()
+
+    def reset_metrics(self) -> None:
+        """Discard aggregated stage timings and counters."""
+        self._metrics.reset()
+
+    def register_metrics_exporter(self, exporter: MetricsExporter) -> None:
+        """Register an exporter that receives metric snapshots on export."""
+        with self._lock:
+            self._metrics_exporters.append(exporter)
+
+    def export_metrics(self) -> MetricsSnapshot:
+        """Push the current snapshot to every registered metrics exporter."""
+        snapshot = self._metrics.snapshot()
+        with self._lock:
+            exporters = list(self._metrics_exporters)
+        for exporter in exporters:
+            self._export_with(exporter, snapshot)
+        return snapshot
+
     # ---------------------------------------------------------------------
     # Internals
     def _emit(self, event_name: str, payload: TelemetryPayload) -> None:
@@ -126,6 +368,15 @@ class TelemetryClient:
         for exporter in list(self._exporters):
             self._emit_with_exporter(exporter, event_name, payload)
 
+    def _export_with(
+        self, exporter: MetricsExporter, snapshot: MetricsSnapshot
+    ) -> None:
+        """Invoke a single metrics exporter while isolating failure handling."""
+        try:
+            exporter(snapshot)
+        except Exception:  # pragma: no cover - telemetry failures shouldn't crash
+            logger.exception("Metrics exporter %s failed", exporter)
+
     def _default_logger_exporter(
         self, event_name: str, payload: TelemetryPayload
     ) -> None:
@@ -145,6 +396,16 @@ class TelemetryClient:
             logger.exception("Telemetry exporter %s failed", exporter)
 
 
+def _register_env_metrics_exporters(client: TelemetryClient) -> None:
+    """Attach file exporters configured through environment variables."""
+    prometheus_path = os.getenv("IMPORTOBOT_TELEMETRY_PROMETHEUS_FILE")
+    if prometheus_path:
+        client.register_metrics_exporter(PrometheusTextExporter(prometheus_path))
+    json_path = os.getenv("IMPORTOBOT_TELEMETRY_JSON_SNAPSHOT")
+    if json_path:
+        client.register_metrics_exporter(JsonSnapshotExporter(json_path))
+
+
 class _TelemetryClientHolder:
     """Thread-safe singleton holder for the telemetry client."""
 
@@ -173,6 +434,7 @@ class _TelemetryClientHolder:
                             min_emit_interval=min_interval,
                             min_sample_delta=min_delta,
                         )
+                        _register_env_metrics_exporters(self._client)
                     else:
                         self._client = None
                     self._initialized = True
@@ -184,6 +446,12 @@ class _TelemetryClientHolder:
             self._client = None
             self._initialized = False
 
+    def set_client(self, client: TelemetryClient | None) -> None:
+        """Install ``client`` as the global instance, bypassing env lookup."""
+        with self._lock:
+            self._client = client
+            self._initialized = True
+
 
 _HOLDER = _TelemetryClientHolder()
 
@@ -198,6 +466,16 @@ def reset_telemetry_client() -> None:
     _HOLDER.reset_client()
 
 
+def set_telemetry_client(client: TelemetryClient | None) -> None:
+    """Install ``client`` as the global telemetry client.
+
+    Used by tooling such as the CLI profiler that needs stage timings even when
+    telemetry is disabled through the environment. Passing None disables
+    telemetry until the next reset.
+    """
+    _HOLDER.set_client(client)
+
+
 def register_telemetry_exporter(exporter: TelemetryExporter) -> None:
     """Register a custom telemetry exporter on the global client.
 
@@ -226,3 +504,35 @@ def restore_default_telemetry_exporter() -> None:
     client = get_telemetry_client()
     if client is not None:
         client.restore_default_exporter()
+
+
+def telemetry_span(stage: str) -> AbstractContextManager[None]:
+    """Time the enclosed block as ``stage`` on the global client.
+
+    Returns a shared no-op context manager when telemetry is disabled.
+    """
+    client = get_telemetry_client()
+    if client is None:
+        return _NULL_SPAN
+    return client.span(stage)
+
+
+def increment_telemetry_counter(name: str, value: float = 1) -> None:
+    """Increment a counter on the global client.
+
+    No-op if telemetry is disabled.
+    """
+    client = get_telemetry_client()
+    if client is not None:
+        client.increment_counter(name, value)
+
+
+def export_telemetry_metrics() -> MetricsSnapshot | None:
+    """Export aggregated metrics from the global client.
+
+    Returns the exported snapshot, or None if telemetry is disabled.
+    """
+    client = get_telemetry_client()
+    if client is None:
+        return None
+    return client.export_metrics()
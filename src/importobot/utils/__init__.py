@@ -4,16 +4,20 @@ This module contains implementation utilities and should not be accessed
 directly. Use public validation functions through importobot.api.validation instead.
 """
 
-from typing import NoReturn
+from types import ModuleType
+
+from importobot.utils.lazy_loader import import_internal_submodule
 
 # No public exports - these are implementation details
 # Access public validation utilities through importobot.api.validation
 __all__: list[str] = []
 
 
-def __getattr__(name: str) -> NoReturn:
+def __getattr__(name: str) -> ModuleType:
     """Guard against accidental use of internal utility modules."""
-    raise ModuleNotFoundError(
+    return import_internal_submodule(
+        __name__,
+        name,
         "importobot.utils is internal. "
-        "Use importobot.api.validation for supported utilities."
+        "Use importobot.api.validation for supported utilities.",
     )
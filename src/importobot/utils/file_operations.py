@@ -25,7 +25,7 @@ class ConversionContext:
 
 def process_single_file_with_suggestions(
     args: Any,
-    convert_file_func: Callable[[str, str], None] | None = None,
+    convert_file_func: Callable[[str, str], object] | None = None,
     apply_suggestions_func: (
         Callable[
             [dict[str, Any] | list[Any]],
@@ -144,7 +144,7 @@ def temporary_json_file(
 def convert_with_temp_file(
     conversion_data: dict[str, Any] | list[Any],
     robot_filename: str,
-    convert_file_func: Callable[[str, str], None],
+    convert_file_func: Callable[[str, str], object],
     context: ConversionContext | None = None,
 ) -> None:
     """Convert data using a temporary file and optionally display changes.
@@ -167,7 +167,7 @@ def convert_with_temp_file(
 def save_improved_json_and_convert(
     improved_data: dict[str, Any] | list[Any],
     base_name: str,
-    convert_file_func: Callable[[str, str], None],
+    convert_file_func: Callable[[str, str], object],
     context: ConversionContext | None = None,
     *,
     args: Any | None = None,
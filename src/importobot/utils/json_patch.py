@@ -0,0 +1,224 @@
+"""Copy-on-write helpers and RFC 6902 JSON Patch support for JSON documents."""
+
+from typing import Any
+
+from importobot import exceptions
+
+PatchOperation = dict[str, Any]
+
+
+def copy_containers(value: Any) -> Any:
+    """Copy the dicts and lists of a JSON value, sharing immutable leaves.
+
+    JSON documents only hold dicts, lists and immutable scalars, so rebuilding
+    the containers is enough to isolate mutations and much cheaper than
+    ``copy.deepcopy``, which keeps a memo of every object it visits.
+    """
+    if isinstance(value, dict):
+        return {key: copy_containers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [copy_containers(item) for item in value]
+    return value
+
+
+def escape_pointer_token(token: str | int) -> str:
+    """Escape a key or index for use in a JSON Pointer (RFC 6901)."""
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape_pointer_token(token: str) -> str:
+    """Reverse :func:`escape_pointer_token`."""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def join_pointer(base: str, token: str | int) -> str:
+    """Append a single reference token to a JSON Pointer."""
+    return f"{base}/{escape_pointer_token(token)}"
+
+
+def diff_json(original: Any, updated: Any, path: str = "") -> list[PatchOperation]:
+    """Return JSON Patch operations that turn ``original`` into ``updated``.
+
+    Dicts are compared key by key and lists by their common prefix and suffix,
+    so inserting a step into a long step list yields a single ``add``.
+    """
+    if original is updated:
+        return []
+    if isinstance(original, dict) and isinstance(updated, dict):
+        return _diff_dicts(original, updated, path)
+    if isinstance(original, list) and isinstance(updated, list):
+        return _diff_lists(original, updated, path)
+    if type(original) is type(updated) and original == updated:
+        return []
+    return [{"op": "replace", "path": path, "value": updated}]
+
+
+def _diff_dicts(
+    original: dict[str, Any], updated: dict[str, Any], path: str
+) -> list[PatchOperation]:
+    """Diff two JSON objects."""
+    operations: list[PatchOperation] = [
+        {"op": "remove", "path": join_pointer(path, key)}
+        for key in original
+        if key not in updated
+    ]
+    for key, value in updated.items():
+        child = join_pointer(path, key)
+        if key in original:
+            operations.extend(diff_json(original[key], value, child))
+        else:
+            operations.append({"op": "add", "path": child, "value": value})
+    return operations
+
+
+def _diff_lists(
+    original: list[Any], updated: list[Any], path: str
+) -> list[PatchOperation]:
+    """Diff two JSON arrays around their shared prefix and suffix."""
+    limit = min(len(original), len(updated))
+    prefix = 0
+    while prefix < limit and original[prefix] == updated[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and original[-1 - suffix] == updated[-1 - suffix]:
+        suffix += 1
+
+    old_middle = original[prefix : len(original) - suffix]
+    new_middle = updated[prefix : len(updated) - suffix]
+    shared = min(len(old_middle), len(new_middle))
+
+    operations: list[PatchOperation] = []
+    for offset in range(shared):
+        operations.extend(
+            diff_json(
+                old_middle[offset],
+                new_middle[offset],
+                join_pointer(path, prefix + offset),
+            )
+        )
+    # Remove from the end so earlier indices stay valid while applying.
+    operations.extend(
+        {"op": "remove", "path": join_pointer(path, prefix + offset)}
+        for offset in range(len(old_middle) - 1, shared - 1, -1)
+    )
+    operations.extend(
+        {
+            "op": "add",
+            "path": join_pointer(path, prefix + offset),
+            "value": new_middle[offset],
+        }
+        for offset in range(shared, len(new_middle))
+    )
+    return operations
+
+
+def apply_json_patch(document: Any, operations: list[PatchOperation]) -> Any:
+    """Apply ``add``/``remove``/``replace`` operations without mutating the input.
+
+    Only the containers along each patched path are copied, each at most once
+    per call; everything else is shared with ``document``.
+
+    Raises:
+        ValidationError: If an operation is unsupported or its path is invalid.
+    """
+    owned: set[int] = set()
+    result = document
+    for operation in operations:
+        result = _apply_operation(result, operation, owned)
+    return result
+
+
+def _apply_operation(document: Any, operation: PatchOperation, owned: set[int]) -> Any:
+    """Apply a single patch operation copy-on-write."""
+    op = operation.get("op")
+    if op not in {"add", "remove", "replace"}:
+        raise exceptions.ValidationError(f"Unsupported JSON Patch operation: {op}")
+    path = operation.get("path", "")
+    if path == "":
+        if op == "remove":
+            raise exceptions.ValidationError("Cannot remove the document root")
+        return operation["value"]
+    if not path.startswith("/"):
+        raise exceptions.ValidationError(f"Invalid JSON Pointer: {path!r}")
+
+    tokens = [_unescape_pointer_token(token) for token in path[1:].split("/")]
+    root = _own(document, owned, path)
+    parent = root
+    for token in tokens[:-1]:
+        key = _resolve_token(parent, token, path)
+        if isinstance(parent, list) and key >= len(parent):
+            raise exceptions.ValidationError(f"Index out of range: {path!r}")
+        child = _own(parent[key], owned, path)
+        parent[key] = child
+        parent = child
+
+    if isinstance(parent, list):
+        _apply_to_list(parent, tokens[-1], operation, path)
+    else:
+        _apply_to_dict(parent, tokens[-1], operation, path)
+    return root
+
+
+def _apply_to_list(
+    target: list[Any], token: str, operation: PatchOperation, path: str
+) -> None:
+    """Apply an operation to an owned JSON array."""
+    index = len(target) if token == "-" else _resolve_token(target, token, path)
+    if operation["op"] == "add":
+        if index > len(target):
+            raise exceptions.ValidationError(f"Index out of range: {path!r}")
+        target.insert(index, operation["value"])
+        return
+    if index >= len(target):
+        raise exceptions.ValidationError(f"Index out of range: {path!r}")
+    if operation["op"] == "remove":
+        del target[index]
+    else:
+        target[index] = operation["value"]
+
+
+def _apply_to_dict(
+    target: dict[str, Any], key: str, operation: PatchOperation, path: str
+) -> None:
+    """Apply an operation to an owned JSON object."""
+    if operation["op"] != "add" and key not in target:
+        raise exceptions.ValidationError(f"Path does not exist: {path!r}")
+    if operation["op"] == "remove":
+        del target[key]
+    else:
+        target[key] = operation["value"]
+
+
+def _own(container: Any, owned: set[int], path: str) -> Any:
+    """Return a private copy of one container level, copying it only once."""
+    if id(container) in owned:
+        return container
+    if isinstance(container, dict):
+        copied: Any = dict(container)
+    elif isinstance(container, list):
+        copied = list(container)
+    else:
+        raise exceptions.ValidationError(f"Path does not exist: {path!r}")
+    owned.add(id(copied))
+    return copied
+
+
+def _resolve_token(container: Any, token: str, path: str) -> Any:
+    """Turn a reference token into a dict key or list index."""
+    if isinstance(container, list):
+        if not token.isdigit():
+            raise exceptions.ValidationError(f"Invalid array index in {path!r}")
+        return int(token)
+    if token not in container:
+        raise exceptions.ValidationError(f"Path does not exist: {path!r}")
+    return token
+
+
+__all__ = [
+    "PatchOperation",
+    "apply_json_patch",
+    "copy_containers",
+    "diff_json",
+    "escape_pointer_token",
+    "join_pointer",
+]
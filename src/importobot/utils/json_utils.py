@@ -6,6 +6,7 @@ from typing import Any
 
 from importobot import exceptions
 from importobot.services.performance_cache import get_performance_cache
+from importobot.telemetry import telemetry_span
 from importobot.utils.validation import validate_safe_path
 
 _MULTI_TEST_CONTAINER_KEY = "testCases"
@@ -33,7 +34,8 @@ def load_json_file(json_file_path: str | None) -> dict[str, Any]:
     _check_file_exists(validated_path)
 
     # Load and process JSON data
-    return _load_and_process_json_data(validated_path)
+    with telemetry_span("json.load"):
+        return _load_and_process_json_data(validated_path)
 
 
 def _validate_file_path_input(json_file_path: str | None) -> str:
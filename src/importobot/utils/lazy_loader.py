@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import importlib
+import importlib.util
 import json
 from functools import lru_cache
 from pathlib import Path
@@ -27,6 +28,18 @@ def _simulate_preprocessing(
     return {"hash": accumulator, "frequency": frequency}
 
 
+def import_internal_submodule(package: str, name: str, message: str) -> ModuleType:
+    """Resolve ``package.name`` for an internal package's ``__getattr__`` guard.
+
+    Submodules are imported on demand, so ``from importobot.core import
+    converter`` works without the package importing everything eagerly; any
+    other attribute raises ``ModuleNotFoundError`` with ``message``.
+    """
+    if not name.startswith("_") and importlib.util.find_spec(f"{package}.{name}"):
+        return importlib.import_module(f"{package}.{name}")
+    raise ModuleNotFoundError(message)
+
+
 class LazyModule:
     """Lazy module loader that defers imports until first access."""
 
@@ -44,7 +57,7 @@ class LazyModule:
 
     def __getattr__(self, name: str) -> Any:
         """Load module on first attribute access."""
-        if self._module is None:
+        if self._module is None and self._import_error is None:
             self._load_module()
 
         if self._import_error:
@@ -249,20 +249,17 @@ class GradientDescentOptimizer:
         gradients = {}
         epsilon = 1e-8
 
-        objective_function(parameters)  # Call to establish baseline
-
-        for param in parameters:
-            # Compute forward difference
-            parameters_plus = parameters.copy()
-            parameters_plus[param] += epsilon
-            forward_value = objective_function(parameters_plus)
+        # Central differences need 2 evaluations per parameter. One probe dict
+        # is reused and restored after each parameter instead of copying twice.
+        probe = parameters.copy()
+        for param, value in parameters.items():
+            probe[param] = value + epsilon
+            forward_value = objective_function(probe)
 
-            # Compute backward difference
-            parameters_minus = parameters.copy()
-            parameters_minus[param] -= epsilon
-            backward_value = objective_function(parameters_minus)
+            probe[param] = value - epsilon
+            backward_value = objective_function(probe)
 
-            # Central difference for better accuracy
+            probe[param] = value
             gradients[param] = (forward_value - backward_value) / (2 * epsilon)
 
         return gradients
@@ -1,12 +1,105 @@
 """Regex compilation cache for improved performance.
 
 This module provides a centralized cache for compiled regex patterns
-to avoid repeated compilation of the same patterns.
+to avoid repeated compilation of the same patterns. Patterns handed out by
+the cache can optionally record cumulative matching time so the CLI
+profiler can report the most expensive expressions.
 """
 
 import re
+import threading
+import time
+from collections.abc import Callable
 from functools import lru_cache
 from re import Pattern
+from typing import Any, cast
+
+
+class _PatternTimingRegistry:
+    """Accumulate call counts and elapsed time per (pattern, flags) key."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self._lock = threading.Lock()
+        self._timings: dict[tuple[str, int], list[float]] = {}
+
+    def record(self, key: tuple[str, int], elapsed: float) -> None:
+        with self._lock:
+            entry = self._timings.get(key)
+            if entry is None:
+                self._timings[key] = [1, elapsed]
+            else:
+                entry[0] += 1
+                entry[1] += elapsed
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        with self._lock:
+            items = [
+                (key, int(calls), seconds)
+                for key, (calls, seconds) in self._timings.items()
+            ]
+        items.sort(key=lambda item: item[2], reverse=True)
+        return [
+            {
+                "pattern": pattern,
+                "flags": flags,
+                "calls": calls,
+                "cumulative_seconds": seconds,
+            }
+            for (pattern, flags), calls, seconds in items
+        ]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._timings.clear()
+
+
+_TIMINGS = _PatternTimingRegistry()
+
+
+class _TimedPattern:
+    """Compiled-pattern proxy that reports matching time to the registry."""
+
+    __slots__ = ("_key", "_pattern")
+
+    def __init__(self, pattern: Pattern[str], key: tuple[str, int]) -> None:
+        self._pattern = pattern
+        self._key = key
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pattern, name)
+
+    def _timed(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            _TIMINGS.record(self._key, time.perf_counter() - start)
+
+    def search(self, *args: Any, **kwargs: Any) -> Any:
+        return self._timed(self._pattern.search, *args, **kwargs)
+
+    def match(self, *args: Any, **kwargs: Any) -> Any:
+        return self._timed(self._pattern.match, *args, **kwargs)
+
+    def fullmatch(self, *args: Any, **kwargs: Any) -> Any:
+        return self._timed(self._pattern.fullmatch, *args, **kwargs)
+
+    def findall(self, *args: Any, **kwargs: Any) -> Any:
+        return self._timed(self._pattern.findall, *args, **kwargs)
+
+    def finditer(self, *args: Any, **kwargs: Any) -> Any:
+        # Materialize so the scan itself is attributed to this pattern
+        return iter(self._timed(lambda: list(self._pattern.finditer(*args, **kwargs))))
+
+    def sub(self, *args: Any, **kwargs: Any) -> Any:
+        return self._timed(self._pattern.sub, *args, **kwargs)
+
+    def subn(self, *args: Any, **kwargs: Any) -> Any:
+        return self._timed(self._pattern.subn, *args, **kwargs)
+
+    def split(self, *args: Any, **kwargs: Any) -> Any:
+        return self._timed(self._pattern.split, *args, **kwargs)
 
 
 def get_compiled_pattern(pattern: str, flags: int | re.RegexFlag = 0) -> Pattern[str]:
@@ -24,7 +117,10 @@ def get_compiled_pattern(pattern: str, flags: int | re.RegexFlag = 0) -> Pattern
         >>> pattern.findall('abc123def')
         ['123']
     """
-    return _compile_pattern(pattern, flags)
+    compiled = _compile_pattern(pattern, flags)
+    if _TIMINGS.enabled:
+        return cast(Pattern[str], _TimedPattern(compiled, (pattern, int(flags))))
+    return compiled
 
 
 @lru_cache(maxsize=512)
@@ -128,12 +224,44 @@ def get_cache_info() -> dict[str, int | None]:
     }
 
 
+def enable_pattern_timing() -> None:
+    """Record cumulative matching time for patterns obtained from the cache.
+
+    Only patterns fetched after enabling are timed; callers that hold on to
+    an earlier compiled pattern keep using it untimed.
+    """
+    _TIMINGS.enabled = True
+
+
+def disable_pattern_timing() -> None:
+    """Stop handing out timed patterns."""
+    _TIMINGS.enabled = False
+
+
+def get_pattern_timings() -> list[dict[str, Any]]:
+    """Get per-pattern call counts and cumulative time, slowest first.
+
+    Returns:
+        List of dictionaries with pattern, flags, calls and cumulative_seconds
+    """
+    return _TIMINGS.snapshot()
+
+
+def reset_pattern_timings() -> None:
+    """Discard recorded pattern timings."""
+    _TIMINGS.reset()
+
+
 __all__ = [
     "clear_cache",
+    "disable_pattern_timing",
+    "enable_pattern_timing",
     "findall_cached",
     "get_cache_info",
     "get_compiled_pattern",
+    "get_pattern_timings",
     "match_cached",
+    "reset_pattern_timings",
     "search_cached",
     "sub_cached",
 ]
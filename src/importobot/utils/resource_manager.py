@@ -120,7 +120,7 @@ class ResourceManager:
         try:
             disk_usage = psutil.disk_usage(output_dir)
             available_gb = disk_usage.free / (1024**3)
-            estimated_usage_gb = (total_tests * 5) / 1024  # 5KB per test
+            estimated_usage_gb = (total_tests * 5) / 1024**2  # 5KB per test
 
             if estimated_usage_gb > available_gb:
                 validation_errors.append(
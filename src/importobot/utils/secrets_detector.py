@@ -41,13 +41,20 @@ class SecretsDetector:
         (r"(?i)bearer\s+[A-Za-z0-9_\-]+\.[A-Za-z0-9_\-]+", "JWT Token"),
     )
 
+    def __init__(self) -> None:
+        """Compile the secret patterns once per detector."""
+        self._compiled_patterns = tuple(
+            (re.compile(pattern), secret_type)
+            for pattern, secret_type in self.SECRET_PATTERNS
+        )
+
     def scan(self, data: Any) -> list[SecretFinding]:
         """Scan arbitrary data for potential secrets."""
         corpus = self._flatten_to_strings(data)
         findings: list[SecretFinding] = []
         for text in corpus:
-            for pattern, secret_type in self.SECRET_PATTERNS:
-                for match in re.finditer(pattern, text):
+            for pattern, secret_type in self._compiled_patterns:
+                for match in pattern.finditer(text):
                     preview = match.group(0)
                     if len(preview) > 20:
                         preview = preview[:20] + "..."
@@ -0,0 +1,57 @@
+"""Small versioned JSON files holding state kept between runs.
+
+State files map string keys to JSON entries under a single field, next to a
+format version. A missing, corrupt or differently versioned file reads as
+empty, so a format change or a damaged file costs one cold run rather than
+an error. Writes go to a temporary sibling that is renamed into place, so
+concurrent readers never see a partial file.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+from importobot.utils.logging import get_logger
+
+logger = get_logger()
+
+
+class VersionedStateFile:
+    """JSON document of ``{"version": version, field: {key: entry}}``."""
+
+    def __init__(self, path: str | Path, *, version: int, field: str) -> None:
+        """Read and write the entries stored under ``field`` at ``path``."""
+        self.path = Path(path)
+        self.version = version
+        self.field = field
+
+    def read(self) -> dict[str, Any]:
+        """Load the entries, treating a missing or corrupt file as empty."""
+        try:
+            document = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as error:
+            if not isinstance(error, FileNotFoundError):
+                logger.warning("Ignoring unreadable state %s: %s", self.path, error)
+            return {}
+        if (
+            not isinstance(document, dict)
+            or document.get("version") != self.version
+            or not isinstance(document.get(self.field), dict)
+        ):
+            return {}
+        entries: dict[str, Any] = document[self.field]
+        return entries
+
+    def write(self, entries: dict[str, Any]) -> None:
+        """Write the entries to a temporary sibling and rename it into place."""
+        document = {"version": self.version, self.field: entries}
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+
+__all__ = ["VersionedStateFile"]
@@ -71,6 +71,45 @@ def format_step_comments(
     return lines
 
 
+COMMAND_STEP_KEYWORDS = frozenset(
+    {
+        "command:",
+        "execute",
+        "run",
+        "hash",
+        "blake",
+        "sha",
+        "md5",
+        "checksum",
+        "sum",
+        "compare",
+        "diff",
+        "echo",
+        "cat",
+        "ls",
+        "curl",
+    }
+)
+
+
+def is_command_step(step: dict[str, Any]) -> bool:
+    """Check whether a step's data or description mentions command execution.
+
+    Args:
+        step: Step dictionary
+
+    Returns:
+        True if any test data or description field contains a command keyword
+    """
+    for field_name in TEST_DATA_FIELD_NAMES + STEP_DESCRIPTION_FIELD_NAMES:
+        value = step.get(field_name)
+        if isinstance(value, str):
+            content = value.lower()
+            if any(token in content for token in COMMAND_STEP_KEYWORDS):
+                return True
+    return False
+
+
 def collect_command_steps(steps: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Collect steps that contain command execution.
 
@@ -80,32 +119,4 @@ def collect_command_steps(steps: list[dict[str, Any]]) -> list[dict[str, Any]]:
     Returns:
         List of steps containing command-related content
     """
-    command_steps = []
-    for step in steps:
-        if isinstance(step, dict):
-            # Look for command-related content in step data or description
-            for field_name in TEST_DATA_FIELD_NAMES + STEP_DESCRIPTION_FIELD_NAMES:
-                if field_name in step and isinstance(step[field_name], str):
-                    content = step[field_name].lower()
-                    # Check for command patterns
-                    keywords = {
-                        "command:",
-                        "execute",
-                        "run",
-                        "hash",
-                        "blake",
-                        "sha",
-                        "md5",
-                        "checksum",
-                        "sum",
-                        "compare",
-                        "diff",
-                        "echo",
-                        "cat",
-                        "ls",
-                        "curl",
-                    }
-                    if any(token in content for token in keywords):
-                        command_steps.append(step)
-                        break
-    return command_steps
+    return [step for step in steps if isinstance(step, dict) and is_command_step(step)]
@@ -2,8 +2,12 @@
 
 import json
 import random
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -27,6 +31,20 @@ from importobot.utils.test_generation.distributions import (
     DistributionManager,
     WeightsDict,
 )
+from importobot.utils.test_generation.sharding import (
+    DEFAULT_SHARD_SIZE,
+    JSONL_FILENAME,
+    OUTPUT_FORMATS,
+    SEEDED_REFERENCE_TIME,
+    ShardResult,
+    SuiteShard,
+    bundle_file_path,
+    case_file_path,
+    plan_test_suite,
+    split_into_shards,
+    to_json_line,
+    write_bundle,
+)
 from importobot.utils.test_generation.templates import TemplateManager
 
 # Resource limits to prevent exhaustion
@@ -90,7 +108,14 @@ class TestSuiteGenerator:
         self.resource_manager = get_resource_manager()
         self.logger = get_logger()
         self.secrets_detector = SecretsDetector()
+        self._scanned_templates: set[str] = set()
         self._file_write_queue: list[Any] = []
+        # Fixed "now" for reproducible suites; None means the wall clock.
+        self.reference_time: datetime | None = None
+
+    def _now(self) -> datetime:
+        """Return the reference time, falling back to the current time."""
+        return self.reference_time or datetime.now()
 
     def generate_realistic_test_data(self) -> dict[str, str]:
         """Generate realistic test data for enterprise scenarios."""
@@ -113,7 +138,7 @@ class TestSuiteGenerator:
             "auth_method": random.choice(auth_methods),
             "database": random.choice(databases),
             "system": random.choice(systems),
-            "timestamp": datetime.now().strftime("%Y%m%d%H%M%S"),
+            "timestamp": self._now().strftime("%Y%m%d%H%M%S"),
             "correlation_id": f"test_{random.randint(100000, 999999)}",
             "user_role": random.choice(["admin", "manager", "analyst", "operator"]),
             "business_unit": random.choice(["finance", "hr", "operations", "sales"]),
@@ -125,7 +150,12 @@ class TestSuiteGenerator:
         self, template: str, test_data: dict[str, str], step_index: int
     ) -> dict[str, Any]:
         """Generate a test step with enterprise context."""
-        findings = self.secrets_detector.scan({"template": template, "data": test_data})
+        self._refuse_secrets({"template": template, "data": test_data})
+        return self._build_enterprise_test_step(template, test_data, step_index)
+
+    def _refuse_secrets(self, payload: dict[str, Any]) -> None:
+        """Raise if the payload looks like it contains credentials."""
+        findings = self.secrets_detector.scan(payload)
         if findings:
             previews = ", ".join(
                 f"{finding.secret_type}: {finding.preview}" for finding in findings
@@ -138,6 +168,10 @@ class TestSuiteGenerator:
                 "Potential secrets detected; sanitize inputs before generation"
             )
 
+    def _build_enterprise_test_step(
+        self, template: str, test_data: dict[str, str], step_index: int
+    ) -> dict[str, Any]:
+        """Build a step from a template and test data already scanned for secrets."""
         try:
             step_description = template.format(**test_data)
             self.logger.debug(
@@ -405,9 +439,15 @@ class TestSuiteGenerator:
             category, scenario, num_steps
         )
 
+        # Every step shares the test data and templates repeat across test
+        # cases, so each is scanned for secrets once rather than once per step.
+        self._refuse_secrets({"data": test_data})
         steps = []
         for i, template in enumerate(selected_templates):
-            step = self.generate_enterprise_test_step(template, test_data, i)
+            if template not in self._scanned_templates:
+                self._refuse_secrets({"template": template})
+                self._scanned_templates.add(template)
+            step = self._build_enterprise_test_step(template, test_data, i)
             steps.append(step)
 
         return steps
@@ -422,7 +462,7 @@ class TestSuiteGenerator:
         test_context: dict[str, Any],
     ) -> dict[str, Any]:
         """Generate test case metadata."""
-        created_date = datetime.now() - timedelta(days=random.randint(1, 180))
+        created_date = self._now() - timedelta(days=random.randint(1, 180))
         updated_date = created_date + timedelta(days=random.randint(1, 30))
 
         return {
@@ -509,8 +549,30 @@ class TestSuiteGenerator:
         total_tests: int = 800,
         distribution: DistributionDict | None = None,
         weights: WeightsDict | None = None,
+        *,
+        seed: int | None = None,
+        workers: int = 1,
+        output_format: str = "files",
+        shard_size: int = DEFAULT_SHARD_SIZE,
     ) -> DistributionDict:
-        """Generate a test suite."""
+        """Generate a test suite.
+
+        By default each test case is written to its own file. Passing a
+        ``seed``, more than one worker or another ``output_format`` plans the
+        whole suite up front and generates it in shards of ``shard_size``
+        cases. Every shard draws from a seed derived from ``seed`` and its
+        position, so a seed reproduces the same suite for any worker count.
+        ``"jsonl"`` writes all cases to a single JSON Lines file and
+        ``"bundles"`` writes one ``testCases`` document per shard.
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(
+                f"Unsupported output format '{output_format}'. "
+                f"Expected one of: {', '.join(OUTPUT_FORMATS)}"
+            )
+        if workers < 1:
+            raise ValueError(f"workers must be at least 1, got {workers}")
+
         # Create output directory before validation
         Path(output_dir).mkdir(parents=True, exist_ok=True)
 
@@ -527,54 +589,174 @@ class TestSuiteGenerator:
                 total_tests, distribution, weights
             )
             category_scenarios = self.template_manager.get_available_scenarios()
+            self._validate_categories(distribution, category_scenarios)
 
-            available_categories = set(category_scenarios.keys())
-            invalid_categories = [
-                category
-                for category in distribution
-                if category not in available_categories
-            ]
-            if invalid_categories:
-                valid_list = ", ".join(sorted(CategoryEnum.get_all_values()))
-                raise ValueError(
-                    "Invalid category "
-                    f"'{invalid_categories[0]}' not in CategoryEnum: {valid_list}"
+            if seed is None and workers == 1 and output_format == "files":
+                return self._generate_serial_suite(
+                    output_dir, distribution, category_scenarios, operation_id
                 )
 
-            generated_counts: dict[str, int] = {}
-            test_id = 1
+            if seed is None:
+                seed = random.getrandbits(63)
+                self.logger.info("Generating sharded test suite with seed %d", seed)
+                reference_time = self._now()
+            else:
+                reference_time = self.reference_time or SEEDED_REFERENCE_TIME
+
+            shards = split_into_shards(
+                plan_test_suite(distribution, category_scenarios),
+                seed=seed,
+                shard_size=shard_size,
+                output_dir=output_dir,
+                output_format=output_format,
+                reference_time=reference_time,
+            )
+            if output_format == "files":
+                for category in distribution:
+                    (Path(output_dir) / category).mkdir(exist_ok=True)
+            return self._collect_shards(
+                shards, distribution, workers=workers, operation_id=operation_id
+            )
+
+        finally:
+            # Always finish operation tracking
+            self.resource_manager.finish_operation(operation_id)
 
-            for category, count in distribution.items():
-                # Check resource limits periodically
-                self.resource_manager.check_operation_limits(operation_id)
+    def _validate_categories(
+        self,
+        distribution: DistributionDict,
+        category_scenarios: dict[str, dict[str, list[str]]],
+    ) -> None:
+        """Reject distribution categories that have no scenarios."""
+        available_categories = set(category_scenarios.keys())
+        invalid_categories = [
+            category
+            for category in distribution
+            if category not in available_categories
+        ]
+        if invalid_categories:
+            valid_list = ", ".join(sorted(CategoryEnum.get_all_values()))
+            raise ValueError(
+                "Invalid category "
+                f"'{invalid_categories[0]}' not in CategoryEnum: {valid_list}"
+            )
+
+    def _generate_serial_suite(
+        self,
+        output_dir: str,
+        distribution: DistributionDict,
+        category_scenarios: dict[str, dict[str, list[str]]],
+        operation_id: str,
+    ) -> DistributionDict:
+        """Generate the suite category by category, one file per test case."""
+        generated_counts: dict[str, int] = {}
+        test_id = 1
+
+        for category, count in distribution.items():
+            # Check resource limits periodically
+            self.resource_manager.check_operation_limits(operation_id)
+
+            # Handle category directory setup
+            category_info: CategoryInfo = {
+                "dir": Path(output_dir) / category,
+                "count": 0,
+            }
+            category_info["dir"].mkdir(exist_ok=True)
+
+            # Get scenarios for this category
+            scenarios = category_scenarios.get(category, {})
+
+            params = CategoryTestParams(
+                category=category,
+                count=count,
+                scenarios=scenarios,
+                category_info=category_info,
+                start_test_id=test_id,
+            )
+            self._generate_category_tests(params)
+
+            generated_counts[category] = category_info["count"]
+            test_id += count
+
+        return generated_counts
 
-                # Handle category directory setup
-                category_info: CategoryInfo = {
-                    "dir": Path(output_dir) / category,
-                    "count": 0,
-                }
-                category_info["dir"].mkdir(exist_ok=True)
-
-                # Get scenarios for this category
-                scenarios = category_scenarios.get(category, {})
-
-                params = CategoryTestParams(
-                    category=category,
-                    count=count,
-                    scenarios=scenarios,
-                    category_info=category_info,
-                    start_test_id=test_id,
+    def _collect_shards(
+        self,
+        shards: list[SuiteShard],
+        distribution: DistributionDict,
+        *,
+        workers: int,
+        operation_id: str,
+    ) -> DistributionDict:
+        """Generate shards and merge their output in shard order."""
+        generated_counts: dict[str, int] = dict.fromkeys(distribution, 0)
+        progress_reporter = ProgressReporter(self.logger, "sharded test generation")
+        progress_reporter.initialize(sum(len(shard.tasks) for shard in shards))
+
+        with ExitStack() as stack:
+            jsonl_file = None
+            if shards and shards[0].output_format == "jsonl":
+                jsonl_path = Path(shards[0].output_dir) / JSONL_FILENAME
+                jsonl_file = stack.enter_context(
+                    open(jsonl_path, "w", encoding="utf-8")
                 )
-                self._generate_category_tests(params)
+            for result in self._run_shards(shards, workers):
+                self.resource_manager.check_operation_limits(operation_id)
+                if jsonl_file is not None:
+                    jsonl_file.writelines(f"{line}\n" for line in result.lines)
+                for category, count in result.counts.items():
+                    generated_counts[category] += count
+                progress_reporter.update(sum(result.counts.values()))
+
+        progress_reporter.complete()
+        return generated_counts
+
+    def _run_shards(
+        self, shards: list[SuiteShard], workers: int
+    ) -> Iterator[ShardResult]:
+        """Yield shard results in shard order, generating shards in parallel."""
+        if workers == 1 or len(shards) <= 1:
+            for shard in shards:
+                yield self._generate_shard(shard)
+            return
 
-                generated_counts[category] = category_info["count"]
-                test_id += count
+        with ProcessPoolExecutor(max_workers=min(workers, len(shards))) as executor:
+            yield from executor.map(_generate_shard_in_worker, shards)
 
-            return generated_counts
+    def _generate_shard(self, shard: SuiteShard) -> ShardResult:
+        """Generate one shard from its own seed and write its output.
 
+        The global random state and reference time are restored afterwards,
+        so generating a shard in-process does not disturb the caller.
+        """
+        random_state = random.getstate()
+        previous_reference_time = self.reference_time
+        random.seed(shard.seed)
+        self.reference_time = shard.reference_time
+        try:
+            result = ShardResult(index=shard.index)
+            bundle: list[dict[str, Any]] = []
+            for task in shard.tasks:
+                scenario = random.choice(task.scenarios)
+                test_case = self.generate_enterprise_test_case(
+                    task.category, scenario, task.test_id
+                )
+                result.counts[task.category] = result.counts.get(task.category, 0) + 1
+                if shard.output_format == "files":
+                    self._write_json_file(
+                        case_file_path(shard.output_dir, task.category, task.test_id),
+                        test_case,
+                    )
+                elif shard.output_format == "jsonl":
+                    result.lines.append(to_json_line(test_case))
+                else:
+                    bundle.append(test_case)
+            if shard.output_format == "bundles":
+                write_bundle(bundle_file_path(shard.output_dir, shard.index), bundle)
+            return result
         finally:
-            # Always finish operation tracking
-            self.resource_manager.finish_operation(operation_id)
+            random.setstate(random_state)
+            self.reference_time = previous_reference_time
 
     def _calculate_test_distribution(
         self, total_count: int, scenario_count: int
@@ -745,14 +927,18 @@ class TestSuiteGenerator:
         reporter: BatchProgressReporter,
     ) -> None:
         """Write a single queued file to disk with error isolation."""
+        if self._write_json_file(item["filepath"], item["content"]):
+            reporter.report_batch_progress(index, queue_size)
+
+    def _write_json_file(self, filepath: Path, content: dict[str, Any]) -> bool:
+        """Write one test case as indented JSON, logging failures."""
         try:
-            with open(item["filepath"], "w", encoding="utf-8") as file_handle:
-                json.dump(item["content"], file_handle, indent=2, ensure_ascii=False)
+            with open(filepath, "w", encoding="utf-8") as file_handle:
+                json.dump(content, file_handle, indent=2, ensure_ascii=False)
         except OSError as error:
-            self.logger.error("Failed to write %s: %s", item["filepath"], error)
-            return
-
-        reporter.report_batch_progress(index, queue_size)
+            self.logger.error("Failed to write %s: %s", filepath, error)
+            return False
+        return True
 
     def _gen_builtin_conversion_data(
         self, _test_data: dict[str, str]
@@ -1025,3 +1211,14 @@ class TestSuiteGenerator:
     def _get_category_scenarios(self) -> dict[str, dict[str, list[str]]]:
         """Get available scenarios by category."""
         return self.template_manager.get_available_scenarios()
+
+
+@lru_cache(maxsize=1)
+def _worker_generator() -> TestSuiteGenerator:
+    """Return the generator reused by every shard run in a worker process."""
+    return TestSuiteGenerator()
+
+
+def _generate_shard_in_worker(shard: SuiteShard) -> ShardResult:
+    """Generate a shard in a worker process."""
+    return _worker_generator()._generate_shard(shard)
@@ -14,6 +14,10 @@ def generate_test_suite(
     total_tests: int = 800,
     distribution: DistributionDict | None = None,
     weights: WeightsDict | None = None,
+    *,
+    seed: int | None = None,
+    workers: int = 1,
+    output_format: str = "files",
 ) -> DistributionDict:
     """Generate a test suite.
 
@@ -26,6 +30,10 @@ def generate_test_suite(
                 - Enum: {CategoryEnum.REGRESSION: 0.5, CategoryEnum.SMOKE: 0.3}
                 - String: {"regression": 0.5, "smoke": 0.3}
                 Weights will be normalized to sum to 1.0 automatically.
+        seed: Seed that makes the generated suite reproducible
+        workers: Number of worker processes generating shards in parallel
+        output_format: "files" (one JSON file per test), "jsonl" (a single
+            JSON Lines file) or "bundles" (one testCases document per shard)
 
     Returns:
         Dictionary mapping category names to actual test counts generated
@@ -37,6 +45,11 @@ def generate_test_suite(
         # Generate with custom weights
         weights = {"regression": 0.6, "smoke": 0.4}
         counts = generate_test_suite("output", 500, weights=weights)
+
+        # Reproducible suite generated by 8 workers into one JSON Lines file
+        counts = generate_test_suite(
+            "output", 20000, seed=42, workers=8, output_format="jsonl"
+        )
     """
     # Validate resource limits to prevent exhaustion
     if total_tests <= 0:
@@ -46,7 +59,13 @@ def generate_test_suite(
 
     generator = TestSuiteGenerator()
     result: DistributionDict = generator.generate_test_suite(
-        output_dir, total_tests, distribution, weights
+        output_dir,
+        total_tests,
+        distribution,
+        weights,
+        seed=seed,
+        workers=workers,
+        output_format=output_format,
     )
     return result
 
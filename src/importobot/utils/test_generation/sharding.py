@@ -0,0 +1,156 @@
+"""Deterministic sharding and bundle output for large generated test suites."""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+OUTPUT_FORMATS = ("files", "jsonl", "bundles")
+DEFAULT_SHARD_SIZE = 500
+JSONL_FILENAME = "test_suite.jsonl"
+BUNDLE_CONTAINER_KEY = "testCases"
+
+# Seeded suites must not depend on the wall clock, so their created/updated
+# dates and timestamps are derived from this fixed instant instead.
+SEEDED_REFERENCE_TIME = datetime(2025, 1, 1)
+
+
+@dataclass(frozen=True)
+class GenerationTask:
+    """One test case to generate: its category, ID and candidate scenarios."""
+
+    category: str
+    test_id: int
+    scenarios: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class SuiteShard:
+    """A contiguous slice of the suite plan generated from its own seed."""
+
+    index: int
+    seed: int
+    tasks: tuple[GenerationTask, ...]
+    output_dir: str
+    output_format: str
+    reference_time: datetime
+
+
+@dataclass
+class ShardResult:
+    """Counts per category and, for JSON Lines output, the serialized cases."""
+
+    index: int
+    counts: dict[str, int] = field(default_factory=dict)
+    lines: list[str] = field(default_factory=list)
+
+
+def derive_shard_seed(seed: int, shard_index: int) -> int:
+    """Derive the seed of one shard from the suite seed.
+
+    Shard seeds depend only on the suite seed and the shard position, never on
+    the number of workers, so any worker count produces the same suite.
+    """
+    digest = hashlib.blake2b(f"{seed}:{shard_index}".encode(), digest_size=8)
+    return int.from_bytes(digest.digest(), "big")
+
+
+def plan_test_suite(
+    distribution: dict[str, int], category_scenarios: dict[str, dict[str, list[str]]]
+) -> list[GenerationTask]:
+    """Lay out every test case of the suite in generation order.
+
+    Tests are spread across a category's scenario types exactly like the
+    serial generator: an even share each, with the remainder going to the
+    first scenario types.
+    """
+    tasks: list[GenerationTask] = []
+    test_id = 1
+    for category, count in distribution.items():
+        if count <= 0:
+            test_id += count
+            continue
+        scenario_lists = [
+            tuple(scenarios)
+            for scenarios in category_scenarios.get(category, {}).values()
+            if scenarios
+        ]
+        if not scenario_lists:
+            raise ValueError(
+                f"No valid scenarios with content found for category: '{category}'"
+            )
+        per_type, remainder = divmod(count, len(scenario_lists))
+        next_id = test_id
+        for position, scenarios in enumerate(scenario_lists):
+            for _ in range(per_type + (1 if position < remainder else 0)):
+                tasks.append(GenerationTask(category, next_id, scenarios))
+                next_id += 1
+        test_id += count
+    return tasks
+
+
+def split_into_shards(
+    tasks: list[GenerationTask],
+    *,
+    seed: int,
+    shard_size: int,
+    output_dir: str,
+    output_format: str,
+    reference_time: datetime,
+) -> list[SuiteShard]:
+    """Cut the plan into fixed-size shards, each with a derived seed."""
+    if shard_size <= 0:
+        raise ValueError(f"shard_size must be positive, got {shard_size}")
+    return [
+        SuiteShard(
+            index=index,
+            seed=derive_shard_seed(seed, index),
+            tasks=tuple(tasks[start : start + shard_size]),
+            output_dir=output_dir,
+            output_format=output_format,
+            reference_time=reference_time,
+        )
+        for index, start in enumerate(range(0, len(tasks), shard_size))
+    ]
+
+
+def case_file_path(output_dir: str, category: str, test_id: int) -> Path:
+    """Return the per-case file path used by the ``files`` output format."""
+    return Path(output_dir) / category / f"test_{category}_{test_id:04d}.json"
+
+
+def bundle_file_path(output_dir: str, shard_index: int) -> Path:
+    """Return the bundle file path used by the ``bundles`` output format."""
+    return Path(output_dir) / f"bundle_{shard_index:05d}.json"
+
+
+def write_bundle(path: Path, test_cases: list[dict[str, Any]]) -> None:
+    """Write one shard as a single document that importobot converts directly."""
+    with open(path, "w", encoding="utf-8") as bundle_file:
+        json.dump({BUNDLE_CONTAINER_KEY: test_cases}, bundle_file, ensure_ascii=False)
+
+
+def to_json_line(test_case: dict[str, Any]) -> str:
+    """Serialize a test case as one compact JSON Lines record."""
+    return json.dumps(test_case, ensure_ascii=False, separators=(",", ":"))
+
+
+__all__ = [
+    "BUNDLE_CONTAINER_KEY",
+    "DEFAULT_SHARD_SIZE",
+    "JSONL_FILENAME",
+    "OUTPUT_FORMATS",
+    "SEEDED_REFERENCE_TIME",
+    "GenerationTask",
+    "ShardResult",
+    "SuiteShard",
+    "bundle_file_path",
+    "case_file_path",
+    "derive_shard_seed",
+    "plan_test_suite",
+    "split_into_shards",
+    "to_json_line",
+    "write_bundle",
+]
@@ -0,0 +1,477 @@
+"""NumPy-backed optimizers that evaluate many parameter vectors per call.
+
+Parameters are held as rows of a ``float64`` array ordered by
+:class:`ParameterSpace`. Every iteration gathers all points it needs (gradient
+probes, population members or annealing chains) into one array and evaluates
+them in a single call, either through a vectorized objective or by mapping the
+scalar objective over the rows, optionally across worker processes.
+
+Requires the ``analytics`` extra (``pip install 'importobot[analytics]'``).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any
+
+import numpy as np
+
+from importobot.utils.optimization import (
+    AnnealingConfig,
+    GeneticAlgorithmOptimizer,
+    OptimizerConfig,
+)
+
+ScalarObjective = Callable[[dict[str, float]], float]
+BatchObjective = Callable[[Mapping[str, Any]], Any]
+
+GRADIENT_EPSILON = 1e-8
+
+
+@dataclass(frozen=True)
+class ParameterSpace:
+    """Named parameter axes with optional bounds and sampling ranges.
+
+    ``lower``/``upper`` are the hard bounds (``-inf``/``inf`` when a parameter
+    is unbounded); ``sample_lower``/``sample_upper`` are finite ranges used to
+    draw random starting points and to scale mutations.
+    """
+
+    names: tuple[str, ...]
+    lower: np.ndarray
+    upper: np.ndarray
+    sample_lower: np.ndarray
+    sample_upper: np.ndarray
+    bounded: np.ndarray
+
+    @classmethod
+    def build(
+        cls,
+        initial_parameters: dict[str, float],
+        parameter_bounds: dict[str, tuple[float, float]] | None,
+        sampling_ranges: dict[str, tuple[float, float]],
+    ) -> ParameterSpace:
+        """Create a space ordered like ``initial_parameters``."""
+        bounds = parameter_bounds or {}
+        names = tuple(initial_parameters)
+        return cls(
+            names=names,
+            lower=np.array([bounds.get(name, (-np.inf, np.inf))[0] for name in names]),
+            upper=np.array([bounds.get(name, (-np.inf, np.inf))[1] for name in names]),
+            sample_lower=np.array([sampling_ranges[name][0] for name in names]),
+            sample_upper=np.array([sampling_ranges[name][1] for name in names]),
+            bounded=np.array([name in bounds for name in names]),
+        )
+
+    def to_array(self, parameters: dict[str, float]) -> np.ndarray:
+        """Convert a parameter dict into a vector."""
+        return np.array([float(parameters[name]) for name in self.names])
+
+    def to_dict(self, vector: np.ndarray) -> dict[str, float]:
+        """Convert a vector back into a parameter dict of Python floats."""
+        return dict(zip(self.names, vector.tolist(), strict=True))
+
+    def clip(self, points: np.ndarray) -> np.ndarray:
+        """Clamp points to the hard bounds."""
+        clipped: np.ndarray = np.clip(points, self.lower, self.upper)
+        return clipped
+
+    def sample(self, rng: np.random.Generator, count: int) -> np.ndarray:
+        """Draw ``count`` points uniformly from the sampling ranges."""
+        return rng.uniform(
+            self.sample_lower, self.sample_upper, size=(count, len(self.names))
+        )
+
+
+class BatchEvaluator:
+    """Evaluate an objective for every row of a points array.
+
+    A ``batch_objective`` receives a mapping of parameter name to column array
+    and returns one value per row. Without one, the scalar objective is
+    mapped over the rows; with ``workers > 1`` those calls are fanned out to a
+    process pool, which requires a picklable objective. Results are returned
+    in row order, so fan-out never changes an optimization result.
+    """
+
+    def __init__(
+        self,
+        space: ParameterSpace,
+        objective: ScalarObjective,
+        *,
+        batch_objective: BatchObjective | None = None,
+        workers: int = 1,
+    ) -> None:
+        """Initialize the evaluator."""
+        self.space = space
+        self.objective = objective
+        self.batch_objective = batch_objective
+        self.workers = max(1, workers)
+        self.evaluations = 0
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __call__(self, points: np.ndarray) -> np.ndarray:
+        """Return the objective value of each row in ``points``."""
+        points = np.atleast_2d(points)
+        self.evaluations += len(points)
+        if self.batch_objective is not None:
+            columns = {name: points[:, i] for i, name in enumerate(self.space.names)}
+            batch_values = np.asarray(self.batch_objective(columns), dtype=float)
+            if batch_values.shape != (len(points),):
+                batch_values = np.full(len(points), batch_values, dtype=float)
+            return batch_values
+
+        rows = [self.space.to_dict(row) for row in points]
+        if self.workers == 1 or len(rows) < 2:
+            return np.array([self.objective(row) for row in rows], dtype=float)
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        chunksize = max(1, -(-len(rows) // self.workers))
+        values: np.ndarray = np.fromiter(
+            self._executor.map(self.objective, rows, chunksize=chunksize),
+            dtype=float,
+            count=len(rows),
+        )
+        return values
+
+    def close(self) -> None:
+        """Shut down the worker pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> BatchEvaluator:
+        """Return the evaluator for use in a ``with`` block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Release the worker pool."""
+        self.close()
+
+
+def _starting_points(
+    space: ParameterSpace,
+    initial_parameters: dict[str, float],
+    n_starts: int,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Return the initial point followed by ``n_starts - 1`` random points."""
+    initial = space.to_array(initial_parameters)[np.newaxis, :]
+    if n_starts <= 1:
+        return initial
+    return np.vstack([initial, space.sample(rng, n_starts - 1)])
+
+
+def _row_norms(gradients: np.ndarray) -> np.ndarray:
+    """Euclidean norm of each row, summed left to right like the scalar path."""
+    total = np.zeros(len(gradients))
+    for column in range(gradients.shape[1]):
+        total = total + gradients[:, column] ** 2
+    return np.sqrt(total)
+
+
+class VectorizedGradientDescent:
+    """Momentum gradient descent run from several starting points at once.
+
+    Each start follows exactly the update rules of
+    :class:`~importobot.utils.optimization.GradientDescentOptimizer`; with a
+    single start the trajectory and result are identical. All central
+    difference probes of all active starts are evaluated in one batch.
+    """
+
+    def __init__(
+        self,
+        config: OptimizerConfig | None = None,
+        *,
+        n_starts: int = 1,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the optimizer."""
+        self.config = config or OptimizerConfig()
+        self.n_starts = max(1, n_starts)
+        self.seed = seed
+
+    def optimize(
+        self, evaluator: BatchEvaluator, initial_parameters: dict[str, float]
+    ) -> tuple[dict[str, float], float, dict[str, Any]]:
+        """Minimize the objective and return the best start's result."""
+        config = self.config
+        space = evaluator.space
+        params = _starting_points(
+            space,
+            initial_parameters,
+            self.n_starts,
+            np.random.default_rng(self.seed),
+        )
+        starts, dimensions = params.shape
+        velocity = np.zeros_like(params)
+        learning_rates = np.full(starts, config.learning_rate)
+        prev_norms = np.full(starts, np.inf)
+        best_values = evaluator(params)
+        best_params = params.copy()
+        histories: list[list[float]] = [[] for _ in range(starts)]
+        active = np.ones(starts, dtype=bool)
+        probes = np.vstack([np.eye(dimensions), -np.eye(dimensions)])
+        probes *= GRADIENT_EPSILON
+
+        for iteration in range(config.max_iterations):
+            rows = np.flatnonzero(active)
+            current = params[rows]
+            probe_values = evaluator(
+                (current[:, np.newaxis, :] + probes).reshape(-1, dimensions)
+            ).reshape(len(rows), 2, dimensions)
+            gradients = (probe_values[:, 0] - probe_values[:, 1]) / (
+                2 * GRADIENT_EPSILON
+            )
+            gradients += config.regularization * current
+
+            velocity[rows] = (
+                config.momentum * velocity[rows]
+                - learning_rates[rows, np.newaxis] * gradients
+            )
+            params[rows] = space.clip(current + velocity[rows])
+            values = evaluator(params[rows])
+
+            improved = values < best_values[rows]
+            best_values[rows[improved]] = values[improved]
+            best_params[rows[improved]] = params[rows[improved]]
+
+            if config.adaptive_learning and iteration > 0:
+                norms = _row_norms(gradients)
+                learning_rates[rows] = _adjust_learning_rates(
+                    norms, learning_rates[rows], prev_norms[rows]
+                )
+                prev_norms[rows] = norms
+
+            for row, value in zip(rows.tolist(), values.tolist(), strict=True):
+                histories[row].append(value)
+                recent = histories[row][-10:]
+                if iteration > 10 and max(recent) - min(recent) < config.tolerance:
+                    active[row] = False
+            if not active.any():
+                break
+
+        best_start = int(np.argmin(best_values))
+        history = histories[best_start]
+        metadata = {
+            "iterations": len(history),
+            "convergence_history": history,
+            "final_learning_rate": float(learning_rates[best_start]),
+            "converged": len(history) < config.max_iterations,
+            "best_value": float(best_values[best_start]),
+            "starts": starts,
+            "best_start": best_start,
+            "start_values": best_values.tolist(),
+            "evaluations": evaluator.evaluations,
+        }
+        return (
+            space.to_dict(best_params[best_start]),
+            float(best_values[best_start]),
+            metadata,
+        )
+
+
+def _adjust_learning_rates(
+    norms: np.ndarray, learning_rates: np.ndarray, prev_norms: np.ndarray
+) -> np.ndarray:
+    """Halve diverging learning rates and grow converging ones by 2%."""
+    adjusted: np.ndarray = np.where(
+        norms > prev_norms * 1.2,
+        learning_rates * 0.5,
+        np.where(norms < prev_norms * 0.8, learning_rates * 1.02, learning_rates),
+    )
+    return adjusted
+
+
+@dataclass
+class GeneticSettings:
+    """Genetic algorithm settings mirroring ``GeneticAlgorithmOptimizer``."""
+
+    population_size: int = 50
+    mutation_rate: float = 0.1
+    crossover_rate: float = 0.8
+    elitism_count: int = 2
+    max_generations: int = 100
+    tournament_size: int = 3
+
+    @classmethod
+    def from_optimizer(
+        cls, optimizer: GeneticAlgorithmOptimizer | None
+    ) -> GeneticSettings:
+        """Copy the settings of a configured genetic optimizer."""
+        if optimizer is None:
+            return cls()
+        return cls(
+            population_size=optimizer.population_size,
+            mutation_rate=optimizer.mutation_rate,
+            crossover_rate=optimizer.crossover_rate,
+            elitism_count=optimizer.elitism_count,
+            max_generations=optimizer.max_generations,
+            tournament_size=optimizer.tournament_size,
+        )
+
+
+def vectorized_genetic_algorithm(
+    evaluator: BatchEvaluator,
+    initial_parameters: dict[str, float],
+    *,
+    maximize: bool = False,
+    settings: GeneticSettings | None = None,
+    seed: int | None = None,
+) -> tuple[dict[str, float], float, dict[str, Any]]:
+    """Run a genetic algorithm evaluating the whole population per generation.
+
+    Fitness is the objective value when maximizing and its negation otherwise;
+    the returned score is always in objective units.
+    """
+    settings = settings or GeneticSettings()
+    space = evaluator.space
+    rng = np.random.default_rng(seed)
+    size = max(2, settings.population_size)
+    population = _starting_points(space, initial_parameters, size, rng)
+    sign = 1.0 if maximize else -1.0
+    best_individual = population[0].copy()
+    best_fitness = -np.inf
+    fitness_history: list[float] = []
+    generation = 0
+
+    for generation in range(settings.max_generations):
+        fitness = sign * evaluator(population)
+        leader = int(np.argmax(fitness))
+        if fitness[leader] > best_fitness:
+            best_fitness = float(fitness[leader])
+            best_individual = population[leader].copy()
+        fitness_history.append(float(fitness[leader]))
+
+        recent = fitness_history[-20:]
+        if generation > 20 and max(recent) - min(recent) < 1e-6:
+            break
+        population = _next_generation(population, fitness, space, settings, rng)
+
+    metadata = {
+        "generations": generation + 1,
+        "fitness_history": fitness_history,
+        "converged": len(fitness_history) < settings.max_generations,
+        "best_fitness": best_fitness,
+        "evaluations": evaluator.evaluations,
+    }
+    return space.to_dict(best_individual), sign * best_fitness, metadata
+
+
+def _next_generation(
+    population: np.ndarray,
+    fitness: np.ndarray,
+    space: ParameterSpace,
+    settings: GeneticSettings,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Build the next population with elitism, tournaments and mutation."""
+    size, dimensions = population.shape
+    elite_count = min(settings.elitism_count, size)
+    elite = population[np.argsort(-fitness, kind="stable")[:elite_count]]
+    children = size - elite_count
+    if children <= 0:
+        survivors: np.ndarray = elite.copy()
+        return survivors
+
+    # Tournament selection without replacement: rank random keys per contest.
+    tournament = min(settings.tournament_size, size)
+    contestants = rng.random((2 * children, size)).argsort(axis=1)[:, :tournament]
+    winners = contestants[
+        np.arange(2 * children), np.argmax(fitness[contestants], axis=1)
+    ]
+    first, second = population[winners[:children]], population[winners[children:]]
+
+    crossover = rng.random(children) < settings.crossover_rate
+    uniform_mask = rng.random((children, dimensions)) < 0.5
+    pick_first = rng.random(children) < 0.5
+    offspring = np.where(
+        crossover[:, np.newaxis],
+        np.where(uniform_mask, first, second),
+        np.where(pick_first[:, np.newaxis], first, second),
+    )
+
+    mutate = rng.random(children) < settings.mutation_rate
+    spread = (space.sample_upper - space.sample_lower) * 0.1
+    noise = rng.normal(0.0, 1.0, size=(children, dimensions)) * spread
+    offspring = np.where(mutate[:, np.newaxis], offspring + noise, offspring)
+    offspring = np.clip(offspring, space.sample_lower, space.sample_upper)
+    return np.vstack([elite, space.clip(offspring)])
+
+
+def multi_chain_simulated_annealing(
+    evaluator: BatchEvaluator,
+    initial_parameters: dict[str, float],
+    *,
+    config: AnnealingConfig | None = None,
+    chains: int = 1,
+    seed: int | None = None,
+) -> tuple[dict[str, float], float, dict[str, Any]]:
+    """Anneal several independent chains in lockstep and keep the best.
+
+    Like :func:`~importobot.utils.optimization.simulated_annealing`, only
+    bounded parameters are perturbed.
+    """
+    config = config or AnnealingConfig()
+    space = evaluator.space
+    rng = np.random.default_rng(seed)
+    current = _starting_points(space, initial_parameters, chains, rng)
+    current_values = evaluator(current)
+    best = current.copy()
+    best_values = current_values.copy()
+    span = np.where(space.bounded, space.upper - space.lower, 0.0)
+    span = np.nan_to_num(span, nan=0.0, posinf=0.0, neginf=0.0)
+
+    temperature = config.initial_temperature
+    iteration = 0
+    accepted = 0
+    while temperature > config.min_temperature and iteration < config.max_iterations:
+        step = span * 0.1 * (temperature / config.initial_temperature)
+        neighbors = space.clip(current + rng.normal(0.0, 1.0, current.shape) * step)
+        neighbor_values = evaluator(neighbors)
+
+        delta = neighbor_values - current_values
+        threshold = np.exp(-np.maximum(delta, 0.0) / temperature)
+        accept = (delta < 0) | (rng.random(len(current)) < threshold)
+        current[accept] = neighbors[accept]
+        current_values[accept] = neighbor_values[accept]
+        accepted += int(accept.sum())
+
+        improved = current_values < best_values
+        best[improved] = current[improved]
+        best_values[improved] = current_values[improved]
+
+        temperature *= config.cooling_rate
+        iteration += 1
+
+    best_chain = int(np.argmin(best_values))
+    proposals = iteration * len(current)
+    metadata = {
+        "iterations": iteration,
+        "final_temperature": temperature,
+        "acceptance_rate": accepted / proposals if proposals else 0,
+        "converged": temperature <= config.min_temperature,
+        "best_value": float(best_values[best_chain]),
+        "chains": len(current),
+        "best_chain": best_chain,
+        "evaluations": evaluator.evaluations,
+    }
+    return space.to_dict(best[best_chain]), float(best_values[best_chain]), metadata
+
+
+__all__ = [
+    "BatchEvaluator",
+    "BatchObjective",
+    "GeneticSettings",
+    "ParameterSpace",
+    "VectorizedGradientDescent",
+    "multi_chain_simulated_annealing",
+    "vectorized_genetic_algorithm",
+]
@@ -137,6 +137,16 @@ def cleanup_test_files(
                 print(f"Warning: Could not clean up {file_path}: {e}")
 
 
+@pytest.fixture(autouse=True)
+def isolate_zephyr_discovery_state(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Keep remembered Zephyr discovery results out of the working tree."""
+    monkeypatch.setenv(
+        "IMPORTOBOT_ZEPHYR_DISCOVERY_STATE", str(tmp_path / "zephyr_discovery.json")
+    )
+
+
 @pytest.fixture
 def telemetry_events(
     monkeypatch: pytest.MonkeyPatch,
@@ -27,11 +27,8 @@ def reset_registry_state() -> Iterator[None]:
     registry.RESOURCE_IMPORTS.clear()
     registry.TEMPLATE_STATE["base_dir"] = None
     yield
-    registry.TEMPLATE_REGISTRY.clear()
-    registry.KNOWLEDGE_BASE.clear()
-    registry.KEYWORD_LIBRARY.clear()
-    registry.RESOURCE_IMPORTS.clear()
-    registry.TEMPLATE_STATE["base_dir"] = None
+    # Also disables templates so later conversions in this process are unaffected.
+    registry.configure_template_sources([])
 
 
 safe_identifier_chars = string.ascii_letters + string.digits + "-_"
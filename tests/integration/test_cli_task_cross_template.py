@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
 from pathlib import Path
 
+import pytest
+
 from importobot.core.converter import JsonToRobotConverter
 from importobot.core.templates import configure_template_sources
 from importobot.utils.json_utils import load_json_file
 
 
+@pytest.fixture(autouse=True)
+def reset_template_sources() -> Iterator[None]:
+    """Disable learned templates after each test so they do not leak."""
+    yield
+    configure_template_sources([])
+
+
 def test_hostname_inferred_from_setconfig_template(tmp_path: Path) -> None:
     """Hostname suite generated using knowledge from another template."""
     # Generate template inline to avoid tracking .robot files in git
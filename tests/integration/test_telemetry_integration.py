@@ -14,6 +14,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from importobot.core.converter import convert_file
 from importobot.services.data_ingestion_service import (
     FileContentCache,
 )
@@ -450,3 +451,38 @@ class TestTelemetryLifecycle:
 
         # Should have only default exporter
         assert len(client._exporters) == 1
+
+
+class TestConversionStageTimings:
+    """Integration tests for stage timings recorded during conversion."""
+
+    def test_conversion_records_pipeline_stage_timings(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Converting a file should time load, parse and keyword stages."""
+        monkeypatch.setenv("IMPORTOBOT_ENABLE_TELEMETRY", "1")
+        reset_telemetry_client()
+        input_file = tmp_path / "case.json"
+        input_file.write_text(
+            '{"name": "Login", "steps": [{"step": "Open browser", '
+            '"testData": "https://example.com", "expectedResult": "Page loads"}]}',
+            encoding="utf-8",
+        )
+
+        convert_file(str(input_file), str(tmp_path / "case.robot"))
+
+        client = get_telemetry_client()
+        assert client is not None
+        timings = client.metrics_snapshot()["timings"]
+        assert isinstance(timings, dict)
+        for stage in (
+            "json.load",
+            "blueprint.render",
+            "parser.find_tests",
+            "parser.find_steps",
+            "keywords.detect_libraries",
+            "keywords.web",
+            "storage.write.robot",
+        ):
+            assert stage in timings, stage
+        reset_telemetry_client()
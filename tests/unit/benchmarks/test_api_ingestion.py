@@ -0,0 +1,110 @@
+"""
+Unit tests for the mock vendor server and the api_ingestion benchmark suite.
+
+These tests check that every API client can page through the mock server,
+that injected rate limits and failures are retried, and that the suites run.
+They do not assert timings.
+"""
+
+from http import HTTPStatus
+
+import pytest
+
+from benchmarks import APIConcurrencySuite, APIFetchSuite, APIRateLimitSuite
+from benchmarks.api_ingestion import VENDORS, build_client
+from benchmarks.mock_vendor_server import (
+    MockVendorConfig,
+    MockVendorServer,
+)
+
+ITEMS = 250
+
+
+def _fetched_ids(server: MockVendorServer, vendor: str) -> list[str]:
+    """Fetch every page from ``server`` and return the item identifiers."""
+    ids: list[str] = []
+    for page in build_client(server, vendor).fetch_all(lambda **_: None):
+        for field in ("issues", "results", "cases", "data"):
+            ids.extend(
+                str(item.get("key") or item["id"]) for item in page.get(field, [])
+            )
+    return ids
+
+
+class TestMockVendorServer:
+    """Tests for MockVendorServer pagination and fault injection."""
+
+    @pytest.mark.parametrize("vendor", VENDORS)
+    def test_clients_page_through_every_item(self, vendor: str) -> None:
+        """Each vendor client receives every item exactly once."""
+        with MockVendorServer(MockVendorConfig(items=ITEMS)) as server:
+            ids = _fetched_ids(server, vendor)
+
+            assert len(ids) == ITEMS
+            assert len(set(ids)) == ITEMS
+            assert server.stats.by_vendor[vendor] == server.stats.requests
+
+    def test_rate_limits_are_retried(self) -> None:
+        """429 responses carry Retry-After and the client retries them."""
+        config = MockVendorConfig(items=ITEMS, rate_limit_every=2)
+        with MockVendorServer(config) as server:
+            ids = _fetched_ids(server, "jira_xray")
+
+            assert len(ids) == ITEMS
+            assert server.stats.statuses[HTTPStatus.TOO_MANY_REQUESTS] >= 1
+
+    def test_injected_failures_are_retried(self) -> None:
+        """503 responses are retried until the page succeeds."""
+        with MockVendorServer(MockVendorConfig(items=ITEMS, fail_every=3)) as server:
+            ids = _fetched_ids(server, "jira_xray")
+
+            assert len(ids) == ITEMS
+            assert server.stats.statuses[HTTPStatus.SERVICE_UNAVAILABLE] >= 1
+
+    def test_sequential_fetch_reuses_one_connection(self) -> None:
+        """Keep-alive lets a sequential client reuse a single connection."""
+        with MockVendorServer(MockVendorConfig(items=ITEMS)) as server:
+            _fetched_ids(server, "testrail")
+
+            assert server.stats.requests > 1
+            assert server.stats.connections == 1
+
+
+class TestAPIIngestionSuites:
+    """Tests that the ASV suites run against the mock server."""
+
+    def test_fetch_suite_tracks_requests(self) -> None:
+        """The request count covers every page of the project."""
+        suite = APIFetchSuite()
+        suite.setup("jira_xray")
+        try:
+            assert suite.track_requests("jira_xray") >= 20
+        finally:
+            suite.teardown("jira_xray")
+
+    def test_concurrency_suite_opens_one_connection_per_worker(self) -> None:
+        """Concurrent prefetch spreads requests over several connections."""
+        suite = APIConcurrencySuite()
+        suite.setup(4)
+        try:
+            assert 1 < suite.track_connections(4) <= 4
+        finally:
+            suite.teardown(4)
+
+    def test_rate_limit_suite_counts_retries(self) -> None:
+        """Retried requests are included in the tracked request count."""
+        suite = APIRateLimitSuite()
+        suite.setup("rate_limited")
+        try:
+            assert suite.track_requests("rate_limited") > 20
+        finally:
+            suite.teardown("rate_limited")
+
+    def test_zephyr_runs_stay_cold(self) -> None:
+        """Discovery is not remembered, so repeated fetches cost the same."""
+        with MockVendorServer(MockVendorConfig(items=ITEMS)) as server:
+            _fetched_ids(server, "zephyr")
+            cold = server.stats.requests
+            _fetched_ids(server, "zephyr")
+
+            assert server.stats.requests == 2 * cold
@@ -0,0 +1,78 @@
+"""
+Unit tests for the import_time benchmark suite.
+
+These tests check the ``-X importtime`` parsing and that importing the
+package, the CLI entry point and the converter keeps heavy dependencies
+deferred. They do not assert wall-clock budgets, which depend on the host.
+"""
+
+import pytest
+
+from benchmarks import ImportTimeSuite
+from benchmarks.import_time import (
+    DEFERRED_MODULES,
+    check_import_budgets,
+    measure_imports,
+    parse_importtime,
+)
+
+SAMPLE_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        420 | json
+import time:      1500 |       1920 | importobot
+"""
+
+
+class TestParseImporttime:
+    """Tests for parsing ``python -X importtime`` output."""
+
+    def test_maps_modules_to_cumulative_microseconds(self) -> None:
+        """Each module maps to its cumulative time; the header is skipped."""
+        assert parse_importtime(SAMPLE_OUTPUT) == {
+            "_io": 120,
+            "json": 420,
+            "importobot": 1920,
+        }
+
+    def test_ignores_unrelated_lines(self) -> None:
+        """Warnings and other stderr noise are ignored."""
+        assert parse_importtime("DeprecationWarning: x\n") == {}
+
+
+class TestDeferredImports:
+    """Tests that entry points do not load heavy dependencies eagerly."""
+
+    @pytest.mark.parametrize("module", sorted(DEFERRED_MODULES))
+    def test_entry_point_defers_heavy_modules(self, module: str) -> None:
+        """Importing an entry point leaves its deferred modules unloaded."""
+        timings = measure_imports(module)
+
+        assert module in timings
+        assert not set(DEFERRED_MODULES[module]) & set(timings)
+
+    def test_lazy_package_attributes_still_resolve(self) -> None:
+        """Lazily exported names load their modules on first access."""
+        timings = measure_imports("importobot; importobot.JsonToRobotConverter")
+
+        # importlib-driven imports are not timed themselves, only their children.
+        assert "importobot.core.engine" in timings
+
+    def test_budget_violations_are_reported(self) -> None:
+        """Exceeding a budget or loading a deferred module is reported."""
+        violations = check_import_budgets(
+            budgets={"importobot": 0.0},
+            deferred={"importobot": ("importobot.config",)},
+        )
+
+        assert len(violations) == 2
+        assert "budget 0.0 ms" in violations[0]
+        assert "eagerly loaded importobot.config" in violations[1]
+
+
+class TestImportTimeSuite:
+    """Tests for the ASV import-time suite."""
+
+    def test_tracks_positive_milliseconds(self) -> None:
+        """The tracked value is the module's import time in milliseconds."""
+        assert ImportTimeSuite().track_import_time("importobot") > 0
@@ -0,0 +1,149 @@
+"""Tests for batch format detection and vectorised Bayesian scoring."""
+
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from importobot.medallion.bronze.evidence_metrics import EvidenceMetrics
+from importobot.medallion.bronze.format_detector import FormatDetector
+from importobot.medallion.bronze.independent_bayesian_scorer import (
+    IndependentBayesianScorer,
+    resolve_batch_engine,
+)
+from importobot.medallion.interfaces.enums import SupportedFormat
+
+EXAMPLES_DIR = Path(__file__).parents[4] / "examples" / "json"
+KEYS = [
+    "name",
+    "tests",
+    "testCase",
+    "execution",
+    "steps",
+    "status",
+    "priority",
+    "project",
+    "issues",
+    "testInfo",
+    "suite_id",
+    "testsuite",
+    "description",
+    "expected",
+]
+EDGE_VALUES = [0.0, 0.5, 0.8, 0.8000001, 0.9, 0.9000001, 1.0]
+
+
+def _random_payload(rng: random.Random) -> dict[str, Any]:
+    payload: dict[str, Any] = {}
+    for key in rng.sample(KEYS, rng.randint(1, 6)):
+        payload[key] = rng.choice(
+            [
+                "value",
+                rng.randint(1, 9),
+                [{rng.choice(KEYS): "step"} for _ in range(rng.randint(0, 3))],
+                {rng.choice(KEYS): {"status": "PASS"}},
+            ]
+        )
+    return payload
+
+
+def _payloads() -> list[Any]:
+    rng = random.Random(40)
+    examples = [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted(EXAMPLES_DIR.glob("*.json"))
+    ]
+    return [*examples, None, {}, ["list"], *(_random_payload(rng) for _ in range(80))]
+
+
+def _random_metrics(rng: random.Random) -> EvidenceMetrics:
+    def value() -> float:
+        return rng.choice([*EDGE_VALUES, rng.random()])
+
+    return EvidenceMetrics(
+        completeness=value(),
+        quality=value(),
+        uniqueness=value(),
+        evidence_count=rng.randint(0, 5),
+        unique_count=rng.randint(0, 3),
+        penalty_factor=rng.choice([1.0, 0.5, 0.1]),
+    )
+
+
+class TestDetectFormats:
+    """Tests for FormatDetector.detect_formats."""
+
+    @pytest.mark.parametrize("engine", ["python", "numpy", "auto"])
+    def test_matches_single_detection(self, engine: str) -> None:
+        """Batch results equal detect_format for every payload."""
+        payloads = _payloads()
+        expected = [FormatDetector().detect_format(p) for p in payloads]
+
+        assert FormatDetector().detect_formats(payloads, engine=engine) == expected
+        assert SupportedFormat.UNKNOWN in expected
+        assert len(set(expected)) > 2
+
+    def test_results_populate_the_detection_cache(self) -> None:
+        """Classified payloads are cached for later single detections."""
+        detector = FormatDetector()
+        payload = {"tests": [{"name": "Login", "steps": [{"action": "open"}]}]}
+
+        [result] = detector.detect_formats(iter([payload]))
+
+        cached = detector.detection_cache.get_cached_detection_result(payload)
+        assert cached == result
+
+    def test_unknown_engine_is_rejected(self) -> None:
+        """Engines other than auto, numpy and python raise ValueError."""
+        with pytest.raises(ValueError, match="Unsupported engine"):
+            FormatDetector().detect_formats([{"tests": []}], engine="gpu")
+
+    def test_open_circuit_returns_unknown(self) -> None:
+        """An open circuit breaker short-circuits the whole batch."""
+        detector = FormatDetector()
+        detector._circuit_open_until = float("inf")
+
+        assert detector.detect_formats([{"testCase": {}}, {}]) == [
+            SupportedFormat.UNKNOWN,
+            SupportedFormat.UNKNOWN,
+        ]
+
+
+class TestLikelihoodBatch:
+    """Tests for IndependentBayesianScorer.calculate_likelihood_batch."""
+
+    def test_python_engine_is_exact(self) -> None:
+        """The pure-Python engine reproduces calculate_likelihood bit for bit."""
+        rng = random.Random(7)
+        metrics = [_random_metrics(rng) for _ in range(500)]
+        scorer = IndependentBayesianScorer()
+
+        assert scorer.calculate_likelihood_batch(metrics, engine="python") == [
+            scorer.calculate_likelihood(m) for m in metrics
+        ]
+
+    def test_numpy_engine_matches_within_rounding(self) -> None:
+        """The NumPy engine agrees with the scalar formula to rounding error."""
+        pytest.importorskip("numpy")
+        rng = random.Random(11)
+        metrics = [_random_metrics(rng) for _ in range(2_000)]
+        scorer = IndependentBayesianScorer()
+
+        batch = scorer.calculate_likelihood_batch(metrics, engine="numpy")
+
+        expected = [scorer.calculate_likelihood(m) for m in metrics]
+        assert batch == pytest.approx(expected, rel=1e-12)
+        assert scorer.calculate_likelihood_batch([], engine="numpy") == []
+
+    def test_auto_engine_selection(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Auto only picks NumPy for large batches when it is installed."""
+        assert resolve_batch_engine("auto", 1) == "python"
+        assert resolve_batch_engine("python", 10_000) == "python"
+
+        monkeypatch.setattr(
+            "importobot.medallion.bronze.independent_bayesian_scorer.NUMPY",
+            type("Missing", (), {"available": False})(),
+        )
+        assert resolve_batch_engine("auto", 10_000) == "python"
@@ -0,0 +1,122 @@
+"""Tests for the shared indicator index used by quick format scoring."""
+
+import json
+import random
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from importobot.medallion.bronze.format_detector import FormatDetector
+from importobot.medallion.bronze.scoring_algorithms import (
+    FormatScoreIndex,
+    ScoringAlgorithms,
+)
+from importobot.medallion.interfaces.enums import SupportedFormat
+
+EXAMPLES_DIR = Path(__file__).parents[4] / "examples" / "json"
+WORDS = ["id", "case", "testCase", "testcasekey", "Suite", "suite_id", "run", "key"]
+
+
+def _random_patterns(rng: random.Random) -> dict[str, Any]:
+    return {
+        "required_keys": rng.sample(WORDS, rng.randint(0, 4)),
+        "optional_keys": rng.sample(WORDS, rng.randint(0, 3)),
+        "structure_indicators": rng.sample(WORDS, rng.randint(0, 2)),
+        "field_patterns": {
+            name: rng.choice([r"\d+", "case", r"[A-Z]+-\d+", "("])
+            for name in rng.sample(WORDS, rng.randint(0, 2))
+        },
+    }
+
+
+@pytest.fixture
+def detector() -> FormatDetector:
+    """Detector backed by the bundled format registry."""
+    return FormatDetector()
+
+
+class TestFormatScoreIndex:
+    """Tests for FormatScoreIndex."""
+
+    def test_presence_respects_containment(self) -> None:
+        """Indicators contained in others are searched and reported exactly."""
+        index = FormatScoreIndex(
+            {"a": {"required_keys": ["case", "testcase", "TestCaseKey"]}}
+        )
+        patterns = ["case", "testcase", "testcasekey"]
+
+        for document, expected in [
+            ("a testcase here", {"case", "testcase"}),
+            ("no match", set()),
+            ("testcasekey", set(patterns)),
+        ]:
+            presence = index.presence(document)
+            found = {p for bit, p in enumerate(patterns) if presence & (1 << bit)}
+            assert found == expected
+
+    def test_shared_indicators_are_indexed_once(self) -> None:
+        """Indicators repeated across formats and cases share one entry."""
+        index = FormatScoreIndex(
+            {
+                "a": {"required_keys": ["testCase", "id"]},
+                "b": {"optional_keys": ["TESTCASE"], "structure_indicators": ["id"]},
+            }
+        )
+
+        assert len(index) == 2
+
+    def test_random_patterns_match_calculate_format_score(self) -> None:
+        """Scores equal ScoringAlgorithms.calculate_format_score exactly."""
+        rng = random.Random(2024)
+        for _ in range(200):
+            format_patterns = {name: _random_patterns(rng) for name in "abcd"}
+            index = FormatScoreIndex(format_patterns)
+            document = " ".join(rng.choices([*WORDS, "12", "XR-7", "x"], k=8))
+            data = {rng.choice(WORDS): document} if rng.random() < 0.5 else None
+
+            scores = index.score_all(document.lower(), data)
+
+            assert scores == {
+                name: ScoringAlgorithms.calculate_format_score(
+                    document.lower(), patterns, data
+                )
+                for name, patterns in format_patterns.items()
+            }
+
+
+class TestDetectorScoring:
+    """Tests for the detector's use of the index."""
+
+    @pytest.mark.parametrize(
+        "example", sorted(EXAMPLES_DIR.glob("*.json"))[:12], ids=lambda p: p.name
+    )
+    def test_registry_scores_are_unchanged(
+        self, detector: FormatDetector, example: Path
+    ) -> None:
+        """Bundled formats score the examples exactly as before."""
+        data = json.loads(example.read_text(encoding="utf-8"))
+        data_str = detector.detection_cache.get_data_string_efficient(data)
+        format_patterns = detector.evidence_collector.get_all_patterns()
+
+        scores = detector._get_score_index().score_all(data_str, data)
+
+        assert scores == {
+            format_type: ScoringAlgorithms.calculate_format_score(
+                data_str, patterns, data
+            )
+            for format_type, patterns in format_patterns.items()
+        }
+
+    def test_index_is_rebuilt_after_pattern_refresh(
+        self, detector: FormatDetector
+    ) -> None:
+        """The index is reused until the collector rebuilds its patterns."""
+        first = detector._get_score_index()
+        assert detector._get_score_index() is first
+
+        detector.evidence_collector.refresh_patterns()
+
+        rebuilt = detector._get_score_index()
+        assert rebuilt is not first
+        assert SupportedFormat.ZEPHYR in rebuilt.score_all("testcase cycle", None)
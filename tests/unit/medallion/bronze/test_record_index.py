@@ -0,0 +1,184 @@
+"""Tests for the Bronze layer's in-memory secondary indexes."""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from importobot.medallion.bronze.record_index import BronzeRecordIndex
+from importobot.medallion.bronze_layer import BronzeLayer, _FilterContext
+from importobot.medallion.interfaces.data_models import LayerMetadata
+from importobot.medallion.interfaces.enums import SupportedFormat
+
+BASE_TIME = datetime(2025, 1, 1, 12, 0)
+
+
+def _index_with(*records: tuple[str, SupportedFormat, str, int]) -> BronzeRecordIndex:
+    index = BronzeRecordIndex()
+    for record_id, format_type, source, minutes in records:
+        index.add(
+            record_id,
+            format_type=format_type,
+            source_path=Path(source),
+            ingested_at=BASE_TIME + timedelta(minutes=minutes),
+        )
+    return index
+
+
+def _context(layer: BronzeLayer, record_id: str) -> _FilterContext:
+    return _FilterContext(
+        record_id=record_id,
+        data=layer._data_store[record_id],
+        metadata=layer._metadata_store[record_id],
+        lineage_info=layer._lineage_store.get(record_id),
+    )
+
+
+def _metadata(source: str, minutes: int) -> LayerMetadata:
+    return LayerMetadata(
+        source_path=Path(source),
+        layer_name="bronze",
+        ingestion_timestamp=BASE_TIME + timedelta(minutes=minutes),
+    )
+
+
+ZEPHYR: dict[str, Any] = {
+    "testCase": {"name": "Login", "steps": [{"action": "Open page"}]},
+    "execution": {"status": "PASS"},
+    "cycle": {"name": "Sprint 1"},
+}
+TESTLINK: dict[str, Any] = {
+    "testsuites": {"testsuite": [{"name": "Suite", "testcase": [{"name": "Case"}]}]}
+}
+
+
+class TestBronzeRecordIndex:
+    """Tests for BronzeRecordIndex."""
+
+    def test_hash_indexes(self) -> None:
+        """Format lookups ignore case and source lookups compare strings."""
+        index = _index_with(
+            ("a", SupportedFormat.ZEPHYR, "a.json", 0),
+            ("b", SupportedFormat.TESTLINK, "b.json", 1),
+        )
+
+        assert index.with_format("ZEPHYR") == {"a"}
+        assert index.with_source("b.json") == {"b"}
+        assert index.with_format("testrail") == set()
+
+    def test_time_range_is_exclusive(self) -> None:
+        """Bounds exclude records ingested exactly at the bound."""
+        index = _index_with(
+            *((f"r{n}", SupportedFormat.ZEPHYR, "x.json", n) for n in range(5))
+        )
+        after = BASE_TIME + timedelta(minutes=1)
+        before = BASE_TIME + timedelta(minutes=3)
+
+        assert index.ingested_between(after, None) == {"r2", "r3", "r4"}
+        assert index.ingested_between(None, after) == {"r0"}
+        assert index.ingested_between(after, before) == {"r2"}
+
+    def test_remove_and_replace(self) -> None:
+        """Removed and replaced records leave no stale index entries."""
+        index = _index_with(
+            ("a", SupportedFormat.ZEPHYR, "a.json", 0),
+            ("b", SupportedFormat.ZEPHYR, "b.json", 1),
+        )
+        index.remove("a")
+        index.add(
+            "b",
+            format_type=SupportedFormat.TESTRAIL,
+            source_path="b.json",
+            ingested_at=BASE_TIME,
+        )
+
+        assert len(index) == 1
+        assert index.with_format("zephyr") == set()
+        assert index.ingested_between(None, None) == {"b"}
+        assert index.in_ingestion_order({"a", "b"}) == ["b"]
+
+    def test_unorderable_timestamps_disable_time_index(self) -> None:
+        """Mixing naive and aware timestamps falls back to scanning."""
+        index = _index_with(("a", SupportedFormat.ZEPHYR, "a.json", 0))
+        index.add(
+            "b",
+            format_type=SupportedFormat.ZEPHYR,
+            source_path="b.json",
+            ingested_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        )
+
+        assert index.ingested_between(BASE_TIME, None) is None
+        assert index.with_format("zephyr") == {"a", "b"}
+
+
+class TestIndexedBronzeFiltering:
+    """Tests for BronzeLayer filters answered from the indexes."""
+
+    @pytest.fixture
+    def layer(self, tmp_path: Path) -> BronzeLayer:
+        """Return a layer holding two Zephyr and one TestLink record."""
+        layer = BronzeLayer(tmp_path / "bronze")
+        layer.ingest(ZEPHYR, _metadata("first.json", 0))
+        layer.ingest(TESTLINK, _metadata("second.json", 10))
+        layer.ingest({**ZEPHYR, "extra": 1}, _metadata("third.json", 20))
+        return layer
+
+    def test_indexed_filters_skip_per_record_matching(
+        self, layer: BronzeLayer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Fully indexed criteria never evaluate records one by one."""
+
+        def fail(*_args: Any, **_kwargs: Any) -> bool:
+            raise AssertionError("record was scanned")
+
+        monkeypatch.setattr(layer, "_matches_filter", fail)
+
+        records = layer.get_bronze_records(
+            {
+                "format_type": "zephyr",
+                "ingestion_timestamp_after": BASE_TIME.isoformat(),
+            }
+        )
+
+        assert [r.lineage.source_location for r in records] == ["third.json"]
+
+    def test_matches_full_scan(self, layer: BronzeLayer) -> None:
+        """Indexed and residual filters return the scan's records in order."""
+        criteria = {
+            "format_type": "zephyr",
+            "ingestion_timestamp_before": BASE_TIME + timedelta(minutes=30),
+            "cycle.name": "Sprint 1",
+        }
+        scanned = [
+            record_id
+            for record_id in layer._data_store
+            if layer._matches_filter(_context(layer, record_id), criteria)
+        ]
+
+        records = layer.get_bronze_records(criteria)
+
+        assert [r.record_id for r in records] == scanned
+        assert len(scanned) == 2
+        assert layer.get_bronze_records(criteria, limit=1)[0].record_id == scanned[0]
+
+    def test_evicted_records_leave_the_index(self, tmp_path: Path) -> None:
+        """Capacity eviction removes records from every index."""
+        layer = BronzeLayer(tmp_path / "bronze", max_in_memory_records=1)
+        layer.ingest(ZEPHYR, _metadata("first.json", 0))
+        layer.ingest(TESTLINK, _metadata("second.json", 10))
+
+        assert layer.get_bronze_records({"source_path": "first.json"}) == []
+        assert len(layer._record_index) == 1
+
+    def test_scan_matches_format_enum(self, layer: BronzeLayer) -> None:
+        """Per-record matching accepts a SupportedFormat like the index does."""
+        criteria = {"format_type": SupportedFormat.ZEPHYR}
+        scanned = [
+            record_id
+            for record_id in layer._data_store
+            if layer._matches_filter(_context(layer, record_id), criteria)
+        ]
+
+        assert len(scanned) == 2
+        assert [r.record_id for r in layer.get_bronze_records(criteria)] == scanned
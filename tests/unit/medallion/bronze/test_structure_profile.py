@@ -0,0 +1,189 @@
+"""Tests for the bounded structural walker used by format detection."""
+
+import os
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+from importobot.medallion.bronze.complexity_analyzer import ComplexityAnalyzer
+from importobot.medallion.bronze.format_detector import FormatDetector
+from importobot.medallion.bronze.structure_profile import (
+    HyperLogLog,
+    profile_structure,
+)
+
+
+def _test_cases(count: int) -> dict[str, Any]:
+    return {
+        "tests": [
+            {
+                "name": f"Login case {index}",
+                "steps": [{"action": f"open page {index}", "expected": "shown"}],
+            }
+            for index in range(count)
+        ]
+    }
+
+
+def _nested_lists(depth: int) -> list[Any]:
+    root: list[Any] = []
+    current = root
+    for _ in range(depth - 1):
+        child: list[Any] = []
+        current.append(child)
+        current = child
+    return root
+
+
+class TestProfileStructure:
+    """Tests for profile_structure."""
+
+    def test_counts_depth_keys_and_size(self) -> None:
+        """Depth, key count and size are measured from the structure."""
+        data = {"a": {"b": [1, 2, {"c": "x y"}]}, "d": {}}
+
+        profile = profile_structure(data)
+
+        assert profile.complete
+        assert profile.nesting_depth == 4
+        assert profile.path_depth == 4
+        assert profile.key_count == 4
+        assert profile.size == pytest.approx(len(str(data)), rel=0.25)
+
+    def test_empty_containers_add_no_path_level(self) -> None:
+        """``path_depth`` ignores empty leaves while ``nesting_depth`` counts them."""
+        profile = profile_structure({"a": {}, "b": 1})
+
+        assert (profile.nesting_depth, profile.path_depth) == (2, 1)
+        assert profile_structure({}).path_depth == 0
+        assert profile_structure("scalar").nesting_depth == 0
+
+    def test_size_limit_stops_before_visiting_everything(self) -> None:
+        """A payload far above the size limit is abandoned almost immediately."""
+        data = _test_cases(30_000)
+
+        profile = profile_structure(data, max_size=50_000)
+
+        assert profile.stopped_by == "size"
+        assert profile.node_count < 10
+        assert not profile.complete
+
+    def test_depth_and_key_limits(self) -> None:
+        """Deep or wide payloads stop at the first exceeded limit."""
+        deep = profile_structure(_nested_lists(5_000), max_depth=25)
+        wide = profile_structure({f"k{i}": i for i in range(3_000)}, max_keys=2_000)
+
+        assert (deep.stopped_by, deep.nesting_depth) == ("depth", 26)
+        assert wide.stopped_by == "keys"
+
+    def test_deep_nesting_without_limits_does_not_recurse(self) -> None:
+        """The walk is iterative, so nesting beyond the recursion limit works."""
+        assert profile_structure(_nested_lists(5_000)).nesting_depth == 5_000
+
+    def test_self_references_terminate(self) -> None:
+        """Containers that contain themselves are visited once per path."""
+        data: dict[str, Any] = {"name": "loop"}
+        data["self"] = data
+
+        profile = profile_structure(data)
+
+        assert profile.complete
+        assert profile.nesting_depth == 1
+
+    def test_sampling_and_node_budget(self) -> None:
+        """Long lists are sampled and the node budget bounds the walk."""
+        data: list[dict[str, Any]] = [{"value": index} for index in range(1_000)]
+        data[-1] = {"value": {"nested": [1]}}
+
+        sampled = profile_structure(data, sample_items=8)
+        budget = profile_structure(data, max_nodes=50)
+
+        assert sampled.sampled
+        assert sampled.node_count < 30
+        assert sampled.path_depth == 4
+        assert (budget.stopped_by, budget.node_count) == ("nodes", 50)
+
+    def test_uniqueness_ratio_reflects_repetition(self) -> None:
+        """Repeated tokens lower the ratio; distinct tokens keep it near one."""
+        repetitive = {"lines": ["same words again"] * 500}
+        distinct = {"lines": [f"token{index}" for index in range(500)]}
+
+        assert profile_structure(repetitive).uniqueness_ratio < 0.01
+        assert profile_structure(distinct).uniqueness_ratio > 0.95
+
+
+class TestHyperLogLog:
+    """Tests for the distinct-token sketch."""
+
+    @pytest.mark.parametrize("count", [0, 10, 1_000, 50_000])
+    def test_estimate_is_close(self, count: int) -> None:
+        """Estimates stay close to the true cardinality, ignoring repeats."""
+        sketch = HyperLogLog()
+        sketch.update(f"token-{index}" for index in range(count))
+        sketch.update(f"token-{index}" for index in range(count))
+
+        assert sketch.estimate() == pytest.approx(count, rel=0.15, abs=1)
+
+    def test_estimate_is_stable_across_processes(self) -> None:
+        """Estimates do not depend on the per-process string hash seed."""
+        script = (
+            "from importobot.medallion.bronze.structure_profile import HyperLogLog;"
+            "s = HyperLogLog(); s.update(f'token-{i}' for i in range(3000));"
+            "print(repr(s.estimate()))"
+        )
+
+        def estimate(seed: str) -> str:
+            result = subprocess.run(
+                [sys.executable, "-c", script],
+                capture_output=True,
+                text=True,
+                check=True,
+                env={**os.environ, "PYTHONHASHSEED": seed},
+            )
+            return result.stdout.strip()
+
+        assert estimate("1") == estimate("2")
+
+    def test_rejects_invalid_precision(self) -> None:
+        """Register counts outside the supported range are refused."""
+        with pytest.raises(ValueError, match="precision"):
+            HyperLogLog(precision=2)
+
+
+class TestComplexityAssessment:
+    """Tests for ComplexityAnalyzer and its callers using the walker."""
+
+    def test_small_payload_reports_stats(self) -> None:
+        """Acceptable payloads report the walker's statistics."""
+        result = ComplexityAnalyzer.assess_data_complexity(_test_cases(3))
+
+        assert result["too_complex"] is False
+        assert result["stats"]["max_depth"] == 5
+        assert result["stats"]["estimated_keys"] == 13
+
+    def test_oversized_payload_is_too_complex(self) -> None:
+        """Payloads above the size limit are flagged without a full walk."""
+        result = ComplexityAnalyzer.assess_data_complexity(_test_cases(5_000))
+
+        assert result["too_complex"] is True
+        assert "Data size" in result["reason"]
+
+    def test_repetitive_large_payload_is_too_complex(self) -> None:
+        """Large payloads made of the same tokens are flagged as repetitive."""
+        data = {"log": ["retry " * 20] * 150}
+
+        result = ComplexityAnalyzer.assess_data_complexity(data)
+
+        assert result["too_complex"] is True
+        assert "repetitive" in result["reason"]
+
+    def test_classifier_depth_uses_path_depth(self) -> None:
+        """The structural-quality depth matches the walker's path depth."""
+        classifier = FormatDetector().hierarchical_classifier
+        data = {"a": {"b": [{"c": 1}]}, "d": {}}
+
+        assert classifier._calculate_depth(data) == 4
+        assert classifier._calculate_depth(data, current_depth=2) == 6
+        assert classifier._calculate_depth([]) == 0
@@ -0,0 +1 @@
+"""Unit tests for Silver layer components."""
@@ -0,0 +1,121 @@
+"""Tests for the dictionary-encoded columnar test-case store."""
+
+import pytest
+
+from importobot.medallion.silver import columnar_store
+from importobot.medallion.silver.columnar_store import (
+    ColumnarTestStore,
+    StringDictionary,
+)
+from importobot.medallion.silver.normalizer import NormalizedStep, NormalizedTestCase
+
+
+def _test(key: str, *actions: str, priority: str = "High") -> NormalizedTestCase:
+    return NormalizedTestCase(
+        key=key,
+        name=f"Test {key}",
+        priority=priority,
+        steps=tuple(
+            NormalizedStep(index=index, action=action, expected="ok")
+            for index, action in enumerate(actions, start=1)
+        ),
+    )
+
+
+class TestStringDictionary:
+    """Tests for StringDictionary."""
+
+    def test_encodes_each_string_once(self) -> None:
+        """Repeated strings share one code and the empty string is code 0."""
+        strings = StringDictionary()
+
+        first = strings.encode("High")
+
+        assert strings.encode("High") == first
+        assert strings.code_of("") == 0
+        assert strings.code_of("Low") is None
+        assert strings.decode(first) == "High"
+        assert list(strings.matching("HIG")) == [0, 1]
+        assert list(strings.matching("HIG", case_sensitive=True)) == [0, 0]
+
+
+class TestColumnarTestStore:
+    """Tests for ColumnarTestStore."""
+
+    def test_round_trips_test_cases(self) -> None:
+        """Stored test cases decode back to equal values."""
+        store = ColumnarTestStore()
+        tests = [_test("A-1", "Open SSH session", "Run ls"), _test("A-2")]
+
+        assert store.add_source("hash-a", "zephyr", tests) == 2
+
+        assert store.test_cases("hash-a") == tests
+        assert store.test_count == 2
+        assert store.step_count == 2
+        assert "hash-a" in store
+
+    def test_find_steps_scans_step_columns(self) -> None:
+        """Step queries return matching steps with their test identity."""
+        store = ColumnarTestStore()
+        store.add_source("hash-a", "zephyr", [_test("A-1", "Open SSH session")])
+        store.add_source("hash-b", "testrail", [_test("B-1", "Run ls", "ssh exit")])
+
+        matches = store.find_steps("ssh")
+
+        assert [(m.source, m.test_key, m.step.index) for m in matches] == [
+            ("hash-a", "A-1", 1),
+            ("hash-b", "B-1", 2),
+        ]
+        assert store.find_steps("ssh", case_sensitive=True)[0].test_key == "B-1"
+        assert store.find_steps("missing") == []
+
+    def test_find_tests_by_column_value(self) -> None:
+        """Equality lookups compare dictionary codes."""
+        store = ColumnarTestStore()
+        store.add_source(
+            "hash-a", "zephyr", [_test("A-1"), _test("A-2", priority="Low")]
+        )
+
+        assert [t.key for t in store.find_tests("priority", "Low")] == ["A-2"]
+        assert store.find_tests("priority", "Critical") == []
+
+    def test_replacing_a_source_hides_old_rows(self) -> None:
+        """Re-adding a source replaces its rows instead of duplicating them."""
+        store = ColumnarTestStore()
+        store.add_source("hash-a", "zephyr", [_test("A-1", "Open SSH session")])
+        store.add_source("hash-a", "zephyr", [_test("A-1", "Run ls")])
+
+        assert store.test_count == 1
+        assert store.find_steps("ssh") == []
+        assert store.find_steps("run")[0].step.action == "Run ls"
+
+    def test_compaction_preserves_live_rows(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Compaction drops dead rows and keeps sources addressable."""
+        monkeypatch.setattr(columnar_store, "COMPACT_MIN_DEAD_ROWS", 1)
+        store = ColumnarTestStore()
+        store.add_source("hash-a", "zephyr", [_test("A-1", "one"), _test("A-2")])
+        store.add_source("hash-b", "zephyr", [_test("B-1", "two")])
+
+        assert store.remove_source("hash-a") == 2
+
+        assert store.stats()["tests"] == 1
+        assert len(store._test_live) == 1
+        assert store.test_cases("hash-b") == [_test("B-1", "two")]
+        assert store.find_steps("two")[0].source == "hash-b"
+
+    def test_numpy_scan_matches_python_scan(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The vectorized scan returns the same rows as the Python loop."""
+        pytest.importorskip("numpy")
+        store = ColumnarTestStore()
+        actions = [f"step {n} {'ssh' if n % 3 == 0 else 'web'}" for n in range(50)]
+        store.add_source("hash-a", "zephyr", [_test("A-1", *actions)])
+        expected = store.find_steps("ssh")
+
+        monkeypatch.setattr(columnar_store, "NUMPY_SCAN_MIN_ROWS", 1)
+
+        assert store.find_steps("ssh") == expected
+        assert len(expected) == 17
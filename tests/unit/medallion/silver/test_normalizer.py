@@ -0,0 +1,102 @@
+"""Tests for cross-format test-case normalization."""
+
+from typing import Any
+
+from importobot.medallion.interfaces.enums import SupportedFormat
+from importobot.medallion.silver.normalizer import (
+    NormalizedStep,
+    NormalizedTestCase,
+    TestCaseNormalizer,
+)
+
+LOGIN_STEP = NormalizedStep(index=1, action="Open login page", expected="Page shown")
+
+
+class TestTestCaseNormalizer:
+    """Tests for TestCaseNormalizer vendor extractors."""
+
+    def test_zephyr_test_case(self) -> None:
+        """Zephyr stepDescription/expectedResult map onto action/expected."""
+        data: dict[str, Any] = {
+            "testCase": {
+                "key": "ZEP-1",
+                "name": "Login",
+                "priority": "High",
+                "steps": [
+                    {
+                        "stepDescription": "Open login page",
+                        "expectedResult": "Page shown",
+                    }
+                ],
+            }
+        }
+
+        [test] = TestCaseNormalizer().normalize(data, SupportedFormat.ZEPHYR)
+
+        assert test == NormalizedTestCase(
+            key="ZEP-1", name="Login", priority="High", steps=(LOGIN_STEP,)
+        )
+
+    def test_xray_issue_reads_jira_fields(self) -> None:
+        """Xray names come from the issue fields and steps from testInfo."""
+        data = {
+            "issues": [
+                {
+                    "key": "XRAY-7",
+                    "fields": {"summary": "Login", "priority": {"name": "Major"}},
+                    "testInfo": {
+                        "steps": [{"action": "Open login page", "result": "Page shown"}]
+                    },
+                }
+            ]
+        }
+
+        [test] = TestCaseNormalizer().normalize(data, SupportedFormat.JIRA_XRAY)
+
+        assert (test.key, test.name, test.priority) == ("XRAY-7", "Login", "Major")
+        assert test.steps == (LOGIN_STEP,)
+
+    def test_testrail_separated_steps(self) -> None:
+        """TestRail custom_steps_separated entries become steps."""
+        data = {
+            "cases": [
+                {
+                    "id": 42,
+                    "title": "Login",
+                    "custom_steps_separated": [
+                        {"content": "Open login page", "expected": "Page shown"}
+                    ],
+                }
+            ]
+        }
+
+        [test] = TestCaseNormalizer().normalize(data, SupportedFormat.TESTRAIL)
+
+        assert (test.key, test.name) == ("42", "Login")
+        assert test.steps == (LOGIN_STEP,)
+
+    def test_testlink_nested_suites(self) -> None:
+        """TestLink test cases are collected from nested suites."""
+        step = {"actions": "Open login page", "expectedresults": "Page shown"}
+        data = {
+            "testsuites": {
+                "testsuite": {
+                    "testcase": {"name": "Top", "steps": {"step": [step]}},
+                    "testsuite": [{"testcase": [{"name": "Nested"}]}],
+                }
+            }
+        }
+
+        tests = TestCaseNormalizer().normalize(data, SupportedFormat.TESTLINK)
+
+        assert [test.name for test in tests] == ["Top", "Nested"]
+        assert tests[0].steps == (LOGIN_STEP,)
+
+    def test_unknown_format_uses_generic_discovery(self) -> None:
+        """Formats without an extractor fall back to generic discovery."""
+        data = {"tests": [{"name": "Login", "steps": [{"action": "Open page"}]}]}
+
+        [test] = TestCaseNormalizer().normalize(data, SupportedFormat.UNKNOWN)
+
+        assert test.name == "Login"
+        assert test.steps == (NormalizedStep(index=1, action="Open page"),)
@@ -0,0 +1,160 @@
+"""Tests for the Silver layer built on the columnar test-case store."""
+
+import warnings
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from importobot.medallion.bronze_layer import BronzeLayer
+from importobot.medallion.interfaces.data_models import LayerMetadata, LayerQuery
+from importobot.medallion.interfaces.enums import ProcessingStatus, SupportedFormat
+from importobot.medallion.silver import ColumnarTestStore, TestCaseNormalizer
+from importobot.medallion.silver_layer import SilverLayer
+
+ZEPHYR_DATA: dict[str, Any] = {
+    "testCase": {
+        "key": "ZEP-1",
+        "name": "Remote login",
+        "steps": [
+            {"stepDescription": "Open SSH session", "expectedResult": "Connected"},
+            {"stepDescription": "Run uptime", "expectedResult": "Uptime shown"},
+        ],
+    },
+    "execution": {"status": "PASS"},
+    "cycle": {"name": "Sprint 1"},
+}
+TESTRAIL_DATA: dict[str, Any] = {
+    "cases": [
+        {
+            "id": 7,
+            "title": "Close session",
+            "custom_steps_separated": [{"content": "Exit ssh", "expected": "Closed"}],
+        }
+    ],
+    "runs": [{"id": 1}],
+}
+
+
+def _metadata(
+    format_type: SupportedFormat = SupportedFormat.UNKNOWN,
+) -> LayerMetadata:
+    return LayerMetadata(
+        source_path=Path("/input/export.json"),
+        layer_name="bronze",
+        ingestion_timestamp=datetime(2025, 1, 1, 12, 0),
+        format_type=format_type,
+    )
+
+
+class TestSilverIngest:
+    """Tests for SilverLayer.ingest."""
+
+    def test_no_placeholder_warning(self) -> None:
+        """The Silver layer is no longer a placeholder."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            SilverLayer()
+
+    def test_ingest_normalizes_into_store(self) -> None:
+        """Ingested test cases are stored and queryable by step text."""
+        layer = SilverLayer()
+
+        result = layer.ingest(ZEPHYR_DATA, _metadata(SupportedFormat.ZEPHYR))
+
+        assert result.status == ProcessingStatus.COMPLETED
+        assert result.metadata.record_count == 1
+        data_hash = result.metadata.data_hash
+        [test] = layer.get_test_cases(data_hash)
+        assert test.key == "ZEP-1"
+        [match] = layer.find_steps("ssh")
+        assert (match.source, match.step.expected) == (data_hash, "Connected")
+        assert layer.get_record_lineage(data_hash) is not None
+
+    def test_repeated_content_is_skipped(self) -> None:
+        """Content whose hash is already stored is not normalized again."""
+        layer = SilverLayer()
+        layer.ingest(ZEPHYR_DATA, _metadata(SupportedFormat.ZEPHYR))
+
+        result = layer.ingest(ZEPHYR_DATA, _metadata(SupportedFormat.ZEPHYR))
+
+        assert result.status == ProcessingStatus.SKIPPED
+        assert result.skipped_count == 1
+        assert layer.store.test_count == 1
+
+    def test_source_already_in_injected_store_is_skipped(self) -> None:
+        """A store filled outside the layer skips with the incoming metadata."""
+        store = ColumnarTestStore()
+        tests = TestCaseNormalizer().normalize(ZEPHYR_DATA, SupportedFormat.ZEPHYR)
+        store.add_source("h1", "zephyr", tests)
+        metadata = _metadata(SupportedFormat.ZEPHYR)
+        metadata.data_hash = "h1"
+
+        result = SilverLayer(store=store).ingest(ZEPHYR_DATA, metadata)
+
+        assert result.status == ProcessingStatus.SKIPPED
+        assert result.metadata is metadata
+        assert store.test_count == 1
+
+    def test_invalid_data_fails(self) -> None:
+        """Non-dictionary input is rejected."""
+        result = SilverLayer().ingest(["not", "a", "dict"], _metadata())
+
+        assert result.status == ProcessingStatus.FAILED
+        assert result.errors
+
+    def test_remove_source(self) -> None:
+        """Removing a source drops its rows, metadata and lineage."""
+        layer = SilverLayer()
+        data_hash = layer.ingest(ZEPHYR_DATA, _metadata()).metadata.data_hash
+
+        assert layer.remove_source(data_hash) is True
+
+        assert layer.get_test_cases() == []
+        assert layer.get_record_metadata(data_hash) is None
+        assert layer.remove_source(data_hash) is False
+
+    def test_retrieve_materializes_sources(self) -> None:
+        """Layer queries return one record per stored source."""
+        layer = SilverLayer()
+        layer.ingest(ZEPHYR_DATA, _metadata(SupportedFormat.ZEPHYR))
+        layer.ingest(TESTRAIL_DATA, _metadata(SupportedFormat.TESTRAIL))
+
+        data = layer.retrieve(LayerQuery(layer_name="silver"))
+
+        assert data.total_count == 2
+        assert [r["format_type"] for r in data.records] == ["zephyr", "testrail"]
+
+
+class TestSyncFromBronze:
+    """Tests for SilverLayer.sync_from_bronze."""
+
+    def test_sync_is_incremental(self, tmp_path: Path) -> None:
+        """Only Bronze records with unseen hashes are normalized."""
+        bronze = BronzeLayer(tmp_path / "bronze")
+        bronze.ingest(ZEPHYR_DATA, _metadata())
+        silver = SilverLayer()
+
+        first = silver.sync_from_bronze(bronze)
+        bronze.ingest(TESTRAIL_DATA, _metadata())
+        second = silver.sync_from_bronze(bronze)
+
+        assert (first.success_count, first.skipped_count) == (1, 0)
+        assert (second.success_count, second.skipped_count) == (1, 1)
+        assert {m.test_key for m in silver.find_steps("ssh")} == {"ZEP-1", "7"}
+
+    def test_ingest_with_detection_builds_silver_rows(self) -> None:
+        """Raw ingestion is normalized into the store and described by a record."""
+        layer = SilverLayer()
+
+        record = layer.ingest_with_detection(
+            ZEPHYR_DATA, {"source_path": "/input/export.json"}
+        )
+        again = layer.ingest_with_detection(ZEPHYR_DATA, {})
+
+        assert record.format_detection.detected_format == SupportedFormat.ZEPHYR
+        assert record.metadata.processing_status == ProcessingStatus.COMPLETED
+        assert record.record_id in layer.store
+        assert record.lineage.source_type == "bronze"
+        assert [m.test_key for m in layer.find_steps("ssh")] == ["ZEP-1"]
+        assert again.metadata.processing_status == ProcessingStatus.SKIPPED
+        assert again.record_id == record.record_id
@@ -0,0 +1,125 @@
+"""Tests for the canonical payload shared across a Bronze ingest."""
+
+import hashlib
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from importobot.medallion.bronze.detection_cache import DetectionCache
+from importobot.medallion.bronze.format_detector import FormatDetector
+from importobot.medallion.bronze_layer import BronzeLayer
+from importobot.medallion.canonical_payload import CanonicalPayload
+from importobot.medallion.interfaces.data_models import LayerMetadata
+from importobot.medallion.storage.local import LocalStorageBackend
+
+ZEPHYR_DATA: dict[str, Any] = {
+    "testCase": {"name": "Login", "steps": [{"action": "Open page"}]},
+    "execution": {"status": "PASS"},
+    "cycle": {"name": "Sprint 1"},
+}
+
+
+def _metadata() -> LayerMetadata:
+    return LayerMetadata(
+        source_path=Path("/input/zephyr.json"),
+        layer_name="bronze",
+        ingestion_timestamp=datetime(2025, 1, 1, 12, 0),
+    )
+
+
+class TestCanonicalPayload:
+    """Tests for CanonicalPayload."""
+
+    def test_carries_text_bytes_digest_and_lowered_view(self) -> None:
+        """All views derive from one sorted-key serialization."""
+        payload = CanonicalPayload.from_data({"b": "Two", "a": 1})
+
+        assert payload.text == '{"a": 1, "b": "Two"}'
+        assert payload.encoded == payload.text.encode("utf-8")
+        assert len(payload) == len(payload.encoded)
+        assert payload.digest == hashlib.blake2b(payload.encoded).hexdigest()
+        assert payload.lowered == '{"a": 1, "b": "two"}'
+        assert payload.lowered is payload.lowered
+
+    def test_default_handles_unserializable_values(self) -> None:
+        """The ``default`` callback renders values JSON cannot encode."""
+        payload = CanonicalPayload.from_data({"path": Path("/tmp/x")}, default=str)
+
+        assert json.loads(payload.text) == {"path": "/tmp/x"}
+
+
+class TestDetectionWithPayload:
+    """Tests for format detection reusing the canonical payload."""
+
+    def test_detection_matches_plain_data(self) -> None:
+        """Detecting the payload gives the same format as the plain data."""
+        payload = CanonicalPayload.from_data(ZEPHYR_DATA)
+        expected = FormatDetector().detect_format(ZEPHYR_DATA)
+
+        assert FormatDetector().detect_format(payload) == expected
+
+    def test_cache_does_not_serialize_payloads(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Cache lookups and writes key payloads by their digest."""
+        cache = DetectionCache()
+        payload = CanonicalPayload.from_data(ZEPHYR_DATA)
+
+        def fail(*_args: Any, **_kwargs: Any) -> str:
+            raise AssertionError("payload was serialized again")
+
+        monkeypatch.setattr(
+            "importobot.medallion.bronze.detection_cache.json.dumps", fail
+        )
+        detector = FormatDetector(cache=cache)
+        result = detector.detect_format(payload)
+
+        assert cache.get_cached_detection_result(payload) == result
+        assert cache.get_data_string_efficient(payload) == payload.lowered
+
+
+class TestBronzeIngest:
+    """Tests for BronzeLayer.ingest using one serialization."""
+
+    def test_storage_writes_the_hashed_bytes(self, tmp_path: Path) -> None:
+        """The persisted file holds exactly the bytes the data hash covers."""
+        backend = LocalStorageBackend({"base_path": str(tmp_path / "store")})
+        layer = BronzeLayer(tmp_path / "bronze", storage_backend=backend)
+
+        result = layer.ingest(ZEPHYR_DATA, _metadata())
+
+        assert result.metadata is not None
+        [data_file] = (tmp_path / "store" / "bronze" / "data").glob("*.json")
+        stored = data_file.read_bytes()
+        assert hashlib.blake2b(stored).hexdigest() == result.metadata.data_hash
+        assert json.loads(stored) == ZEPHYR_DATA
+        assert backend.retrieve_data("bronze", data_file.stem) is not None
+
+    def test_ingest_serializes_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Hashing, detection and validation share a single serialization."""
+        layer = BronzeLayer(tmp_path / "bronze")
+        calls: list[Any] = []
+        original = layer._serialize_data
+
+        def counting(data: Any) -> str:
+            calls.append(data)
+            return original(data)
+
+        monkeypatch.setattr(layer, "_serialize_data", counting)
+
+        result = layer.ingest(ZEPHYR_DATA, _metadata())
+
+        assert len(calls) == 1
+        assert result.metadata is not None
+        assert result.metadata.format_type == FormatDetector().detect_format(
+            ZEPHYR_DATA
+        )
+        assert (
+            result.metadata.data_hash
+            == hashlib.blake2b(original(ZEPHYR_DATA).encode()).hexdigest()
+        )
@@ -1,11 +1,14 @@
 """Tests for Medallion architecture interfaces."""
 
+import sys
 import unittest
 from datetime import datetime
 from pathlib import Path
 
 from importobot.medallion.interfaces.data_models import (
+    DataLineage,
     DataQualityMetrics,
+    FormatDetectionResult,
     LayerData,
     LayerMetadata,
     LayerQuery,
@@ -13,6 +16,7 @@ from importobot.medallion.interfaces.data_models import (
     ProcessingResult,
 )
 from importobot.medallion.interfaces.enums import ProcessingStatus, SupportedFormat
+from importobot.medallion.interfaces.records import RecordMetadata
 from importobot.utils.validation_models import QualitySeverity, ValidationResult
 
 
@@ -255,5 +259,40 @@ class TestMedallionInterfaces(unittest.TestCase):
         assert isinstance(validation.validation_timestamp, datetime)
 
 
+class TestCompactRecordModels(unittest.TestCase):
+    """Test the slotted, label-interning record models."""
+
+    def test_models_are_slotted(self) -> None:
+        """Per-record models carry no instance ``__dict__``."""
+        timestamp = datetime(2025, 1, 1)
+        models = [
+            LayerMetadata(Path("a.json"), "bronze", timestamp),
+            LineageInfo("id", "input", "bronze", "raw_ingestion", timestamp),
+            DataLineage(source_id="id", source_type="file", source_location="a"),
+            RecordMetadata(record_id="id"),
+            FormatDetectionResult(SupportedFormat.ZEPHYR, 0.5, {}),
+        ]
+        for model in models:
+            with self.subTest(model=type(model).__name__):
+                assert not hasattr(model, "__dict__")
+
+    def test_repeated_labels_share_one_string(self) -> None:
+        """Equal labels built at runtime are interned to the same object."""
+        location = "".join(["exports/", "batch.json"])
+        copies = [
+            DataLineage(
+                source_id=str(index),
+                source_type="file",
+                source_location="".join(["exports/", "batch.json"]),
+            )
+            for index in range(2)
+        ]
+
+        assert copies[0].source_location is copies[1].source_location
+        assert copies[0].source_location == location
+        metadata = LayerMetadata(Path("a"), "".join(["bro", "nze"]), datetime.now())
+        assert metadata.layer_name is sys.intern("bronze")
+
+
 if __name__ == "__main__":
     unittest.main()
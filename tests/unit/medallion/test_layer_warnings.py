@@ -1,4 +1,4 @@
-"""Runtime warning tests for Silver and Gold layers."""
+"""Runtime warning tests for placeholder medallion layers."""
 
 from __future__ import annotations
 
@@ -7,10 +7,9 @@ import warnings
 import pytest
 
 from importobot.medallion.gold_layer import GoldLayer
-from importobot.medallion.silver_layer import SilverLayer
 
 
-@pytest.mark.parametrize("layer_cls", [SilverLayer, GoldLayer])
+@pytest.mark.parametrize("layer_cls", [GoldLayer])
 def test_placeholder_layers_emit_warning(layer_cls: type) -> None:
     """Ensure placeholder layer implementations emit a runtime warning."""
     with warnings.catch_warnings(record=True) as caught:
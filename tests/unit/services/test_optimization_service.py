@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import random
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -226,3 +228,115 @@ def test_gold_layer_optimization_preview_included(tmp_path: Path) -> None:
     assert preview["algorithm"] == "gradient_descent"
     assert set(preview["parameters"]).issuperset({"quality_weight", "latency_weight"})
     assert preview["score"] >= 0.0
+
+
+def _register_bowl(service: OptimizationService, name: str) -> None:
+    def objective(parameters: dict[str, float]) -> float:
+        return (parameters["x"] - 1.0) ** 2 + (parameters["y"] + 0.5) ** 2
+
+    service.register_scenario(
+        name,
+        objective_function=objective,
+        initial_parameters={"x": 0.0, "y": 1.0},
+        parameter_bounds={"x": (-2.0, 2.0), "y": (-2.0, 2.0)},
+    )
+
+
+def test_numpy_engine_matches_python_gradient_descent() -> None:
+    """A single-start NumPy run reproduces the Python engine exactly."""
+    service = OptimizationService()
+    _register_bowl(service, "parity")
+    config = OptimizerConfig(learning_rate=0.05, max_iterations=30)
+
+    python_outcome = service.execute("parity", gradient_config=config)
+    numpy_outcome = service.execute("parity", gradient_config=config, engine="numpy")
+
+    assert numpy_outcome.parameters == python_outcome.parameters
+    assert numpy_outcome.score == python_outcome.score
+    assert numpy_outcome.details["engine"] == "numpy"
+    assert "engine" not in python_outcome.details
+
+
+@pytest.mark.parametrize("engine", ["python", "numpy"])
+@pytest.mark.parametrize("algorithm", ["genetic_algorithm", "simulated_annealing"])
+def test_seeded_runs_are_reproducible(engine: str, algorithm: str) -> None:
+    """The same seed gives the same result on each engine."""
+    service = OptimizationService(engine=engine)
+    _register_bowl(service, "seeded")
+
+    first = service.execute("seeded", algorithm=algorithm, seed=42, starts=2)
+    second = service.execute("seeded", algorithm=algorithm, seed=42, starts=2)
+
+    assert first.parameters == second.parameters
+    assert first.score == second.score
+
+
+def test_seeded_python_run_restores_global_random_state() -> None:
+    """Seeding a run does not disturb the caller's random sequence."""
+    service = OptimizationService()
+    _register_bowl(service, "isolated")
+    random.seed(9)
+    expected = random.random()
+
+    random.seed(9)
+    service.execute("isolated", algorithm="simulated_annealing", seed=1)
+
+    assert random.random() == expected
+
+
+def test_auto_engine_uses_numpy_only_for_batched_runs() -> None:
+    """``auto`` keeps single-start runs on Python and batches multi-start ones."""
+    service = OptimizationService(engine="auto")
+    _register_bowl(service, "auto")
+    config = OptimizerConfig(max_iterations=5)
+
+    single = service.execute("auto", gradient_config=config)
+    multi = service.execute("auto", gradient_config=config, starts=4, seed=1)
+
+    assert "engine" not in single.details
+    assert multi.details["engine"] == "numpy"
+    assert multi.details["metadata"]["starts"] == 4
+
+
+def test_unknown_engine_is_rejected() -> None:
+    """Invalid engine names raise ValueError at construction and execution."""
+    with pytest.raises(ValueError, match="Unsupported engine"):
+        OptimizationService(engine="gpu")
+
+    service = OptimizationService()
+    _register_bowl(service, "engine-check")
+    with pytest.raises(ValueError, match="Unsupported engine"):
+        service.execute("engine-check", engine="gpu")
+
+
+def test_gold_layer_multi_start_preview_uses_batch_objective(tmp_path: Path) -> None:
+    """Multi-start previews run vectorized and never score worse than one start."""
+    with pytest.warns(
+        UserWarning, match="GoldLayer is currently a placeholder implementation"
+    ):
+        gold_layer = GoldLayer(optimization_service=OptimizationService())
+
+    def preview(**overrides: Any) -> dict[str, Any]:
+        metadata = LayerMetadata(
+            source_path=tmp_path / "source.json",
+            layer_name="gold",
+            ingestion_timestamp=datetime.now(),
+            custom_metadata={
+                "conversion_optimization": {
+                    "enabled": True,
+                    "scenario_name": "conversion-preview",
+                    "preview_max_iterations": 10,
+                    **overrides,
+                }
+            },
+        )
+        result = gold_layer.ingest({"test_cases": [1, 2, 3]}, metadata)
+        return result.details["optimization_preview"]  # type: ignore[no-any-return]
+
+    single = preview()
+    multi = preview(starts=6, seed=3, engine="numpy")
+
+    assert single["engine"] == "python"
+    assert preview(starts=6, seed=3)["engine"] == "python"
+    assert multi["engine"] == "numpy"
+    assert multi["score"] <= single["score"]
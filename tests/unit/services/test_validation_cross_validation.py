@@ -0,0 +1,177 @@
+"""Tests for k-fold cross-validation in the validation service."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from importobot.services.validation_service import ValidationService
+from importobot.utils.validation_models import ValidationResult, ValidationSeverity
+
+
+class EvenRecordStrategy:
+    """Accept records whose ``n`` is even."""
+
+    def validate(self, data: Any, context: dict[str, Any]) -> ValidationResult:
+        """Validate one record."""
+        return ValidationResult(
+            is_valid=data["n"] % 2 == 0,
+            severity=ValidationSeverity.INFO,
+            context=context,
+        )
+
+
+def _service() -> ValidationService:
+    service = ValidationService()
+    service.register_strategy("even", EvenRecordStrategy())
+    return service
+
+
+def _records(count: int) -> list[dict[str, int]]:
+    return [{"n": n} for n in range(count)]
+
+
+class TestFoldAssignment:
+    """Tests for deterministic fold membership."""
+
+    def test_records_are_dealt_round_robin(self) -> None:
+        """Record ``i`` lands in fold ``i % k``; earlier folds take the rest."""
+        result = _service().cross_validate(_records(12), ["even"], k_folds=5)
+
+        sizes = [fold["validation_size"] for fold in result["fold_results"]]
+        assert sizes == [3, 3, 2, 2, 2]
+        assert result["total_data_size"] == 12
+        assert result["early_stopped"] is False
+
+    def test_process_pool_matches_in_process_run(self) -> None:
+        """The worker count never changes the result."""
+        service = _service()
+
+        serial = service.cross_validate(_records(40), ["even", "json"], k_folds=4)
+        parallel = service.cross_validate(
+            _records(40), ["even", "json"], k_folds=4, workers=2
+        )
+
+        assert parallel == serial
+
+
+class TestScoringParity:
+    """Tests that every execution mode scores the same unit."""
+
+    def test_list_streaming_and_workers_agree(self) -> None:
+        """List, streaming and process-pool runs report equal fold results."""
+        service = _service()
+        strategies = ["even", "json"]
+
+        listed = service.cross_validate(_records(40), strategies, k_folds=4)
+        streamed = service.cross_validate(
+            iter(_records(40)), strategies, k_folds=4, streaming=True, chunk_size=7
+        )
+        parallel = service.cross_validate(
+            _records(40), strategies, k_folds=4, workers=2
+        )
+
+        assert listed["fold_results"] == streamed["fold_results"]
+        assert listed["fold_results"] == parallel["fold_results"]
+        scores = [fold["strategy_scores"] for fold in listed["fold_results"]]
+        assert [fold["even"] for fold in scores] == [1.0, 0.0, 1.0, 0.0]
+        assert [fold["json"] for fold in scores] == [1.0] * 4
+        assert listed["overall_reliability"] == streamed["overall_reliability"]
+
+
+class TestStreamingCrossValidation:
+    """Tests for cross-validation over an iterator."""
+
+    def test_scores_each_record(self) -> None:
+        """Streaming fold scores are the fraction of records that pass."""
+        result = _service().cross_validate(
+            iter(_records(30)), ["even"], k_folds=3, streaming=True, chunk_size=7
+        )
+
+        scores = [fold["strategy_scores"]["even"] for fold in result["fold_results"]]
+        assert scores == pytest.approx([0.5, 0.5, 0.5])
+        assert result["total_data_size"] == 30
+
+    def test_process_pool_matches_in_process_run(self) -> None:
+        """Chunks merged in order give the same result with workers."""
+        service = _service()
+        options: dict[str, Any] = {"k_folds": 3, "streaming": True, "chunk_size": 5}
+
+        serial = service.cross_validate(iter(_records(31)), ["even"], **options)
+        parallel = service.cross_validate(
+            iter(_records(31)), ["even"], workers=2, **options
+        )
+
+        assert parallel == serial
+
+    def test_early_exit_stops_reading(self) -> None:
+        """A tight interval stops consuming the iterator after a chunk."""
+        consumed = 0
+
+        def records() -> Iterator[dict[str, int]]:
+            nonlocal consumed
+            for record in _records(10_000):
+                consumed += 1
+                yield record
+
+        result = _service().cross_validate(
+            records(),
+            ["even"],
+            k_folds=3,
+            streaming=True,
+            chunk_size=100,
+            ci_tolerance=0.05,
+        )
+
+        assert result["early_stopped"] is True
+        assert result["total_data_size"] == 100
+        # One record past the chunk is read to confirm records were left unread
+        assert consumed == 101
+
+    @pytest.mark.parametrize(
+        "options", [{}, {"chunk_size": 40}, {"chunk_size": 40, "workers": 2}]
+    )
+    def test_tight_interval_on_the_last_chunk_is_not_early(
+        self, options: dict[str, Any]
+    ) -> None:
+        """Reading every record is not reported as an early stop."""
+        result = _service().cross_validate(
+            iter([{"n": 2 * n} for n in range(40)]),
+            ["even"],
+            k_folds=3,
+            streaming=True,
+            ci_tolerance=0.05,
+            **options,
+        )
+
+        assert result["total_data_size"] == 40
+        assert result["early_stopped"] is False
+
+    def test_too_few_records(self) -> None:
+        """Streams shorter than k_folds are rejected."""
+        with pytest.raises(ValueError, match="must be >= k_folds"):
+            _service().cross_validate(iter(_records(2)), ["even"], streaming=True)
+
+
+class TestEarlyExit:
+    """Tests for stopping once confidence intervals are tight."""
+
+    def test_stops_after_minimum_folds(self) -> None:
+        """Identical fold scores stop the run after three folds."""
+        data = [{"n": 2 * n} for n in range(50)]
+
+        result = _service().cross_validate(data, ["even"], k_folds=10, ci_tolerance=0.1)
+
+        assert result["early_stopped"] is True
+        assert len(result["fold_results"]) == 3
+
+    @pytest.mark.parametrize(
+        "options",
+        [{"workers": 0}, {"ci_tolerance": 0.0}, {"chunk_size": 0}],
+    )
+    def test_rejects_invalid_options(self, options: dict[str, Any]) -> None:
+        """Execution options are validated before any work starts."""
+        with pytest.raises(ValueError, match="must be"):
+            _service().cross_validate(_records(10), ["even"], **options)
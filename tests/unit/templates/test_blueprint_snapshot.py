@@ -0,0 +1,252 @@
+"""Tests for the packed knowledge-base snapshot used by template ingestion."""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from importobot.core.templates.blueprints import registry
+from importobot.core.templates.blueprints.snapshot import (
+    SNAPSHOT_FILENAME,
+    KnowledgeBaseSnapshot,
+    deserialize_analysis,
+    serialize_analysis,
+)
+from importobot.core.templates.blueprints.storage import SuiteSettings
+
+SSH_TEMPLATE = """*** Settings ***
+Suite Setup         Connect To Lab
+
+*** Test Cases ***
+Sample
+    Switch Connection    Controller
+    Write    {command} --proc_name foo
+    ${{result}}=    Read Until Regexp    {command} task completed
+"""
+
+
+@pytest.fixture(autouse=True)
+def _restrict_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("IMPORTOBOT_BLUEPRINT_CACHE", raising=False)
+    monkeypatch.delenv("IMPORTOBOT_BLUEPRINT_CACHE_DIR", raising=False)
+
+
+@pytest.fixture(autouse=True)
+def reset_registry_state() -> Iterator[None]:
+    yield
+    registry.configure_template_sources([])
+
+
+@pytest.fixture
+def analysis_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record every template body that is analysed from scratch."""
+    calls: list[str] = []
+    original = registry._analyze_template_content
+
+    def _counting(content: str) -> object:
+        calls.append(content)
+        return original(content)
+
+    monkeypatch.setattr(registry, "_analyze_template_content", _counting)
+    return calls
+
+
+def _snapshot_path() -> Path:
+    return Path(".importobot/cache/blueprints") / SNAPSHOT_FILENAME
+
+
+def _write_corpus(root: Path, count: int) -> Path:
+    corpus = root / "templates"
+    corpus.mkdir()
+    for index in range(count):
+        (corpus / f"cmd{index}.robot").write_text(
+            SSH_TEMPLATE.format(command=f"cmd{index}"), encoding="utf-8"
+        )
+    return corpus
+
+
+class TestIncrementalIngestion:
+    """Tests for replaying unchanged sources from the snapshot."""
+
+    def test_unchanged_sources_are_replayed_without_analysis(
+        self, tmp_path: Path, analysis_calls: list[str]
+    ) -> None:
+        """A second configuration reuses every stored analysis."""
+        corpus = _write_corpus(tmp_path, 3)
+
+        registry.configure_template_sources([str(corpus)])
+        assert len(analysis_calls) == 3
+        assert _snapshot_path().exists()
+
+        registry.configure_template_sources([str(corpus)])
+
+        assert len(analysis_calls) == 3
+        pattern = registry.find_step_pattern(command_token="cmd1")
+        assert pattern is not None
+        assert pattern.library == "SSHLibrary"
+        assert registry.get_template("cmd2") is not None
+        assert registry.TEMPLATE_STATE["enabled"] is True
+
+    def test_only_changed_sources_are_reanalysed(
+        self, tmp_path: Path, analysis_calls: list[str]
+    ) -> None:
+        """Editing one template re-analyses that file alone."""
+        corpus = _write_corpus(tmp_path, 3)
+        registry.configure_template_sources([str(corpus)])
+        analysis_calls.clear()
+
+        changed = corpus / "cmd1.robot"
+        changed.write_text(SSH_TEMPLATE.format(command="renamed"), encoding="utf-8")
+        registry.configure_template_sources([str(corpus)])
+
+        assert len(analysis_calls) == 1
+        assert "renamed" in analysis_calls[0]
+        assert registry.find_step_pattern(command_token="renamed") is not None
+        assert registry.find_step_pattern(command_token="cmd1") is None
+        assert registry.find_step_pattern(command_token="cmd0") is not None
+
+    def test_manifest_tracks_mtime(
+        self, tmp_path: Path, analysis_calls: list[str]
+    ) -> None:
+        """A touched file with the same size is analysed again."""
+        corpus = _write_corpus(tmp_path, 1)
+        registry.configure_template_sources([str(corpus)])
+        source = corpus / "cmd0.robot"
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        registry.configure_template_sources([str(corpus)])
+
+        assert len(analysis_calls) == 2
+
+    def test_removed_sources_drop_out_of_the_snapshot(self, tmp_path: Path) -> None:
+        """Sources that are no longer configured are pruned on save."""
+        corpus = _write_corpus(tmp_path, 2)
+        registry.configure_template_sources([str(corpus)])
+        (corpus / "cmd0.robot").unlink()
+
+        registry.configure_template_sources([str(corpus)])
+
+        snapshot = KnowledgeBaseSnapshot.load(_snapshot_path())
+        assert len(snapshot) == 1
+        assert registry.find_step_pattern(command_token="cmd0") is None
+
+    def test_suite_settings_resources_and_helpers_are_replayed(
+        self, tmp_path: Path
+    ) -> None:
+        """Replayed sources restore settings, resource imports and keywords."""
+        corpus = _write_corpus(tmp_path, 1)
+        (corpus / "common.resource").write_text(
+            "*** Keywords ***\nConnect To Lab\n    Log    connecting\n",
+            encoding="utf-8",
+        )
+        (corpus / "helpers.py").write_text(
+            "def open_lab_session():\n    pass\n", encoding="utf-8"
+        )
+        registry.configure_template_sources([str(corpus)])
+        first = (
+            registry.get_suite_settings(),
+            registry.get_resource_imports(),
+            set(registry.KEYWORD_LIBRARY._keywords),
+        )
+
+        registry.configure_template_sources([str(corpus)])
+
+        settings = registry.get_suite_settings()
+        assert settings is not None
+        assert settings.suite_setup == ["Suite Setup         Connect To Lab"]
+        assert (
+            settings,
+            registry.get_resource_imports(),
+            set(registry.KEYWORD_LIBRARY._keywords),
+        ) == first
+        assert "open lab session" in registry.KEYWORD_LIBRARY._keywords
+
+
+class TestSnapshotFile:
+    """Tests for the snapshot file and its fallbacks."""
+
+    def test_disabled_cache_writes_nothing(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        analysis_calls: list[str],
+    ) -> None:
+        """IMPORTOBOT_BLUEPRINT_CACHE=0 analyses every source every time."""
+        monkeypatch.setenv("IMPORTOBOT_BLUEPRINT_CACHE", "0")
+        corpus = _write_corpus(tmp_path, 2)
+
+        registry.configure_template_sources([str(corpus)])
+        registry.configure_template_sources([str(corpus)])
+
+        assert len(analysis_calls) == 4
+        assert not _snapshot_path().exists()
+
+    def test_cache_dir_override(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The snapshot lives in IMPORTOBOT_BLUEPRINT_CACHE_DIR when set."""
+        cache_dir = tmp_path / "custom-cache"
+        monkeypatch.setenv("IMPORTOBOT_BLUEPRINT_CACHE_DIR", str(cache_dir))
+
+        registry.configure_template_sources([str(_write_corpus(tmp_path, 1))])
+
+        assert (cache_dir / SNAPSHOT_FILENAME).exists()
+
+    @pytest.mark.parametrize(
+        "payload", ["not json", json.dumps({"version": -1, "entries": {}})]
+    )
+    def test_invalid_snapshots_are_ignored(
+        self, tmp_path: Path, analysis_calls: list[str], payload: str
+    ) -> None:
+        """Corrupt or outdated snapshots are rebuilt from the sources."""
+        corpus = _write_corpus(tmp_path, 1)
+        _snapshot_path().parent.mkdir(parents=True)
+        _snapshot_path().write_text(payload, encoding="utf-8")
+
+        registry.configure_template_sources([str(corpus)])
+
+        assert len(analysis_calls) == 1
+        assert len(KnowledgeBaseSnapshot.load(_snapshot_path())) == 1
+
+    def test_replayed_template_content_is_validated(self, tmp_path: Path) -> None:
+        """Disallowed content written into the snapshot is rejected on replay."""
+        corpus = _write_corpus(tmp_path, 1)
+        registry.configure_template_sources([str(corpus)])
+        document = json.loads(_snapshot_path().read_text(encoding="utf-8"))
+        for entry in document["entries"].values():
+            entry["content"] = "Evaluate    __import__('os').system('id')"
+        _snapshot_path().write_text(json.dumps(document), encoding="utf-8")
+
+        registry.configure_template_sources([str(corpus)])
+
+        assert registry.get_template("cmd0") is None
+
+    def test_unchanged_snapshot_is_not_rewritten(self, tmp_path: Path) -> None:
+        """Loading without any change leaves the snapshot file untouched."""
+        corpus = _write_corpus(tmp_path, 1)
+        registry.configure_template_sources([str(corpus)])
+        before = _snapshot_path().stat().st_mtime_ns
+        snapshot = KnowledgeBaseSnapshot.load(_snapshot_path())
+        source = corpus / "cmd0.robot"
+
+        assert snapshot.lookup(source.resolve(), source.stat(), "template")
+        assert snapshot.save() is False
+        assert _snapshot_path().stat().st_mtime_ns == before
+        assert (snapshot.hits, snapshot.misses) == (1, 0)
+
+    def test_analysis_round_trip_keeps_suite_settings(self) -> None:
+        """Serialised analyses restore patterns, keywords and settings."""
+        analysis = registry._analyze_template_content(
+            SSH_TEMPLATE.format(command="status")
+        )
+
+        restored = deserialize_analysis(serialize_analysis(analysis))
+
+        assert restored == analysis
+        assert isinstance(restored.suite_settings, SuiteSettings)
@@ -0,0 +1,145 @@
+"""Tests for the indexed blueprint KnowledgeBase."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from importobot.core.templates.blueprints.storage import KnowledgeBase, StepPattern
+
+
+def _pattern(library: str, keyword: str, token: str, marker: str = "") -> StepPattern:
+    return StepPattern(
+        library=library,
+        keyword=keyword,
+        connection=None,
+        command_token=token,
+        lines=[f"    {keyword}    {token} {marker}".rstrip()],
+    )
+
+
+def _first_with_token(group: list[StepPattern], token: str) -> StepPattern | None:
+    return next((p for p in group if p.command_token == token.lower()), None)
+
+
+def _linear_find(
+    patterns: list[StepPattern],
+    library: str | None,
+    keyword: str | None,
+    command_token: str | None,
+) -> StepPattern | None:
+    """Reference implementation: scan groups in registration order."""
+    groups: dict[tuple[str, str], list[StepPattern]] = {}
+    for pattern in patterns:
+        groups.setdefault((pattern.library, pattern.keyword), []).append(pattern)
+    if library and keyword:
+        group = groups.get((library, keyword), [])
+        found = _first_with_token(group, command_token) if command_token else None
+        if found is not None or (not command_token and group):
+            return found or group[0]
+    if command_token:
+        for group in groups.values():
+            found = _first_with_token(group, command_token)
+            if found is not None:
+                return found
+    return None
+
+
+@pytest.fixture
+def knowledge_base() -> KnowledgeBase:
+    """Knowledge base with overlapping tokens across groups."""
+    kb = KnowledgeBase()
+    kb.add_pattern(_pattern("SSHLibrary", "Write", "ls", "first"))
+    kb.add_pattern(_pattern("OperatingSystem", "Run", "cat", "os-cat"))
+    kb.add_pattern(_pattern("SSHLibrary", "Write", "cat", "ssh-cat"))
+    kb.add_pattern(_pattern("SSHLibrary", "Write", "ls", "second"))
+    kb.add_pattern(_pattern("OperatingSystem", "Run", "ls", "os-ls"))
+    return kb
+
+
+class TestFindPattern:
+    """Tests for indexed lookups."""
+
+    def test_primary_key_with_token_returns_first_registered(
+        self, knowledge_base: KnowledgeBase
+    ) -> None:
+        """Within a group the earliest pattern for the token wins."""
+        pattern = knowledge_base.find_pattern("SSHLibrary", "Write", "LS")
+
+        assert pattern is not None
+        assert pattern.lines[0].endswith("first")
+
+    def test_primary_key_without_token_returns_group_head(
+        self, knowledge_base: KnowledgeBase
+    ) -> None:
+        """Without a token the group's first pattern is returned."""
+        pattern = knowledge_base.find_pattern("OperatingSystem", "Run")
+
+        assert pattern is not None
+        assert pattern.lines[0].endswith("os-cat")
+
+    def test_token_fallback_follows_group_order(
+        self, knowledge_base: KnowledgeBase
+    ) -> None:
+        """Token-only lookups prefer the earliest group, then the earliest pattern."""
+        cat = knowledge_base.find_pattern(command_token="cat")
+        missed_group = knowledge_base.find_pattern("Process", "Run Process", "cat")
+
+        assert cat is not None
+        assert cat.lines[0].endswith("ssh-cat")
+        assert missed_group is cat
+
+    def test_misses_and_stats(self, knowledge_base: KnowledgeBase) -> None:
+        """Hits and misses are counted and reset by clear()."""
+        knowledge_base.find_pattern(command_token="ls")
+        knowledge_base.find_pattern(command_token="rm")
+        knowledge_base.find_pattern("SSHLibrary", "Write")
+
+        stats = knowledge_base.get_stats()
+
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+        assert (stats["patterns"], stats["groups"], stats["command_tokens"]) == (
+            5,
+            2,
+            2,
+        )
+
+        knowledge_base.clear()
+
+        assert knowledge_base.find_pattern(command_token="ls") is None
+        assert knowledge_base.get_stats()["patterns"] == 0
+        assert knowledge_base.get_stats()["misses"] == 1
+
+    def test_library_index(self, knowledge_base: KnowledgeBase) -> None:
+        """Patterns can be listed per library in registration order."""
+        patterns = knowledge_base.patterns_for_library("OperatingSystem")
+
+        assert [p.command_token for p in patterns] == ["cat", "ls"]
+        assert knowledge_base.patterns_for_library("Telnet") == []
+
+    def test_matches_linear_scan(self) -> None:
+        """Random corpora give the same results as a scan in registration order."""
+        rng = random.Random(1234)
+        libraries = ["SSHLibrary", "OperatingSystem", "Process", "Telnet"]
+        keywords = ["Write", "Run", "Execute Command"]
+        tokens = ["ls", "cat", "grep", "echo", "Tar", "ps"]
+        patterns = [
+            _pattern(
+                rng.choice(libraries), rng.choice(keywords), rng.choice(tokens), str(i)
+            )
+            for i in range(200)
+        ]
+        kb = KnowledgeBase()
+        for pattern in patterns:
+            kb.add_pattern(pattern)
+
+        for _ in range(500):
+            library = rng.choice([*libraries, None])
+            keyword = rng.choice([*keywords, None])
+            token = rng.choice([*tokens, "TAR", "LS", "missing", None])
+            assert kb.find_pattern(library, keyword, token) is _linear_find(
+                patterns, library, keyword, token
+            )
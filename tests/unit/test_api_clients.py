@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
 import warnings
 from collections.abc import Callable
 from http import HTTPStatus
@@ -321,6 +323,126 @@ def test_jira_xray_client_accepts_project_id(monkeypatch: pytest.MonkeyPatch) ->
     assert params["jql"] == "project=321"
 
 
+class JiraPageSession:
+    """Thread-safe session serving Jira pages by ``startAt``."""
+
+    def __init__(self, total: int, page_size: int) -> None:
+        self.total = total
+        self.page_size = page_size
+        self.started: list[int] = []
+        self.queries: list[str | None] = []
+        self.headers: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self, url: str, *, params: dict[str, Any], headers: dict[str, str]
+    ) -> DummyResponse:
+        """Return the page at ``startAt``, later pages answering sooner."""
+        start_at = params["startAt"]
+        with self._lock:
+            self.started.append(start_at)
+            self.queries.append(params.get("jql"))
+        time.sleep(0.01 * max(0, 4 - start_at // self.page_size))
+        end = min(start_at + self.page_size, self.total)
+        return DummyResponse(
+            status_code=HTTPStatus.OK,
+            payload={
+                "issues": [{"id": str(i)} for i in range(start_at, end)],
+                "total": self.total,
+                "startAt": start_at,
+            },
+        )
+
+
+def test_jira_xray_client_prefetches_pages_in_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Known totals should fan out page requests yet yield pages in order."""
+    session = JiraPageSession(total=23, page_size=5)
+    monkeypatch.setattr(
+        "importobot.integrations.clients.base.requests.Session", lambda: session
+    )
+    client = JiraXrayClient(
+        api_url="https://jira.example/rest/api/2/search",
+        tokens=["token"],
+        user=None,
+        project_name="PRJ",
+        project_id=None,
+        max_concurrency=4,
+        verify_ssl=True,
+    )
+    progress: list[dict[str, Any]] = []
+
+    pages = gather(client, lambda **kwargs: progress.append(kwargs))
+
+    assert [page["startAt"] for page in pages] == [0, 5, 10, 15, 20]
+    assert sorted(session.started) == [0, 5, 10, 15, 20]
+    assert [call["page"] for call in progress] == [1, 2, 3, 4, 5]
+    ids = [issue["id"] for page in pages for issue in page["issues"]]
+    assert ids == [str(i) for i in range(23)]
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_jira_xray_client_builds_jql_once_per_fetch(
+    monkeypatch: pytest.MonkeyPatch, max_concurrency: int
+) -> None:
+    """Every page of one fetch runs the same query, even as the clock moves."""
+    session = JiraPageSession(total=23, page_size=5)
+    monkeypatch.setattr(
+        "importobot.integrations.clients.base.requests.Session", lambda: session
+    )
+    built = iter(f'updated >= "-{minutes}m"' for minutes in range(1, 100))
+    monkeypatch.setattr(JiraXrayClient, "_jql", lambda self: next(built))
+    client = JiraXrayClient(
+        api_url="https://jira.example/rest/api/2/search",
+        tokens=["token"],
+        user=None,
+        project_name="PRJ",
+        project_id=None,
+        max_concurrency=max_concurrency,
+        verify_ssl=True,
+    )
+
+    gather(client, lambda **_: None)
+
+    assert len(session.queries) == 5
+    assert set(session.queries) == {'updated >= "-1m"'}
+
+
+def test_page_prefetch_bounds_reorder_buffer(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Only a bounded number of pages should run ahead of the consumer."""
+    monkeypatch.setattr(
+        "importobot.integrations.clients.base.requests.Session",
+        lambda: DummySession([]),
+    )
+    client = JiraXrayClient(
+        api_url="https://jira.example/rest/api/2/search",
+        tokens=["token"],
+        user=None,
+        project_name="PRJ",
+        project_id=None,
+        max_concurrency=2,
+        verify_ssl=True,
+    )
+    requested: list[int] = []
+    lock = threading.Lock()
+
+    def fetch(page: int) -> dict[str, Any]:
+        with lock:
+            requested.append(page)
+        return {"page": page}
+
+    pages = client._fetch_pages_in_order(  # pylint: disable=protected-access
+        fetch, range(100)
+    )
+    first = [next(pages)["page"] for _ in range(3)]
+    time.sleep(0.05)
+    pages.close()
+
+    assert first == [0, 1, 2]
+    assert len(requested) <= 3 + 2 * 2
+
+
 def test_client_retries_on_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
     """All clients should retry when receiving HTTP 429 with Retry-After."""
     responses = [
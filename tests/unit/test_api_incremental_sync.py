@@ -0,0 +1,336 @@
+"""Tests for incremental API sync with updated-since high-water marks."""
+
+from __future__ import annotations
+
+import json
+from argparse import Namespace
+from collections.abc import Iterable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from importobot import exceptions
+from importobot.cli.handlers import handle_api_ingest
+from importobot.config import APIIngestConfig
+from importobot.integrations.clients import JiraXrayClient, TestRailClient, ZephyrClient
+from importobot.integrations.incremental import (
+    SyncStateStore,
+    merge_snapshot,
+    payload_items,
+    sync_key,
+)
+from importobot.medallion.interfaces.enums import SupportedFormat
+
+SINCE = datetime(2025, 1, 31, 12, 0, tzinfo=timezone.utc)
+
+
+class RecordingClient:
+    """Client yielding fixed pages and recording the filter it was built with."""
+
+    supports_updated_since = True
+
+    def __init__(self, pages: list[dict[str, Any]], updated_since: Any) -> None:
+        self.pages = pages
+        self.updated_since = updated_since
+
+    def fetch_all(self, progress_cb: Any) -> Iterable[dict[str, Any]]:
+        """Yield the configured pages."""
+        for page in self.pages:
+            progress_cb(items=len(payload_items(page)[1]), total=None, page=1)
+            yield page
+
+
+def _ingest(
+    monkeypatch: pytest.MonkeyPatch,
+    output_dir: Path,
+    pages: list[dict[str, Any]],
+    *,
+    incremental: bool = True,
+    supports_updated_since: bool = True,
+) -> tuple[Path, RecordingClient]:
+    """Run one API ingest returning the payload path and the client used."""
+    monkeypatch.setattr(
+        "importobot.cli.handlers.resolve_api_ingest_config",
+        lambda args: APIIngestConfig(
+            fetch_format=SupportedFormat.JIRA_XRAY,
+            api_url="https://jira.example/rest",
+            tokens=["token"],
+            user=None,
+            project_name="PRJ",
+            project_id=None,
+            output_dir=output_dir,
+            max_concurrency=None,
+            insecure=False,
+            incremental=incremental,
+        ),
+    )
+    clients: list[RecordingClient] = []
+
+    def make_client(fmt: Any, **kwargs: Any) -> RecordingClient:
+        clients.append(RecordingClient(pages, kwargs.get("updated_since")))
+        clients[0].supports_updated_since = supports_updated_since
+        return clients[0]
+
+    monkeypatch.setattr("importobot.cli.handlers.get_api_client", make_client)
+    return Path(handle_api_ingest(Namespace())), clients[0]
+
+
+class TestMergeSnapshot:
+    """Tests for merge_snapshot."""
+
+    def test_changes_replace_by_key_and_append(self) -> None:
+        """Changed items replace their old version; new items are appended."""
+        previous = [
+            {"issues": [{"id": "1", "v": 1}, {"id": "2", "v": 1}]},
+            {"issues": [{"id": "3", "v": 1}]},
+        ]
+        changes = [{"issues": [{"id": "2", "v": 2}, {"id": "4", "v": 1}]}]
+
+        merged = merge_snapshot(previous, changes)
+
+        assert merged == {
+            "issues": [
+                {"id": "1", "v": 1},
+                {"id": "2", "v": 2},
+                {"id": "3", "v": 1},
+                {"id": "4", "v": 1},
+            ],
+            "total": 4,
+        }
+
+    def test_falls_back_to_key_field(self) -> None:
+        """Items without ``id`` are matched by ``key``."""
+        merged = merge_snapshot(
+            [{"results": [{"key": "Z-1", "name": "old"}]}],
+            [{"results": [{"key": "Z-1", "name": "new"}]}],
+        )
+
+        assert merged["results"] == [{"key": "Z-1", "name": "new"}]
+
+    def test_reads_zephyr_values_and_envelopes(self) -> None:
+        """Items under ``values`` or a ``value`` envelope are merged, not lost."""
+        merged = merge_snapshot(
+            [{"values": [{"key": "A"}, {"key": "B", "v": 1}]}],
+            [{"value": {"results": [{"key": "B", "v": 2}]}}],
+        )
+
+        assert merged == {
+            "values": [{"key": "A"}, {"key": "B", "v": 2}],
+            "total": 2,
+        }
+
+    def test_unrecognised_page_is_an_error(self) -> None:
+        """A page holding data in an unknown shape is not read as empty."""
+        with pytest.raises(exceptions.ParseError, match="unknown"):
+            merge_snapshot([{"issues": [{"id": "1"}]}], [{"unknown": [{"id": "2"}]}])
+
+    def test_empty_pages_merge_to_previous(self) -> None:
+        """Pages without items or data leave the snapshot unchanged."""
+        merged = merge_snapshot(
+            [{"issues": [{"id": "1"}]}], [{"issues": [], "total": 0}, {"total": 0}]
+        )
+
+        assert merged == {"issues": [{"id": "1"}], "total": 1}
+
+
+class TestSyncStateStore:
+    """Tests for SyncStateStore."""
+
+    def test_round_trip_applies_overlap(self, tmp_path: Path) -> None:
+        """The recorded mark is the sync start minus the overlap window."""
+        store = SyncStateStore.for_directory(tmp_path)
+        key = sync_key("jira_xray", "https://jira.example/rest/", "PRJ")
+
+        store.save(
+            key, sync_started=SINCE, snapshot=tmp_path / "a.json", overlap_seconds=60
+        )
+
+        assert store.load(key) == (SINCE - timedelta(seconds=60), tmp_path / "a.json")
+        assert (
+            store.load(sync_key("jira_xray", "https://jira.example/rest", "X")) is None
+        )
+
+    def test_corrupt_state_reads_as_empty(self, tmp_path: Path) -> None:
+        """An unreadable state file means a full sync rather than an error."""
+        store = SyncStateStore(tmp_path / "state.json")
+        store.path.write_text("[", encoding="utf-8")
+
+        assert store.load("key") is None
+
+
+class TestIncrementalIngest:
+    """Tests for handle_api_ingest in incremental mode."""
+
+    def test_second_run_fetches_changes_and_merges(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """The first run is a full pull; the next merges changes into it."""
+        first_path, first_client = _ingest(
+            monkeypatch,
+            tmp_path,
+            [{"issues": [{"id": "1", "v": 1}]}, {"issues": [{"id": "2", "v": 1}]}],
+        )
+        first_path.rename(tmp_path / "first.json")
+        state = SyncStateStore.for_directory(tmp_path)
+        key = sync_key("jira_xray", "https://jira.example/rest", "PRJ")
+        state.save(key, sync_started=SINCE, snapshot=tmp_path / "first.json")
+
+        second_path, second_client = _ingest(
+            monkeypatch, tmp_path, [{"issues": [{"id": "2", "v": 2}]}]
+        )
+
+        assert first_client.updated_since is None
+        assert second_client.updated_since == SINCE
+        snapshot = json.loads(second_path.read_text(encoding="utf-8"))
+        assert snapshot["issues"] == [{"id": "1", "v": 1}, {"id": "2", "v": 2}]
+        metadata = json.loads(
+            second_path.with_suffix(".meta.json").read_text(encoding="utf-8")
+        )
+        assert metadata["incremental"]["changed_items"] == 1
+        assert metadata["incremental"]["snapshot_items"] == 2
+        recorded = state.load(key)
+        assert recorded is not None
+        assert recorded[0] > SINCE
+        assert recorded[1] == second_path
+
+    def test_missing_snapshot_triggers_full_sync(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """A recorded mark without its snapshot file is ignored."""
+        SyncStateStore.for_directory(tmp_path).save(
+            sync_key("jira_xray", "https://jira.example/rest", "PRJ"),
+            sync_started=SINCE,
+            snapshot=tmp_path / "gone.json",
+        )
+
+        _, client = _ingest(monkeypatch, tmp_path, [{"issues": [{"id": "1"}]}])
+
+        assert client.updated_since is None
+
+    def test_unrecognised_changes_keep_previous_state(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Changes that cannot be read fail the sync without moving the mark."""
+        (tmp_path / "first.json").write_text(
+            json.dumps({"issues": [{"id": "1"}]}), encoding="utf-8"
+        )
+        state = SyncStateStore.for_directory(tmp_path)
+        key = sync_key("jira_xray", "https://jira.example/rest", "PRJ")
+        state.save(key, sync_started=SINCE, snapshot=tmp_path / "first.json")
+
+        with pytest.raises(exceptions.ParseError):
+            _ingest(monkeypatch, tmp_path, [{"unknown": [{"id": "2"}]}])
+
+        assert state.load(key) == (SINCE, tmp_path / "first.json")
+
+    def test_unreadable_snapshot_triggers_full_sync(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """A previous snapshot in an unknown shape is replaced by a full pull."""
+        (tmp_path / "first.json").write_text(
+            json.dumps({"unknown": [{"id": "1"}]}), encoding="utf-8"
+        )
+        SyncStateStore.for_directory(tmp_path).save(
+            sync_key("jira_xray", "https://jira.example/rest", "PRJ"),
+            sync_started=SINCE,
+            snapshot=tmp_path / "first.json",
+        )
+
+        _, client = _ingest(monkeypatch, tmp_path, [{"issues": [{"id": "1"}]}])
+
+        assert client.updated_since is None
+
+    def test_source_without_filter_replaces_snapshot(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Full re-fetches replace the snapshot, so keyless items do not pile up."""
+        pages = [{"data": [{"name": "suite"}]}]
+        first_path, _ = _ingest(
+            monkeypatch, tmp_path, pages, supports_updated_since=False
+        )
+        first_path.rename(tmp_path / "first.json")
+        SyncStateStore.for_directory(tmp_path).save(
+            sync_key("jira_xray", "https://jira.example/rest", "PRJ"),
+            sync_started=SINCE,
+            snapshot=tmp_path / "first.json",
+        )
+
+        second_path, _ = _ingest(
+            monkeypatch, tmp_path, pages, supports_updated_since=False
+        )
+
+        assert json.loads(second_path.read_text(encoding="utf-8")) == pages[0]
+
+    def test_full_ingest_records_no_state(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Without --incremental the sync state file is left untouched."""
+        _ingest(monkeypatch, tmp_path, [{"issues": []}], incremental=False)
+
+        assert not SyncStateStore.for_directory(tmp_path).path.exists()
+
+
+class TestUpdatedSinceFilters:
+    """Tests for the vendor-specific updated-since request filters."""
+
+    @staticmethod
+    def _options(**overrides: Any) -> dict[str, Any]:
+        options: dict[str, Any] = {
+            "api_url": "https://vendor.example/api",
+            "tokens": ["token"],
+            "user": "user",
+            "project_name": "PRJ",
+            "project_id": None,
+            "max_concurrency": None,
+            "verify_ssl": True,
+            "updated_since": SINCE,
+        }
+        options.update(overrides)
+        return options
+
+    def test_jira_uses_relative_jql_duration(self) -> None:
+        """Jira filters with a relative duration covering the mark."""
+        client = JiraXrayClient(**self._options())
+
+        jql = client._jql()  # pylint: disable=protected-access
+
+        assert jql.startswith('project=PRJ AND updated >= "-')
+        minutes = int(jql.rsplit("-", 1)[1].rstrip('m"'))
+        elapsed = datetime.now(timezone.utc) - SINCE
+        assert minutes >= elapsed.total_seconds() / 60
+
+    def test_zephyr_adds_updated_on_clause(self) -> None:
+        """Zephyr queries add an updatedOn bound in UTC."""
+        client = ZephyrClient(**self._options())
+
+        query = client._search_query("PRJ")  # pylint: disable=protected-access
+
+        assert query == (
+            'testCase.projectKey IN ("PRJ") AND '
+            'testCase.updatedOn >= "2025-01-31T12:00:00Z"'
+        )
+
+    def test_testrail_sends_updated_after(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """TestRail requests carry updated_after as a Unix timestamp."""
+        client = TestRailClient(**self._options())
+        seen: list[dict[str, Any]] = []
+
+        class Response:
+            status_code = 200
+
+            @staticmethod
+            def json() -> dict[str, Any]:
+                return {"cases": []}
+
+        def fake_request(method: str, url: str, **kwargs: Any) -> Response:
+            seen.append(kwargs["params"])
+            return Response()
+
+        monkeypatch.setattr(client, "_request", fake_request)
+        list(client.fetch_all(lambda **_: None))
+
+        assert seen == [{"offset": 0, "updated_after": int(SINCE.timestamp())}]
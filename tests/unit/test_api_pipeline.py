@@ -0,0 +1,257 @@
+"""Tests for pipelined API fetch and conversion."""
+
+from __future__ import annotations
+
+import json
+import time
+from argparse import Namespace
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from importobot import exceptions
+from importobot.cli.handlers import handle_api_stream
+from importobot.config import APIIngestConfig
+from importobot.integrations.pipeline import fetch_and_convert
+from importobot.medallion.interfaces.enums import SupportedFormat
+
+
+def _case(number: int) -> dict[str, Any]:
+    """Return a Zephyr-style test case."""
+    return {
+        "id": number,
+        "name": f"Verify feature {number}",
+        "testScript": {
+            "steps": [
+                {
+                    "description": f"Open page {number}",
+                    "expectedResult": "Page loads",
+                }
+            ]
+        },
+    }
+
+
+def _page(*numbers: int) -> dict[str, Any]:
+    """Return a Zephyr search page holding the given cases."""
+    return {"results": [_case(n) for n in numbers], "total": len(numbers)}
+
+
+class PageClient:
+    """Client yielding fixed pages, optionally failing after them."""
+
+    def __init__(
+        self, pages: list[dict[str, Any]], error: Exception | None = None
+    ) -> None:
+        self.pages = pages
+        self.error = error
+        self.yielded = 0
+
+    def fetch_all(self, progress_cb: Any) -> Iterator[dict[str, Any]]:
+        """Yield the configured pages, then raise the configured error."""
+        for page in self.pages:
+            progress_cb(items=len(page), total=None, page=self.yielded)
+            self.yielded += 1
+            yield page
+        if self.error is not None:
+            raise self.error
+
+
+def _convert(client: Any, output_dir: Path, **options: Any) -> Any:
+    """Run fetch_and_convert with a no-op progress callback."""
+    return fetch_and_convert(
+        client,
+        output_dir,
+        basename="zephyr",
+        progress_cb=lambda **_: None,
+        **options,
+    )
+
+
+class TestFetchAndConvert:
+    """Tests for fetch_and_convert."""
+
+    def test_writes_one_robot_file_per_page_in_order(self, tmp_path: Path) -> None:
+        """Each page becomes its own numbered .robot file."""
+        result = _convert(PageClient([_page(1, 2), _page(3)]), tmp_path)
+
+        assert result.pages == 2
+        assert result.items == 3
+        assert [path.name for path in result.robot_files] == [
+            "zephyr-page-0001.robot",
+            "zephyr-page-0002.robot",
+        ]
+        first = result.robot_files[0].read_text(encoding="utf-8")
+        assert "Verify feature 1" in first
+        assert "Verify feature 2" in first
+        assert "Verify feature 3" in result.robot_files[1].read_text(encoding="utf-8")
+
+    def test_empty_pages_are_skipped(self, tmp_path: Path) -> None:
+        """Pages without items are counted but not converted."""
+        result = _convert(PageClient([_page(1), {"results": [], "total": 1}]), tmp_path)
+
+        assert result.pages == 2
+        assert result.skipped_pages == 1
+        assert len(result.robot_files) == 1
+
+    def test_converts_zephyr_values_and_envelopes(self, tmp_path: Path) -> None:
+        """Items under ``values`` or a ``value`` envelope are converted."""
+        pages: list[dict[str, Any]] = [
+            {"values": [_case(1)]},
+            {"value": {"results": [_case(2)]}, "total": 2},
+        ]
+
+        result = _convert(PageClient(pages), tmp_path)
+
+        assert result.items == 2
+        assert result.skipped_pages == 0
+        assert len(result.robot_files) == 2
+
+    def test_unrecognised_page_is_an_error(self, tmp_path: Path) -> None:
+        """A page holding data in an unknown shape fails instead of vanishing."""
+        with pytest.raises(exceptions.ParseError, match="unknown"):
+            _convert(PageClient([{"unknown": [_case(1)]}]), tmp_path)
+
+    def test_archive_holds_every_page(self, tmp_path: Path) -> None:
+        """The archived payload is a JSON list of the fetched pages."""
+        pages = [_page(1), {"results": [], "total": 1}, _page(2)]
+        archive = tmp_path / "payload" / "zephyr.json"
+
+        result = _convert(PageClient(pages), tmp_path / "robot", archive_path=archive)
+
+        assert result.archive_path == archive
+        assert json.loads(archive.read_text(encoding="utf-8")) == pages
+
+    def test_fetch_error_is_raised(self, tmp_path: Path) -> None:
+        """An error from the client stops the pipeline and is re-raised."""
+        client = PageClient([_page(1)], error=RuntimeError("connection reset"))
+
+        with pytest.raises(RuntimeError, match="connection reset"):
+            _convert(client, tmp_path)
+
+        assert (tmp_path / "zephyr-page-0001.robot").exists()
+
+    def test_fetch_all_raising_immediately_is_raised(self, tmp_path: Path) -> None:
+        """A client failing before returning an iterator does not hang the run."""
+
+        class FailingClient:
+            def fetch_all(self, progress_cb: Any) -> Iterator[dict[str, Any]]:
+                """Fail before any page is produced."""
+                raise RuntimeError("authentication failed")
+
+        with pytest.raises(RuntimeError, match="authentication failed"):
+            _convert(FailingClient(), tmp_path)
+
+    def test_queue_bounds_pages_fetched_ahead(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """The producer stops fetching once the queue is full."""
+        client = PageClient([_page(n) for n in range(1, 11)])
+        ahead: list[int] = []
+
+        def slow_convert(page: dict[str, Any], output_path: str) -> str:
+            time.sleep(0.02)
+            ahead.append(client.yielded - len(ahead) - 1)
+            return output_path
+
+        monkeypatch.setattr(
+            "importobot.integrations.pipeline.convert_page", slow_convert
+        )
+        result = _convert(client, tmp_path, queue_pages=1)
+
+        assert len(result.robot_files) == 10
+        # One page queued plus one held by the producer waiting to queue it
+        assert max(ahead) <= 2
+
+    def test_process_pool_converts_every_page(self, tmp_path: Path) -> None:
+        """Conversion workers produce the same files as inline conversion."""
+        result = _convert(
+            PageClient([_page(1), _page(2), _page(3)]), tmp_path, workers=2
+        )
+
+        assert [path.name for path in result.robot_files] == [
+            "zephyr-page-0001.robot",
+            "zephyr-page-0002.robot",
+            "zephyr-page-0003.robot",
+        ]
+        assert all(path.exists() for path in result.robot_files)
+
+    def test_rejects_non_positive_sizes(self, tmp_path: Path) -> None:
+        """Workers and queue size must be at least one."""
+        with pytest.raises(ValueError, match="at least 1"):
+            _convert(PageClient([]), tmp_path, queue_pages=0)
+
+
+class TestHandleApiStream:
+    """Tests for the --stream ingest handler."""
+
+    @staticmethod
+    def _configure(
+        monkeypatch: pytest.MonkeyPatch,
+        payload_dir: Path,
+        client: PageClient,
+        *,
+        incremental: bool = False,
+    ) -> None:
+        """Point the handler at ``client`` and ``payload_dir``."""
+        monkeypatch.setattr(
+            "importobot.cli.handlers.resolve_api_ingest_config",
+            lambda args: APIIngestConfig(
+                fetch_format=SupportedFormat.ZEPHYR,
+                api_url="https://zephyr.example/rest",
+                tokens=["token"],
+                user=None,
+                project_name="PRJ",
+                project_id=None,
+                output_dir=payload_dir,
+                max_concurrency=None,
+                insecure=False,
+                incremental=incremental,
+            ),
+        )
+        monkeypatch.setattr(
+            "importobot.cli.handlers.get_api_client", lambda fmt, **kwargs: client
+        )
+
+    def test_writes_robot_files_without_payload(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Without --archive-payload only .robot files are written."""
+        payload_dir = tmp_path / "payloads"
+        self._configure(monkeypatch, payload_dir, PageClient([_page(1), _page(2)]))
+
+        output = handle_api_stream(Namespace(output=str(tmp_path / "robot")))
+
+        assert len(list(Path(output).glob("*.robot"))) == 2
+        assert not payload_dir.exists() or not any(payload_dir.iterdir())
+
+    def test_archive_payload_writes_payload_and_metadata(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """--archive-payload keeps the raw pages and their metadata."""
+        payload_dir = tmp_path / "payloads"
+        self._configure(monkeypatch, payload_dir, PageClient([_page(1), _page(2)]))
+
+        handle_api_stream(
+            Namespace(output=str(tmp_path / "robot"), archive_payload=True)
+        )
+
+        payloads = [
+            path
+            for path in payload_dir.glob("*.json")
+            if not path.name.endswith(".meta.json")
+        ]
+        assert len(payloads) == 1
+        assert len(json.loads(payloads[0].read_text(encoding="utf-8"))) == 2
+        assert payloads[0].with_suffix(".meta.json").exists()
+
+    def test_incremental_is_rejected(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Streaming cannot merge into a previous snapshot."""
+        self._configure(monkeypatch, tmp_path, PageClient([]), incremental=True)
+
+        with pytest.raises(exceptions.ConfigurationError, match="--stream"):
+            handle_api_stream(Namespace(output=str(tmp_path / "robot")))
@@ -0,0 +1,116 @@
+"""Tests for copy-on-write JSON helpers and JSON Patch support."""
+
+from typing import Any
+
+import pytest
+
+from importobot import exceptions
+from importobot.utils.json_patch import (
+    apply_json_patch,
+    copy_containers,
+    diff_json,
+    escape_pointer_token,
+)
+
+
+class TestCopyContainers:
+    """Test container-only copies."""
+
+    def test_copies_containers_and_shares_leaves(self) -> None:
+        """Dicts and lists should be new objects; scalars should be shared."""
+        text = "x" * 100
+        original: dict[str, Any] = {"a": [{"b": text}], "n": 1}
+
+        copied = copy_containers(original)
+
+        assert copied == original
+        assert copied is not original
+        assert copied["a"] is not original["a"]
+        assert copied["a"][0] is not original["a"][0]
+        assert copied["a"][0]["b"] is text
+
+
+class TestDiffJson:
+    """Test JSON Patch generation."""
+
+    def test_identical_documents_have_no_operations(self) -> None:
+        """Equal values should produce an empty patch."""
+        assert diff_json({"a": [1, 2]}, {"a": [1, 2]}) == []
+
+    def test_dict_add_remove_replace(self) -> None:
+        """Dict changes should map to add, remove and replace operations."""
+        operations = diff_json({"a": 1, "b": 2}, {"a": 3, "c/d": 4})
+
+        assert {"op": "remove", "path": "/b"} in operations
+        assert {"op": "replace", "path": "/a", "value": 3} in operations
+        assert {"op": "add", "path": "/c~1d", "value": 4} in operations
+
+    def test_list_insert_is_single_add(self) -> None:
+        """Inserting into a list should not rewrite the following items."""
+        original = [{"i": 0}, {"i": 1}, {"i": 2}]
+        updated = [{"i": 0}, {"i": 1}, {"new": True}, {"i": 2}]
+
+        assert diff_json(original, updated, "/steps") == [
+            {"op": "add", "path": "/steps/2", "value": {"new": True}}
+        ]
+
+    def test_type_change_is_replaced(self) -> None:
+        """Values of different JSON types should be replaced wholesale."""
+        assert diff_json({"a": 1}, {"a": True}) == [
+            {"op": "replace", "path": "/a", "value": True}
+        ]
+
+    @pytest.mark.parametrize(
+        ("original", "updated"),
+        [
+            ([1, 2, 3, 4], [1, 4]),
+            ([1, 2], [0, 1, 2, 3]),
+            ({"a": [1, {"b": 2}]}, {"a": [{"b": 3}], "c": []}),
+            ([{"x": 1}, {"y": 2}], [{"x": 1, "z": 0}, {"y": 3}, {"w": 1}]),
+        ],
+    )
+    def test_round_trip(self, original: Any, updated: Any) -> None:
+        """Applying a diff should reproduce the updated document."""
+        snapshot = copy_containers(original)
+
+        assert apply_json_patch(original, diff_json(original, updated)) == updated
+        assert original == snapshot
+
+
+class TestApplyJsonPatch:
+    """Test copy-on-write patch application."""
+
+    def test_untouched_branches_are_shared(self) -> None:
+        """Only containers on patched paths should be copied."""
+        document: dict[str, Any] = {"cases": [{"a": 1}, {"b": 2}], "meta": {}}
+
+        result = apply_json_patch(
+            document, [{"op": "add", "path": "/cases/0/c", "value": 3}]
+        )
+
+        assert result["cases"][0] == {"a": 1, "c": 3}
+        assert document["cases"][0] == {"a": 1}
+        assert result["cases"][1] is document["cases"][1]
+        assert result["meta"] is document["meta"]
+
+    @pytest.mark.parametrize(
+        "operation",
+        [
+            {"op": "move", "path": "/a", "from": "/b"},
+            {"op": "remove", "path": "/missing"},
+            {"op": "replace", "path": "/list/5", "value": 1},
+            {"op": "add", "path": "/list/x", "value": 1},
+            {"op": "add", "path": "/a/b", "value": 1},
+            {"op": "add", "path": "no-slash", "value": 1},
+        ],
+    )
+    def test_invalid_operations_raise(self, operation: dict[str, Any]) -> None:
+        """Unsupported operations and bad paths should raise ValidationError."""
+        with pytest.raises(exceptions.ValidationError):
+            apply_json_patch({"a": 1, "list": [0]}, [operation])
+
+    def test_pointer_escaping(self) -> None:
+        """Pointer tokens should escape tilde and slash."""
+        assert escape_pointer_token("a/b~c") == "a~1b~0c"
+        result = apply_json_patch({"a/b": 1}, [{"op": "remove", "path": "/a~1b"}])
+        assert result == {}
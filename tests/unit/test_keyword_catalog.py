@@ -0,0 +1,206 @@
+"""Tests for the compiled, memory-mapped keyword catalog."""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from importobot import exceptions
+from importobot.core.keyword_catalog import (
+    CATALOG_FORMAT_VERSION,
+    KEYWORD_DATA_DIR,
+    KeywordCatalog,
+    build_catalog_bytes,
+    collect_catalog_entries,
+    compile_keyword_catalog,
+    get_keyword_catalog,
+    load_keyword_catalog,
+    normalize_keyword_name,
+)
+from importobot.core.keywords.generators.ssh_keywords import SSHKeywordGenerator
+from importobot.core.keywords_registry import (
+    IntentRecognitionEngine,
+    RobotFrameworkKeywordRegistry,
+)
+
+
+@pytest.fixture
+def catalog_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Point the shared catalog at a temporary file."""
+    path = tmp_path / "keyword_catalog.bin"
+    monkeypatch.setenv("IMPORTOBOT_KEYWORD_CATALOG", str(path))
+    get_keyword_catalog.cache_clear()
+    yield path
+    get_keyword_catalog.cache_clear()
+
+
+@pytest.fixture
+def catalog(tmp_path: Path) -> Iterator[KeywordCatalog]:
+    """Compile and map a catalog from the bundled sources."""
+    with KeywordCatalog.open(compile_keyword_catalog(tmp_path / "cat.bin")) as mapped:
+        yield mapped
+
+
+class TestNormalization:
+    """Tests for Robot Framework keyword name normalization."""
+
+    @pytest.mark.parametrize(
+        "name", ["Open Browser", "open_browser", "OPENBROWSER", " open browser "]
+    )
+    def test_ignores_case_spaces_and_underscores(self, name: str) -> None:
+        """Names differing only in case, spaces or underscores normalize alike."""
+        assert normalize_keyword_name(name) == "openbrowser"
+
+
+class TestKeywordCatalogLookup:
+    """Tests for lookups against a compiled catalog."""
+
+    def test_every_registry_keyword_is_indexed(self, catalog: KeywordCatalog) -> None:
+        """Each registry keyword resolves to its library's entry."""
+        registry = RobotFrameworkKeywordRegistry.KEYWORD_LIBRARIES
+        for library, keywords in registry.items():
+            for keyword, info in keywords.items():
+                entry = catalog.get(library, keyword)
+                assert entry is not None, (library, keyword)
+                assert list(entry.args) == info["args"]
+
+    def test_every_json_keyword_is_indexed(self, catalog: KeywordCatalog) -> None:
+        """Keywords that only exist in the JSON catalogs are included."""
+        for path in KEYWORD_DATA_DIR.glob("*.json"):
+            config = json.loads(path.read_text(encoding="utf-8"))
+            for keyword in config["keywords"]:
+                assert catalog.get(config["library_name"], keyword) is not None
+
+    def test_lookup_returns_each_defining_library(
+        self, catalog: KeywordCatalog
+    ) -> None:
+        """A name defined by several libraries returns one entry per library."""
+        libraries = {entry.library for entry in catalog.lookup("get_file")}
+
+        assert {"OperatingSystem", "SSHLibrary"} <= libraries
+
+    def test_entries_carry_intents_and_security_warnings(
+        self, catalog: KeywordCatalog
+    ) -> None:
+        """Intents come from the registry and warnings from both sources."""
+        entry = catalog.get("SSH", "execute command")
+
+        assert entry is not None
+        assert entry.library == "SSHLibrary"
+        assert "ssh_execute" in entry.intents
+        assert len(entry.security_warnings) == 2
+
+    def test_builtin_aliases_share_one_library(self, catalog: KeywordCatalog) -> None:
+        """The registry's ``builtin`` and the JSON ``BuiltIn`` are merged."""
+        entries = catalog.lookup("Log")
+
+        assert [entry.library for entry in entries] == ["builtin"]
+        assert catalog.get("BuiltIn", "Log") == entries[0]
+
+    def test_unknown_names_and_metadata(self, catalog: KeywordCatalog) -> None:
+        """Misses return nothing; the intent table and libraries are exposed."""
+        assert catalog.lookup("Definitely Not A Keyword") == ()
+        assert "Definitely Not A Keyword" not in catalog
+        assert "Open Browser" in catalog
+        assert catalog.intent_keyword("ssh_connect") == (
+            "SSHLibrary",
+            "Open Connection",
+        )
+        assert catalog.intent_keyword("unknown") is None
+        assert "SeleniumLibrary" in catalog.libraries
+        assert len(catalog) == len(
+            {normalize_keyword_name(e.keyword) for e in collect_catalog_entries()}
+        )
+
+    def test_mapping_is_read_only(self, catalog: KeywordCatalog) -> None:
+        """The mapped file cannot be modified through the catalog."""
+        with pytest.raises(TypeError):
+            catalog._buffer[0] = 0  # type: ignore[index]
+
+
+class TestCatalogFile:
+    """Tests for validation, rebuilding and fallbacks of the catalog file."""
+
+    def test_rejects_foreign_and_future_files(self, tmp_path: Path) -> None:
+        """Wrong magic numbers and versions raise ValidationError."""
+        payload = build_catalog_bytes([], {}, b"\0" * 16)
+        future = bytearray(payload)
+        future[4:6] = (CATALOG_FORMAT_VERSION + 1).to_bytes(2, "little")
+        (tmp_path / "foreign.bin").write_bytes(b"XXXX" + payload[4:])
+        (tmp_path / "future.bin").write_bytes(bytes(future))
+
+        with pytest.raises(exceptions.ValidationError, match="Not a keyword"):
+            KeywordCatalog.open(tmp_path / "foreign.bin")
+        with pytest.raises(exceptions.ValidationError, match="version"):
+            KeywordCatalog.open(tmp_path / "future.bin")
+        with pytest.raises(exceptions.ValidationError, match="truncated"):
+            KeywordCatalog(payload[:10])
+
+    def test_stale_catalog_is_recompiled(self, catalog_path: Path) -> None:
+        """A catalog with an outdated fingerprint is rebuilt on load."""
+        catalog_path.write_bytes(build_catalog_bytes([], {}, b"\0" * 16))
+
+        with load_keyword_catalog() as loaded:
+            assert "Open Browser" in loaded
+
+        with KeywordCatalog.open(catalog_path) as on_disk:
+            assert len(on_disk) > 0
+
+    def test_unwritable_location_falls_back_to_memory(self, tmp_path: Path) -> None:
+        """When the catalog cannot be written it is built in memory."""
+        blocker = tmp_path / "not-a-directory"
+        blocker.write_text("", encoding="utf-8")
+
+        loaded = load_keyword_catalog(blocker / "catalog.bin")
+
+        assert "Open Browser" in loaded
+
+
+class TestCatalogIntegration:
+    """Tests for the registry and generator lookups served by the catalog."""
+
+    def test_registry_keyword_info_uses_normalized_names(
+        self, catalog_path: Path
+    ) -> None:
+        """Library aliases and keyword spelling variants resolve to one entry."""
+        info = RobotFrameworkKeywordRegistry.get_keyword_info(
+            "selenium", "click_element"
+        )
+
+        assert info["library"] == "SeleniumLibrary"
+        assert info["keyword"] == "Click Element"
+        assert info["args"] == ["locator"]
+        assert catalog_path.exists()
+
+    def test_registry_finds_json_only_keywords(self, catalog_path: Path) -> None:
+        """Keywords defined only in the JSON libraries are found."""
+        ssh_keywords = RobotFrameworkKeywordRegistry.KEYWORD_LIBRARIES["SSHLibrary"]
+
+        info = RobotFrameworkKeywordRegistry.get_keyword_info(
+            "SSHLibrary", "Close All Connections"
+        )
+
+        assert "Close All Connections" not in ssh_keywords
+        assert info["keyword"] == "Close All Connections"
+
+    def test_security_warnings_combine_both_sources(self, catalog_path: Path) -> None:
+        """Warnings from the registry and the JSON libraries are both reported."""
+        warnings = IntentRecognitionEngine.get_security_warnings_for_keyword(
+            "SSH", "execute command"
+        )
+
+        assert len(warnings) == 2
+
+    def test_generators_resolve_intents_from_the_catalog(
+        self, catalog_path: Path
+    ) -> None:
+        """Keyword generators read their intent keywords from the catalog."""
+        line = SSHKeywordGenerator().generate_connect_keyword("host: example.com")
+
+        assert line.startswith("Open Connection")
+        assert get_keyword_catalog().intent_keyword("ssh_connect") == (
+            "SSHLibrary",
+            "Open Connection",
+        )
+        assert catalog_path.exists()
@@ -5,14 +5,19 @@ Following TDD principles with comprehensive keyword generation testing.
 """
 
 from contextlib import suppress
-from typing import Any
+from typing import Any, ClassVar
 from unittest.mock import MagicMock, Mock, patch
 
 from importobot.core.converter import get_conversion_suggestions
+from importobot.core.engine import GenericConversionEngine
 from importobot.core.interfaces import KeywordGenerator
-from importobot.core.keyword_generator import GenericKeywordGenerator
+from importobot.core.keyword_generator import (
+    GenericKeywordGenerator,
+    StepKeywordMemo,
+    get_shared_step_memo,
+)
 from importobot.core.keywords.generators.builtin_keywords import BuiltInKeywordGenerator
-from importobot.core.pattern_matcher import IntentType
+from importobot.core.pattern_matcher import IntentType, RobotFrameworkLibrary
 
 
 class TestGenericKeywordGeneratorInitialization:
@@ -640,3 +645,157 @@ class TestKeywordGeneratorIntegration:
         test_data: dict[str, Any] = {"steps": [None, "invalid", {}]}
         result = generator.generate_test_case(test_data)
         assert isinstance(result, list)
+
+
+class TestStepKeywordMemo:
+    """Test memoization of generated step keywords."""
+
+    STEP: ClassVar[dict[str, str]] = {
+        "description": "Open browser",
+        "testData": "https://example.com",
+        "expectedResult": "Login page is shown",
+    }
+
+    def test_repeated_steps_reuse_generated_lines(self) -> None:
+        """A repeated step is generated once and served from the memo."""
+        generator = GenericKeywordGenerator()
+
+        with patch.object(
+            generator, "_generate_step_lines", wraps=generator._generate_step_lines
+        ) as generate:
+            first = generator.generate_step_keywords(dict(self.STEP))
+            second = generator.generate_step_keywords(
+                {
+                    "step": "Open browser",
+                    "test_data": "https://example.com",
+                    "expected": "Login page is shown",
+                }
+            )
+
+        assert first == second
+        assert generate.call_count == 1
+        assert generator.step_memo.get_stats()["cache_hits"] == 1
+
+    def test_memoized_lines_match_uncached_generation(self) -> None:
+        """Memoized output equals generation with memoization disabled."""
+        steps = [
+            dict(self.STEP),
+            {"description": "Enter username", "testData": "username: admin"},
+            {"description": "Run command", "testData": "ls -la /tmp"},
+            dict(self.STEP),
+        ]
+        memoized = GenericKeywordGenerator()
+        uncached = GenericKeywordGenerator(step_memo=StepKeywordMemo(max_size=0))
+
+        assert [memoized.generate_step_keywords(s) for s in steps] == [
+            uncached.generate_step_keywords(s) for s in steps
+        ]
+        assert len(uncached.step_memo) == 0
+
+    def test_library_context_is_part_of_the_key(self) -> None:
+        """Changing the library context regenerates the step."""
+        generator = GenericKeywordGenerator()
+        step = {"description": "Verify page", "testData": "Welcome"}
+
+        generator.generate_step_keywords(step)
+        generator.set_library_context({RobotFrameworkLibrary.SELENIUM_LIBRARY})
+        generator.generate_step_keywords(step)
+
+        stats = generator.step_memo.get_stats()
+        assert (stats["cache_hits"], stats["cache_misses"]) == (0, 2)
+
+    def test_returned_lines_are_independent_copies(self) -> None:
+        """Mutating a returned list does not affect the memoized entry."""
+        generator = GenericKeywordGenerator()
+
+        generator.generate_step_keywords(dict(self.STEP)).append("    Extra")
+
+        assert "    Extra" not in generator.generate_step_keywords(dict(self.STEP))
+
+    def test_lru_eviction_and_stats(self) -> None:
+        """The least recently used entry is evicted once the memo is full."""
+        memo = StepKeywordMemo(max_size=2)
+        keys = [(name, "", "", frozenset[str]()) for name in ("a", "b", "c")]
+
+        memo.put(keys[0], ["A"])
+        memo.put(keys[1], ["B"])
+        assert memo.get(keys[0]) == ("A",)
+        memo.put(keys[2], ["C"])
+
+        assert memo.get(keys[1]) is None
+        assert memo.get(keys[2]) == ("C",)
+        stats = memo.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["cache_size"] == 2
+        assert stats["hit_rate"] == 2 / 3
+
+        memo.clear()
+        assert len(memo) == 0
+        assert memo.get_stats()["cache_hits"] == 0
+
+    def test_engines_share_the_process_memo(self) -> None:
+        """Conversion engines use the process-wide memo."""
+        first = GenericConversionEngine()
+        second = GenericConversionEngine()
+
+        assert first.keyword_generator.step_memo is get_shared_step_memo()
+        assert second.keyword_generator.step_memo is get_shared_step_memo()
+
+
+class TestIntentDispatch:
+    """Test the prebuilt intent dispatch table and ambiguity rules."""
+
+    def test_handlers_are_shared_across_instances(self) -> None:
+        """The dispatch table is built once on the class, not per generator."""
+        first = GenericKeywordGenerator()
+        second = GenericKeywordGenerator()
+
+        assert first._INTENT_HANDLERS is second._INTENT_HANDLERS
+        assert IntentType.BROWSER_OPEN in GenericKeywordGenerator._INTENT_HANDLERS
+        assert IntentType.SSH_CONNECT in GenericKeywordGenerator._INTENT_HANDLERS
+
+    def test_handler_receives_the_library_context(self) -> None:
+        """Handlers are called with the generator and its library context."""
+        generator = GenericKeywordGenerator()
+        generator.set_library_context({RobotFrameworkLibrary.SELENIUM_LIBRARY})
+
+        keyword = generator._determine_robot_keyword(
+            "Verify page contains text", "Welcome", ""
+        )
+
+        assert keyword.startswith("SeleniumLibrary.Page Should Contain")
+
+    def test_ambiguity_rules_resolve_once_per_context(self) -> None:
+        """The verification keyword is looked up again only on context change."""
+        generator = GenericKeywordGenerator()
+
+        with patch.object(
+            generator,
+            "_get_library_aware_verification",
+            wraps=generator._get_library_aware_verification,
+        ) as resolver:
+            for _ in range(3):
+                generator._detect_ambiguous_cases("log and verify result", "", "")
+            assert resolver.call_count == 1
+
+            generator.set_library_context({RobotFrameworkLibrary.SELENIUM_LIBRARY})
+            suggestions = generator._detect_ambiguous_cases(
+                "log and verify result", "", ""
+            )
+
+        assert resolver.call_count == 2
+        assert suggestions[0] == "Log    ${message}"
+        assert suggestions[1].startswith("SeleniumLibrary.Page Should Contain")
+
+    def test_overlapping_rules_are_deduplicated_in_order(self) -> None:
+        """Suggestions from several matching rules keep their first position."""
+        generator = GenericKeywordGenerator()
+
+        suggestions = generator._detect_ambiguous_cases(
+            "log and verify, then verify and log", "", ""
+        )
+
+        assert suggestions == [
+            "Log    ${message}",
+            "Should Contain    ${container}    ${item}",
+        ]
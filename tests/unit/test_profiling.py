@@ -0,0 +1,218 @@
+"""Tests for the CLI profiling mode and regex pattern timing."""
+
+import json
+import re
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from importobot.__main__ import main
+from importobot.cli.parser import create_parser
+from importobot.cli.profiling import (
+    PROFILE_REPORT_SCHEMA_VERSION,
+    ProfilingSession,
+    default_profile_output,
+)
+from importobot.core.converter import convert_file
+from importobot.telemetry import get_telemetry_client, reset_telemetry_client
+from importobot.utils.regex_cache import (
+    disable_pattern_timing,
+    enable_pattern_timing,
+    get_compiled_pattern,
+    get_pattern_timings,
+    reset_pattern_timings,
+    search_cached,
+)
+
+SAMPLE_TEST_CASE = {
+    "name": "Login",
+    "steps": [
+        {
+            "step": "Open browser",
+            "testData": "https://example.com",
+            "expectedResult": "Page loads",
+        },
+        {"step": "Run command", "testData": "ls -la", "expectedResult": "Listing"},
+    ],
+}
+
+
+@pytest.fixture
+def sample_json(tmp_path: Path) -> Path:
+    """Write a small convertible test case to disk."""
+    path = tmp_path / "case.json"
+    path.write_text(json.dumps(SAMPLE_TEST_CASE), encoding="utf-8")
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _isolate_telemetry(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Start every test with telemetry disabled."""
+    monkeypatch.delenv("IMPORTOBOT_ENABLE_TELEMETRY", raising=False)
+    reset_telemetry_client()
+
+
+class TestProfileArguments:
+    """Test parsing of the --profile flags."""
+
+    def test_profile_defaults_to_cpu(self) -> None:
+        """A bare --profile should select CPU profiling."""
+        args = create_parser().parse_args(["in.json", "out.robot", "--profile"])
+        assert args.profile == "cpu"
+        assert args.profile_output is None
+
+    def test_profile_accepts_mem_and_output(self) -> None:
+        """The mode and report path should be configurable."""
+        args = create_parser().parse_args(
+            ["--profile=mem", "--profile-output", "report.json", "in.json"]
+        )
+        assert args.profile == "mem"
+        assert args.profile_output == "report.json"
+
+    def test_profile_disabled_by_default(self) -> None:
+        """Profiling should be off unless requested."""
+        args = create_parser().parse_args(["in.json", "out.robot"])
+        assert args.profile is None
+
+    def test_invalid_mode_is_rejected(self) -> None:
+        """Unknown modes should be reported by argparse."""
+        with pytest.raises(SystemExit):
+            create_parser().parse_args(["--profile=gpu", "in.json"])
+
+
+class TestProfilingSession:
+    """Test report generation for both profiling modes."""
+
+    def test_cpu_report_attributes_stages_and_functions(
+        self, sample_json: Path, tmp_path: Path
+    ) -> None:
+        """CPU reports should include stages, hot functions and caches."""
+        report_path = tmp_path / "profile.json"
+
+        with ProfilingSession("cpu", report_path, argv=["case.json"]):
+            convert_file(str(sample_json), str(tmp_path / "case.robot"))
+
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        assert report["schema_version"] == PROFILE_REPORT_SCHEMA_VERSION
+        assert report["mode"] == "cpu"
+        assert report["argv"] == ["case.json"]
+        assert report["exit_status"] == "ok"
+        assert {"json.load", "blueprint.render", "storage.write.robot"} <= set(
+            report["stages"]
+        )
+        assert report["stages"]["json.load"]["count"] == 1
+        assert report["top_functions"]
+        assert report["hot_functions"]
+        assert any(
+            row["component"].startswith("importobot.")
+            for row in report["top_functions"]
+        )
+        assert {"regex_cache", "string_cache", "performance_cache"} <= set(
+            report["caches"]
+        )
+        assert "memory" not in report
+
+    def test_mem_report_records_stage_peaks(
+        self, sample_json: Path, tmp_path: Path
+    ) -> None:
+        """Memory reports should include per-stage peaks and allocation sites."""
+        report_path = tmp_path / "profile.json"
+
+        with ProfilingSession("mem", report_path, argv=[]):
+            convert_file(str(sample_json), str(tmp_path / "case.robot"))
+
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        assert report["mode"] == "mem"
+        assert report["memory"]["peak_bytes"] > 0
+        assert report["memory"]["top_allocations"]
+        assert report["stages"]["json.load"]["peak_memory_bytes"] > 0
+        assert "top_functions" not in report
+
+    def test_session_restores_previous_telemetry_client(self, tmp_path: Path) -> None:
+        """The profiler should not leave its telemetry client installed."""
+        with ProfilingSession("cpu", tmp_path / "profile.json", argv=[]):
+            assert get_telemetry_client() is not None
+
+        assert get_telemetry_client() is None
+
+    def test_failed_run_still_writes_report(self, tmp_path: Path) -> None:
+        """Reports should be written even when the profiled code exits."""
+        report_path = tmp_path / "profile.json"
+
+        with (
+            pytest.raises(SystemExit),
+            ProfilingSession("cpu", report_path, argv=[]),
+        ):
+            sys.exit(1)
+
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        assert report["exit_status"] == "error"
+
+    def test_invalid_mode_raises(self) -> None:
+        """Sessions should reject unsupported modes."""
+        with pytest.raises(ValueError, match="Unsupported profile mode"):
+            ProfilingSession("gpu")
+
+    def test_default_output_path_uses_mode(self) -> None:
+        """Default report names should include the mode."""
+        assert default_profile_output("mem") == Path("importobot-profile-mem.json")
+
+
+class TestProfileCli:
+    """Test the --profile flag end to end through the CLI entry point."""
+
+    def test_cli_profile_writes_report(
+        self, sample_json: Path, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Running the CLI with --profile should write the requested report."""
+        report_path = tmp_path / "report.json"
+        argv = [
+            "importobot",
+            "--no-suggestions",
+            f"--profile-output={report_path}",
+            "--profile=cpu",
+            str(sample_json),
+            str(tmp_path / "case.robot"),
+        ]
+
+        with patch.object(sys, "argv", argv):
+            main()
+
+        assert (tmp_path / "case.robot").exists()
+        report = json.loads(report_path.read_text(encoding="utf-8"))
+        assert "storage.write.robot" in report["stages"]
+        assert "Profile report (cpu) written to" in capsys.readouterr().err
+
+
+class TestRegexPatternTiming:
+    """Test per-pattern timing in the regex cache layer."""
+
+    def test_timing_disabled_returns_compiled_pattern(self) -> None:
+        """Without timing the cache should hand out plain compiled patterns."""
+        disable_pattern_timing()
+        assert isinstance(get_compiled_pattern(r"\d+"), re.Pattern)
+
+    def test_timing_records_calls_per_pattern(self) -> None:
+        """Timed patterns should accumulate calls and cumulative time."""
+        reset_pattern_timings()
+        enable_pattern_timing()
+        try:
+            pattern = get_compiled_pattern(r"\d+", re.IGNORECASE)
+            assert pattern.findall("a1b22") == ["1", "22"]
+            assert pattern.search("x9") is not None
+            assert [m.group() for m in pattern.finditer("3 4")] == ["3", "4"]
+            assert pattern.pattern == r"\d+"
+            assert search_cached(r"[a-z]+", "abc") is not None
+        finally:
+            disable_pattern_timing()
+
+        timings = {row["pattern"]: row for row in get_pattern_timings()}
+        assert timings[r"\d+"]["calls"] == 3
+        assert timings[r"\d+"]["flags"] == int(re.IGNORECASE)
+        assert timings[r"[a-z]+"]["calls"] == 1
+        assert timings[r"\d+"]["cumulative_seconds"] >= 0.0
+
+        reset_pattern_timings()
+        assert get_pattern_timings() == []
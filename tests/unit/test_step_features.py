@@ -0,0 +1,122 @@
+"""Tests for the shared step feature pass used by the suggestion analyzers."""
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+from importobot.cli.handlers import display_suggestions
+from importobot.core.converter import convert_file
+from importobot.core.suggestions import step_features
+from importobot.core.suggestions.step_features import (
+    extract_features,
+    extract_step_features,
+    find_placeholders,
+    normalize_command_signature,
+)
+from importobot.core.suggestions.suggestion_engine import GenericSuggestionEngine
+
+HASH_CASE: dict[str, Any] = {
+    "name": "Hash comparison",
+    "description": "Uses {base_dir}",
+    "testScript": {
+        "steps": [
+            {
+                "step": "Compute hash of <first>",
+                "testData": "sha256sum -b {file_1}",
+                "expectedResult": "Digest for ${first}",
+                "index": 1,
+            },
+            {
+                "step": "Compute hash of second",
+                "testData": "sha256sum -b {file_2}",
+                "expectedResult": "Digest (second",
+                "index": 3,
+            },
+        ]
+    },
+}
+
+
+class TestExtractFeatures:
+    """Test the per-step feature extraction."""
+
+    def test_extracts_text_commands_and_placeholders(self) -> None:
+        """Each feature should carry normalized text and parameter names."""
+        step = HASH_CASE["testScript"]["steps"][0]
+        feature = extract_features(step, 0)
+
+        assert feature.step is step
+        assert feature.description_lower == "compute hash of <first>"
+        assert feature.combined_lower == (
+            "compute hash of <first> sha256sum -b {file_1} digest for ${first}"
+        )
+        assert feature.command == "sha256sum -b {file_1}"
+        assert feature.is_command
+        assert feature.command_signature == "sha256sum|-b"
+        assert feature.robot_placeholders == {"first"}
+        assert feature.legacy_placeholders == {"file_1", "first"}
+        assert feature.index_values == (1,)
+        assert feature.unmatched_braces == ()
+
+    def test_records_unmatched_braces_per_field(self) -> None:
+        """Unbalanced braces should be reported with field and brace type."""
+        feature = extract_features(HASH_CASE["testScript"]["steps"][1], 1)
+        assert feature.unmatched_braces == (("expectedResult", "round"),)
+
+    def test_skips_non_dict_steps_but_keeps_positions(self) -> None:
+        """Step numbers should match the position in the original list."""
+        features = extract_step_features(["bad", {"step": "Open page"}])  # type: ignore[list-item]
+        assert [feature.index for feature in features] == [1]
+
+    def test_placeholder_helpers(self) -> None:
+        """Placeholder and signature helpers should ignore one-letter names."""
+        robot, legacy = find_placeholders("${a} ${name} <x> [item]")
+        assert robot == {"name"}
+        assert legacy == {"name", "item"}
+        assert normalize_command_signature("  ") is None
+        assert normalize_command_signature("LS -l -a 'x") == "ls|-a|-l"
+
+
+class TestSharedFeaturePass:
+    """Test that the engine and CLI avoid repeated work."""
+
+    def test_engine_extracts_features_once_per_test_case(self) -> None:
+        """All analyzers should share one feature pass per test case."""
+        engine = GenericSuggestionEngine()
+        with patch(
+            "importobot.core.suggestions.suggestion_engine.extract_step_features",
+            wraps=step_features.extract_step_features,
+        ) as extract:
+            suggestions = engine.get_suggestions([HASH_CASE, HASH_CASE])
+
+        assert extract.call_count == 2
+        assert any("comparison step" in suggestion for suggestion in suggestions)
+        assert any("unmatched round braces" in suggestion for suggestion in suggestions)
+
+    def test_analyzers_extract_features_when_called_directly(self) -> None:
+        """Analyzers should still accept raw steps without precomputed features."""
+        engine = GenericSuggestionEngine()
+        steps = HASH_CASE["testScript"]["steps"]
+        shared: list[str] = []
+        direct: list[str] = []
+
+        features = extract_step_features(steps)
+        engine.step_analyzer.check_steps(steps, 1, shared, features=features)
+        engine.step_analyzer.check_steps(steps, 1, direct)
+
+        assert shared == direct
+
+    def test_cli_reuses_parsed_document(self, tmp_path: Path, capsys: Any) -> None:
+        """Suggestions should be generated from the document conversion parsed."""
+        input_path = tmp_path / "case.json"
+        input_path.write_text(json.dumps(HASH_CASE), encoding="utf-8")
+
+        json_data = convert_file(str(input_path), str(tmp_path / "case.robot"))
+        assert json_data == HASH_CASE
+
+        with patch("importobot.cli.handlers.load_json_file") as load:
+            display_suggestions(str(input_path), json_data=json_data)
+
+        load.assert_not_called()
+        assert "Conversion Suggestions" in capsys.readouterr().out
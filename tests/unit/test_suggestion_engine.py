@@ -4,6 +4,8 @@ Tests the main suggestion engine that orchestrates all suggestion components.
 Following TDD principles with comprehensive suggestion validation.
 """
 
+import json
+from pathlib import Path
 from typing import Any
 from unittest.mock import Mock, patch
 
@@ -12,6 +14,7 @@ import pytest
 from importobot import exceptions
 from importobot.core.interfaces import SuggestionEngine
 from importobot.core.suggestions.suggestion_engine import GenericSuggestionEngine
+from importobot.utils.json_patch import apply_json_patch
 
 
 class TestGenericSuggestionEngineInitialization:
@@ -254,6 +257,83 @@ class TestApplySuggestions:
             engine.apply_suggestions(test_data)
 
 
+class TestPlanSuggestions:
+    """Test the copy-on-write suggestion plan."""
+
+    @staticmethod
+    def _complete_case(name: str) -> dict[str, Any]:
+        """Build a test case that needs no improvements."""
+        return {
+            "name": name,
+            "description": "Already complete",
+            "parameters": [],
+            "testScript": {
+                "steps": [
+                    {
+                        "step": "Open page",
+                        "testData": "url: home",
+                        "expectedResult": "Page shown",
+                    }
+                ]
+            },
+        }
+
+    def test_unchanged_document_is_not_copied(self) -> None:
+        """Documents needing no changes should be returned as-is."""
+        engine = GenericSuggestionEngine()
+        test_data = {"testCases": [self._complete_case("a"), self._complete_case("b")]}
+
+        patch_plan = engine.plan_suggestions(test_data)
+
+        assert not patch_plan.has_changes
+        assert patch_plan.operations == []
+        assert patch_plan.improved is test_data
+
+    def test_only_changed_test_cases_are_copied(self) -> None:
+        """Unchanged test cases should be shared with the original document."""
+        engine = GenericSuggestionEngine()
+        complete = self._complete_case("complete")
+        incomplete: dict[str, Any] = {"testScript": {"steps": []}}
+        test_data = [complete, incomplete]
+
+        improved, changes = engine.apply_suggestions(test_data)
+
+        assert changes
+        assert improved[0] is complete
+        assert improved[1] is not incomplete
+        assert incomplete == {"testScript": {"steps": []}}
+
+    def test_operations_reproduce_improved_document(self) -> None:
+        """JSON Patch operations should turn the original into the result."""
+        engine = GenericSuggestionEngine()
+        test_data: dict[str, Any] = {
+            "tests": [self._complete_case("ok"), {"steps": []}],
+            "project": "DEMO",
+        }
+
+        patch_plan = engine.plan_suggestions(test_data)
+
+        assert all(op["path"].startswith("/tests/1") for op in patch_plan.operations)
+        assert apply_json_patch(test_data, patch_plan.operations) == (
+            patch_plan.improved
+        )
+        assert patch_plan.improved["tests"][0] is test_data["tests"][0]
+
+    def test_write_improved_and_patch(self, tmp_path: Path) -> None:
+        """The plan should write the improved document and its patch to disk."""
+        engine = GenericSuggestionEngine()
+        test_data: dict[str, Any] = {"steps": []}
+        patch_plan = engine.plan_suggestions(test_data)
+
+        improved_path = patch_plan.write_improved(tmp_path / "improved.json")
+        patch_path = patch_plan.write_patch(tmp_path / "improved.patch.json")
+
+        improved = json.loads(improved_path.read_text(encoding="utf-8"))
+        operations = json.loads(patch_path.read_text(encoding="utf-8"))
+        assert improved == patch_plan.improved
+        assert apply_json_patch(test_data, operations) == improved
+
+
 class TestPrivateMethods:
     """Test private helper methods."""
 
@@ -7,24 +7,32 @@ Following TDD principles, these tests verify:
 - Thread-safe singleton pattern
 - Exporter registration and lifecycle
 - Cache metrics collection
+- Stage timing histograms, counters and metric exporters
 """
 
 import json
 import threading
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
 from importobot.telemetry import (
+    JsonSnapshotExporter,
+    MetricsAggregator,
+    MetricsSnapshot,
+    PrometheusTextExporter,
     TelemetryClient,
     TelemetryPayload,
     _flag_from_env,
     _float_from_env,
     _int_from_env,
     clear_telemetry_exporters,
+    export_telemetry_metrics,
     get_telemetry_client,
     register_telemetry_exporter,
     reset_telemetry_client,
+    telemetry_span,
 )
 
 
@@ -583,3 +591,139 @@ class TestThreadSafety:
 
         # All threads should get the same instance
         assert len({id(c) for c in clients}) == 1
+
+
+class TestStageMetrics:
+    """Test stage timing spans, counters and metric snapshots."""
+
+    def test_aggregator_histogram_buckets_are_cumulative(self) -> None:
+        """Bucket counts should follow the Prometheus cumulative convention."""
+        aggregator = MetricsAggregator(buckets=(0.1, 1.0))
+        for value in (0.05, 0.5, 0.5, 5.0):
+            aggregator.observe("stage", value)
+
+        timing = aggregator.snapshot()["timings"]["stage"]  # type: ignore[index]
+
+        assert timing["count"] == 4
+        assert timing["sum"] == pytest.approx(6.05)
+        assert timing["min"] == 0.05
+        assert timing["max"] == 5.0
+        assert timing["buckets"] == {"0.1": 1, "1.0": 3, "+Inf": 4}
+
+    def test_span_records_duration_and_errors(self) -> None:
+        """Spans should record timings even when the block raises."""
+        client = TelemetryClient(min_emit_interval=60.0, min_sample_delta=100)
+
+        with client.span("json.load"):
+            pass
+        with pytest.raises(ValueError, match="boom"), client.span("json.load"):
+            raise ValueError("boom")
+
+        snapshot = client.metrics_snapshot()
+        assert snapshot["timings"]["json.load"]["count"] == 2  # type: ignore[index]
+        assert snapshot["counters"] == {"json.load.errors": 1}
+
+    def test_spans_do_not_emit_events(self) -> None:
+        """Stage timings should aggregate silently rather than log per call."""
+        client = TelemetryClient(min_emit_interval=0.0, min_sample_delta=0)
+        exporter = Mock()
+        client.clear_exporters()
+        client.register_exporter(exporter)
+
+        with client.span("parser.find_tests"):
+            pass
+        client.increment_counter("files")
+
+        exporter.assert_not_called()
+
+    def test_export_metrics_invokes_metrics_exporters(self) -> None:
+        """Registered metrics exporters should receive the current snapshot."""
+        client = TelemetryClient(min_emit_interval=60.0, min_sample_delta=100)
+        snapshots: list[MetricsSnapshot] = []
+
+        def failing_exporter(snapshot: MetricsSnapshot) -> None:
+            raise RuntimeError("Simulated exporter failure")
+
+        client.register_metrics_exporter(failing_exporter)
+        client.register_metrics_exporter(snapshots.append)
+        client.record_timing("storage.write.bronze", 0.25)
+
+        client.export_metrics()
+
+        assert len(snapshots) == 1
+        assert "storage.write.bronze" in snapshots[0]["timings"]  # type: ignore[operator]
+
+    def test_reset_metrics_clears_aggregates(self) -> None:
+        """Resetting should drop timings and counters."""
+        client = TelemetryClient(min_emit_interval=60.0, min_sample_delta=100)
+        client.record_timing("stage", 0.1)
+        client.increment_counter("counter", 3)
+
+        client.reset_metrics()
+
+        snapshot = client.metrics_snapshot()
+        assert snapshot["timings"] == {}
+        assert snapshot["counters"] == {}
+
+    def test_prometheus_exporter_writes_text_format(self, tmp_path: Path) -> None:
+        """Prometheus exporter should write histogram and counter samples."""
+        aggregator = MetricsAggregator(buckets=(0.5,))
+        aggregator.observe("format.detect", 0.25)
+        aggregator.increment("keywords.cache.hits", 2)
+        target = tmp_path / "metrics" / "importobot.prom"
+
+        PrometheusTextExporter(target)(aggregator.snapshot())
+
+        text = target.read_text(encoding="utf-8")
+        assert "# TYPE importobot_stage_duration_seconds histogram" in text
+        assert (
+            'importobot_stage_duration_seconds_bucket{stage="format.detect",le="0.5"} 1'
+            in text
+        )
+        assert (
+            'importobot_stage_duration_seconds_count{stage="format.detect"} 1' in text
+        )
+        assert "importobot_keywords_cache_hits_total 2" in text
+
+    def test_json_snapshot_exporter_round_trips(self, tmp_path: Path) -> None:
+        """JSON exporter output should load back into the same snapshot."""
+        aggregator = MetricsAggregator()
+        aggregator.observe("blueprint.render", 0.002)
+        snapshot = aggregator.snapshot()
+        target = tmp_path / "snapshot.json"
+
+        JsonSnapshotExporter(target)(snapshot)
+
+        assert json.loads(target.read_text(encoding="utf-8")) == snapshot
+
+    def test_global_span_is_noop_when_disabled(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Module-level helpers should be inert when telemetry is disabled."""
+        monkeypatch.delenv("IMPORTOBOT_ENABLE_TELEMETRY", raising=False)
+        reset_telemetry_client()
+
+        with telemetry_span("json.load"):
+            pass
+
+        assert export_telemetry_metrics() is None
+
+    def test_env_configured_exporters_write_files(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Exporter paths from the environment should be registered on init."""
+        prom_path = tmp_path / "importobot.prom"
+        json_path = tmp_path / "importobot.json"
+        monkeypatch.setenv("IMPORTOBOT_ENABLE_TELEMETRY", "1")
+        monkeypatch.setenv("IMPORTOBOT_TELEMETRY_PROMETHEUS_FILE", str(prom_path))
+        monkeypatch.setenv("IMPORTOBOT_TELEMETRY_JSON_SNAPSHOT", str(json_path))
+        reset_telemetry_client()
+
+        with telemetry_span("parser.find_steps"):
+            pass
+        export_telemetry_metrics()
+        reset_telemetry_client()
+
+        assert 'stage="parser.find_steps"' in prom_path.read_text(encoding="utf-8")
+        snapshot = json.loads(json_path.read_text(encoding="utf-8"))
+        assert snapshot["timings"]["parser.find_steps"]["count"] == 1
@@ -5,6 +5,7 @@ Tests for test generation utilities including CategoryEnum enum functionality.
 # pylint: disable=protected-access,no-member
 
 import json
+import random
 import re
 import tempfile
 from pathlib import Path
@@ -24,6 +25,13 @@ from importobot.utils.test_generation.helpers import (
     get_available_structures,
     get_required_libraries_for_keywords,
 )
+from importobot.utils.test_generation.sharding import (
+    JSONL_FILENAME,
+    SEEDED_REFERENCE_TIME,
+    derive_shard_seed,
+    plan_test_suite,
+    split_into_shards,
+)
 
 
 class TestCategoryEnumEnum:
@@ -1094,3 +1102,150 @@ class TestProgressReporting:
                     if f"concurrent_test_{category_num}" in str(call)
                 ]
                 assert len(category_messages) > 0
+
+
+class TestShardedSuiteGeneration:
+    """Test seeded, sharded and parallel test suite generation."""
+
+    @staticmethod
+    def _generate_jsonl(output_dir: Path, seed: int, workers: int) -> str:
+        """Generate a small seeded JSON Lines suite and return its contents."""
+        TestSuiteGenerator().generate_test_suite(
+            str(output_dir),
+            total_tests=24,
+            seed=seed,
+            workers=workers,
+            output_format="jsonl",
+            shard_size=5,
+        )
+        return (output_dir / JSONL_FILENAME).read_text(encoding="utf-8")
+
+    def test_same_seed_gives_same_suite_for_any_worker_count(
+        self, tmp_path: Path
+    ) -> None:
+        """Worker count must not change a seeded suite; the seed must."""
+        serial = self._generate_jsonl(tmp_path / "serial", seed=11, workers=1)
+        parallel = self._generate_jsonl(tmp_path / "parallel", seed=11, workers=2)
+        other = self._generate_jsonl(tmp_path / "other", seed=12, workers=1)
+
+        assert serial == parallel
+        assert serial != other
+
+    def test_jsonl_output_holds_every_test_case_in_order(self, tmp_path: Path) -> None:
+        """JSON Lines output should contain one record per test in ID order."""
+        counts = TestSuiteGenerator().generate_test_suite(
+            str(tmp_path),
+            total_tests=12,
+            weights={CategoryEnum.SMOKE: 1.0},
+            seed=3,
+            output_format="jsonl",
+            shard_size=5,
+        )
+
+        lines = (tmp_path / JSONL_FILENAME).read_text(encoding="utf-8").splitlines()
+        keys = [json.loads(line)["key"] for line in lines]
+        assert counts == {"smoke": 12}
+        assert keys == [f"ENTERPRISE-{test_id:04d}" for test_id in range(1, 13)]
+        assert not (tmp_path / "smoke").exists()
+
+    def test_bundles_output_writes_one_document_per_shard(self, tmp_path: Path) -> None:
+        """Bundle output should write testCases documents of shard_size cases."""
+        TestSuiteGenerator().generate_test_suite(
+            str(tmp_path),
+            total_tests=12,
+            weights={CategoryEnum.REGRESSION: 1.0},
+            seed=3,
+            output_format="bundles",
+            shard_size=5,
+        )
+
+        bundles = sorted(tmp_path.glob("bundle_*.json"))
+        sizes = [
+            len(json.loads(bundle.read_text(encoding="utf-8"))["testCases"])
+            for bundle in bundles
+        ]
+        assert [bundle.name for bundle in bundles] == [
+            "bundle_00000.json",
+            "bundle_00001.json",
+            "bundle_00002.json",
+        ]
+        assert sizes == [5, 5, 2]
+
+    def test_seeded_files_output_keeps_per_case_layout(self, tmp_path: Path) -> None:
+        """Seeded generation should still write one file per test by default."""
+        counts = TestSuiteGenerator().generate_test_suite(
+            str(tmp_path),
+            total_tests=6,
+            weights={CategoryEnum.E2E: 1.0},
+            seed=5,
+            shard_size=4,
+        )
+
+        files = sorted(path.name for path in (tmp_path / "e2e").glob("*.json"))
+        assert counts == {"e2e": 6}
+        assert files == [f"test_e2e_{test_id:04d}.json" for test_id in range(1, 7)]
+
+    def test_rejects_invalid_options(self, tmp_path: Path) -> None:
+        """Unknown formats and non-positive worker counts should be rejected."""
+        generator = TestSuiteGenerator()
+        with pytest.raises(ValueError, match="Unsupported output format"):
+            generator.generate_test_suite(str(tmp_path), 5, output_format="csv")
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            generator.generate_test_suite(str(tmp_path), 5, workers=0)
+
+    def test_shard_generation_restores_global_random_state(
+        self, tmp_path: Path
+    ) -> None:
+        """Generating a shard in-process should not reseed the caller's RNG."""
+        generator = TestSuiteGenerator()
+        tasks = plan_test_suite(
+            {"smoke": 2}, generator.template_manager.get_available_scenarios()
+        )
+        shards = split_into_shards(
+            tasks,
+            seed=1,
+            shard_size=2,
+            output_dir=str(tmp_path),
+            output_format="jsonl",
+            reference_time=SEEDED_REFERENCE_TIME,
+        )
+
+        random.seed(99)
+        expected = random.random()
+        random.seed(99)
+        result = generator._generate_shard(shards[0])
+
+        assert random.random() == expected
+        assert result.counts == {"smoke": 2}
+        assert generator.reference_time is None
+
+
+class TestSuitePlanning:
+    """Test the suite plan and shard seeds behind sharded generation."""
+
+    def test_plan_spreads_tests_like_serial_generation(self) -> None:
+        """Remainders should go to the first scenario types, IDs stay global."""
+        scenarios = {
+            "smoke": {"a": ["a1"], "b": ["b1", "b2"], "empty": []},
+            "e2e": {"c": ["c1"]},
+        }
+        tasks = plan_test_suite({"smoke": 3, "e2e": 2}, scenarios)
+
+        assert [(task.category, task.test_id, task.scenarios) for task in tasks] == [
+            ("smoke", 1, ("a1",)),
+            ("smoke", 2, ("a1",)),
+            ("smoke", 3, ("b1", "b2")),
+            ("e2e", 4, ("c1",)),
+            ("e2e", 5, ("c1",)),
+        ]
+
+    def test_plan_rejects_categories_without_scenarios(self) -> None:
+        """A category with only empty scenario lists cannot be planned."""
+        with pytest.raises(ValueError, match="No valid scenarios"):
+            plan_test_suite({"smoke": 1}, {"smoke": {"a": []}})
+
+    def test_shard_seeds_are_stable_and_distinct(self) -> None:
+        """Shard seeds depend only on the suite seed and shard position."""
+        assert derive_shard_seed(7, 0) == derive_shard_seed(7, 0)
+        assert len({derive_shard_seed(7, index) for index in range(50)}) == 50
+        assert derive_shard_seed(7, 1) != derive_shard_seed(8, 1)
@@ -0,0 +1,160 @@
+"""Tests for remembering Zephyr API discovery between runs."""
+
+from __future__ import annotations
+
+import json
+from http import HTTPStatus
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from importobot.integrations.clients import ZephyrClient
+from importobot.integrations.clients.discovery_state import (
+    DiscoveryStateStore,
+    default_state_path,
+    discovery_key,
+)
+
+API_URL = "https://zephyr.example"
+TOKENS = ["primary-token", "secondary-token"]
+
+
+class DualTokenSession:
+    """Session stub accepting only dual-token requests."""
+
+    def __init__(self) -> None:
+        self.headers: dict[str, str] = {}
+        self.auth = None
+        self.calls: list[str] = []
+        self.accepting = True
+
+    def get(self, url: str, **kwargs: Any) -> SimpleNamespace:
+        """Answer OK when the X-Authorization header is present."""
+        headers = kwargs.get("headers") or {}
+        self.calls.append(url)
+        ok = self.accepting and "X-Authorization" in headers
+        return SimpleNamespace(
+            status_code=HTTPStatus.OK if ok else HTTPStatus.UNAUTHORIZED,
+            headers={},
+            request=SimpleNamespace(url=url, headers=headers),
+            json=lambda: {"results": [{"key": "ZEP-1"}], "total": 1},
+        )
+
+
+def _client(
+    monkeypatch: pytest.MonkeyPatch,
+    session: DualTokenSession,
+    store: DiscoveryStateStore,
+) -> ZephyrClient:
+    monkeypatch.setattr(
+        "importobot.integrations.clients.base.requests.Session", lambda: session
+    )
+    return ZephyrClient(
+        api_url=API_URL,
+        tokens=TOKENS,
+        user=None,
+        project_name="PRJ",
+        project_id=None,
+        max_concurrency=None,
+        verify_ssl=True,
+        discovery_state=store,
+    )
+
+
+class TestDiscoveryStateStore:
+    """Tests for DiscoveryStateStore."""
+
+    def test_round_trip_without_secrets(self, tmp_path: Path) -> None:
+        """Entries are keyed by a fingerprint and never contain the tokens."""
+        store = DiscoveryStateStore(tmp_path / "state.json", ttl_seconds=60)
+        key = discovery_key(API_URL, "PRJ", TOKENS)
+
+        store.save(key, {"pattern": "direct_search", "page_size": 200})
+
+        assert store.load(key) is not None
+        assert store.load(key)["page_size"] == 200  # type: ignore[index]
+        assert "primary-token" not in (tmp_path / "state.json").read_text()
+        assert key != discovery_key(API_URL, "PRJ", ["rotated-token"])
+        assert key != discovery_key(API_URL, "OTHER", TOKENS)
+
+    def test_expired_entries_are_ignored(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Entries older than the TTL are neither returned nor kept."""
+        store = DiscoveryStateStore(tmp_path / "state.json", ttl_seconds=60)
+        monkeypatch.setattr(
+            "importobot.integrations.clients.discovery_state.time.time", lambda: 1000.0
+        )
+        store.save("old", {"pattern": "direct_search"})
+        monkeypatch.setattr(
+            "importobot.integrations.clients.discovery_state.time.time", lambda: 1100.0
+        )
+        store.save("new", {"pattern": "alternative"})
+
+        assert store.load("old") is None
+        entries = json.loads((tmp_path / "state.json").read_text())["entries"]
+        assert list(entries) == ["new"]
+
+    def test_corrupt_file_and_disabled_store(self, tmp_path: Path) -> None:
+        """A corrupt file reads as empty and a zero TTL never touches disk."""
+        path = tmp_path / "state.json"
+        path.write_text("{not json")
+        assert DiscoveryStateStore(path, ttl_seconds=60).load("key") is None
+
+        disabled = DiscoveryStateStore(tmp_path / "off.json", ttl_seconds=0)
+        disabled.save("key", {"pattern": "direct_search"})
+        assert not (tmp_path / "off.json").exists()
+
+    def test_default_path_follows_environment(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """IMPORTOBOT_ZEPHYR_DISCOVERY_STATE relocates the state file."""
+        monkeypatch.setenv("IMPORTOBOT_ZEPHYR_DISCOVERY_STATE", str(tmp_path / "s"))
+
+        assert default_state_path() == tmp_path / "s"
+        assert DiscoveryStateStore().path == tmp_path / "s"
+
+
+class TestZephyrWarmStart:
+    """Tests for ZephyrClient reusing remembered discovery results."""
+
+    def test_warm_start_probes_once(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A second client verifies the stored configuration with one probe."""
+        store = DiscoveryStateStore(tmp_path / "state.json", ttl_seconds=60)
+        cold_session = DualTokenSession()
+        cold = _client(monkeypatch, cold_session, store)
+        assert cold._discover_working_configuration()
+
+        warm_session = DualTokenSession()
+        warm = _client(monkeypatch, warm_session, store)
+        assert warm._discover_working_configuration()
+
+        assert len(cold_session.calls) == 5
+        assert len(warm_session.calls) == 1
+        assert warm._discovered_pattern == cold._discovered_pattern
+        assert warm._working_auth_strategy is not None
+        assert warm._working_auth_strategy["type"] is ZephyrClient.AuthType.DUAL_TOKEN
+        assert warm._effective_page_size == cold._effective_page_size
+
+    def test_stale_configuration_triggers_full_discovery(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failing stored configuration is forgotten and rediscovered."""
+        store = DiscoveryStateStore(tmp_path / "state.json", ttl_seconds=60)
+        key = discovery_key(API_URL, "PRJ", TOKENS)
+        store.save(
+            key, {"pattern": "direct_search", "auth": "bearer", "page_size": 100}
+        )
+
+        session = DualTokenSession()
+        client = _client(monkeypatch, session, store)
+
+        assert client._discover_working_configuration()
+        assert client._discovered_pattern is not None
+        assert client._discovered_pattern["name"] == "working_two_stage"
+        assert store.load(key)["auth"] == "dual_token"  # type: ignore[index]
+        assert len(session.calls) == 6
@@ -0,0 +1,32 @@
+"""Tests for VersionedStateFile."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from importobot.utils.state_file import VersionedStateFile
+
+
+def test_round_trip_under_field(tmp_path: Path) -> None:
+    """Entries are written under the field next to the version."""
+    state = VersionedStateFile(tmp_path / "nested" / "state.json", version=2, field="x")
+
+    state.write({"key": {"value": 1}})
+
+    assert state.read() == {"key": {"value": 1}}
+    document = json.loads(state.path.read_text(encoding="utf-8"))
+    assert document == {"version": 2, "x": {"key": {"value": 1}}}
+    assert list(state.path.parent.iterdir()) == [state.path]
+
+
+def test_missing_corrupt_or_other_version_reads_empty(tmp_path: Path) -> None:
+    """Unusable files read as empty instead of raising."""
+    state = VersionedStateFile(tmp_path / "state.json", version=1, field="x")
+    assert state.read() == {}
+
+    state.path.write_text("{", encoding="utf-8")
+    assert state.read() == {}
+
+    VersionedStateFile(state.path, version=2, field="x").write({"key": 1})
+    assert state.read() == {}
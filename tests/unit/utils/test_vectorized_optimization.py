@@ -0,0 +1,204 @@
+"""Tests for the NumPy-backed batch optimizers."""
+
+from collections.abc import Mapping
+from typing import Any
+
+import numpy as np
+import pytest
+
+from importobot.utils.optimization import (
+    AnnealingConfig,
+    GradientDescentOptimizer,
+    OptimizerConfig,
+)
+from importobot.utils.vectorized_optimization import (
+    BatchEvaluator,
+    GeneticSettings,
+    ParameterSpace,
+    VectorizedGradientDescent,
+    multi_chain_simulated_annealing,
+    vectorized_genetic_algorithm,
+)
+
+BOUNDS = {"x": (-3.0, 3.0), "y": (-3.0, 3.0)}
+INITIAL = {"x": 2.5, "y": -2.0}
+
+
+def bowl(parameters: dict[str, float]) -> float:
+    """Quadratic bowl with its minimum at (1, -0.5)."""
+    return (parameters["x"] - 1.0) ** 2 + 2.0 * (parameters["y"] + 0.5) ** 2
+
+
+def bowl_batch(columns: Mapping[str, Any]) -> Any:
+    """Vectorized form of :func:`bowl`."""
+    return (columns["x"] - 1.0) ** 2 + 2.0 * (columns["y"] + 0.5) ** 2
+
+
+def double_well(parameters: dict[str, float]) -> float:
+    """One-dimensional function with a shallow and a deep minimum."""
+    x = parameters["x"]
+    return (x**2 - 1.0) ** 2 + 0.3 * x
+
+
+def _space(
+    initial: dict[str, float] = INITIAL,
+    bounds: dict[str, tuple[float, float]] | None = None,
+) -> ParameterSpace:
+    bounds = BOUNDS if bounds is None else bounds
+    return ParameterSpace.build(
+        initial, bounds, {name: bounds[name] for name in initial}
+    )
+
+
+class TestParameterSpace:
+    """Tests for parameter vector conversion."""
+
+    def test_round_trips_parameters_in_initial_order(self) -> None:
+        """Vectors follow the order of the initial parameters."""
+        space = _space()
+
+        vector = space.to_array({"y": 1.5, "x": -1.0})
+
+        assert space.names == ("x", "y")
+        assert vector.tolist() == [-1.0, 1.5]
+        assert space.to_dict(vector) == {"x": -1.0, "y": 1.5}
+
+    def test_clip_only_limits_bounded_parameters(self) -> None:
+        """Unbounded parameters keep their values when clipping."""
+        space = ParameterSpace.build(
+            {"x": 0.0, "y": 0.0},
+            {"x": (0.0, 1.0)},
+            {"x": (0.0, 1.0), "y": (-1.0, 1.0)},
+        )
+
+        clipped = space.clip(np.array([[5.0, 50.0]]))
+
+        assert clipped.tolist() == [[1.0, 50.0]]
+
+
+class TestBatchEvaluator:
+    """Tests for batched objective evaluation."""
+
+    def test_batch_objective_matches_scalar_objective(self) -> None:
+        """Column-wise evaluation returns the same values as row mapping."""
+        points = np.array([[0.0, 0.0], [1.0, -0.5], [2.5, 3.0]])
+        scalar = BatchEvaluator(_space(), bowl)
+        batched = BatchEvaluator(_space(), bowl, batch_objective=bowl_batch)
+
+        assert scalar(points).tolist() == batched(points).tolist()
+        assert scalar.evaluations == batched.evaluations == 3
+
+    def test_worker_pool_preserves_row_order(self) -> None:
+        """Fanning out to processes returns values in row order."""
+        points = np.array([[float(i), float(-i)] for i in range(6)])
+
+        with BatchEvaluator(_space(), bowl, workers=2) as evaluator:
+            values = evaluator(points)
+
+        assert values.tolist() == [bowl({"x": x, "y": y}) for x, y in points]
+
+
+class TestVectorizedGradientDescent:
+    """Tests for multi-start gradient descent."""
+
+    def test_single_start_matches_python_optimizer(self) -> None:
+        """One start follows the dict-based optimizer's trajectory exactly."""
+        config = OptimizerConfig(learning_rate=0.05, max_iterations=60)
+        expected_params, expected_value, expected_meta = GradientDescentOptimizer(
+            config
+        ).optimize(bowl, dict(INITIAL), BOUNDS)
+
+        params, value, metadata = VectorizedGradientDescent(config).optimize(
+            BatchEvaluator(_space(), bowl), INITIAL
+        )
+
+        assert params == expected_params
+        assert value == expected_value
+        assert metadata["convergence_history"] == expected_meta["convergence_history"]
+        assert metadata["iterations"] == expected_meta["iterations"]
+
+    def test_batch_objective_gives_same_result(self) -> None:
+        """A vectorized objective does not change the optimization result."""
+        config = OptimizerConfig(learning_rate=0.05, max_iterations=40)
+
+        scalar = VectorizedGradientDescent(config, n_starts=4, seed=3).optimize(
+            BatchEvaluator(_space(), bowl), INITIAL
+        )
+        batched = VectorizedGradientDescent(config, n_starts=4, seed=3).optimize(
+            BatchEvaluator(_space(), bowl, batch_objective=bowl_batch), INITIAL
+        )
+
+        assert scalar[0] == pytest.approx(batched[0])
+        assert scalar[1] == pytest.approx(batched[1])
+
+    def test_multiple_starts_escape_local_minimum(self) -> None:
+        """Extra starts find the deeper well that a single start misses."""
+        bounds = {"x": (-2.0, 2.0)}
+        space = _space({"x": 1.5}, bounds)
+        config = OptimizerConfig(learning_rate=0.01, max_iterations=300)
+
+        _, single_value, _ = VectorizedGradientDescent(config).optimize(
+            BatchEvaluator(space, double_well), {"x": 1.5}
+        )
+        params, value, metadata = VectorizedGradientDescent(
+            config, n_starts=16, seed=7
+        ).optimize(BatchEvaluator(space, double_well), {"x": 1.5})
+
+        assert value < single_value
+        assert params["x"] < 0
+        assert metadata["starts"] == 16
+        assert len(metadata["start_values"]) == 16
+
+
+class TestStochasticOptimizers:
+    """Tests for the seeded genetic algorithm and annealing chains."""
+
+    def test_genetic_algorithm_is_reproducible_and_bounded(self) -> None:
+        """The same seed yields the same result within the bounds."""
+        settings = GeneticSettings(population_size=30, max_generations=40)
+
+        runs = [
+            vectorized_genetic_algorithm(
+                BatchEvaluator(_space(), bowl, batch_objective=bowl_batch),
+                INITIAL,
+                settings=settings,
+                seed=11,
+            )
+            for _ in range(2)
+        ]
+
+        assert runs[0][0] == runs[1][0]
+        assert runs[0][1] == runs[1][1]
+        assert all(-3.0 <= value <= 3.0 for value in runs[0][0].values())
+        assert runs[0][1] == pytest.approx(bowl(runs[0][0]))
+        assert runs[0][1] < bowl(INITIAL)
+
+    def test_genetic_algorithm_maximizes(self) -> None:
+        """Maximizing reports the score in objective units."""
+        params, score, metadata = vectorized_genetic_algorithm(
+            BatchEvaluator(_space(), bowl),
+            INITIAL,
+            maximize=True,
+            settings=GeneticSettings(population_size=20, max_generations=20),
+            seed=5,
+        )
+
+        assert score == pytest.approx(bowl(params))
+        assert score >= bowl(INITIAL)
+        assert metadata["best_fitness"] == pytest.approx(score)
+
+    def test_annealing_chains_are_reproducible(self) -> None:
+        """Multiple chains under one seed always return the same best point."""
+        config = AnnealingConfig(max_iterations=200)
+
+        first = multi_chain_simulated_annealing(
+            BatchEvaluator(_space(), bowl), INITIAL, config=config, chains=8, seed=2
+        )
+        second = multi_chain_simulated_annealing(
+            BatchEvaluator(_space(), bowl), INITIAL, config=config, chains=8, seed=2
+        )
+
+        assert first[0] == second[0]
+        assert first[1] == second[1]
+        assert first[1] <= bowl(INITIAL)
+        assert all(-3.0 <= value <= 3.0 for value in first[0].values())